@@ -9,9 +9,9 @@ import os
 import os.path
 import pathlib
 import re
-import shlex
 import shutil
 import traceback
+from functools import partial
 from typing import Any
 
 import pytest
@@ -22,7 +22,6 @@ from _pytest.reports import CollectReport, TestReport
 from _pytest.runner import CallInfo
 from kubernetes.dynamic.exceptions import ConflictError
 from ocp_resources.network_config_openshift_io import Network
-from pyhelper_utils.shell import run_command
 from pytest import Item
 from pytest_testconfig import config as py_config
 
@@ -31,16 +30,15 @@ import utilities.cluster
 # TODO: Remove this import when utilities modules are refactored...
 import utilities.infra  # noqa
 from libs.storage.config import StorageClassConfig
-from utilities.bitwarden import get_cnv_tests_secret_by_name
+from utilities.bitwarden import get_cnv_tests_secret_by_name, prefetch_cnv_tests_secrets
+from utilities.bootstrap import BootstrapStage, run_bootstrap_stages
 from utilities.constants import (
     AMD_64,
     QUARANTINED,
     SETUP_ERROR,
-    TIMEOUT_5MIN,
     NamespacesNames,
 )
 from utilities.data_collector import (
-    collect_default_cnv_must_gather_with_vm_gather,
     get_data_collector_dir,
     get_scope_identifier,
     set_data_collector_directory,
@@ -50,6 +48,7 @@ from utilities.database import Database
 from utilities.exceptions import MissingEnvironmentVariableError, StorageSanityError
 from utilities.junit_ai_utils import enrich_junit_xml, setup_ai_analysis
 from utilities.logger import setup_logging
+from utilities.must_gather_collector import MustGatherCollector
 from utilities.pytest_utils import (
     config_default_storage_class,
     deploy_run_in_progress_config_map,
@@ -111,7 +110,6 @@ MUST_GATHER_IGNORE_EXCEPTION_LIST = [
     StorageSanityError,
     ConflictError,
 ]
-INSPECT_BASE_COMMAND = "oc adm inspect"
 
 
 def pytest_addoption(parser):
@@ -724,7 +722,7 @@ def pytest_runtest_setup(item):
     if item.config.getoption("--data-collector"):
         # before the setup work starts, insert current epoch time into the database
         try:
-            db = Database(base_dir=item.config.getoption("--data-collector-output-dir"))
+            db = item.config.option.data_collector_db
             scope_marker = item.get_closest_marker(name="data_collector_scope")
             scope_value = scope_marker.kwargs.get("scope") if scope_marker else None
 
@@ -777,6 +775,81 @@ def pytest_generate_tests(metafunc):
     reorder_early_fixtures(metafunc=metafunc)
 
 
+def bootstrap_session(session):
+    """
+    Run the cluster and Bitwarden lookups of the session start concurrently, see run_bootstrap_stages.
+
+    The run in progress namespace and ConfigMap are deployed only after all the other stages passed.
+    """
+    admin_client = utilities.cluster.cache_admin_client()
+    stages = [
+        BootstrapStage(
+            name="version_explorer_url", func=partial(get_cnv_version_explorer_url, pytest_config=session.config)
+        ),
+        BootstrapStage(
+            name="cluster_service_network",
+            func=lambda: Network(client=admin_client, name="cluster").instance.status.serviceNetwork,
+        ),
+        BootstrapStage(name="run_in_progress_check", func=partial(stop_if_run_in_progress, client=admin_client)),
+    ]
+    check_artifactory = not session.config.getoption("--skip-artifactory-check")
+    if check_artifactory:
+        # Read once for the session, later secret reads (here and in fixtures) do not call bws
+        secret_names = ["os_login"]
+        if not (py_config["server_url"] or os.environ.get("ARTIFACTORY_SERVER")):
+            secret_names.append("artifactory_servers")
+        stages.append(
+            BootstrapStage(
+                name="bitwarden_secrets",
+                func=partial(prefetch_cnv_tests_secrets, secret_names=secret_names, session=session),
+            )
+        )
+        if not py_config["server_url"]:
+            stages.append(
+                BootstrapStage(
+                    name="server_url",
+                    func=partial(
+                        get_artifactory_server_url, cluster_host_url=admin_client.configuration.host, session=session
+                    ),
+                    depends_on=("bitwarden_secrets",),
+                )
+            )
+        stages.append(
+            BootstrapStage(
+                name="os_login_param",
+                func=partial(get_cnv_tests_secret_by_name, secret_name="os_login", session=session),
+                depends_on=("bitwarden_secrets",),
+            )
+        )
+
+    # must be at the end to make sure we create it only after all pytest_sessionstart checks pass.
+    checks = tuple(stage.name for stage in stages)
+    stages.extend([
+        BootstrapStage(
+            name="run_in_progress_namespace",
+            func=partial(deploy_run_in_progress_namespace, client=admin_client),
+            depends_on=checks,
+        ),
+        BootstrapStage(
+            name="run_in_progress_config_map",
+            func=partial(deploy_run_in_progress_config_map, client=admin_client, session=session),
+            depends_on=("run_in_progress_namespace",),
+        ),
+    ])
+    results = run_bootstrap_stages(stages=stages)
+
+    # Set py_config["servers"] and py_config["os_login_param"]
+    # Send --tc=server_url:<url> to override servers URL
+    py_config["version_explorer_url"] = results["version_explorer_url"]
+    py_config["cluster_service_network"] = results["cluster_service_network"]
+    if check_artifactory:
+        py_config["server_url"] = py_config["server_url"] or results["server_url"]
+        py_config["servers"] = {
+            name: _server.format(server=py_config["server_url"]) for name, _server in py_config["servers"].items()
+        }
+        py_config["os_login_param"] = results["os_login_param"]
+
+
 def pytest_sessionstart(session):
     data_collector_dict = set_data_collector_values(base_dir=session.config.getoption("data_collector_output_dir"))
     shutil.rmtree(
@@ -793,6 +866,18 @@ def pytest_sessionstart(session):
         log_level=session.config.getoption("log_cli_level") or logging.INFO,
     )
 
+    if session.config.getoption("--data-collector"):
+        # Start times of the tests, used to limit must-gather collection to the failed test time frame
+        # Shared by the xdist workers, created by the controller (or single process run) for the session
+        session.config.option.data_collector_db = Database(
+            base_dir=session.config.getoption("--data-collector-output-dir"),
+            recreate=not hasattr(session.config, "workerinput"),
+        )
+        # Must-gathers of the failed tests, collected in the background
+        session.config.option.must_gather_collector = MustGatherCollector(
+            output_dir=os.path.join(data_collector_dict["data_collector_base_directory"], "must-gather")
+        )
+
     # Save the default storage_class_matrix before it is updated
     # with runtime storage_class_matrix value(s)
     py_config["system_storage_class_matrix"] = py_config.get("storage_class_matrix", [])
@@ -819,27 +904,8 @@ def pytest_sessionstart(session):
 
         py_config[key] = items_list
     config_default_storage_class(session=session)
-    # Set py_config["servers"] and py_config["os_login_param"]
-    # Send --tc=server_url:<url> to override servers URL
     if not skip_if_pytest_flags_exists(pytest_config=session.config):
-        admin_client = utilities.cluster.cache_admin_client()
-        py_config["version_explorer_url"] = get_cnv_version_explorer_url(pytest_config=session.config)
-        py_config["cluster_service_network"] = Network(
-            client=admin_client, name="cluster"
-        ).instance.status.serviceNetwork
-        if not session.config.getoption("--skip-artifactory-check"):
-            py_config["server_url"] = py_config["server_url"] or get_artifactory_server_url(
-                cluster_host_url=admin_client.configuration.host, session=session
-            )
-            py_config["servers"] = {
-                name: _server.format(server=py_config["server_url"]) for name, _server in py_config["servers"].items()
-            }
-            py_config["os_login_param"] = get_cnv_tests_secret_by_name(secret_name="os_login", session=session)
-
-        # must be at the end to make sure we create it only after all pytest_sessionstart checks pass.
-        stop_if_run_in_progress(client=admin_client)
-        deploy_run_in_progress_namespace(client=admin_client)
-        deploy_run_in_progress_config_map(client=admin_client, session=session)
+        bootstrap_session(session=session)
 
     # Set up AI analysis if --analyze-with-ai is passed.
     # Source: https://github.com/myk-org/jenkins-job-insight/blob/main/examples/pytest-junitxml/conftest_junit_ai.py
@@ -864,10 +930,11 @@ def pytest_sessionfinish(session, exitstatus):
     reporter = session.config.pluginmanager.get_plugin("terminalreporter")
     reporter.summary_stats()
     if session.config.getoption("--data-collector"):
-        db = Database(base_dir=session.config.getoption("--data-collector-output-dir"))
-        file_path = db.database_file_path
-        LOGGER.info(f"Removing database file path {file_path}")
-        os.remove(file_path)
+        session.config.option.must_gather_collector.close()
+        if hasattr(session.config, "workerinput"):
+            session.config.option.data_collector_db.close()
+        else:
+            session.config.option.data_collector_db.remove()
     # clean up the empty folders
     collector_directory = py_config["data_collector"]["data_collector_base_directory"]
     if os.path.exists(collector_directory):
@@ -926,15 +993,6 @@ def get_inspect_command_namespace_string(node: Node, test_name: str) -> str:
     return namespace_str
 
 
-def calculate_must_gather_timer(test_start_time):
-    if test_start_time > 0:
-        # Add 5-minute (300s) buffer to work around must-gather timing issues
-        return int(datetime.datetime.now().strftime("%s")) - test_start_time + 300
-    else:
-        LOGGER.warning(f"[DATA_COLLECTOR] Could not get start time. Collecting must-gather for last {TIMEOUT_5MIN}s")
-        return TIMEOUT_5MIN
-
-
 def pytest_exception_interact(node: Item | Collector, call: CallInfo[Any], report: TestReport | CollectReport) -> None:
     BASIC_LOGGER.error(report.longreprtext)
     if node.config.getoption("--data-collector") and not is_skip_must_gather(node=node):
@@ -947,29 +1005,15 @@ def pytest_exception_interact(node: Item | Collector, call: CallInfo[Any], repor
                 f"[DATA_COLLECTOR] Must-gather collection would be skipped for exception: {call.excinfo.type}"
             )
         else:
-            db = Database(base_dir=node.config.getoption("--data-collector-output-dir"))
-            test_start_time = db.get_start_time_for_collection(node=node)
-
+            test_start_time = node.config.option.data_collector_db.get_start_time_for_collection(node=node)
+            inspect_str = get_inspect_command_namespace_string(test_name=test_name, node=node)
             try:
-                collection_dir = os.path.join(get_data_collector_dir(), "pytest_exception_interact")
-                collect_default_cnv_must_gather_with_vm_gather(
-                    since_time=calculate_must_gather_timer(test_start_time=test_start_time),
-                    target_dir=collection_dir,
-                    admin_client=utilities.cluster.cache_admin_client(),
+                node.config.option.must_gather_collector.add_failure(
+                    test_name=test_name,
+                    test_start_time=test_start_time,
+                    failure_dir=os.path.join(get_data_collector_dir(), "pytest_exception_interact"),
+                    inspect_resources=inspect_str.split(),
                 )
-                if inspect_str := get_inspect_command_namespace_string(test_name=test_name, node=node):
-                    target_dir = os.path.join(collection_dir, "inspect_collection")
-                    inspect_command = (
-                        f"{INSPECT_BASE_COMMAND} {inspect_str} "
-                        f"--since={calculate_must_gather_timer(test_start_time=test_start_time)}s "
-                        f"--dest-dir={target_dir}"
-                    )
-                    LOGGER.info(f"running inspect command on {inspect_command}")
-                    run_command(
-                        command=shlex.split(inspect_command),
-                        check=False,
-                        verify_stderr=False,
-                    )
             except Exception as current_exception:
                 LOGGER.warning(f"Failed to collect logs: {test_name}: {current_exception} {traceback.format_exc()}")
 
@@ -24,6 +24,7 @@ from libs.vm.spec import (
 )
 from tests.network.libs import cloudinit
 from utilities import infra
+from utilities.console import CONSOLE_SESSION_POOL
 from utilities.constants import CLOUD_INIT_DISK_NAME
 from utilities.network import IfaceNotFound
 from utilities.virt import get_oc_image_info, vm_console_run_commands
@@ -77,7 +78,11 @@ class BaseVirtualMachine(VirtualMachine):
         commands: list[str],
         timeout: int,
     ) -> dict[str, list[str]]:
-        return vm_console_run_commands(vm=self, commands=commands, timeout=timeout)
+        return vm_console_run_commands(vm=self, commands=commands, timeout=timeout, reuse_session=True)
+
+    def clean_up(self, wait: bool = True, timeout: int | None = None) -> bool:
+        CONSOLE_SESSION_POOL.close(vm=self)
+        return super().clean_up(wait=wait, timeout=timeout)
 
     def wait_for_agent_connected(self) -> None:
         self.vmi.wait_for_condition(
@@ -21,6 +21,7 @@ from __future__ import annotations
 import argparse
 import ast
 import base64
+import hashlib
 import json
 import logging
 import os
@@ -29,11 +30,14 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import urllib.error
 import urllib.parse
 import urllib.request
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from functools import cache, partial
 from pathlib import Path
 from typing import Any
 
@@ -55,6 +59,14 @@ MAX_FILES_PER_PR = 10000
 # Parallelization settings
 MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
 
+# Analysis index settings
+# The analyzer source hash is part of the version, so an index of results of a changed analyzer is not reused
+ANALYSIS_INDEX_VERSION = f"1-{hashlib.sha256(Path(__file__).read_bytes()).hexdigest()}"
+ANALYSIS_INDEX_ENV_VAR = "PYTEST_MARKER_ANALYZER_INDEX"
+# Files whose content can change the pytest collection results
+COLLECTION_INPUT_DIRS = ("tests", "utilities", "libs")
+COLLECTION_INPUT_FILES = ("conftest.py", "pytest.ini", "pyproject.toml", "uv.lock")
+
 
 def validate_repo_name(repo: str) -> None:
     """Validate GitHub repo name format strictly.
@@ -938,6 +950,286 @@ class FixtureDefinitionVisitor(ast.NodeVisitor):
         self.generic_visit(node=node)
 
 
+class AnalysisIndex:
+    """Per-file analysis results keyed by file content hash, optionally persisted between runs.
+
+    Entries are keyed by the sha256 of the file content (not its path), so they are shared by
+    checkouts of different PRs and only files whose content changed are parsed again.  Each entry
+    holds JSON-serializable results per analysis kind (imports, fixtures, marked tests).
+    Results of the pytest collection (``--collect-only`` and ``--setup-plan``) are stored with a
+    fingerprint of all the files that can change them.
+
+    Attributes:
+        index_path: JSON file the index is loaded from and saved to, ``None`` for an in-memory index.
+        hits: Number of results served from the index.
+        misses: Number of results computed by parsing a file.
+    """
+
+    def __init__(self, index_path: Path | None = None) -> None:
+        self.index_path = index_path
+        self.hits = 0
+        self.misses = 0
+        self._files: dict[str, dict[str, Any]] = {}
+        self._collection: dict[str, Any] = {}
+        self._used_digests: set[str] = set()
+        # (path, mtime, size) -> content digest, avoids hashing a file again within a run
+        self._digests: dict[tuple[str, int, int], str] = {}
+        # Content digest -> parse error, files which cannot be parsed are not parsed again within a run
+        self._parse_errors: dict[str, SyntaxError | UnicodeDecodeError] = {}
+        self._lock = threading.Lock()
+        if index_path:
+            self.load()
+
+    def use_file(self, index_path: Path) -> None:
+        """Load the index from a file and save it there."""
+        self.index_path = index_path
+        self.load()
+
+    def load(self) -> None:
+        if not self.index_path:
+            return
+
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            logger.info(msg="Analysis index not found, starting a new one", extra={"index_path": str(self.index_path)})
+            return
+        except (OSError, ValueError) as e:  # fmt: skip
+            logger.warning(
+                msg="Ignoring unreadable analysis index", extra={"index_path": str(self.index_path), "error": str(e)}
+            )
+            return
+
+        if data.get("version") != ANALYSIS_INDEX_VERSION:
+            logger.info(msg="Ignoring analysis index of another version", extra={"index_path": str(self.index_path)})
+            return
+
+        with self._lock:
+            self._files = data.get("files", {})
+            self._collection = data.get("collection", {})
+        logger.info(
+            msg="Loaded analysis index", extra={"index_path": str(self.index_path), "file_count": len(self._files)}
+        )
+
+    def save(self) -> None:
+        """Save the index, dropping entries of files that were not analyzed in this run."""
+        if not self.index_path:
+            return
+
+        with self._lock:
+            files = {digest: entry for digest, entry in self._files.items() if digest in self._used_digests}
+            data = {"version": ANALYSIS_INDEX_VERSION, "files": files, "collection": self._collection}
+
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        tmp_path.replace(self.index_path)
+        logger.info(
+            msg="Saved analysis index",
+            extra={
+                "index_path": str(self.index_path),
+                "file_count": len(files),
+                "hits": self.hits,
+                "misses": self.misses,
+            },
+        )
+
+    def file_digest(self, file_path: Path) -> str:
+        """Get the sha256 of a file content, hashing the file only once per modification."""
+        stat = file_path.stat()
+        stat_key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+        if digest := self._digests.get(stat_key):
+            return digest
+
+        digest = hashlib.sha256(file_path.read_bytes()).hexdigest()
+        self._digests[stat_key] = digest
+        return digest
+
+    def get(self, file_path: Path, kind: str, compute: Callable[..., Any]) -> Any:
+        """Get an analysis result of a file, parsing the file only if its content is not indexed.
+
+        Args:
+            file_path: Python file to analyze.
+            kind: Analysis name; must identify all inputs of ``compute`` other than the file content.
+            compute: Called with the parsed module as ``tree``, returns a JSON-serializable result.
+                Returned results are shared, callers must not modify them.
+
+        Returns:
+            The analysis result.
+
+        Raises:
+            SyntaxError, UnicodeDecodeError, OSError: If the file cannot be read or parsed.
+        """
+        digest = self.file_digest(file_path=file_path)
+        with self._lock:
+            self._used_digests.add(digest)
+            entry = self._files.setdefault(digest, {})
+            if kind in entry:
+                self.hits += 1
+                return entry[kind]
+
+            if parse_error := self._parse_errors.get(digest):
+                raise parse_error
+
+        try:
+            tree = ast.parse(file_path.read_text(encoding="utf-8"), filename=str(file_path))
+        except (SyntaxError, UnicodeDecodeError) as e:  # fmt: skip
+            with self._lock:
+                self._parse_errors[digest] = e
+            raise
+
+        result = compute(tree=tree)
+        with self._lock:
+            self.misses += 1
+            entry[kind] = result
+        return result
+
+    def get_collection(self, fingerprint: str) -> dict[str, Any] | None:
+        """Get the stored pytest collection results if they were collected from the same files."""
+        with self._lock:
+            if self._collection.get("fingerprint") == fingerprint:
+                self.hits += 1
+                return self._collection
+        return None
+
+    def store_collection(self, fingerprint: str, node_ids: list[str], fixture_usage: dict[str, set[str]]) -> None:
+        with self._lock:
+            self._collection = {
+                "fingerprint": fingerprint,
+                "node_ids": node_ids,
+                "fixture_usage": {node_id: sorted(fixtures) for node_id, fixtures in fixture_usage.items()},
+            }
+
+
+# Process-wide index shared by the analysis helpers; persisted when an index file is configured
+ANALYSIS_INDEX = AnalysisIndex()
+
+
+def collection_fingerprint(repo_root: Path, marker_expression: str) -> str:
+    """Hash the marker expression and every file that can change pytest collection results.
+
+    Args:
+        repo_root: Repository root path.
+        marker_expression: Marker expression used for collection.
+
+    Returns:
+        Hex digest identifying the collection inputs.
+    """
+    input_files = [repo_root / file_name for file_name in COLLECTION_INPUT_FILES]
+    for dir_name in COLLECTION_INPUT_DIRS:
+        input_files.extend((repo_root / dir_name).rglob("*.py"))
+
+    fingerprint = hashlib.sha256(marker_expression.encode())
+    for input_file in sorted(input_files):
+        if input_file.is_file():
+            fingerprint.update(str(input_file.relative_to(repo_root)).encode())
+            fingerprint.update(hashlib.sha256(input_file.read_bytes()).digest())
+    return fingerprint.hexdigest()
+
+
+def _marker_names_key(marker_names: set[str]) -> str:
+    return ",".join(sorted(marker_names))
+
+
+def _find_marked_test_names(tree: ast.Module, marker_names: set[str]) -> list[str]:
+    """Find the tests of a module with specified markers.
+
+    Args:
+        tree: Parsed test module
+        marker_names: Set of marker names to look for
+
+    Returns:
+        List of test names (``test_name`` or ``TestClass::test_name``)
+    """
+    # Check for module-level pytestmark assignment
+    module_has_marker = False
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and check_pytestmark_assignment(node=node, marker_names=marker_names):
+            module_has_marker = True
+            break
+
+    tests = []
+    if module_has_marker:
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if node.name.startswith("test_"):
+                    tests.append(node.name)
+            elif isinstance(node, ast.ClassDef):
+                for item in node.body:
+                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        if item.name.startswith("test_"):
+                            tests.append(f"{node.name}::{item.name}")
+    else:
+        # Check class-level and method-level markers
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if node.name.startswith("test_"):
+                    for decorator in node.decorator_list:
+                        if is_marker(decorator=decorator, marker_names=marker_names):
+                            tests.append(node.name)
+                            break
+                        elif check_parametrize_marks(decorator=decorator, marker_names=marker_names):
+                            tests.append(node.name)
+                            break
+            elif isinstance(node, ast.ClassDef):
+                class_has_marker = False
+                for decorator in node.decorator_list:
+                    if is_marker(decorator=decorator, marker_names=marker_names):
+                        class_has_marker = True
+                        break
+                if class_has_marker:
+                    for item in node.body:
+                        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                            if item.name.startswith("test_"):
+                                tests.append(f"{node.name}::{item.name}")
+                else:
+                    for item in node.body:
+                        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                            if item.name.startswith("test_"):
+                                for decorator in item.decorator_list:
+                                    if is_marker(decorator=decorator, marker_names=marker_names):
+                                        tests.append(f"{node.name}::{item.name}")
+                                        break
+                                    elif check_parametrize_marks(decorator=decorator, marker_names=marker_names):
+                                        tests.append(f"{node.name}::{item.name}")
+                                        break
+
+    return tests
+
+
+def _import_index_entry(tree: ast.Module) -> dict[str, Any]:
+    """Get the (unresolved) imports of a module in a JSON-serializable form.
+
+    Module names are resolved to paths by the callers, since resolution depends on other files.
+    """
+    visitor = ImportVisitor()
+    visitor.visit(node=tree)
+    return {
+        "imports": sorted(visitor.imports),
+        "symbol_imports": {module: sorted(symbols) for module, symbols in visitor.symbol_imports.items()},
+        "opaque_imports": sorted(visitor.opaque_imports),
+    }
+
+
+def _conftest_index_entry(tree: ast.Module) -> dict[str, Any]:
+    """Get the fixture definitions and imports of a conftest in a JSON-serializable form."""
+    fixture_visitor = FixtureDefinitionVisitor()
+    fixture_visitor.visit(node=tree)
+    return {
+        "fixtures": {
+            name: {"fixture_deps": sorted(fixture.fixture_deps), "function_calls": sorted(fixture.function_calls)}
+            for name, fixture in fixture_visitor.fixtures.items()
+        },
+        **_import_index_entry(tree=tree),
+    }
+
+
+def _used_fixture_names(tree: ast.Module, marker_names: set[str]) -> list[str]:
+    visitor = FixtureVisitor(marker_names=marker_names)
+    visitor.visit(node=tree)
+    return sorted(visitor.fixtures)
+
+
 def _process_test_file_for_markers(
     test_file: Path, marker_names: set[str], repo_root: Path
 ) -> list[tuple[str, str, Path]]:
@@ -953,61 +1245,11 @@ def _process_test_file_for_markers(
     """
     results = []
     try:
-        source = test_file.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(test_file))
-
-        # Check for module-level pytestmark assignment
-        module_has_marker = False
-        for node in tree.body:
-            if isinstance(node, ast.Assign) and check_pytestmark_assignment(node=node, marker_names=marker_names):
-                module_has_marker = True
-                break
-
-        tests = []
-        if module_has_marker:
-            for node in tree.body:
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    if node.name.startswith("test_"):
-                        tests.append(node.name)
-                elif isinstance(node, ast.ClassDef):
-                    for item in node.body:
-                        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                            if item.name.startswith("test_"):
-                                tests.append(f"{node.name}::{item.name}")
-        else:
-            # Check class-level and method-level markers
-            for node in tree.body:
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    if node.name.startswith("test_"):
-                        for decorator in node.decorator_list:
-                            if is_marker(decorator=decorator, marker_names=marker_names):
-                                tests.append(node.name)
-                                break
-                            elif check_parametrize_marks(decorator=decorator, marker_names=marker_names):
-                                tests.append(node.name)
-                                break
-                elif isinstance(node, ast.ClassDef):
-                    class_has_marker = False
-                    for decorator in node.decorator_list:
-                        if is_marker(decorator=decorator, marker_names=marker_names):
-                            class_has_marker = True
-                            break
-                    if class_has_marker:
-                        for item in node.body:
-                            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                                if item.name.startswith("test_"):
-                                    tests.append(f"{node.name}::{item.name}")
-                    else:
-                        for item in node.body:
-                            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                                if item.name.startswith("test_"):
-                                    for decorator in item.decorator_list:
-                                        if is_marker(decorator=decorator, marker_names=marker_names):
-                                            tests.append(f"{node.name}::{item.name}")
-                                            break
-                                        elif check_parametrize_marks(decorator=decorator, marker_names=marker_names):
-                                            tests.append(f"{node.name}::{item.name}")
-                                            break
+        tests = ANALYSIS_INDEX.get(
+            file_path=test_file,
+            kind=f"marked_tests:{_marker_names_key(marker_names=marker_names)}",
+            compute=partial(_find_marked_test_names, marker_names=marker_names),
+        )
 
         for test_name in tests:
             try:
@@ -1028,8 +1270,9 @@ def _process_conftest_with_imports(
 ) -> tuple[dict[str, Fixture], dict[Path, set[str]], set[Path]]:
     """Process conftest: extract fixtures + symbol imports + opaque deps in single parse.
 
-    Parses the conftest file once and runs both ``FixtureDefinitionVisitor``
-    and ``ImportVisitor`` on the same AST tree.  This provides the caller
+    Parses the conftest file once (only if its content is not in the analysis
+    index) and runs both ``FixtureDefinitionVisitor`` and ``ImportVisitor`` on
+    the same AST tree.  This provides the caller
     with fixture definitions alongside the conftest's own import metadata,
     enabling symbol-level dependency tracking through conftest files.
 
@@ -1048,20 +1291,20 @@ def _process_conftest_with_imports(
     opaque_deps: set[Path] = set()
 
     try:
-        source = conftest.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(conftest))
-
-        # Extract fixtures
-        fixture_visitor = FixtureDefinitionVisitor()
-        fixture_visitor.file_path = conftest
-        fixture_visitor.visit(node=tree)
-        fixtures = fixture_visitor.fixtures
-
-        # Extract imports
-        import_visitor = ImportVisitor()
-        import_visitor.visit(node=tree)
-
-        symbol_imports, opaque_deps = _resolve_visitor_symbol_imports(visitor=import_visitor, repo_root=repo_root)
+        entry = ANALYSIS_INDEX.get(file_path=conftest, kind="conftest", compute=_conftest_index_entry)
+
+        fixtures = {
+            name: Fixture(
+                name=name,
+                file_path=conftest,
+                fixture_deps=set(fixture["fixture_deps"]),
+                function_calls=set(fixture["function_calls"]),
+            )
+            for name, fixture in entry["fixtures"].items()
+        }
+        symbol_imports, opaque_deps = _resolve_symbol_imports(
+            symbol_imports=entry["symbol_imports"], opaque_imports=set(entry["opaque_imports"]), repo_root=repo_root
+        )
 
     except (SyntaxError, UnicodeDecodeError, OSError) as e:  # fmt: skip
         logger.info(
@@ -1083,11 +1326,7 @@ def _extract_imports_from_file(file_path: Path) -> set[str]:
     """
     imports = set()
     try:
-        source = file_path.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(file_path))
-        visitor = ImportVisitor()
-        visitor.visit(node=tree)
-        imports = visitor.imports
+        imports = set(ANALYSIS_INDEX.get(file_path=file_path, kind="imports", compute=_import_index_entry)["imports"])
     except (SyntaxError, UnicodeDecodeError, OSError) as e:  # fmt: skip
         logger.info(msg="Error extracting imports from file", extra={"file": str(file_path), "error": str(e)})
     return imports
@@ -1105,21 +1344,25 @@ def _extract_fixtures_from_file(file_path: Path, marker_names: set[str]) -> set[
     """
     fixtures = set()
     try:
-        source = file_path.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(file_path))
-        visitor = FixtureVisitor(marker_names=marker_names)
-        visitor.visit(node=tree)
-        fixtures = visitor.fixtures
+        fixtures = set(
+            ANALYSIS_INDEX.get(
+                file_path=file_path,
+                kind=f"fixtures:{_marker_names_key(marker_names=marker_names)}",
+                compute=partial(_used_fixture_names, marker_names=marker_names),
+            )
+        )
     except (SyntaxError, UnicodeDecodeError, OSError) as e:  # fmt: skip
         logger.info(msg="Error extracting fixtures from file", extra={"file": str(file_path), "error": str(e)})
     return fixtures
 
 
+@cache
 def _resolve_module_to_path(module: str, repo_root: Path) -> Path | None:
     """Resolve a single dotted module name to a file path.
 
     Checks for a matching Python package (``__init__.py``) or module (``.py``)
     relative to *repo_root*, then falls back to the ``tests/`` subdirectory.
+    Results are memoized; the repository layout does not change during an analysis.
 
     Args:
         module: Dotted module name (e.g. ``utilities.virt``).
@@ -1177,25 +1420,43 @@ def _resolve_visitor_symbol_imports(visitor: ImportVisitor, repo_root: Path) ->
         - opaque_deps is the set of resolved file paths imported opaquely
           (bare ``import`` or ``from module import *``).
     """
-    symbol_imports: dict[Path, set[str]] = {}
+    return _resolve_symbol_imports(
+        symbol_imports=visitor.symbol_imports, opaque_imports=visitor.opaque_imports, repo_root=repo_root
+    )
+
+
+def _resolve_symbol_imports(
+    symbol_imports: dict[str, Any], opaque_imports: set[str], repo_root: Path
+) -> tuple[dict[Path, set[str]], set[Path]]:
+    """Resolve module symbol imports to file paths, separating symbol and opaque imports.
+
+    Args:
+        symbol_imports: Module name to the symbol names imported from it.
+        opaque_imports: Modules imported without specific names.
+        repo_root: Repository root path for module resolution.
+
+    Returns:
+        Tuple of (symbol_imports, opaque_deps), see ``_resolve_visitor_symbol_imports``.
+    """
+    resolved_symbol_imports: dict[Path, set[str]] = {}
     opaque_deps: set[Path] = set()
 
-    for module, symbols in visitor.symbol_imports.items():
-        if module in visitor.opaque_imports:
+    for module, symbols in symbol_imports.items():
+        if module in opaque_imports:
             continue
         resolved_path = _resolve_module_to_path(module=module, repo_root=repo_root)
         if resolved_path is not None:
-            if resolved_path in symbol_imports:
-                symbol_imports[resolved_path].update(symbols)
+            if resolved_path in resolved_symbol_imports:
+                resolved_symbol_imports[resolved_path].update(symbols)
             else:
-                symbol_imports[resolved_path] = set(symbols)
+                resolved_symbol_imports[resolved_path] = set(symbols)
 
-    for module in visitor.opaque_imports:
+    for module in opaque_imports:
         resolved_path = _resolve_module_to_path(module=module, repo_root=repo_root)
         if resolved_path is not None:
             opaque_deps.add(resolved_path)
 
-    return symbol_imports, opaque_deps
+    return resolved_symbol_imports, opaque_deps
 
 
 def _extract_symbol_imports_from_file(file_path: Path, repo_root: Path) -> dict[Path, set[str]]:
@@ -1217,12 +1478,10 @@ def _extract_symbol_imports_from_file(file_path: Path, repo_root: Path) -> dict[
     """
     symbol_imports: dict[Path, set[str]] = {}
     try:
-        source = file_path.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(file_path))
-        visitor = ImportVisitor()
-        visitor.visit(node=tree)
-
-        symbol_imports, _ = _resolve_visitor_symbol_imports(visitor=visitor, repo_root=repo_root)
+        entry = ANALYSIS_INDEX.get(file_path=file_path, kind="imports", compute=_import_index_entry)
+        symbol_imports, _ = _resolve_symbol_imports(
+            symbol_imports=entry["symbol_imports"], opaque_imports=set(entry["opaque_imports"]), repo_root=repo_root
+        )
     except (SyntaxError, UnicodeDecodeError, OSError) as e:  # fmt: skip
         logger.info(
             msg="Error extracting symbol imports from file",
@@ -2980,6 +3239,22 @@ class MarkerTestAnalyzer:
         """Discover all tests with specified marker expression using pytest collection."""
         logger.info(msg="Discovering tests with marker expression", extra={"marker_expression": self.marker_expression})
 
+        # Reuse the previous pytest collection if none of the files it depends on changed
+        fingerprint = collection_fingerprint(repo_root=self.repo_root, marker_expression=self.marker_expression)
+        if collection := ANALYSIS_INDEX.get_collection(fingerprint=fingerprint):
+            for node_id in collection["node_ids"]:
+                self._add_collected_test(node_id=node_id)
+            self.fixture_usage = {
+                node_id: set(fixtures)
+                for node_id, fixtures in collection["fixture_usage"].items()
+                if node_id in self.marked_tests
+            }
+            logger.info(
+                msg="Reused pytest collection from the analysis index",
+                extra={"test_count": len(self.marked_tests), "marker_expression": self.marker_expression},
+            )
+            return
+
         # Use pytest --collect-only to discover ALL tests with the marker
         result = self._run_pytest_command(args=["--collect-only", "-q", "-m", self.marker_expression])
 
@@ -3002,18 +3277,7 @@ class MarkerTestAnalyzer:
             line = line.strip()
             if "::" in line and not line.startswith(" "):
                 # Format: tests/path/to/test_file.py::TestClass::test_method
-                node_id = line
-                parts = node_id.split("::")
-                file_path = self.repo_root / parts[0]
-
-                if file_path.exists():
-                    test_name = parts[-1] if len(parts) > 1 else "unknown"
-                    marked_test = MarkedTest(
-                        file_path=file_path,
-                        test_name=test_name,
-                        node_id=node_id,
-                    )
-                    self.marked_tests[node_id] = marked_test
+                self._add_collected_test(node_id=line)
 
         if not self.marked_tests:
             logger.info(
@@ -3022,6 +3286,12 @@ class MarkerTestAnalyzer:
             )
             # Fallback: scan known test files directly
             self._fallback_discover_marked_tests()
+            logger.info(
+                msg="Found tests with marker expression",
+                extra={"test_count": len(self.marked_tests), "marker_expression": self.marker_expression},
+            )
+            self._try_pytest_setup_plan()
+            return
 
         logger.info(
             msg="Found tests with marker expression",
@@ -3030,7 +3300,25 @@ class MarkerTestAnalyzer:
 
         # After discovering all tests, try to get fixture usage with --setup-plan
         # This is optional and will add fixture information if available
-        self._try_pytest_setup_plan()
+        setup_plan_succeeded = self._try_pytest_setup_plan()
+        # Collection and setup plan issues may come from the environment, not from the indexed files
+        if result.returncode in (0, 5) and setup_plan_succeeded:
+            ANALYSIS_INDEX.store_collection(
+                fingerprint=fingerprint, node_ids=list(self.marked_tests), fixture_usage=self.fixture_usage
+            )
+
+    def _add_collected_test(self, node_id: str) -> None:
+        """Add a test collected by pytest, if its file exists."""
+        parts = node_id.split("::")
+        file_path = self.repo_root / parts[0]
+
+        if file_path.exists():
+            test_name = parts[-1] if len(parts) > 1 else "unknown"
+            self.marked_tests[node_id] = MarkedTest(
+                file_path=file_path,
+                test_name=test_name,
+                node_id=node_id,
+            )
 
     def _try_pytest_setup_plan(self) -> bool:
         """Try to use pytest --setup-plan to get fixture usage for already-discovered tests.
@@ -3906,6 +4194,15 @@ def main() -> int:
         type=Path,
         help="Directory to write output files (creates marker_analysis.json or marker_analysis.md)",
     )
+    parser.add_argument(
+        "--index-file",
+        type=Path,
+        default=os.environ.get(ANALYSIS_INDEX_ENV_VAR),
+        help=(
+            "JSON file keeping per-file analysis results and pytest collection results between runs; only files "
+            f"whose content changed are analyzed again (default: ${ANALYSIS_INDEX_ENV_VAR}, no index if not set)"
+        ),
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -3940,6 +4237,10 @@ def main() -> int:
     if args.verbose:
         logger.setLevel(level=logging.DEBUG)
 
+    if args.index_file:
+        # Resolve before GitHub mode changes the working directory
+        ANALYSIS_INDEX.use_file(index_path=args.index_file.resolve())
+
     # Determine mode and run
     github_mode = args.repo is not None or args.pr is not None
 
@@ -3948,6 +4249,11 @@ def main() -> int:
     else:
         result, exit_code = run_local_mode(args=args)
 
+    try:
+        ANALYSIS_INDEX.save()
+    except OSError as e:
+        logger.warning(msg="Failed to save analysis index", extra={"index_path": str(args.index_file), "error": str(e)})
+
     if exit_code != 0 or result is None:
         return exit_code
 
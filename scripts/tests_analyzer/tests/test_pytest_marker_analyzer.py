@@ -6,27 +6,37 @@ Co-authored-by: Claude <noreply@anthropic.com>
 
 import argparse
 import ast
+import hashlib
 import textwrap
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from scripts.tests_analyzer import pytest_marker_analyzer
 from scripts.tests_analyzer.pytest_marker_analyzer import (
+    ANALYSIS_INDEX_VERSION,
+    AnalysisIndex,
     AttributeAccessCollector,
     Fixture,
     ImportVisitor,
     MarkedTest,
+    MarkerTestAnalyzer,
     SymbolClassification,
     _build_intra_class_call_graph,
     _build_line_to_symbol_map,
     _check_conftest_pathway,
     _collect_test_attribute_accesses,
     _collect_test_function_calls,
+    _conftest_index_entry,
     _expand_modified_members_transitively,
     _extract_modified_items_from_conftest,
     _extract_modified_symbols,
     _get_modified_function_names,
     _is_fixture_decorator_standalone,
     _parse_diff_for_functions,
+    _process_conftest_with_imports,
+    collection_fingerprint,
     run_github_mode,
 )
 
@@ -2228,3 +2238,194 @@ class TestCheckConftestPathwayTransitive:
         )
         assert len(matching_deps) == 1
         assert "lookup_iface_status" in matching_deps[0]
+
+
+class TestAnalysisIndex:
+    def test_get_parses_file_once(self, tmp_path):
+        module_file = tmp_path / "module.py"
+        module_file.write_text("import os\n")
+        index = AnalysisIndex()
+        compute = MagicMock(return_value=["os"])
+
+        assert index.get(file_path=module_file, kind="imports", compute=compute) == ["os"]
+        assert index.get(file_path=module_file, kind="imports", compute=compute) == ["os"]
+        compute.assert_called_once()
+        assert (index.hits, index.misses) == (1, 1)
+
+    def test_get_keyed_by_content(self, tmp_path):
+        """Files with the same content share the entry, changed files are parsed again."""
+        first_file = tmp_path / "first.py"
+        second_file = tmp_path / "second.py"
+        first_file.write_text("x = 1\n")
+        second_file.write_text("x = 1\n")
+        index = AnalysisIndex()
+        compute = MagicMock(return_value=[])
+
+        index.get(file_path=first_file, kind="imports", compute=compute)
+        index.get(file_path=second_file, kind="imports", compute=compute)
+        assert compute.call_count == 1
+
+        second_file.write_text("x = 2\n")
+        index.get(file_path=second_file, kind="imports", compute=compute)
+        assert compute.call_count == 2
+
+    def test_parse_error_not_parsed_again(self, tmp_path):
+        broken_file = tmp_path / "broken.py"
+        broken_file.write_text("def broken(:\n")
+        index = AnalysisIndex()
+
+        with pytest.raises(SyntaxError):
+            index.get(file_path=broken_file, kind="imports", compute=MagicMock())
+
+        with (
+            patch("scripts.tests_analyzer.pytest_marker_analyzer.ast.parse") as mock_parse,
+            pytest.raises(SyntaxError),
+        ):
+            index.get(file_path=broken_file, kind="imports", compute=MagicMock())
+
+        mock_parse.assert_not_called()
+
+    def test_save_and_load(self, tmp_path):
+        module_file = tmp_path / "module.py"
+        module_file.write_text("import os\n")
+        index_path = tmp_path / "index" / "analysis.json"
+        index = AnalysisIndex(index_path=index_path)
+        index.get(file_path=module_file, kind="imports", compute=lambda tree: ["os"])
+        index.store_collection(fingerprint="abc", node_ids=["tests/test_a.py::test_a"], fixture_usage={})
+        index.save()
+
+        loaded_index = AnalysisIndex(index_path=index_path)
+        compute = MagicMock()
+
+        assert loaded_index.get(file_path=module_file, kind="imports", compute=compute) == ["os"]
+        compute.assert_not_called()
+        assert loaded_index.get_collection(fingerprint="abc")["node_ids"] == ["tests/test_a.py::test_a"]
+        assert loaded_index.get_collection(fingerprint="other") is None
+
+    def test_save_drops_unused_entries(self, tmp_path):
+        module_file = tmp_path / "module.py"
+        module_file.write_text("import os\n")
+        index_path = tmp_path / "analysis.json"
+        index = AnalysisIndex(index_path=index_path)
+        index.get(file_path=module_file, kind="imports", compute=lambda tree: ["os"])
+        index.save()
+
+        AnalysisIndex(index_path=index_path).save()
+
+        assert AnalysisIndex(index_path=index_path)._files == {}
+
+    def test_load_ignores_corrupted_index(self, tmp_path):
+        index_path = tmp_path / "analysis.json"
+        index_path.write_text("{not json")
+
+        assert AnalysisIndex(index_path=index_path)._files == {}
+
+    def test_load_ignores_index_of_changed_analyzer(self, tmp_path):
+        """An index saved by another analyzer source is not loaded."""
+        module_file = tmp_path / "module.py"
+        module_file.write_text("import os\n")
+        index_path = tmp_path / "analysis.json"
+        with patch("scripts.tests_analyzer.pytest_marker_analyzer.ANALYSIS_INDEX_VERSION", "1-previous-analyzer"):
+            index = AnalysisIndex(index_path=index_path)
+            index.get(file_path=module_file, kind="imports", compute=lambda tree: ["os"])
+            index.save()
+
+        assert AnalysisIndex(index_path=index_path)._files == {}
+
+    def test_index_version_tracks_analyzer_source(self):
+        analyzer_source = Path(pytest_marker_analyzer.__file__).read_bytes()
+
+        assert ANALYSIS_INDEX_VERSION.endswith(hashlib.sha256(analyzer_source).hexdigest())
+
+
+class TestConftestIndexEntry:
+    def test_cached_conftest_matches_parsed_conftest(self, tmp_path):
+        (tmp_path / "utilities").mkdir()
+        (tmp_path / "utilities" / "virt.py").write_text("def running_vm():\n    pass\n")
+        conftest = tmp_path / "conftest.py"
+        conftest.write_text(
+            textwrap.dedent("""\
+                import pytest
+
+                from utilities.virt import running_vm
+
+
+                @pytest.fixture()
+                def vm(namespace, request):
+                    return running_vm()
+            """)
+        )
+
+        entry = _conftest_index_entry(tree=ast.parse(conftest.read_text()))
+        fixtures, symbol_imports, opaque_deps = _process_conftest_with_imports(conftest=conftest, repo_root=tmp_path)
+
+        assert entry["fixtures"] == {"vm": {"fixture_deps": ["namespace"], "function_calls": ["running_vm"]}}
+        assert fixtures["vm"].file_path == conftest
+        assert fixtures["vm"].fixture_deps == {"namespace"}
+        assert symbol_imports == {tmp_path / "utilities" / "virt.py": {"running_vm"}}
+        assert opaque_deps == set()
+
+
+class TestCollectionFingerprint:
+    def test_fingerprint_changes_with_tests_content(self, tmp_path):
+        test_file = tmp_path / "tests" / "test_a.py"
+        test_file.parent.mkdir()
+        test_file.write_text("def test_a():\n    pass\n")
+        fingerprint = collection_fingerprint(repo_root=tmp_path, marker_expression="smoke")
+
+        assert collection_fingerprint(repo_root=tmp_path, marker_expression="smoke") == fingerprint
+        assert collection_fingerprint(repo_root=tmp_path, marker_expression="gating") != fingerprint
+
+        test_file.write_text("def test_b():\n    pass\n")
+        assert collection_fingerprint(repo_root=tmp_path, marker_expression="smoke") != fingerprint
+
+    def test_discover_reuses_indexed_collection(self, tmp_path):
+        test_file = tmp_path / "tests" / "test_a.py"
+        test_file.parent.mkdir()
+        test_file.write_text("def test_a(vm):\n    pass\n")
+        index = AnalysisIndex()
+        index.store_collection(
+            fingerprint=collection_fingerprint(repo_root=tmp_path, marker_expression="smoke"),
+            node_ids=["tests/test_a.py::test_a"],
+            fixture_usage={"tests/test_a.py::test_a": {"vm"}},
+        )
+        analyzer = MarkerTestAnalyzer(marker_expression="smoke", repo_root=tmp_path)
+
+        with (
+            patch("scripts.tests_analyzer.pytest_marker_analyzer.ANALYSIS_INDEX", index),
+            patch.object(analyzer, "_run_pytest_command") as mock_run_pytest,
+        ):
+            analyzer.discover_marked_tests()
+
+        mock_run_pytest.assert_not_called()
+        assert list(analyzer.marked_tests) == ["tests/test_a.py::test_a"]
+        assert analyzer.fixture_usage == {"tests/test_a.py::test_a": {"vm"}}
+
+    @pytest.mark.parametrize(
+        "setup_plan_returncode, stored",
+        [
+            pytest.param(0, True, id="setup_plan_succeeded"),
+            pytest.param(1, False, id="setup_plan_failed"),
+        ],
+    )
+    def test_discover_stores_collection_only_with_setup_plan(self, tmp_path, setup_plan_returncode, stored):
+        test_file = tmp_path / "tests" / "test_a.py"
+        test_file.parent.mkdir()
+        test_file.write_text("def test_a(vm):\n    pass\n")
+        index = AnalysisIndex()
+        analyzer = MarkerTestAnalyzer(marker_expression="smoke", repo_root=tmp_path)
+        collect_result = MagicMock(returncode=0, stdout="tests/test_a.py::test_a\n", stderr="")
+        setup_plan_result = MagicMock(
+            returncode=setup_plan_returncode,
+            stdout="SETUP    F vm\ntests/test_a.py::test_a (fixtures used: vm)\n",
+            stderr="",
+        )
+
+        with (
+            patch("scripts.tests_analyzer.pytest_marker_analyzer.ANALYSIS_INDEX", index),
+            patch.object(analyzer, "_run_pytest_command", side_effect=[collect_result, setup_plan_result]),
+        ):
+            analyzer.discover_marked_tests()
+
+        fingerprint = collection_fingerprint(repo_root=tmp_path, marker_expression="smoke")
+        assert (index.get_collection(fingerprint=fingerprint) is not None) == stored
@@ -1,5 +1,6 @@
 import logging
 import multiprocessing
+import os
 import random
 
 import pytest
@@ -32,6 +33,7 @@ from utilities.constants import (
     Images,
     NamespacesNames,
 )
+from utilities.data_collector import get_data_collector_base_directory
 from utilities.infra import (
     ExecCommandOnPod,
     create_ns,
@@ -43,11 +45,23 @@ from utilities.infra import (
     utility_daemonset_for_custom_tests,
     wait_for_node_status,
 )
+from utilities.resource_usage import ResourceUsageRecorder
 from utilities.virt import VirtualMachineForTests, running_vm
 
 LOGGER = logging.getLogger(__name__)
 
 
+@pytest.fixture(autouse=True)
+def resource_usage_recorder(request, admin_client):
+    """Nodes and virt-launcher pods CPU and memory usage time series, recorded during each chaos test"""
+    with ResourceUsageRecorder(
+        client=admin_client,
+        output_directory=os.path.join(get_data_collector_base_directory(), "chaos", request.node.name),
+        interval=TIMEOUT_10SEC,
+    ) as recorder:
+        yield recorder
+
+
 @pytest.fixture(scope="module")
 def chaos_namespace(admin_client):
     yield from create_ns(admin_client=admin_client, name=NamespacesNames.CHAOS)
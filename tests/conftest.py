@@ -102,6 +102,7 @@ from utilities.constants import (
     NODE_ROLE_KUBERNETES_IO,
     NODE_TYPE_WORKER_LABEL,
     OC_ADM_LOGS_COMMAND,
+    OC_CLI_DOWNLOADS,
     OS_FLAVOR_RHEL,
     OVS_BRIDGE,
     POD_SECURITY_NAMESPACE_LABELS,
@@ -138,7 +139,7 @@ from utilities.infra import (
     ExecCommandOnPod,
     add_scc_to_service_account,
     create_ns,
-    download_file_from_cluster,
+    download_files_from_cluster,
     generate_namespace_name,
     generate_openshift_pull_secret_file,
     get_cluster_platform,
@@ -203,6 +204,7 @@ from utilities.virt import (
     vm_instance_from_template,
     wait_for_windows_vm,
 )
+from utilities.watch import RESOURCE_CACHE
 
 LOGGER = logging.getLogger(__name__)
 HTTP_SECRET_NAME = "htpass-secret-for-cnv-tests"
@@ -435,7 +437,7 @@ def unprivileged_client(
 
 @pytest.fixture(scope="session")
 def nodes(admin_client):
-    yield list(Node.get(client=admin_client))
+    yield RESOURCE_CACHE.list(client=admin_client, resource_kind=Node)
 
 
 @pytest.fixture(scope="session")
@@ -447,7 +449,7 @@ def schedulable_nodes(nodes):
         for node in nodes
         if schedulable_label in node.labels.keys()
         and node.labels[schedulable_label] == "true"
-        and not node.instance.spec.unschedulable
+        and not RESOURCE_CACHE.instance(resource=node).spec.unschedulable
         and not kubernetes_taint_exists(node)
         and node.kubelet_ready
     ]
@@ -1286,7 +1288,7 @@ def hyperconverged_ovs_annotations_enabled_scope_session(
 
 @pytest.fixture(scope="session")
 def cluster_storage_classes(admin_client):
-    return list(StorageClass.get(client=admin_client))
+    return RESOURCE_CACHE.list(client=admin_client, resource_kind=StorageClass)
 
 
 @pytest.fixture(scope="session")
@@ -1339,7 +1341,7 @@ def hpp_cr_installed(hostpath_provisioner_scope_session):
 
 @pytest.fixture(scope="module")
 def cnv_pods(admin_client, hco_namespace):
-    yield list(Pod.get(client=admin_client, namespace=hco_namespace.name))
+    yield RESOURCE_CACHE.list(client=admin_client, resource_kind=Pod, namespace=hco_namespace.name)
 
 
 @pytest.fixture(scope="session")
@@ -1922,27 +1924,40 @@ def os_path_environment():
 
 
 @pytest.fixture(scope="session")
-def virtctl_binary(installing_cnv, bin_directory, admin_client):
+def cli_binaries(installing_cnv, bin_directory, admin_client, cnv_current_version, openshift_current_version):
+    """
+    Download the virtctl and oc binaries concurrently, through the binary cache (see CNV_TESTS_BINARY_CACHE_DIR).
+
+    Binaries set by CNV_TESTS_VIRTCTL_BIN and CNV_TESTS_OC_BIN are not downloaded.
+    """
+    console_cli_downloads = {}
+    if not (installing_cnv or os.environ.get("CNV_TESTS_VIRTCTL_BIN")):
+        console_cli_downloads[VIRTCTL_CLI_DOWNLOADS] = cnv_current_version
+    if not os.environ.get("CNV_TESTS_OC_BIN"):
+        console_cli_downloads[OC_CLI_DOWNLOADS] = openshift_current_version
+    return download_files_from_cluster(
+        console_cli_downloads=console_cli_downloads, dest_dir=bin_directory, admin_client=admin_client
+    )
+
+
+@pytest.fixture(scope="session")
+def virtctl_binary(installing_cnv, cli_binaries):
     if installing_cnv:
         return
     installed_virtctl = os.environ.get("CNV_TESTS_VIRTCTL_BIN")
     if installed_virtctl:
         LOGGER.warning(f"Using previously installed: {installed_virtctl}")
         return
-    return download_file_from_cluster(
-        get_console_spec_links_name=VIRTCTL_CLI_DOWNLOADS, dest_dir=bin_directory, admin_client=admin_client
-    )
+    return cli_binaries[VIRTCTL_CLI_DOWNLOADS]
 
 
 @pytest.fixture(scope="session")
-def oc_binary(bin_directory, admin_client):
+def oc_binary(cli_binaries):
     installed_oc = os.environ.get("CNV_TESTS_OC_BIN")
     if installed_oc:
         LOGGER.warning(f"Using previously installed: {installed_oc}")
         return
-    return download_file_from_cluster(
-        get_console_spec_links_name="oc-cli-downloads", dest_dir=bin_directory, admin_client=admin_client
-    )
+    return cli_binaries[OC_CLI_DOWNLOADS]
 
 
 @pytest.fixture(scope="session")
@@ -4,7 +4,7 @@ from collections import defaultdict
 import pytest
 from packaging.version import Version
 
-from utilities.infra import get_node_audit_log_line_dict
+from utilities.audit_logs import scan_audit_logs
 
 LOGGER = logging.getLogger(__name__)
 
@@ -75,33 +75,30 @@ def format_printed_deprecations_dict(deprecated_calls):
 def deprecated_apis_calls(audit_logs):
     """Go over control plane nodes audit logs and look for calls using deprecated APIs"""
     failed_api_calls = defaultdict(list)
-    for node, logs in audit_logs.items():
-        for audit_log_entry_dict in get_node_audit_log_line_dict(
-            logs=logs, node=node, log_entry=DEPRECATED_API_LOG_ENTRY
+    for audit_log_entry_dict in scan_audit_logs(nodes_logs=audit_logs, log_entry=DEPRECATED_API_LOG_ENTRY):
+        annotations = audit_log_entry_dict["annotations"]
+        user_agent = audit_log_entry_dict["userAgent"]
+        component = failed_api_calls.get(user_agent)
+
+        if skip_component_check(
+            user_agent=user_agent,
+            deprecation_version=annotations.get("k8s.io/removed-release"),
         ):
-            annotations = audit_log_entry_dict["annotations"]
-            user_agent = audit_log_entry_dict["userAgent"]
-            component = failed_api_calls.get(user_agent)
-
-            if skip_component_check(
-                user_agent=user_agent,
-                deprecation_version=annotations.get("k8s.io/removed-release"),
+            continue
+
+        # Add new component to dict if not already in it
+        if not component:
+            failed_api_calls[user_agent].append(audit_log_entry_dict)
+
+        # Add failure dict if failure annotations and object_ref not in component list of errors
+        else:
+            if failure_not_in_component_list(
+                component=component,
+                annotations=annotations,
+                audit_log_entry_dict=audit_log_entry_dict,
             ):
-                continue
-
-            # Add new component to dict if not already in it
-            if not component:
                 failed_api_calls[user_agent].append(audit_log_entry_dict)
 
-            # Add failure dict if failure annotations and object_ref not in component list of errors
-            else:
-                if failure_not_in_component_list(
-                    component=component,
-                    annotations=annotations,
-                    audit_log_entry_dict=audit_log_entry_dict,
-                ):
-                    failed_api_calls[user_agent].append(audit_log_entry_dict)
-
     return failed_api_calls
 
 
@@ -11,7 +11,7 @@ from tests.infrastructure.golden_images.constants import (
     CUSTOM_DATA_SOURCE_NAME,
 )
 from tests.infrastructure.golden_images.update_boot_source.utils import (
-    get_image_version,
+    get_images_versions,
     wait_for_created_volume_from_data_import_cron,
     wait_for_existing_auto_update_data_import_crons,
 )
@@ -36,12 +36,19 @@ pytestmark = pytest.mark.post_upgrade
 
 @pytest.mark.polarion("CNV-12414")
 def test_updated_rhel_image(golden_images_data_import_crons_scope_class, latest_rhel_release_versions_dict, subtests):
-    for rhel_dic in [dic for dic in golden_images_data_import_crons_scope_class if "rhel" in dic.name.lower()]:
-        rhel_instance_dict = rhel_dic.instance
-        image_reference_version = get_image_version(
-            image=rhel_instance_dict.metadata.annotations.get("cdi.kubevirt.io/storage.import.imageStreamDockerRef")
-        )
-        with subtests.test(rhel_dic_name=rhel_dic.name, managed_data_source=rhel_instance_dict.spec.managedDataSource):
+    rhel_instances_dicts = {
+        rhel_dic.name: rhel_dic.instance
+        for rhel_dic in golden_images_data_import_crons_scope_class
+        if "rhel" in rhel_dic.name.lower()
+    }
+    rhel_images = {
+        name: rhel_instance_dict.metadata.annotations.get("cdi.kubevirt.io/storage.import.imageStreamDockerRef")
+        for name, rhel_instance_dict in rhel_instances_dicts.items()
+    }
+    images_versions = get_images_versions(images=list(rhel_images.values()))
+    for rhel_dic_name, rhel_instance_dict in rhel_instances_dicts.items():
+        image_reference_version = images_versions[rhel_images[rhel_dic_name]]
+        with subtests.test(rhel_dic_name=rhel_dic_name, managed_data_source=rhel_instance_dict.spec.managedDataSource):
             managed_data_source = rhel_instance_dict.spec.managedDataSource
             assert managed_data_source, "spec.managedDataSource doesn't exists"
             assert latest_rhel_release_versions_dict[managed_data_source] == image_reference_version
@@ -29,7 +29,7 @@ from utilities.storage import (
     DATA_IMPORT_CRON_SUFFIX,
     RESOURCE_MANAGED_BY_DATA_IMPORT_CRON_LABEL,
 )
-from utilities.virt import get_oc_image_info
+from utilities.virt import get_oc_images_info
 
 LOGGER = logging.getLogger(__name__)
 
@@ -136,32 +136,34 @@ def get_all_release_versions_from_docs(major_ver_num: int) -> list[int]:
     return versions
 
 
-def get_image_version(image: str) -> str | None:
+def get_images_versions(images: list[str]) -> dict[str, str | None]:
     """
-    Extract the major.minor version from an image's version label.
+    Extract the major.minor version from the version label of many images.
 
-    Retrieves image information and extracts the version label, returning
+    Retrieves the images information in parallel and extracts their version label, returning
     only the major and minor version components (e.g., "8.9" from "8.9.0").
 
     Args:
-        image: Image reference string.
+        images: Image reference strings.
 
     Returns:
-        Version string in "major.minor" format (e.g., "8.9"), or None if:
+        Image reference to its version string in "major.minor" format (e.g., "8.9"), or None if:
         - The image information cannot be retrieved
         - The version label is not present in the image metadata
     """
-    image_info = get_oc_image_info(
-        image=image,
+    images_versions: dict[str, str | None] = {}
+    for image, image_info in get_oc_images_info(
+        images=images,
         pull_secret=generate_openshift_pull_secret_file(),
-    )
-    full_version = image_info.get("config", {}).get("config", {}).get("Labels", {}).get("version")
-    try:
-        version = Version(version=full_version)
-        return f"{version.major}.{version.minor}"
-    except ValueError, AttributeError, TypeError:
-        LOGGER.warning(f"No RHEL version was found from: {image}")
-        return None
+    ).items():
+        full_version = (image_info or {}).get("config", {}).get("config", {}).get("Labels", {}).get("version")
+        try:
+            version = Version(version=full_version)
+            images_versions[image] = f"{version.major}.{version.minor}"
+        except ValueError, AttributeError, TypeError:
+            LOGGER.warning(f"No RHEL version was found from: {image}")
+            images_versions[image] = None
+    return images_versions
 
 
 def wait_for_existing_auto_update_data_import_crons(admin_client: DynamicClient, namespace: Namespace) -> None:
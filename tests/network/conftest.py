@@ -16,6 +16,7 @@ from ocp_resources.pod import Pod
 from pytest_testconfig import config as py_config
 from timeout_sampler import TimeoutExpiredError
 
+import tests.network.libs.nodenetworkconfigurationpolicy as libnncp
 from libs.net.cluster import ipv4_supported_cluster, ipv6_supported_cluster
 from tests.network.utils import get_vlan_index_number
 from utilities.constants import (
@@ -76,6 +77,13 @@ def ipv6_primary_interface_cloud_init_data() -> dict[str, dict] | None:
     return None
 
 
+@pytest.fixture(scope="session")
+def nncp_registry(admin_client):
+    registry = libnncp.NncpRegistry(client=admin_client)
+    yield registry
+    registry.clean_up()
+
+
 @pytest.fixture(scope="session")
 def istio_system_namespace(admin_client):
     return Namespace(name=ISTIO_SYSTEM_DEFAULT_NS, client=admin_client).exists
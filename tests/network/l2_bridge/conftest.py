@@ -2,7 +2,6 @@ import shlex
 from collections.abc import Generator
 
 import pytest
-from kubernetes.dynamic import DynamicClient
 from pyhelper_utils.shell import run_ssh_commands
 
 import tests.network.libs.nodenetworkconfigurationpolicy as libnncp
@@ -290,11 +289,10 @@ def started_vmb_dhcp_client(l2_bridge_running_vm_b, eth3_nmcli_connection_uuid):
 @pytest.fixture(scope="package")
 def bridge_nncp(
     nmstate_dependent_placeholder: None,
-    admin_client: DynamicClient,
+    nncp_registry: libnncp.NncpRegistry,
     hosts_common_available_ports: list[str],
 ) -> Generator[libnncp.NodeNetworkConfigurationPolicy]:
-    with libnncp.NodeNetworkConfigurationPolicy(
-        client=admin_client,
+    with nncp_registry.policy(
         name="l2-bridge-test-nncp",
         desired_state=libnncp.DesiredState(
             interfaces=[
@@ -311,5 +309,4 @@ def bridge_nncp(
         ),
         node_selector={WORKER_NODE_LABEL_KEY: ""},
     ) as nncp_br:
-        nncp_br.wait_for_status_success()
         yield nncp_br
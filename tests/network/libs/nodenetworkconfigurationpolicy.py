@@ -1,21 +1,23 @@
 import contextlib
+import json
+import logging
+import threading
 from collections.abc import Iterator
 from copy import deepcopy
 from dataclasses import asdict, dataclass
-from datetime import datetime
 from enum import Enum
 from typing import Any
 
 from kubernetes.dynamic import DynamicClient
-from ocp_resources.exceptions import NNCPConfigurationFailed
 from ocp_resources.node_network_configuration_policy_latest import NodeNetworkConfigurationPolicy as Nncp
 from ocp_resources.resource import Resource, ResourceEditor
-from timeout_sampler import retry
 
 from tests.network.libs.apimachinery import dict_normalization_for_dataclass
+from utilities.network import wait_for_nncp_status_success
+
+LOGGER = logging.getLogger(__name__)
 
 WAIT_FOR_STATUS_TIMEOUT_SEC = 120
-WAIT_FOR_STATUS_INTERVAL_SEC = 5
 DEFAULT_OVN_EXTERNAL_BRIDGE = "br-ex"  # Default name for OVN-Kubernetes external bridge
 
 
@@ -149,35 +151,11 @@ class NodeNetworkConfigurationPolicy(Nncp):
                 ResourceEditor(patches={self: {"spec": {"desiredState": desired_state}}}).update()
         return super().clean_up(wait=wait, timeout=timeout)
 
-    @retry(
-        wait_timeout=WAIT_FOR_STATUS_TIMEOUT_SEC,
-        sleep=WAIT_FOR_STATUS_INTERVAL_SEC,
-        exceptions_dict={},  # Using a no-op exception so any other error will be raised
-    )
     def wait_for_status_success(self, last_success_timestamp: str = "") -> dict[str, Any]:
-        date_format = "%Y-%m-%dT%H:%M:%SZ"
-        initial_transition_datetime = (
-            datetime.strptime(last_success_timestamp, date_format) if last_success_timestamp else None
-        )
-
-        conditions = (
-            condition
-            for condition in self.instance.get("status", {}).get("conditions", {})
-            if condition["status"] == Resource.Condition.Status.TRUE
+        return wait_for_nncp_status_success(
+            nncp=self, timeout=WAIT_FOR_STATUS_TIMEOUT_SEC, last_success_timestamp=last_success_timestamp
         )
 
-        for condition in conditions:
-            if condition["type"] == Resource.Condition.AVAILABLE:
-                if (
-                    not initial_transition_datetime
-                    or datetime.strptime(condition["lastTransitionTime"], date_format) > initial_transition_datetime
-                ):
-                    self.logger.info(f"{self.kind}/{self.name} configured successfully")
-                    return condition
-            if condition["type"] == Resource.Condition.DEGRADED:
-                raise NNCPConfigurationFailed(f"{self.name} failed on condition:\n{condition}")
-        return {}
-
     def _interfaces_for_deletion(self) -> list[Interface]:
         if isinstance(self.desired_state, dict):
             to_delete_interfaces = deepcopy(self.desired_state.get("interfaces", []))
@@ -216,3 +194,155 @@ class NodeNetworkConfigurationPolicy(Nncp):
             ):
                 return condition["lastTransitionTime"]
         return ""
+
+
+def desired_state_key(desired_state: DesiredState, node_selector: dict[str, str] | None = None) -> str:
+    """
+    Get the identity of a policy configuration; equivalent desired states (same interfaces and OVN bridge mappings in
+    any order) applied to the same nodes share it.
+
+    Args:
+        desired_state (DesiredState): Policy desired state.
+        node_selector (dict, optional): Policy node selector.
+
+    Returns:
+        str: Canonical JSON of the desired state and node selector.
+    """
+    state = asdict(desired_state, dict_factory=dict_normalization_for_dataclass)
+    state.get("interfaces", []).sort(key=lambda interface: interface["name"])
+    state.get("ovn", {}).get("bridge-mappings", []).sort(key=lambda bridge_mapping: bridge_mapping["localnet"])
+    return json.dumps({"desired_state": state, "node_selector": node_selector or {}}, sort_keys=True)
+
+
+def _desired_state_names(desired_state: DesiredState) -> set[str]:
+    """Interface, bridge port and localnet names a desired state configures."""
+    names = set()
+    for interface in desired_state.interfaces or []:
+        names.add(interface.name)
+        if interface.bridge and interface.bridge.port:
+            names.update(port.name for port in interface.bridge.port)
+    if desired_state.ovn:
+        names.update(bridge_mapping.localnet for bridge_mapping in desired_state.ovn.bridge_mappings)
+    return names
+
+
+@dataclass
+class _RegisteredPolicy:
+    nncp: NodeNetworkConfigurationPolicy
+    references: int = 0
+    linger: bool = False
+
+
+class NncpRegistry:
+    """
+    Reference counted NodeNetworkConfigurationPolicy objects, shared by all the tests requesting an equivalent
+    configuration (see desired_state_key), so nmstate reconfigures the nodes once instead of once per test module.
+
+    A policy is applied by its first user and removed when its last user releases it, or, for lingering policies, kept
+    applied for the next module and removed only when another policy configures the same interfaces, ports or localnets,
+    or when the registry is cleaned up (end of session, see nncp_registry fixture).
+
+    Usage:
+        with nncp_registry.policy(name="test-nncp", desired_state=desired_state, node_selector=node_selector) as nncp:
+            ...
+    """
+
+    def __init__(self, client: DynamicClient):
+        self.client = client
+        self._policies: dict[str, _RegisteredPolicy] = {}
+        self._lock = threading.RLock()
+
+    def acquire(
+        self,
+        name: str,
+        desired_state: DesiredState,
+        node_selector: dict[str, str] | None = None,
+        linger: bool = False,
+    ) -> NodeNetworkConfigurationPolicy:
+        """
+        Get an applied policy of the desired state, applying it unless an equivalent one is already applied.
+
+        Args:
+            name (str): Name of the policy, if it is created.
+            desired_state (DesiredState): Policy desired state.
+            node_selector (dict, optional): Nodes to apply the policy to.
+            linger (bool): Keep the policy applied when it is not used anymore, for reuse by later modules.
+
+        Returns:
+            NodeNetworkConfigurationPolicy: Applied (status Available) policy; must be released by `release`.
+
+        Raises:
+            NNCPConfigurationFailed: If the policy is degraded.
+        """
+        key = desired_state_key(desired_state=desired_state, node_selector=node_selector)
+        with self._lock:
+            if registered_policy := self._policies.get(key):
+                registered_policy.references += 1
+                registered_policy.linger |= linger
+                LOGGER.info(
+                    f"Reusing {registered_policy.nncp.kind}/{registered_policy.nncp.name} for {name} "
+                    f"({registered_policy.references} users)"
+                )
+                return registered_policy.nncp
+
+            self._remove_conflicting_idle_policies(names=_desired_state_names(desired_state=desired_state))
+            nncp = NodeNetworkConfigurationPolicy(
+                client=self.client, name=name, desired_state=desired_state, node_selector=node_selector
+            )
+            nncp.deploy(wait=nncp.wait_for_resource)
+            try:
+                nncp.wait_for_status_success()
+            except Exception:
+                nncp.clean_up()
+                raise
+
+            self._policies[key] = _RegisteredPolicy(nncp=nncp, references=1, linger=linger)
+            return nncp
+
+    def release(self, nncp: NodeNetworkConfigurationPolicy) -> None:
+        """
+        Release a policy returned by `acquire`, removing it if it is not used anymore and not lingering.
+
+        Args:
+            nncp (NodeNetworkConfigurationPolicy): Policy to release.
+        """
+        with self._lock:
+            key, registered_policy = next(
+                (_key, _policy) for _key, _policy in self._policies.items() if _policy.nncp is nncp
+            )
+            registered_policy.references -= 1
+            if not registered_policy.references and not registered_policy.linger:
+                del self._policies[key]
+                nncp.clean_up()
+
+    @contextlib.contextmanager
+    def policy(
+        self,
+        name: str,
+        desired_state: DesiredState,
+        node_selector: dict[str, str] | None = None,
+        linger: bool = False,
+    ) -> Iterator[NodeNetworkConfigurationPolicy]:
+        """Context manager of `acquire` and `release`, see `acquire` for the arguments."""
+        nncp = self.acquire(name=name, desired_state=desired_state, node_selector=node_selector, linger=linger)
+        try:
+            yield nncp
+        finally:
+            self.release(nncp=nncp)
+
+    def _remove_conflicting_idle_policies(self, names: set[str]) -> None:
+        for key, registered_policy in list(self._policies.items()):
+            if not registered_policy.references and names & _desired_state_names(
+                desired_state=registered_policy.nncp.desired_state_spec
+            ):
+                LOGGER.info(f"Removing idle {registered_policy.nncp.kind}/{registered_policy.nncp.name}")
+                del self._policies[key]
+                registered_policy.nncp.clean_up()
+
+    def clean_up(self) -> None:
+        """Remove the idle policies; policies still in use are left to their users."""
+        with self._lock:
+            for key, registered_policy in list(self._policies.items()):
+                if not registered_policy.references:
+                    del self._policies[key]
+                    registered_policy.nncp.clean_up()
@@ -39,7 +39,7 @@ from utilities.virt import migrate_vm_and_verify
 
 @pytest.fixture(scope="module")
 def nncp_localnet(
-    nmstate_dependent_placeholder: None, admin_client: DynamicClient
+    nmstate_dependent_placeholder: None, nncp_registry: libnncp.NncpRegistry
 ) -> Generator[libnncp.NodeNetworkConfigurationPolicy]:
     desired_state = libnncp.DesiredState(
         ovn=libnncp.OVN([
@@ -51,13 +51,13 @@ def nncp_localnet(
         ])
     )
 
-    with libnncp.NodeNetworkConfigurationPolicy(
-        client=admin_client,
+    # The br-ex bridge mapping does not touch node NICs, it stays applied for all the localnet modules
+    with nncp_registry.policy(
         name="test-localnet-nncp",
         desired_state=desired_state,
         node_selector={WORKER_NODE_LABEL_KEY: ""},
+        linger=True,
     ) as nncp:
-        nncp.wait_for_status_success()
         yield nncp
 
 
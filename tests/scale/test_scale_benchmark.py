@@ -1,21 +1,20 @@
 import datetime
+import json
 import logging
 import os
 import re
-import shlex
 import time
-from collections import Counter
+from dataclasses import asdict
+from itertools import islice
 
 import pytest
 import yaml
-from kubernetes.dynamic.exceptions import ForbiddenError
+from kubernetes.dynamic.exceptions import ForbiddenError, NotFoundError
 from ocp_resources.data_source import DataSource
 from ocp_resources.datavolume import DataVolume
+from ocp_resources.node import Node
 from ocp_resources.template import Template
-from ocp_resources.virtual_machine_instance_migration import (
-    VirtualMachineInstanceMigration,
-)
-from pyhelper_utils.shell import run_command
+from ocp_resources.virtual_machine import VirtualMachine
 from timeout_sampler import TimeoutExpiredError, TimeoutSampler
 
 from tests.os_params import (
@@ -31,31 +30,50 @@ from utilities.artifactory import (
     get_artifactory_config_map,
     get_artifactory_secret,
 )
+from utilities.bulk import (
+    DEFAULT_API_REQUESTS_PER_SECOND,
+    DEFAULT_BULK_WORKERS,
+    collect_vm_start_timings,
+    delete_collection,
+    delete_resources_in_parallel,
+    deploy_resources_in_parallel,
+    migrate_vms_in_waves,
+    sample_vms_health,
+    vm_start_latency_histograms,
+    wait_for_vmis_running,
+)
 from utilities.constants import (
-    NODE_STR,
     OS_FLAVOR_FEDORA,
     OS_FLAVOR_RHEL,
     OS_FLAVOR_WINDOWS,
     TIMEOUT_1MIN,
+    TIMEOUT_10MIN,
     TIMEOUT_30MIN,
+    TIMEOUT_60MIN,
     StorageClassNames,
 )
+from utilities.data_collector import get_data_collector_base_directory, write_to_file
+from utilities.data_volume_import import DEFAULT_IMPORTS_PER_STORAGE_CLASS, import_data_volumes
 from utilities.infra import (
     create_ns,
 )
 from utilities.must_gather import run_must_gather
+from utilities.resource_usage import DEFAULT_RESOURCE_USAGE_INTERVAL, ResourceUsageRecorder
+from utilities.scale_ramp import RAMP_PROFILE_CONSTANT, find_saturation, ramp_batch_sizes, run_vms_batch
 from utilities.storage import generate_data_source_dict, get_test_artifact_server_url
 from utilities.virt import (
     VirtualMachineForTestsFromTemplate,
     verify_vm_migrated,
-    wait_for_migration_finished,
 )
 
 LOGGER = logging.getLogger(__name__)
 OCS = "ocs"
 NFS = "nfs"
-VMI_SOURCE_POD_STR = "vmi_source_pod"
-MIGRATION_INSTANCE_STR = "migration_instance"
+VM_START_LATENCIES_FILE = "vm_start_latencies.json"
+VMS_HEALTH_FILE = "vms_health.json"
+MIGRATIONS_FILE = "vm_migrations.json"
+DELETIONS_FILE = "deletions.json"
+SATURATION_FILE = "saturation.json"
 
 SCALE_STORAGE_TYPES = {
     OCS: StorageClassNames.CEPH_RBD_VIRTUALIZATION,
@@ -64,47 +82,184 @@ SCALE_STORAGE_TYPES = {
 pytestmark = pytest.mark.scale
 
 
-def log_nodes_load_data(vms=None):
+def log_nodes_load_data(client, vms=None, health_samples=None):
     """
     Log the distribution of VM's on the nodes, and the cluster memory/cpu statistics
 
     Args:
+        client (DynamicClient): Client to use
         vms (list): List of vms to log statistics on
+        health_samples (list, optional): Time series to add the sample to
+
+    Returns:
+        VmsHealthSample: VMs health and nodes usage
     """
-    nodes_load_distribute = Counter([vm.vmi.node.name for vm in vms or []])
-    LOGGER.info(f"Nodes vm load distribution: {nodes_load_distribute or 'no scale VMs running'}")
-    cmd_succeeded, nodes_load_statistics, _ = run_command(
-        command=shlex.split("oc adm top nodes --use-protocol-buffers")
+    sample = sample_vms_health(client=client, vms=vms or [], nodes_usage=True)
+    LOGGER.info(f"Nodes vm load distribution: {sample.vms_per_node or 'no scale VMs running'}")
+    nodes_load_statistics = "\n".join(
+        f"{node}: CPU {usage['cpu_cores']:.2f} cores, memory {usage['memory_bytes'] / 2**30:.2f}Gi"
+        for node, usage in sorted(sample.nodes_usage.items())
     )
-    assert cmd_succeeded, "Failed to get nodes status"
     LOGGER.info(f"Nodes load statistics:\n {nodes_load_statistics}")
+    if health_samples is not None:
+        health_samples.append(sample)
+    return sample
 
 
-def all_vms_running(vms):
+def all_vms_running(client, vms, health_samples):
     """
-    Check if all VMIs are in running state
+    Check if all VMIs are in running state, with one VMIs list and one node metrics read
 
     Args:
+        client (DynamicClient): Client to use
         vms (list): List of vms to verify
+        health_samples (list): Time series to add the sample to
 
     Returns:
         bool: True if all vms in running state, False otherwise
     """
-    num_of_running_vms = len([vm for vm in vms if vm.vmi.status == vm.Status.RUNNING])
-    LOGGER.info(f"Number of running vms: {num_of_running_vms}")
-    return num_of_running_vms == len(vms)
+    sample = log_nodes_load_data(client=client, vms=vms, health_samples=health_samples)
+    LOGGER.info(f"Number of running vms: {sample.running}, vms per phase: {sample.phases}")
+    return sample.all_running
+
+
+def scale_batch_sizes(scale_test_param, vms_per_batch, number_of_batches):
+    """
+    Get the VM batch sizes of the ramp profile configured in scale_params.yaml
+
+    Args:
+        scale_test_param (dict): Parameters dictionary of scale_params.yaml
+        vms_per_batch (int): Size of the first batch
+        number_of_batches (int): Number of batches
+
+    Returns:
+        list: Number of VMs of each batch
+    """
+    return list(
+        islice(
+            ramp_batch_sizes(
+                profile=scale_test_param.get("ramp_profile", RAMP_PROFILE_CONSTANT),
+                initial=vms_per_batch,
+                increment=scale_test_param.get("ramp_increment", 0),
+                factor=scale_test_param.get("ramp_factor", 2),
+                step_batches=scale_test_param.get("ramp_step_batches", 1),
+            ),
+            number_of_batches,
+        )
+    )
+
+
+def scale_vm(name, client, namespace, data_source, vm_info, run_strategy=None):
+    return VirtualMachineForTestsFromTemplate(
+        name=name,
+        namespace=namespace.name,
+        client=client,
+        cpu_cores=vm_info["cores"],
+        memory_requests=vm_info["memory"],
+        data_source=data_source,
+        labels=Template.generate_template_labels(**vm_info["latest_labels"]),
+        run_strategy=run_strategy or vm_info["run_strategy"],
+    )
+
+
+def report_saturation(summary, junitxml_property=None):
+    """
+    Save the saturation search summary as JSON in the data collector directory and as JUnit properties
+
+    Args:
+        summary (dict): Saturation search summary, see SaturationResult.summary
+        junitxml_property (function, optional): record_testsuite_property, if JUnit XML is enabled
+    """
+    LOGGER.info(f"Saturation search summary:\n{json.dumps(summary, indent=2)}")
+    write_to_file(
+        file_name=SATURATION_FILE,
+        content=json.dumps(summary, indent=2),
+        base_directory=scale_data_directory(),
+    )
+    if junitxml_property:
+        for name in ("max_sustainable_vms", "max_sustainable_vms_per_node", "knee_batch"):
+            junitxml_property(name=f"saturation_{name}", value=summary[name])
+
+
+def load_scale_params(scale_params_file):
+    with open(scale_params_file) as params_file:
+        return yaml.safe_load(stream=params_file)
+
+
+def scale_data_directory():
+    return os.path.join(get_data_collector_base_directory(), "scale")
+
+
+def scale_vm_group(vm_name):
+    """
+    Get the OS and storage type group of a scale VM from its name (vm-<os>-<storage type>-b<batch>-<index>)
+
+    Args:
+        vm_name (str): Scale VM name
+
+    Returns:
+        str: <os>-<storage type>
+    """
+    return re.sub(r"^vm-(.+)-b\d+-\d+$", r"\1", vm_name)
+
+
+def report_vm_start_latencies(histograms, junitxml_property=None):
+    """
+    Save the VM start latency histograms as JSON in the data collector directory and as JUnit properties
+
+    Args:
+        histograms (dict): Group name to start phase to its latency summary, see vm_start_latency_histograms
+        junitxml_property (function, optional): record_testsuite_property, if JUnit XML is enabled
+    """
+    LOGGER.info(f"VM start latencies (seconds):\n{json.dumps(histograms, indent=2)}")
+    write_to_file(
+        file_name=VM_START_LATENCIES_FILE,
+        content=json.dumps(histograms, indent=2),
+        base_directory=scale_data_directory(),
+    )
+    if junitxml_property:
+        for group, phases in histograms.items():
+            for phase, summary in phases.items():
+                for stat, value in summary.items():
+                    if stat != "count":
+                        junitxml_property(name=f"vm_start_{group}_{phase}_{stat}", value=value)
 
 
 def delete_resources(resources):
-    deleted_resources = []
-    for _resource in resources:
-        try:
-            _resource.delete()
-            deleted_resources.append(_resource)
-        except ForbiddenError:
-            pass
-    for _resource in deleted_resources:
-        _resource.wait_deleted()
+    """
+    Delete resources concurrently and wait for all of them with one watch per kind
+
+    Args:
+        resources (list): Resources to delete, resources the client is not allowed to delete are skipped
+
+    Returns:
+        DeletionReport: Deletion timings
+    """
+    return delete_resources_in_parallel(resources=resources, ignored_exceptions=(NotFoundError, ForbiddenError))
+
+
+def report_deletions(reports, junitxml_property=None):
+    """
+    Save the deletion summaries as JSON in the data collector directory and as JUnit properties
+
+    Args:
+        reports (dict): Name of the deleted resources group to its DeletionReport
+        junitxml_property (function, optional): record_testsuite_property, if JUnit XML is enabled
+    """
+    summaries = {name: report.summary() for name, report in reports.items()}
+    LOGGER.info(f"Deletion summary:\n{json.dumps(summaries, indent=2)}")
+    write_to_file(
+        file_name=DELETIONS_FILE,
+        content=json.dumps(summaries, indent=2),
+        base_directory=scale_data_directory(),
+    )
+    if junitxml_property:
+        for name, summary in summaries.items():
+            junitxml_property(name=f"delete_{name}_duration", value=summary["duration"])
+            junitxml_property(name=f"delete_{name}_per_second", value=summary["deletions_per_second"])
+            for stat, value in summary["deletion_duration"].items():
+                if stat != "count":
+                    junitxml_property(name=f"delete_{name}_duration_{stat}", value=value)
 
 
 def save_must_gather_logs(must_gather_image_url):
@@ -119,23 +274,44 @@ def save_must_gather_logs(must_gather_image_url):
     )
 
 
-def failure_finalizer(vms_list, must_gather_image_url):
-    log_nodes_load_data(vms=vms_list)
+def failure_finalizer(client, vms_list, must_gather_image_url):
+    log_nodes_load_data(client=client, vms=vms_list)
     logs_folders = save_must_gather_logs(must_gather_image_url=must_gather_image_url)
     pytest.fail(
         reason=f"Test failed, keeping the test environment. the must-gather logs are saved under {logs_folders}"
     )
 
 
-def start_live_migration(vm, client):
-    with VirtualMachineInstanceMigration(
-        name=vm.name,
-        namespace=vm.namespace,
-        vmi_name=vm.vmi.name,
-        teardown=False,
-        client=client,
-    ) as migration:
-        return migration
+def report_migrations(report, live_migration_config, junitxml_property=None):
+    """
+    Save the mass live migration summary and per VM results as JSON in the data collector directory,
+    and the summary as JUnit properties
+
+    Args:
+        report (MigrationReport): Mass live migration report
+        live_migration_config (dict): HyperConverged liveMigrationConfig the migrations ran with
+        junitxml_property (function, optional): record_testsuite_property, if JUnit XML is enabled
+    """
+    summary = report.summary()
+    LOGGER.info(f"Mass live migration summary:\n{json.dumps(summary, indent=2)}")
+    write_to_file(
+        file_name=MIGRATIONS_FILE,
+        content=json.dumps(
+            {
+                "live_migration_config": live_migration_config,
+                "summary": summary,
+                "migrations": [asdict(result) for result in report.results.values()],
+            },
+            indent=2,
+        ),
+        base_directory=scale_data_directory(),
+    )
+    if junitxml_property:
+        for name in ("migrations", "failed", "duration", "migrations_per_minute", "data_processed_bytes"):
+            junitxml_property(name=f"migration_{name}", value=summary[name])
+        for stat, value in summary["migration_duration"].items():
+            if stat != "count":
+                junitxml_property(name=f"migration_duration_{stat}", value=value)
 
 
 @pytest.fixture(scope="class")
@@ -144,7 +320,7 @@ def fail_if_param_vms_zero(expected_num_of_vms):
         pytest.fail(f"The sum of the VMs number in the scale_params.yaml file is {expected_num_of_vms}")
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="module")
 def keep_resources(scale_test_param):
     return scale_test_param["keep_resources"]
 
@@ -174,18 +350,21 @@ def expected_num_of_vms(scale_test_param):
         int: amount of total vms that should start
     """
     return sum([
-        sum([
-            os_vms[storage_type_key]["vms_per_batch"] * os_vms[storage_type_key]["number_of_batches"]
-            for storage_type_key in SCALE_STORAGE_TYPES
-        ])
+        sum(
+            scale_batch_sizes(
+                scale_test_param=scale_test_param,
+                vms_per_batch=os_vms[storage_type_key]["vms_per_batch"],
+                number_of_batches=os_vms[storage_type_key]["number_of_batches"],
+            )
+        )
         for os_vms in scale_test_param["vms"].values()
+        for storage_type_key in SCALE_STORAGE_TYPES
     ])
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="module")
 def scale_test_param(pytestconfig):
-    with open(pytestconfig.option.scale_params_file) as params_file:
-        return yaml.safe_load(stream=params_file)
+    return load_scale_params(scale_params_file=pytestconfig.option.scale_params_file)
 
 
 @pytest.fixture(scope="class")
@@ -195,10 +374,11 @@ def scale_namespace(admin_client, unprivileged_client, scale_test_param, keep_re
         name=scale_test_param["test_namespace"],
         teardown=not keep_resources,
         unprivileged_client=unprivileged_client,
+        bulk_delete_kinds=[VirtualMachine, DataVolume],
     )
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="module")
 def dvs_os_info():
     return {
         OS_FLAVOR_RHEL: {
@@ -216,7 +396,7 @@ def dvs_os_info():
     }
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="module")
 def dvs_info(scale_test_param, dvs_os_info):
     dvs_info = {}
     for os_name in dvs_os_info:
@@ -251,8 +431,8 @@ def vms_info(scale_test_param):
     return vms_info_dict
 
 
-@pytest.fixture(scope="class")
-def golden_images_scale_dvs(request, keep_resources, admin_client, golden_images_namespace, dvs_info):
+@pytest.fixture(scope="module")
+def golden_images_scale_dvs(request, keep_resources, admin_client, golden_images_namespace, dvs_info, scale_test_param):
     dvs_list = []
 
     def _delete_resources():
@@ -279,10 +459,17 @@ def golden_images_scale_dvs(request, keep_resources, admin_client, golden_images
                 secret=artifactory_secret,
                 cert_configmap=artifactory_config_map.name,
             )
-            golden_images_scale_dv.deploy()
             dvs_list.append(golden_images_scale_dv)
-    for dv in dvs_list:
-        dv.wait_for_status(status=DataVolume.Status.SUCCEEDED, timeout=TIMEOUT_30MIN)
+    # All golden images are imported at once, limited per storage class
+    for dv in import_data_volumes(
+        client=admin_client,
+        data_volumes=dvs_list,
+        imports_per_storage_class=scale_test_param.get(
+            "golden_images_imports_per_storage_class", DEFAULT_IMPORTS_PER_STORAGE_CLASS
+        ),
+        timeout=TIMEOUT_60MIN,
+    ):
+        LOGGER.info(f"Golden image {dv.name} is ready")
     yield dvs_list
 
     cleanup_artifactory_secret_and_config_map(
@@ -290,7 +477,7 @@ def golden_images_scale_dvs(request, keep_resources, admin_client, golden_images
     )
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="module")
 def data_sources(request, keep_resources, admin_client, golden_images_scale_dvs):
     data_sources = {}
 
@@ -323,6 +510,7 @@ def scale_vms(
     unprivileged_client,
     data_sources,
     scale_namespace,
+    scale_test_param,
     vms_info,
 ):
     """
@@ -336,39 +524,54 @@ def scale_vms(
 
     for os_type, vm_info in vms_info.items():
         for storage_type_key in SCALE_STORAGE_TYPES:
-            vm_base_name = f"{os_type}-{storage_type_key}"
-            num_of_vms_per_batch = vm_info[storage_type_key]["vms_per_batch"]
-            num_of_batches = vm_info[storage_type_key]["number_of_batches"]
-            for batch_number in range(num_of_batches):
-                vms_in_batch_list = []
-                for vm_index in range(num_of_vms_per_batch):
-                    vms_in_batch_list.append(
-                        VirtualMachineForTestsFromTemplate(
-                            name=f"vm-{vm_base_name}-b{batch_number}-{vm_index}",
-                            namespace=scale_namespace.name,
-                            client=unprivileged_client,
-                            cpu_cores=vm_info["cores"],
-                            memory_requests=vm_info["memory"],
-                            data_source=data_sources[f"{vm_base_name}-datasource"],
-                            labels=Template.generate_template_labels(**vm_info["latest_labels"]),
-                            run_strategy=vm_info["run_strategy"],
-                        )
+            for batch_number, num_of_vms_in_batch in enumerate(
+                scale_batch_sizes(
+                    scale_test_param=scale_test_param,
+                    vms_per_batch=vm_info[storage_type_key]["vms_per_batch"],
+                    number_of_batches=vm_info[storage_type_key]["number_of_batches"],
+                )
+            ):
+                vms_batches_list.append([
+                    scale_vm(
+                        name=f"vm-{os_type}-{storage_type_key}-b{batch_number}-{vm_index}",
+                        client=unprivileged_client,
+                        namespace=scale_namespace,
+                        data_source=data_sources[f"{os_type}-{storage_type_key}-datasource"],
+                        vm_info=vm_info,
                     )
-                vms_batches_list.append(vms_in_batch_list)
+                    for vm_index in range(num_of_vms_in_batch)
+                ])
     yield vms_batches_list
 
 
 @pytest.fixture(scope="class")
-def vm_migration_info(scale_vms, admin_client):
-    vm_migration_info = {}
-    for batch in scale_vms:
-        for vm in batch:
-            vm_migration_info[vm.name] = {
-                NODE_STR: vm.vmi.node,
-                VMI_SOURCE_POD_STR: vm.vmi.get_virt_launcher_pod(privileged_client=admin_client),
-                MIGRATION_INSTANCE_STR: start_live_migration(vm=vm, client=admin_client),
-            }
-    return vm_migration_info
+def vms_health_samples():
+    """VMs health time series of the stability check, saved as JSON in the data collector directory"""
+    samples = []
+    yield samples
+    if samples:
+        write_to_file(
+            file_name=VMS_HEALTH_FILE,
+            content=json.dumps([asdict(sample) for sample in samples], indent=2),
+            base_directory=scale_data_directory(),
+        )
+
+
+@pytest.fixture(scope="class")
+def resource_usage_recorder(admin_client, scale_test_param):
+    """Nodes and virt-launcher pods CPU and memory usage time series, recorded during the whole scale test"""
+    with ResourceUsageRecorder(
+        client=admin_client,
+        output_directory=scale_data_directory(),
+        interval=scale_test_param.get("resource_usage_interval", DEFAULT_RESOURCE_USAGE_INTERVAL),
+    ) as recorder:
+        yield recorder
+
+
+@pytest.fixture(scope="class")
+def vms_start_requested_times():
+    """VM name to the time (seconds since the epoch) it was requested to start, filled by the tests"""
+    return {}
 
 
 @pytest.fixture(scope="class")
@@ -379,65 +582,102 @@ def all_vms_objects(scale_vms):
     return all_vms_objects
 
 
+@pytest.mark.usefixtures("resource_usage_recorder")
 class TestScale:
     @pytest.mark.dependency(name="test_create_vms")
     @pytest.mark.polarion("CNV-8447")
     def test_create_vms(
         self,
+        admin_client,
         fail_if_param_vms_zero,
+        scale_test_param,
         scale_vms,
+        vms_start_requested_times,
     ):
-        log_nodes_load_data()
+        log_nodes_load_data(client=admin_client)
         for batch in scale_vms:
-            for vm in batch:
-                vm.deploy()
+            timings = deploy_resources_in_parallel(
+                resources=batch,
+                max_workers=scale_test_param.get("provisioning_workers", DEFAULT_BULK_WORKERS),
+                api_requests_per_second=scale_test_param.get(
+                    "api_requests_per_second", DEFAULT_API_REQUESTS_PER_SECOND
+                ),
+            )
+            # VMs with runStrategy Always start when created, the others are restarted by test_start_vms
+            vms_start_requested_times.update({name: timing.submitted for name, timing in timings.items()})
 
     @pytest.mark.dependency(
         name="test_start_vms",
         depends=["test_create_vms"],
     )
     @pytest.mark.polarion("CNV-8448")
-    def test_start_vms(self, scale_test_param, scale_vms, all_vms_objects, must_gather_image_url):
+    def test_start_vms(
+        self,
+        admin_client,
+        junitxml_plugin,
+        scale_test_param,
+        scale_vms,
+        all_vms_objects,
+        vms_start_requested_times,
+        must_gather_image_url,
+    ):
         for batch in scale_vms:
             for vm in batch:
                 if vm.instance.spec.runStrategy == vm.RunStrategy.ALWAYS:
                     continue
+                vms_start_requested_times[vm.name] = time.time()
                 vm.start()
             time.sleep(scale_test_param["seconds_between_batches"])
-        for batch in scale_vms:
-            for vm in batch:
-                try:
-                    vm.vmi.wait(timeout=TIMEOUT_30MIN)
-                    vm.vmi.wait_until_running()
-                except TimeoutExpiredError:
-                    LOGGER.error("Could not start new VM, running must-gather, check cluster capacity.")
-                    failure_finalizer(
-                        vms_list=all_vms_objects,
-                        must_gather_image_url=must_gather_image_url,
-                    )
+        try:
+            wait_for_vmis_running(client=admin_client, vms=all_vms_objects, timeout=TIMEOUT_30MIN)
+        except TimeoutExpiredError:
+            LOGGER.error("Could not start new VM, running must-gather, check cluster capacity.")
+            failure_finalizer(
+                client=admin_client,
+                vms_list=all_vms_objects,
+                must_gather_image_url=must_gather_image_url,
+            )
+
+        report_vm_start_latencies(
+            histograms=vm_start_latency_histograms(
+                timings=collect_vm_start_timings(
+                    client=admin_client,
+                    vms=all_vms_objects,
+                    requested=vms_start_requested_times,
+                    agent_timeout=scale_test_param.get("guest_agent_timeout", TIMEOUT_10MIN),
+                ),
+                group_of=scale_vm_group,
+            ),
+            junitxml_property=junitxml_plugin,
+        )
 
     # TODO check the os internally to see if it didn't reboot
     @pytest.mark.dependency(name="test_scale_vms_running_stability", depends=["test_start_vms"])
     @pytest.mark.polarion("CNV-8449")
     def test_scale_vms_running_stability(
         self,
+        admin_client,
         scale_test_param,
         all_vms_objects,
+        vms_health_samples,
         must_gather_image_url,
     ):
-        log_nodes_load_data(vms=all_vms_objects)
+        log_nodes_load_data(client=admin_client, vms=all_vms_objects, health_samples=vms_health_samples)
         LOGGER.info("Verifying all VMS are running")
         try:
             sampler = TimeoutSampler(
                 wait_timeout=scale_test_param["test_duration"] * TIMEOUT_1MIN,
                 sleep=scale_test_param["vms_verification_interval"] * TIMEOUT_1MIN,
                 func=all_vms_running,
+                client=admin_client,
                 vms=all_vms_objects,
+                health_samples=vms_health_samples,
             )
             for vms_are_ready in sampler:
                 if not vms_are_ready:
                     LOGGER.error("VMs check failed, running must gather to collect data.")
                     failure_finalizer(
+                        client=admin_client,
                         vms_list=all_vms_objects,
                         must_gather_image_url=must_gather_image_url,
                     )
@@ -449,30 +689,150 @@ class TestScale:
     def test_mass_vm_live_migration(
         self,
         skip_if_not_run_live_migration,
-        scale_vms,
-        vm_migration_info,
+        admin_client,
+        junitxml_plugin,
+        prometheus,
+        hyperconverged_resource_scope_class,
+        scale_test_param,
+        all_vms_objects,
     ):
-        for batch in scale_vms:
-            for vm in batch:
-                wait_for_migration_finished(
-                    namespace=vm.namespace,
-                    migration=vm_migration_info[vm.name][MIGRATION_INSTANCE_STR],
-                )
-                verify_vm_migrated(
-                    vm=vm,
-                    node_before=vm_migration_info[vm.name][NODE_STR],
-                )
+        report = migrate_vms_in_waves(
+            client=admin_client,
+            vms=all_vms_objects,
+            wave_size=scale_test_param.get("migration_wave_size", 0),
+            max_workers=scale_test_param.get("provisioning_workers", DEFAULT_BULK_WORKERS),
+            api_requests_per_second=scale_test_param.get("api_requests_per_second", DEFAULT_API_REQUESTS_PER_SECOND),
+            prometheus=prometheus,
+        )
+        report_migrations(
+            report=report,
+            live_migration_config=hyperconverged_resource_scope_class.instance.to_dict()["spec"].get(
+                "liveMigrationConfig", {}
+            ),
+            junitxml_property=junitxml_plugin,
+        )
+        assert not report.failed, f"Failed migrations: {report.failed}"
+        for vm in all_vms_objects:
+            verify_vm_migrated(
+                vm=vm,
+                node_before=Node(name=report.results[vm.name].source_node, client=admin_client),
+            )
 
     @pytest.mark.order(after="test_scale_vms_running_stability")
     @pytest.mark.polarion("CNV-8883")
     def test_delete_resources(
         self,
         skip_if_keep_resources,
+        admin_client,
+        junitxml_plugin,
         golden_images_scale_dvs,
         data_sources,
+        saturation_search_param,
         scale_namespace,
         scale_vms,
         all_vms_objects,
     ):
-        # TODO record time for the deletion of VMs and the cloned DVs
-        delete_resources(resources=list(data_sources.values()) + golden_images_scale_dvs + all_vms_objects)
+        reports = {
+            "vms": delete_resources(resources=all_vms_objects),
+            # DataVolumes cloned for the VMs, left to the garbage collector by the VMs deletion
+            "vms_dvs": delete_collection(client=admin_client, resource_kind=DataVolume, namespace=scale_namespace.name),
+        }
+        # The saturation search uses the same golden images, they are deleted by their fixtures teardown after it
+        if not saturation_search_param.get("enabled"):
+            reports["golden_images"] = delete_resources(resources=list(data_sources.values()) + golden_images_scale_dvs)
+        report_deletions(reports=reports, junitxml_property=junitxml_plugin)
+
+
+@pytest.fixture(scope="module")
+def saturation_search_param(scale_test_param):
+    return scale_test_param.get("saturation_search", {})
+
+
+@pytest.fixture(scope="module")
+def skip_if_not_saturation_search(saturation_search_param):
+    if not saturation_search_param.get("enabled"):
+        pytest.skip("Skipping saturation search, saturation_search enabled parameter is not set")
+
+
+@pytest.fixture(scope="class")
+def saturation_namespace(admin_client, unprivileged_client, scale_test_param, keep_resources):
+    yield from create_ns(
+        admin_client=admin_client,
+        name=f"{scale_test_param['test_namespace']}-saturation",
+        teardown=not keep_resources,
+        unprivileged_client=unprivileged_client,
+        bulk_delete_kinds=[VirtualMachine, DataVolume],
+    )
+
+
+@pytest.fixture(scope="class")
+def saturation_vms(request, keep_resources):
+    """VMs added by the saturation search, deleted at the end unless keep_resources is set"""
+    vms = []
+    if not keep_resources:
+        request.addfinalizer(lambda: delete_resources(resources=vms))
+    return vms
+
+
+# Module scoped and requested first, so it skips before the golden images and namespace fixtures are set up
+@pytest.mark.usefixtures("skip_if_not_saturation_search")
+class TestScaleSaturation:
+    def test_find_saturation(
+        self,
+        admin_client,
+        unprivileged_client,
+        junitxml_plugin,
+        schedulable_nodes,
+        scale_test_param,
+        saturation_search_param,
+        saturation_namespace,
+        data_sources,
+        vms_info,
+        saturation_vms,
+    ):
+        os_type = saturation_search_param["os"]
+        storage_type = saturation_search_param["storage_type"]
+        data_source_name = f"{os_type}-{storage_type}-datasource"
+        assert data_source_name in data_sources, (
+            f"No {os_type} {storage_type} golden image, set {os_type} {storage_type} VMs in the vms parameter"
+        )
+
+        def _run_batch(batch, size, total_vms):
+            vms = [
+                scale_vm(
+                    name=f"vm-{os_type}-{storage_type}-s{batch}-{vm_index}",
+                    client=unprivileged_client,
+                    namespace=saturation_namespace,
+                    data_source=data_sources[data_source_name],
+                    vm_info=vms_info[os_type],
+                    run_strategy=VirtualMachine.RunStrategy.ALWAYS,
+                )
+                for vm_index in range(size)
+            ]
+            saturation_vms.extend(vms)
+            return run_vms_batch(
+                client=admin_client,
+                vms=vms,
+                batch=batch,
+                total_vms=total_vms,
+                timeout=saturation_search_param.get("batch_timeout", TIMEOUT_30MIN),
+                max_workers=scale_test_param.get("provisioning_workers", DEFAULT_BULK_WORKERS),
+                api_requests_per_second=scale_test_param.get(
+                    "api_requests_per_second", DEFAULT_API_REQUESTS_PER_SECOND
+                ),
+            )
+
+        result = find_saturation(
+            run_batch=_run_batch,
+            batch_sizes=ramp_batch_sizes(
+                profile=saturation_search_param.get("ramp_profile", RAMP_PROFILE_CONSTANT),
+                initial=saturation_search_param["initial_batch_size"],
+                increment=saturation_search_param.get("ramp_increment", 0),
+                factor=saturation_search_param.get("ramp_factor", 2),
+                step_batches=saturation_search_param.get("ramp_step_batches", 1),
+            ),
+            latency_threshold=saturation_search_param["latency_threshold_seconds"],
+            failure_rate_threshold=saturation_search_param["failure_rate_threshold"],
+            max_vms=saturation_search_param["max_vms"],
+        )
+        report_saturation(summary=result.summary(nodes=len(schedulable_nodes)), junitxml_property=junitxml_plugin)
@@ -30,6 +30,7 @@ from utilities.artifactory import (
     get_artifactory_secret,
     get_http_image_url,
 )
+from utilities.bulk import DEFAULT_BULK_WORKERS, provision_vms
 from utilities.constants import (
     DISK_SERIAL,
     NODE_HUGE_PAGES_1GI_KEY,
@@ -78,10 +79,13 @@ def create_vms(
     ssh=True,
     node_selector_labels=None,
     cpu_model=None,
+    max_workers=DEFAULT_BULK_WORKERS,
 ):
     """
     Create n number of fedora vms.
 
+    The VMs are created concurrently, see utilities.bulk.provision_vms.
+
     Args:
         name_prefix (str): prefix to be used to name virtualmachines
         namespace_name (str): Namespace to be used for vm creation
@@ -90,6 +94,7 @@ def create_vms(
         client (DynamicClient): DynamicClient object
         ssh (bool): enable SSH on the VM
         cpu_model (str): CPU model to be used for the VMs
+        max_workers (int): Maximum number of VMs created in parallel
 
     Returns:
         list: List of VirtualMachineForTests
@@ -97,18 +102,20 @@ def create_vms(
     vms_list = []
     for idx in range(vm_count):
         vm_name = f"{name_prefix}-{idx}"
-        with VirtualMachineForTests(
-            name=vm_name,
-            namespace=namespace_name,
-            body=fedora_vm_body(name=vm_name),
-            node_selector_labels=node_selector_labels,
-            teardown=False,
-            run_strategy=VirtualMachine.RunStrategy.ALWAYS,
-            ssh=ssh,
-            client=client,
-            cpu_model=cpu_model,
-        ) as vm:
-            vms_list.append(vm)
+        vms_list.append(
+            VirtualMachineForTests(
+                name=vm_name,
+                namespace=namespace_name,
+                body=fedora_vm_body(name=vm_name),
+                node_selector_labels=node_selector_labels,
+                teardown=False,
+                run_strategy=VirtualMachine.RunStrategy.ALWAYS,
+                ssh=ssh,
+                client=client,
+                cpu_model=cpu_model,
+            )
+        )
+    provision_vms(client=client, vms=vms_list, max_workers=max_workers, wait_for_running=False)
     return vms_list
 
 
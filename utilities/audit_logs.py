@@ -0,0 +1,270 @@
+import json
+import logging
+import queue
+import shlex
+import subprocess
+import tempfile
+import threading
+import time
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from timeout_sampler import TimeoutExpiredError, retry
+
+from utilities.constants import (
+    AUDIT_LOGS_PATH,
+    OC_ADM_LOGS_COMMAND,
+    TIMEOUT_1SEC,
+    TIMEOUT_3MIN,
+    TIMEOUT_4MIN,
+    TIMEOUT_10SEC,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_AUDIT_LOG_WORKERS = 6
+# Matching entries waiting to be consumed; workers block when the consumer falls behind
+AUDIT_LOG_QUEUE_SIZE = 1000
+# Time in seconds to read one audit log file, a stuck node-logs stream is killed after it
+AUDIT_LOG_FILE_TIMEOUT = TIMEOUT_3MIN
+ROTATED_AUDIT_LOG_ERROR = "404 page not found"
+_SCAN_DONE = object()
+
+
+@dataclass
+class AuditLogScanStats:
+    """Audit log scan counters, updated by all scanning workers."""
+
+    files: int = 0
+    lines: int = 0
+    bytes: int = 0
+    matched: int = 0
+    duplicates: int = 0
+    duration: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, **counters: int) -> None:
+        with self._lock:
+            for name, value in counters.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.bytes / 2**20 / self.duration if self.duration else 0.0
+
+
+def audit_log_entry_key(entry: dict[str, Any]) -> tuple[str, str, str]:
+    """
+    Get the identity of an audit log entry; entries of repeated calls (same client, object and annotations) share it.
+
+    Args:
+        entry (dict): Parsed audit log entry
+
+    Returns:
+        tuple: userAgent, objectRef and annotations of the entry
+    """
+    return (
+        entry.get("userAgent", ""),
+        json.dumps(entry.get("objectRef"), sort_keys=True),
+        json.dumps(entry.get("annotations"), sort_keys=True),
+    )
+
+
+def _put(entries: queue.Queue, stop: threading.Event, item: Any) -> bool:
+    """Put an item in a bounded queue unless the scan is stopped; returns False if it was."""
+    while not stop.is_set():
+        try:
+            entries.put(item, timeout=TIMEOUT_1SEC)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+@retry(wait_timeout=TIMEOUT_4MIN, sleep=TIMEOUT_10SEC, exceptions_dict={RuntimeError: []})
+def _scan_node_audit_log(
+    node: str,
+    log: str,
+    log_entry: str,
+    entries: queue.Queue,
+    stop: threading.Event,
+    stats: AuditLogScanStats,
+) -> bool:
+    with tempfile.TemporaryFile(mode="w+") as stderr:
+        with subprocess.Popen(
+            args=shlex.split(f"{OC_ADM_LOGS_COMMAND} {node} {AUDIT_LOGS_PATH}/{log}"),
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            text=True,
+        ) as process:
+            timed_out = threading.Event()
+
+            def _kill_on_deadline() -> None:
+                timed_out.set()
+                process.kill()
+
+            deadline = threading.Timer(interval=AUDIT_LOG_FILE_TIMEOUT, function=_kill_on_deadline)
+            deadline.daemon = True
+            deadline.start()
+            lines = bytes_read = matched = 0
+            try:
+                for line in process.stdout:
+                    # Checked on every line, a file with few matching lines is not read to its end once stopped
+                    if stop.is_set():
+                        process.kill()
+                        return True
+
+                    lines += 1
+                    bytes_read += len(line)
+                    if log_entry not in line:
+                        continue
+
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        LOGGER.error(f"Unable to parse line: {line!r}")
+                        raise
+
+                    matched += 1
+                    if not _put(entries=entries, stop=stop, item=entry):
+                        process.kill()
+                        return True
+            except BaseException:
+                process.kill()
+                raise
+            finally:
+                deadline.cancel()
+                stats.add(lines=lines, bytes=bytes_read, matched=matched)
+
+        if timed_out.is_set():
+            LOGGER.warning(f"Reading {log} of node {node} took more than {AUDIT_LOG_FILE_TIMEOUT}s, killed")
+            raise subprocess.TimeoutExpired(cmd=process.args, timeout=AUDIT_LOG_FILE_TIMEOUT)
+
+        if process.returncode:
+            stderr.seek(0)
+            error = stderr.read()
+            if ROTATED_AUDIT_LOG_ERROR in error:
+                LOGGER.warning(f"Skipping {log} check as it was rotated:\n{error}")
+                return True
+
+            LOGGER.warning(f"oc command failed for node {node}, log {log}:\n{error}")
+            raise RuntimeError(error)
+
+    stats.add(files=1)
+    return True
+
+
+def scan_node_audit_log(
+    node: str,
+    log: str,
+    log_entry: str,
+    entries: queue.Queue,
+    stop: threading.Event,
+    stats: AuditLogScanStats,
+) -> bool:
+    """
+    Stream one audit log file of a node and put its entries matching `log_entry` in `entries`, line by line.
+
+    Reading a file is limited to AUDIT_LOG_FILE_TIMEOUT seconds; a stuck stream is killed and not retried.
+
+    A retried file may put entries again, consumers de-duplicate them (see scan_audit_logs).
+
+    Args:
+        node (str): Node name
+        log (str): Audit log file name
+        log_entry (str): Text matching lines must contain
+        entries (Queue): Queue of parsed matching entries
+        stop (Event): Set by the consumer to stop the scan, checked on every line
+        stats (AuditLogScanStats): Scan counters
+
+    Returns:
+        bool: True when the file was scanned, rotated meanwhile or the scan was stopped
+
+    Raises:
+        TimeoutExpiredError: If reading the file kept failing
+        subprocess.TimeoutExpired: If reading the file took more than AUDIT_LOG_FILE_TIMEOUT seconds
+        json.JSONDecodeError: If a matching line is not a JSON entry
+    """
+    try:
+        return _scan_node_audit_log(node=node, log=log, log_entry=log_entry, entries=entries, stop=stop, stats=stats)
+    except TimeoutExpiredError as exp:
+        # A malformed line or a stuck stream is not retried, raise its own error
+        if isinstance(exp.last_exp, json.JSONDecodeError | subprocess.TimeoutExpired):
+            raise exp.last_exp from exp
+        raise
+
+
+def scan_audit_logs(
+    nodes_logs: dict[str, list[str]],
+    log_entry: str,
+    max_workers: int = DEFAULT_AUDIT_LOG_WORKERS,
+    stats: AuditLogScanStats | None = None,
+) -> Generator[dict[str, Any], None, None]:
+    """
+    Scan audit log files of many nodes concurrently and yield their unique entries matching `log_entry`.
+
+    Files are streamed, never held in memory; identical entries (see audit_log_entry_key) are yielded once.
+    Closing the generator stops the scan.
+
+    Args:
+        nodes_logs (dict): Node name to its audit log file names
+        log_entry (str): Text matching lines must contain
+        max_workers (int): Maximum number of files scanned concurrently
+        stats (AuditLogScanStats, optional): Scan counters to update, for reporting by the caller
+
+    Yields:
+        dict: Parsed audit log entry
+
+    Raises:
+        TimeoutExpiredError: If a file could not be read
+        subprocess.TimeoutExpired: If reading a file took more than AUDIT_LOG_FILE_TIMEOUT seconds
+        json.JSONDecodeError: If a matching line is not a JSON entry
+    """
+    stats = stats or AuditLogScanStats()
+    entries: queue.Queue = queue.Queue(maxsize=AUDIT_LOG_QUEUE_SIZE)
+    stop = threading.Event()
+    seen_entries: set[tuple[str, str, str]] = set()
+    files = [(node, log) for node, logs in nodes_logs.items() for log in logs]
+
+    def _scan(_node: str, _log: str) -> None:
+        try:
+            scan_node_audit_log(node=_node, log=_log, log_entry=log_entry, entries=entries, stop=stop, stats=stats)
+        except Exception as exp:
+            _put(entries=entries, stop=stop, item=exp)
+        _put(entries=entries, stop=stop, item=_SCAN_DONE)
+
+    LOGGER.info(f"Scanning {len(files)} audit logs of {len(nodes_logs)} nodes with {max_workers} workers")
+    start_time = time.monotonic()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        for node, log in files:
+            executor.submit(_scan, _node=node, _log=log)
+
+        scanned_files = 0
+        while scanned_files < len(files):
+            item = entries.get()
+            if item is _SCAN_DONE:
+                scanned_files += 1
+                continue
+
+            if isinstance(item, Exception):
+                raise item
+
+            if (entry_key := audit_log_entry_key(entry=item)) in seen_entries:
+                stats.add(duplicates=1)
+                continue
+
+            seen_entries.add(entry_key)
+            yield item
+
+    finally:
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+        stats.duration = time.monotonic() - start_time
+        LOGGER.info(
+            f"Scanned {stats.files} audit logs, {stats.lines} lines ({stats.bytes / 2**20:.1f} MiB) in "
+            f"{stats.duration:.1f}s ({stats.megabytes_per_second:.1f} MiB/s): {stats.matched} matching entries, "
+            f"{stats.duplicates} duplicates"
+        )
@@ -0,0 +1,341 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+from dataclasses import dataclass
+from typing import IO, Any
+
+import requests
+import urllib3
+
+from utilities.constants import TIMEOUT_10MIN, TIMEOUT_30SEC
+
+LOGGER = logging.getLogger(__name__)
+
+# Directory of the on-disk cache, shared by processes and sessions; no on-disk cache if not set
+BINARY_CACHE_DIR_ENV_VAR = "CNV_TESTS_BINARY_CACHE_DIR"
+BINARY_CACHE_METADATA_FILE = "metadata.json"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+ZIP_FILE_EXTENSION = ".zip"
+
+
+class BinaryDownloadError(Exception):
+    def __init__(self, url: str, reason: str) -> None:
+        self.url = url
+        self.reason = reason
+
+    def __str__(self) -> str:
+        return f"Failed to download a binary from {self.url}: {self.reason}"
+
+
+class _CountingReader:
+    """Read-only file object counting the bytes read from `source`."""
+
+    def __init__(self, source: IO[bytes]) -> None:
+        self.source = source
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.source.read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def copy_with_sha256(source: IO[bytes], destination: IO[bytes]) -> str:
+    """
+    Copy a file object to another one, hashing the content on the way.
+
+    Args:
+        source (IO): File object to read
+        destination (IO): File object to write
+
+    Returns:
+        str: sha256 hex digest of the copied content
+    """
+    sha256 = hashlib.sha256()
+    while chunk := source.read(DOWNLOAD_CHUNK_SIZE):
+        sha256.update(chunk)
+        destination.write(chunk)
+    return sha256.hexdigest()
+
+
+def file_sha256(path: str) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as fd:
+        while chunk := fd.read(DOWNLOAD_CHUNK_SIZE):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def extract_single_file(archive: IO[bytes], url: str, destination: IO[bytes]) -> tuple[str, str]:
+    """
+    Extract the single file of a tar (any compression) or zip archive stream.
+
+    Tar archives are extracted while they are read, without storing the archive; zip archives need a seekable file and
+    are spooled to a temporary file first. The whole archive is read, so the gzip and zip CRCs are verified.
+
+    Args:
+        archive (IO): Archive stream, e.g. the raw HTTP response
+        url (str): Archive URL, zip archives are detected by its extension
+        destination (IO): File object the extracted file is written to
+
+    Returns:
+        tuple[str, str]: Extracted file base name and its sha256 hex digest
+
+    Raises:
+        BinaryDownloadError: If the archive does not hold exactly one file
+    """
+    names, sha256 = [], ""
+    if url.endswith(ZIP_FILE_EXTENSION):
+        with tempfile.TemporaryFile() as zip_file:
+            shutil.copyfileobj(archive, zip_file, DOWNLOAD_CHUNK_SIZE)
+            with zipfile.ZipFile(file=zip_file) as zip_archive:
+                names = [name for name in zip_archive.namelist() if not name.endswith("/")]
+                if len(names) == 1:
+                    with zip_archive.open(names[0]) as member:
+                        sha256 = copy_with_sha256(source=member, destination=destination)
+    else:
+        with tarfile.open(fileobj=archive, mode="r|*") as tar_archive:
+            for member in tar_archive:
+                if not member.isfile():
+                    continue
+
+                names.append(member.name)
+                if len(names) == 1:
+                    sha256 = copy_with_sha256(source=tar_archive.extractfile(member), destination=destination)
+
+    if len(names) != 1:
+        raise BinaryDownloadError(url=url, reason=f"Only a single file expected in archive: files={names}")
+
+    return os.path.basename(names[0]), sha256
+
+
+def download_binary(url: str, destination: IO[bytes]) -> tuple[str, str]:
+    """
+    Download an archive and extract its single file straight from the HTTP response.
+
+    Args:
+        url (str): Archive URL
+        destination (IO): File object the extracted file is written to
+
+    Returns:
+        tuple[str, str]: Extracted file base name and its sha256 hex digest
+
+    Raises:
+        BinaryDownloadError: If the archive is truncated or does not hold exactly one file
+    """
+    LOGGER.info(f"Downloading archive using: url={url}")
+    urllib3.disable_warnings()  # TODO: remove this when we fix the SSL warning
+    with requests.get(url, verify=False, stream=True, timeout=TIMEOUT_10MIN) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        archive = _CountingReader(source=response.raw)
+        name, sha256 = extract_single_file(archive=archive, url=url, destination=destination)
+        # Read what is left after the archive end, then compare with the announced size (not known if encoded)
+        while archive.read(DOWNLOAD_CHUNK_SIZE):
+            pass
+        content_length = response.headers.get("Content-Length")
+        if (
+            content_length
+            and not response.headers.get("Content-Encoding")
+            and archive.bytes_read != int(content_length)
+        ):
+            raise BinaryDownloadError(
+                url=url, reason=f"Received {archive.bytes_read} bytes, expected {content_length} bytes"
+            )
+
+    LOGGER.info(f"Downloaded file: {name}")
+    return name, sha256
+
+
+def download_binary_to_directory(url: str, directory: str) -> tuple[str, str]:
+    """
+    Download the single file of an archive into a directory, see download_binary.
+
+    The file is written to a temporary file and renamed, so other processes never read a partial file.
+
+    Args:
+        url (str): Archive URL
+        directory (str): Directory of the extracted file
+
+    Returns:
+        tuple[str, str]: Extracted file path and its sha256 hex digest
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            name, sha256 = download_binary(url=url, destination=tmp_file)
+        path = os.path.join(directory, name)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+    return path, sha256
+
+
+def url_validator(url: str) -> str:
+    """
+    Get the validator of a URL content, its ETag or else its Last-Modified and Content-Length, with a HEAD request.
+
+    Args:
+        url (str): URL
+
+    Returns:
+        str: Validator, empty string if the server sent none or the request failed
+    """
+    urllib3.disable_warnings()  # TODO: remove this when we fix the SSL warning
+    try:
+        response = requests.head(url, verify=False, allow_redirects=True, timeout=TIMEOUT_30SEC)
+        response.raise_for_status()
+    except requests.RequestException as exp:
+        LOGGER.warning(f"Failed to get the validator of {url}: {exp}")
+        return ""
+
+    if etag := response.headers.get("ETag"):
+        return etag
+
+    if last_modified := response.headers.get("Last-Modified"):
+        return f"{last_modified}|{response.headers.get('Content-Length', '')}"
+
+    return ""
+
+
+@dataclass
+class BinaryCacheStats:
+    hits: int = 0
+    downloads: int = 0
+
+
+class BinaryCache:
+    def __init__(self, cache_dir: str | None = None) -> None:
+        """
+        Cache of binaries downloaded from archive URLs (e.g. ConsoleCLIDownload links), optionally persisted on disk.
+
+        Entries are keyed by URL, server version and the URL content validator (ETag, or Last-Modified and
+        Content-Length), so a cluster upgrade or a new binary behind the same URL downloads again. Each entry is a
+        directory with the binary and its metadata (written last, an entry without it is incomplete) including the
+        binary sha256, verified on every hit. Storing an entry removes the older entries of its URL.
+
+        Args:
+            cache_dir (str, optional): Directory of the on-disk cache
+        """
+        self.cache_dir = cache_dir
+        self.stats = BinaryCacheStats()
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def cache_key(url: str, server_version: str, validator: str) -> str:
+        return hashlib.sha256(f"{url}|{server_version}|{validator}".encode()).hexdigest()
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            setattr(self.stats, stat, getattr(self.stats, stat) + 1)
+
+    def _read_metadata(self, entry_dir: str) -> dict[str, Any] | None:
+        try:
+            with open(os.path.join(entry_dir, BINARY_CACHE_METADATA_FILE)) as fd:
+                return json.load(fd)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exp:
+            LOGGER.warning(f"Ignoring unreadable binary cache entry {entry_dir}: {exp}")
+            return None
+
+    def _cached_binary(self, key: str) -> str | None:
+        entry_dir = os.path.join(self.cache_dir, key)
+        if not (metadata := self._read_metadata(entry_dir=entry_dir)):
+            return None
+
+        binary = os.path.join(entry_dir, metadata["name"])
+        try:
+            sha256 = file_sha256(path=binary)
+        except OSError as exp:
+            LOGGER.warning(f"Ignoring binary cache entry {entry_dir}: {exp}")
+            return None
+
+        if sha256 != metadata["sha256"]:
+            LOGGER.warning(
+                f"Ignoring corrupted binary cache entry {entry_dir}: sha256 {sha256} != {metadata['sha256']}"
+            )
+            return None
+
+        return binary
+
+    def _store(self, key: str, url: str, server_version: str, validator: str) -> str:
+        entry_dir = os.path.join(self.cache_dir, key)
+        os.makedirs(entry_dir, exist_ok=True)
+        binary, sha256 = download_binary_to_directory(url=url, directory=entry_dir)
+
+        metadata = {
+            "url": url,
+            "server_version": server_version,
+            "validator": validator,
+            "name": os.path.basename(binary),
+            "sha256": sha256,
+            "downloaded": time.time(),
+        }
+        fd, tmp_metadata = tempfile.mkstemp(dir=entry_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as tmp_file:
+            json.dump(metadata, tmp_file)
+        os.replace(tmp_metadata, os.path.join(entry_dir, BINARY_CACHE_METADATA_FILE))
+        self._prune(url=url, keep_key=key)
+        return binary
+
+    def _prune(self, url: str, keep_key: str) -> None:
+        for key in os.listdir(self.cache_dir):
+            entry_dir = os.path.join(self.cache_dir, key)
+            if key == keep_key or not os.path.isdir(entry_dir):
+                continue
+
+            if (metadata := self._read_metadata(entry_dir=entry_dir)) and metadata["url"] == url:
+                LOGGER.info(f"Removing outdated binary cache entry {entry_dir}")
+                shutil.rmtree(entry_dir, ignore_errors=True)
+
+    def get(self, url: str, dest_dir: str, server_version: str = "") -> str:
+        """
+        Get the binary of an archive URL into `dest_dir`, from the cache or downloaded (and cached).
+
+        Args:
+            url (str): Archive URL, the archive holds a single file
+            dest_dir (str): Directory the binary is copied (or, without an on-disk cache, downloaded) to
+            server_version (str): Version of the server the binary comes from, e.g. the cluster version
+
+        Returns:
+            str: Binary path in `dest_dir`
+
+        Raises:
+            BinaryDownloadError: If the archive is truncated or does not hold exactly one file
+        """
+        if not self.cache_dir:
+            self._count(stat="downloads")
+            return download_binary_to_directory(url=url, directory=dest_dir)[0]
+
+        validator = url_validator(url=url)
+        key = self.cache_key(url=url, server_version=server_version, validator=validator)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            if cached_binary := self._cached_binary(key=key):
+                self._count(stat="hits")
+                LOGGER.info(f"Using cached binary {cached_binary} of {url}")
+            else:
+                self._count(stat="downloads")
+                cached_binary = self._store(key=key, url=url, server_version=server_version, validator=validator)
+
+        binary = os.path.join(dest_dir, os.path.basename(cached_binary))
+        shutil.copyfile(cached_binary, binary)
+        return binary
+
+
+BINARY_CACHE = BinaryCache(cache_dir=os.environ.get(BINARY_CACHE_DIR_ENV_VAR))
@@ -1,10 +1,19 @@
+import base64
+import hashlib
 import json
 import logging
 import os
+import tempfile
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from functools import cache
 from typing import Any
 
 from _pytest.main import Session
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from pyhelper_utils.shell import run_command
 from timeout_sampler import retry
 
@@ -12,6 +21,17 @@ from utilities.exceptions import MissingEnvironmentVariableError
 
 LOGGER = logging.getLogger(__name__)
 
+# Directory of the encrypted on-disk secrets cache, shared by processes and runs; no on-disk cache if not set
+SECRETS_CACHE_DIR_ENV_VAR = "CNV_TESTS_SECRETS_CACHE_DIR"
+# Time in seconds to keep the on-disk secrets cache
+SECRETS_CACHE_TTL_ENV_VAR = "CNV_TESTS_SECRETS_CACHE_TTL"
+DEFAULT_SECRETS_CACHE_TTL = 60 * 60
+DEFAULT_SECRET_FETCH_WORKERS = 4
+
+# Secret name to its parsed value, filled by the secrets list and the secret reads
+_SECRET_VALUES: dict[str, dict[str, Any]] = {}
+_SECRETS_CACHE_LOCK = threading.Lock()
+
 
 def _run_bws_command(args: list[str]) -> Any:
     """Run bws CLI command and return parsed JSON output.
@@ -81,6 +101,15 @@ def get_all_cnv_tests_secrets() -> dict[str, str]:
         dict[str, str]: Dictionary mapping secret name to secret UUID
     """
     data = _run_bws_command(args=["secret", "list"])
+    # The list holds the secrets values too, keep them to skip the per secret reads
+    for secret in data:
+        if "value" not in secret:
+            continue
+
+        try:
+            _SECRET_VALUES[secret["key"]] = json.loads(secret["value"])
+        except ValueError:
+            LOGGER.debug(f"Secret '{secret['key']}' value is not JSON, it is read on access")
 
     LOGGER.info(f"Cache info stats for pulling secrets: {get_all_cnv_tests_secrets.cache_info()}")
 
@@ -91,6 +120,8 @@ def get_all_cnv_tests_secrets() -> dict[str, str]:
 def get_cnv_tests_secret_by_name(secret_name: str, session: Session | None = None) -> dict[str, Any]:
     """Pull a specific secret from Bitwarden Secret Manager by name.
 
+    Secrets already listed or prefetched (see prefetch_cnv_tests_secrets) are returned without calling bws.
+
     Args:
         secret_name: Bitwarden Secret Manager secret name
         session: Pytest session object
@@ -105,7 +136,12 @@ def get_cnv_tests_secret_by_name(secret_name: str, session: Session | None = Non
         LOGGER.info("`--disabled-bitwarden` is set; skipping Bitwarden access.")
         return {}
 
+    if secret_name in _SECRET_VALUES:
+        return _SECRET_VALUES[secret_name]
+
     secrets = get_all_cnv_tests_secrets()
+    if secret_name in _SECRET_VALUES:
+        return _SECRET_VALUES[secret_name]
 
     secret_id = secrets.get(secret_name)
     if not secret_id:
@@ -115,5 +151,100 @@ def get_cnv_tests_secret_by_name(secret_name: str, session: Session | None = Non
     secret_value = secret_data.get("value", "")
 
     secret_dict = json.loads(secret_value)
+    _SECRET_VALUES[secret_name] = secret_dict
     LOGGER.info(f"Cache info stats for getting specific secret: {get_cnv_tests_secret_by_name.cache_info()}")
     return secret_dict
+
+
+def _secrets_cache(access_token: str) -> tuple[str, Fernet] | None:
+    """On-disk secrets cache file of an access token and its cipher, None if the cache is not enabled."""
+    if not (cache_dir := os.environ.get(SECRETS_CACHE_DIR_ENV_VAR)):
+        return None
+
+    # Both derived from the access token: only its holders find and decrypt the cache
+    cache_file = os.path.join(cache_dir, f"{hashlib.sha256(f'{access_token}|file'.encode()).hexdigest()}.bin")
+    key = HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=b"cnv-tests-secrets-cache").derive(
+        access_token.encode()
+    )
+    return cache_file, Fernet(key=base64.urlsafe_b64encode(key))
+
+
+def _read_secrets_cache(access_token: str) -> dict[str, dict[str, Any]] | None:
+    if not (secrets_cache := _secrets_cache(access_token=access_token)):
+        return None
+
+    cache_file, fernet = secrets_cache
+    ttl = int(os.environ.get(SECRETS_CACHE_TTL_ENV_VAR, DEFAULT_SECRETS_CACHE_TTL))
+    try:
+        with open(cache_file, "rb") as fd:
+            # Fernet tokens hold their creation time, decrypt rejects tokens older than ttl
+            return json.loads(fernet.decrypt(token=fd.read(), ttl=ttl))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, InvalidToken) as exp:
+        LOGGER.info(f"Ignoring expired or unreadable secrets cache {cache_file}: {exp!r}")
+        return None
+
+
+def _write_secrets_cache(access_token: str, secrets: dict[str, dict[str, Any]]) -> None:
+    if not (secrets_cache := _secrets_cache(access_token=access_token)):
+        return
+
+    cache_file, fernet = secrets_cache
+    os.makedirs(os.path.dirname(cache_file), mode=0o700, exist_ok=True)
+    # Write (readable only by the owner) and rename, so other processes never read a partial cache
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_file), suffix=".tmp")
+    with os.fdopen(fd, "wb") as tmp_file:
+        tmp_file.write(fernet.encrypt(data=json.dumps(secrets).encode()))
+    os.replace(tmp_path, cache_file)
+
+
+def prefetch_cnv_tests_secrets(
+    secret_names: Iterable[str] = (),
+    session: Session | None = None,
+    max_workers: int = DEFAULT_SECRET_FETCH_WORKERS,
+) -> None:
+    """Fetch the secrets of the session once, so later get_cnv_tests_secret_by_name calls do not call bws.
+
+    All the secrets values come with a single `bws secret list`; `secret_names` not in the list output are read
+    concurrently. With CNV_TESTS_SECRETS_CACHE_DIR set, the secrets are kept in an encrypted file (key derived from
+    ACCESS_TOKEN) for CNV_TESTS_SECRETS_CACHE_TTL seconds, shared by back-to-back runs and worker processes, which
+    then skip bws entirely.
+
+    Args:
+        secret_names: Bitwarden Secret Manager secret names the session needs
+        session: Pytest session object
+        max_workers: Maximum number of concurrent secret reads
+
+    Raises:
+        MissingEnvironmentVariableError: If ACCESS_TOKEN not set
+        ValueError: If a secret is not found
+    """
+    if session and session.config.getoption("--disabled-bitwarden"):
+        LOGGER.info("`--disabled-bitwarden` is set; skipping Bitwarden secrets prefetch.")
+        return
+
+    access_token = os.getenv("ACCESS_TOKEN")
+    if not access_token:
+        raise MissingEnvironmentVariableError("Bitwarden client needs ACCESS_TOKEN environment variable set up")
+
+    with _SECRETS_CACHE_LOCK:
+        if (cached_secrets := _read_secrets_cache(access_token=access_token)) and set(secret_names) <= set(
+            cached_secrets
+        ):
+            LOGGER.info(f"Using {len(cached_secrets)} cached Bitwarden secrets")
+            _SECRET_VALUES.update(cached_secrets)
+            return
+
+        get_all_cnv_tests_secrets()
+        if missing_names := [name for name in dict.fromkeys(secret_names) if name not in _SECRET_VALUES]:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(get_cnv_tests_secret_by_name, secret_name=name, session=session)
+                    for name in missing_names
+                ]
+            for future in futures:
+                future.result()
+
+        LOGGER.info(f"Prefetched {len(_SECRET_VALUES)} Bitwarden secrets")
+        _write_secrets_cache(access_token=access_token, secrets=_SECRET_VALUES)
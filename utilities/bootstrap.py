@@ -0,0 +1,131 @@
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_BOOTSTRAP_WORKERS = 8
+
+
+@dataclass
+class BootstrapStage:
+    """Step of the session bootstrap, run once all the stages it depends on succeeded."""
+
+    name: str
+    func: Callable[[], Any]
+    depends_on: tuple[str, ...] = ()
+
+
+@dataclass
+class BootstrapStageTiming:
+    """Stage start and end, in seconds since the bootstrap started."""
+
+    name: str
+    started: float
+    finished: float | None = None
+
+    @property
+    def duration(self) -> float | None:
+        return self.finished - self.started if self.finished is not None else None
+
+
+def validate_bootstrap_stages(stages: list[BootstrapStage]) -> None:
+    """
+    Validate the stages form a dependency graph which can run to completion.
+
+    Args:
+        stages (list[BootstrapStage]): Stages
+
+    Raises:
+        ValueError: If a stage name is duplicated, a dependency is unknown or the dependencies have a cycle
+    """
+    names = [stage.name for stage in stages]
+    if duplicates := sorted({name for name in names if names.count(name) > 1}):
+        raise ValueError(f"Duplicated bootstrap stages: {duplicates}")
+
+    for stage in stages:
+        if unknown := sorted(set(stage.depends_on) - set(names)):
+            raise ValueError(f"Bootstrap stage {stage.name} depends on unknown stages: {unknown}")
+
+    resolved: set[str] = set()
+    pending = list(stages)
+    while pending:
+        ready = [stage for stage in pending if set(stage.depends_on) <= resolved]
+        if not ready:
+            raise ValueError(f"Bootstrap stages dependency cycle: {sorted(stage.name for stage in pending)}")
+
+        resolved.update(stage.name for stage in ready)
+        pending = [stage for stage in pending if stage.name not in resolved]
+
+
+def run_bootstrap_stages(
+    stages: list[BootstrapStage],
+    max_workers: int = DEFAULT_BOOTSTRAP_WORKERS,
+    timings: dict[str, BootstrapStageTiming] | None = None,
+) -> dict[str, Any]:
+    """
+    Run the stages concurrently, each one as soon as the stages it depends on succeeded, and log their timing.
+
+    After a stage failed no new stage is started; the running stages are waited for and the first failure is raised.
+
+    Args:
+        stages (list[BootstrapStage]): Stages
+        max_workers (int): Maximum number of stages running at once
+        timings (dict, optional): Filled with stage name to its timing, for reporting by the caller
+
+    Returns:
+        dict: Stage name to its func return value
+
+    Raises:
+        ValueError: If the stages dependency graph is invalid, see validate_bootstrap_stages
+        Exception: The first stage failure
+    """
+    validate_bootstrap_stages(stages=stages)
+    timings = {} if timings is None else timings
+    results: dict[str, Any] = {}
+    pending = list(stages)
+    running: dict[Future, BootstrapStage] = {}
+    failure: BaseException | None = None
+    start_time = time.monotonic()
+
+    def _run(_stage: BootstrapStage) -> Any:
+        timings[_stage.name] = BootstrapStageTiming(name=_stage.name, started=time.monotonic() - start_time)
+        try:
+            return _stage.func()
+        finally:
+            timings[_stage.name].finished = time.monotonic() - start_time
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bootstrap") as executor:
+        while pending or running:
+            if not failure:
+                for stage in [stage for stage in pending if all(name in results for name in stage.depends_on)]:
+                    pending.remove(stage)
+                    running[executor.submit(_run, stage)] = stage
+
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                try:
+                    results[stage.name] = future.result()
+                except BaseException as exp:
+                    LOGGER.error(f"Bootstrap stage {stage.name} failed: {exp!r}")
+                    failure = failure or exp
+
+    LOGGER.info(
+        f"Bootstrap stages finished in {time.monotonic() - start_time:.2f}s: "
+        + ", ".join(
+            f"{timing.name} {timing.started:.2f}s+{timing.duration:.2f}s"
+            for timing in sorted(timings.values(), key=lambda _timing: _timing.started)
+            if timing.duration is not None
+        )
+    )
+    if failure:
+        raise failure
+
+    return results
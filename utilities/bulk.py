@@ -0,0 +1,1020 @@
+import itertools
+import logging
+import math
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.exceptions import NotFoundError
+from kubernetes.utils import parse_quantity
+from ocp_resources.pod import Pod
+from ocp_resources.resource import Resource
+from ocp_resources.virtual_machine import VirtualMachine
+from ocp_resources.virtual_machine_instance import VirtualMachineInstance
+from ocp_resources.virtual_machine_instance_migration import VirtualMachineInstanceMigration
+from timeout_sampler import TimeoutExpiredError
+
+from utilities.constants import TIMEOUT_1MIN, TIMEOUT_30MIN, VIRT_LAUNCHER
+from utilities.watch import get_resource_api, wait_for_resources, wait_for_resources_deleted
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_BULK_WORKERS = 10
+DEFAULT_API_REQUESTS_PER_SECOND = 20
+DEFAULT_SLOWEST_DELETIONS = 10
+# VM start phases, in the order a starting VM reaches them
+VM_START_PHASES = ("created", "scheduled", "launcher_running", "running", "agent_connected")
+LATENCY_PERCENTILES = (50, 90, 99)
+POD_SCHEDULED_CONDITION = "PodScheduled"
+NODE_METRICS_API_VERSION = "metrics.k8s.io/v1beta1"
+# Phase of VMs without a VMI in a health sample
+VMI_MISSING_PHASE = "Missing"
+MIGRATION_FINAL_PHASES = (
+    VirtualMachineInstanceMigration.Status.SUCCEEDED,
+    VirtualMachineInstanceMigration.Status.FAILED,
+)
+# Max data processed by each VMI migration in a namespace over the last `window` seconds
+MIGRATION_DATA_PROCESSED_QUERY = (
+    "max by (name) (max_over_time(kubevirt_vmi_migration_data_processed_bytes{{namespace='{namespace}'}}[{window}s]))"
+)
+
+
+class BulkOperationError(Exception):
+    def __init__(self, operation, errors):
+        self.operation = operation
+        self.errors = errors
+
+    def __str__(self):
+        return f"{self.operation} failed for {len(self.errors)} resources: {self.errors}"
+
+
+class RateLimiter:
+    def __init__(self, requests_per_second: float) -> None:
+        """
+        Thread safe limiter which spaces API requests of all workers evenly.
+
+        Args:
+            requests_per_second: Maximum number of requests per second, 0 means unlimited
+        """
+        self.interval = 1 / requests_per_second if requests_per_second else 0
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+
+        if delay > 0:
+            time.sleep(delay)
+
+
+@dataclass
+class ProvisioningTiming:
+    """Per resource provisioning timestamps, in seconds since the epoch."""
+
+    name: str
+    submitted: float
+    created: float | None = None
+    running: float | None = None
+    error: str | None = None
+
+    @property
+    def create_duration(self) -> float | None:
+        return self.created - self.submitted if self.created else None
+
+    @property
+    def start_duration(self) -> float | None:
+        return self.running - self.submitted if self.running else None
+
+
+def deploy_resources_in_parallel(
+    resources: list[Resource],
+    max_workers: int = DEFAULT_BULK_WORKERS,
+    api_requests_per_second: float = DEFAULT_API_REQUESTS_PER_SECOND,
+) -> dict[str, ProvisioningTiming]:
+    """
+    Deploy resources (VMs, DVs, ...) concurrently with a bounded worker pool and a shared API rate limit.
+
+    Args:
+        resources (list): Resources to deploy; names must be unique
+        max_workers (int): Maximum number of concurrent create requests
+        api_requests_per_second (float): Maximum create requests per second, 0 means unlimited
+
+    Returns:
+        dict[str, ProvisioningTiming]: Resource name to its timing
+
+    Raises:
+        BulkOperationError: If any of the resources failed to deploy (after all resources were submitted)
+    """
+    rate_limiter = RateLimiter(requests_per_second=api_requests_per_second)
+    timings: dict[str, ProvisioningTiming] = {}
+
+    def _deploy(_resource: Resource) -> None:
+        rate_limiter.wait()
+        timings[_resource.name] = ProvisioningTiming(name=_resource.name, submitted=time.time())
+        _resource.deploy()
+        timings[_resource.name].created = time.time()
+
+    LOGGER.info(f"Deploying {len(resources)} resources with {max_workers} workers")
+    errors = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_deploy, _resource): _resource for _resource in resources}
+        for future in as_completed(futures):
+            if exp := future.exception():
+                name = futures[future].name
+                errors[name] = str(exp)
+                if name in timings:
+                    timings[name].error = str(exp)
+
+    if errors:
+        raise BulkOperationError(operation="deploy", errors=errors)
+
+    return timings
+
+
+def parse_timestamp(timestamp: str | None) -> float | None:
+    """
+    Convert a Kubernetes timestamp (e.g. 2025-01-01T00:00:00Z) to seconds since the epoch.
+
+    Args:
+        timestamp (str, optional): RFC 3339 timestamp
+
+    Returns:
+        float | None: Seconds since the epoch, None if no timestamp is given
+    """
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp() if timestamp else None
+
+
+def vmi_phase_transition_time(vmi: dict[str, Any], phase: str) -> float | None:
+    """
+    Get the time a VMI reached a phase from status.phaseTransitionTimestamps.
+
+    Args:
+        vmi (dict): Raw VMI dict
+        phase (str): VMI phase, e.g. Running
+
+    Returns:
+        float | None: Seconds since the epoch, None if the VMI did not report the phase
+    """
+    for transition in vmi.get("status", {}).get("phaseTransitionTimestamps") or []:
+        if transition.get("phase") == phase:
+            return parse_timestamp(timestamp=transition["phaseTransitionTimestamp"])
+    return None
+
+
+def condition_transition_time(resource: dict[str, Any], condition_type: str) -> float | None:
+    """
+    Get the time a condition of a resource (VMI, pod, ...) last became True.
+
+    Args:
+        resource (dict): Raw resource dict
+        condition_type (str): Condition type, e.g. AgentConnected
+
+    Returns:
+        float | None: Seconds since the epoch, None if the condition is not True
+    """
+    for condition in resource.get("status", {}).get("conditions") or []:
+        if condition.get("type") == condition_type and condition.get("status") == "True":
+            return parse_timestamp(timestamp=condition.get("lastTransitionTime"))
+    return None
+
+
+def _wait_for_resources_per_namespace(
+    client: DynamicClient,
+    resource_kind: type[Resource],
+    resources: list[Resource],
+    predicate: Callable[[dict[str, Any]], bool],
+    timeout: int,
+    description: str,
+) -> dict[str, dict[str, Any]]:
+    """
+    Wait for many namespaced resources to match `predicate`, with one watch per namespace; returns the raw resources.
+    """
+    names_by_namespace = defaultdict(set)
+    for resource in resources:
+        names_by_namespace[resource.namespace].add(resource.name)
+
+    deadline = time.monotonic() + timeout
+    raw_resources = {}
+    for namespace, names in names_by_namespace.items():
+        remaining = int(deadline - time.monotonic())
+        if remaining <= 0:
+            raise TimeoutExpiredError(
+                f"Timed out waiting for {resource_kind.kind} resources in {namespace} to be {description}: "
+                f"{sorted(names)}"
+            )
+
+        raw_resources.update(
+            wait_for_resources(
+                client=client,
+                resource_kind=resource_kind,
+                names=names,
+                namespace=namespace,
+                predicate=predicate,
+                timeout=remaining,
+            )
+        )
+
+    return raw_resources
+
+
+def wait_for_vmis_running(
+    client: DynamicClient,
+    vms: list[VirtualMachine],
+    timeout: int = TIMEOUT_30MIN,
+) -> dict[str, float]:
+    """
+    Wait for the VMIs of many VMs to be Running, with one VMI watch per namespace instead of polling each VMI.
+
+    Args:
+        client (DynamicClient): Client to use
+        vms (list): VMs to wait for
+        timeout (int): Time in seconds to wait for all VMIs
+
+    Returns:
+        dict[str, float]: VM name to the time (seconds since the epoch) its VMI reached Running
+
+    Raises:
+        TimeoutExpiredError: If not all VMIs are Running in time
+    """
+    vmis = _wait_for_resources_per_namespace(
+        client=client,
+        resource_kind=VirtualMachineInstance,
+        resources=vms,
+        predicate=lambda _vmi: _vmi.get("status", {}).get("phase") == VirtualMachineInstance.Status.RUNNING,
+        timeout=timeout,
+        description="running",
+    )
+    # The watch may see the VMI late (e.g. a namespace waited after another one), prefer the VMI own timestamp
+    return {
+        name: vmi_phase_transition_time(vmi=vmi, phase=VirtualMachineInstance.Status.RUNNING) or time.time()
+        for name, vmi in vmis.items()
+    }
+
+
+@dataclass
+class VmStartTiming:
+    """Per VM start timestamps, in seconds since the epoch; phases the VM did not reach are None."""
+
+    name: str
+    requested: float
+    created: float | None = None
+    scheduled: float | None = None
+    launcher_running: float | None = None
+    running: float | None = None
+    agent_connected: float | None = None
+
+    def latencies(self) -> dict[str, float]:
+        """Time in seconds from the start request to each reached phase (see VM_START_PHASES)."""
+        return {
+            phase: timestamp - self.requested
+            for phase in VM_START_PHASES
+            if (timestamp := getattr(self, phase)) is not None
+        }
+
+
+def launcher_pod_start_times(pod: dict[str, Any]) -> tuple[float | None, float | None]:
+    """
+    Get the times a virt-launcher pod was scheduled and its compute container started.
+
+    Args:
+        pod (dict): Raw virt-launcher pod dict
+
+    Returns:
+        tuple: Scheduled time and compute container start time, in seconds since the epoch (None if not reached)
+    """
+    launcher_running = None
+    for container_status in pod.get("status", {}).get("containerStatuses") or []:
+        if container_status.get("name") == "compute":
+            launcher_running = parse_timestamp(
+                timestamp=(container_status.get("state", {}).get("running") or {}).get("startedAt")
+            )
+
+    return condition_transition_time(resource=pod, condition_type=POD_SCHEDULED_CONDITION), launcher_running
+
+
+def collect_vm_start_timings(
+    client: DynamicClient,
+    vms: list[VirtualMachine],
+    requested: dict[str, float],
+    agent_timeout: int = 0,
+) -> dict[str, VmStartTiming]:
+    """
+    Collect the start phase timestamps of many VMs from their VMIs and virt-launcher pods.
+
+    Timestamps are taken from the resources themselves (not from when they were observed), so they can be collected
+    once all VMs started. One VMI and one virt-launcher pod list are read per namespace.
+
+    Args:
+        client (DynamicClient): Client to use
+        vms (list): Started VMs
+        requested (dict): VM name to the time (seconds since the epoch) its start was requested
+        agent_timeout (int): Time in seconds to wait (one VMI watch per namespace) for the guest agents to connect,
+            VMs whose agent did not connect in time have no agent_connected time; 0 does not wait
+
+    Returns:
+        dict[str, VmStartTiming]: VM name to its start timing
+    """
+    if agent_timeout:
+        try:
+            _wait_for_resources_per_namespace(
+                client=client,
+                resource_kind=VirtualMachineInstance,
+                resources=vms,
+                predicate=lambda _vmi: bool(
+                    condition_transition_time(
+                        resource=_vmi, condition_type=VirtualMachineInstance.Condition.Type.AGENT_CONNECTED
+                    )
+                ),
+                timeout=agent_timeout,
+                description="connected to the guest agent",
+            )
+        except TimeoutExpiredError as exp:
+            LOGGER.warning(f"Not all guest agents connected: {exp}")
+
+    timings = {}
+    for namespace in {vm.namespace for vm in vms}:
+        vmis = {
+            vmi["metadata"]["name"]: vmi
+            for vmi in get_resource_api(client=client, resource_kind=VirtualMachineInstance)
+            .get(namespace=namespace)
+            .to_dict()["items"]
+        }
+        launcher_pods = {
+            pod["metadata"].get("labels", {}).get("vm.kubevirt.io/name"): pod
+            for pod in get_resource_api(client=client, resource_kind=Pod)
+            .get(namespace=namespace, label_selector=f"kubevirt.io={VIRT_LAUNCHER}")
+            .to_dict()["items"]
+        }
+        for vm in vms:
+            if vm.namespace != namespace:
+                continue
+
+            timing = VmStartTiming(name=vm.name, requested=requested[vm.name])
+            if vmi := vmis.get(vm.name):
+                timing.created = parse_timestamp(timestamp=vmi["metadata"].get("creationTimestamp"))
+                timing.running = vmi_phase_transition_time(vmi=vmi, phase=VirtualMachineInstance.Status.RUNNING)
+                timing.agent_connected = condition_transition_time(
+                    resource=vmi, condition_type=VirtualMachineInstance.Condition.Type.AGENT_CONNECTED
+                )
+            if pod := launcher_pods.get(vm.name):
+                timing.scheduled, timing.launcher_running = launcher_pod_start_times(pod=pod)
+            timings[vm.name] = timing
+
+    return timings
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """
+    Get a percentile of values, nearest-rank method (the result is always one of the values).
+
+    Args:
+        values (list): Values, not empty
+        percent (float): Percentile, 0 to 100
+
+    Returns:
+        float: Smallest value which at least `percent` percent of the values are less or equal to
+    """
+    sorted_values = sorted(values)
+    return sorted_values[max(math.ceil(percent / 100 * len(sorted_values)), 1) - 1]
+
+
+def latency_summary(values: list[float]) -> dict[str, float]:
+    """
+    Summarize latencies as count, p50, p90, p99 and max.
+
+    Args:
+        values (list): Latencies in seconds
+
+    Returns:
+        dict: Summary name to its value, only the count if there are no values
+    """
+    if not values:
+        return {"count": 0}
+
+    return {
+        "count": len(values),
+        **{f"p{_percent}": round(percentile(values=values, percent=_percent), 3) for _percent in LATENCY_PERCENTILES},
+        "max": round(max(values), 3),
+    }
+
+
+def vm_start_latency_histograms(
+    timings: dict[str, VmStartTiming], group_of: Callable[[str], str]
+) -> dict[str, dict[str, dict[str, float]]]:
+    """
+    Summarize VM start latencies per group (e.g. OS and storage type) and start phase.
+
+    Args:
+        timings (dict): VM name to its start timing
+        group_of (Callable): Called with a VM name, returns its group name
+
+    Returns:
+        dict: Group name to start phase to its latency summary (see latency_summary)
+    """
+    latencies: dict[str, dict[str, list[float]]] = defaultdict(lambda: {phase: [] for phase in VM_START_PHASES})
+    for name, timing in timings.items():
+        for phase, latency in timing.latencies().items():
+            latencies[group_of(name)][phase].append(latency)
+
+    return {
+        group: {phase: latency_summary(values=values) for phase, values in phases.items()}
+        for group, phases in sorted(latencies.items())
+    }
+
+
+def provision_vms(
+    client: DynamicClient,
+    vms: list[VirtualMachine],
+    max_workers: int = DEFAULT_BULK_WORKERS,
+    api_requests_per_second: float = DEFAULT_API_REQUESTS_PER_SECOND,
+    wait_for_running: bool = True,
+    timeout: int = TIMEOUT_30MIN,
+) -> dict[str, ProvisioningTiming]:
+    """
+    Create many VMs concurrently and (optionally) wait for all of them to run using a shared VMI watch.
+
+    VMs should be started by their run strategy (e.g. Always) if wait_for_running is set.
+
+    Args:
+        client (DynamicClient): Client used for the VMI watch
+        vms (list): VMs (not yet deployed) to create
+        max_workers (int): Maximum number of concurrent create requests
+        api_requests_per_second (float): Maximum create requests per second, 0 means unlimited
+        wait_for_running (bool): Wait for the VMIs to be Running
+        timeout (int): Time in seconds to wait for all VMIs to be Running
+
+    Returns:
+        dict[str, ProvisioningTiming]: VM name to its timing
+
+    Raises:
+        BulkOperationError: If any VM failed to deploy
+        TimeoutExpiredError: If not all VMIs are Running in time
+    """
+    timings = deploy_resources_in_parallel(
+        resources=vms, max_workers=max_workers, api_requests_per_second=api_requests_per_second
+    )
+    if wait_for_running:
+        for name, running_time in wait_for_vmis_running(client=client, vms=vms, timeout=timeout).items():
+            timings[name].running = running_time
+
+    durations = sorted(timing.start_duration or timing.create_duration or 0 for timing in timings.values())
+    if durations:
+        LOGGER.info(
+            f"Provisioned {len(timings)} VMs, slowest: {durations[-1]:.1f}s, "
+            f"median: {durations[len(durations) // 2]:.1f}s"
+        )
+    return timings
+
+
+def get_nodes_usage(client: DynamicClient) -> dict[str, dict[str, float]]:
+    """
+    Get the CPU and memory usage of all nodes with one metrics API read (the data `oc adm top nodes` shows).
+
+    Args:
+        client (DynamicClient): Client to use
+
+    Returns:
+        dict: Node name to its usage, {"cpu_cores": float, "memory_bytes": float}
+    """
+    node_metrics = client.resources.get(api_version=NODE_METRICS_API_VERSION, kind="NodeMetrics").get()
+    return {
+        metrics["metadata"]["name"]: {
+            "cpu_cores": float(parse_quantity(metrics["usage"]["cpu"])),
+            "memory_bytes": float(parse_quantity(metrics["usage"]["memory"])),
+        }
+        for metrics in node_metrics.to_dict()["items"]
+    }
+
+
+@dataclass
+class VmsHealthSample:
+    """VMs health at one point in time, see sample_vms_health."""
+
+    timestamp: float
+    total: int
+    running: int
+    phases: dict[str, int] = field(default_factory=dict)
+    vms_per_node: dict[str, int] = field(default_factory=dict)
+    nodes_usage: dict[str, dict[str, float]] = field(default_factory=dict)
+
+    @property
+    def all_running(self) -> bool:
+        return self.running == self.total
+
+
+def sample_vms_health(
+    client: DynamicClient,
+    vms: list[VirtualMachine],
+    nodes_usage: bool = False,
+) -> VmsHealthSample:
+    """
+    Sample the health of many VMs with one VMI list per namespace instead of reading each VMI.
+
+    Args:
+        client (DynamicClient): Client to use
+        vms (list): VMs to sample
+        nodes_usage (bool): Also read the nodes CPU and memory usage (see get_nodes_usage)
+
+    Returns:
+        VmsHealthSample: Running VMs count, VMs per phase (VMs without a VMI are Missing) and running VMs per node
+    """
+    vmis = {}
+    for namespace in {vm.namespace for vm in vms}:
+        for vmi in (
+            get_resource_api(client=client, resource_kind=VirtualMachineInstance)
+            .get(namespace=namespace)
+            .to_dict()["items"]
+        ):
+            vmis[(namespace, vmi["metadata"]["name"])] = vmi
+
+    phases: Counter = Counter()
+    vms_per_node: Counter = Counter()
+    for vm in vms:
+        vmi_status = vmis.get((vm.namespace, vm.name), {}).get("status")
+        phase = (vmi_status or {}).get("phase") or VMI_MISSING_PHASE
+        phases[phase] += 1
+        if phase == VirtualMachineInstance.Status.RUNNING:
+            vms_per_node[vmi_status.get("nodeName")] += 1
+
+    return VmsHealthSample(
+        timestamp=time.time(),
+        total=len(vms),
+        running=phases[VirtualMachineInstance.Status.RUNNING],
+        phases=dict(phases),
+        vms_per_node=dict(vms_per_node),
+        nodes_usage=get_nodes_usage(client=client) if nodes_usage else {},
+    )
+
+
+@dataclass
+class MigrationResult:
+    """Per VM live migration result, timestamps in seconds since the epoch."""
+
+    name: str
+    migration: str
+    submitted: float
+    phase: str | None = None
+    started: float | None = None
+    completed: float | None = None
+    source_node: str | None = None
+    target_node: str | None = None
+    failure_reason: str | None = None
+    data_processed_bytes: float | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.phase == VirtualMachineInstanceMigration.Status.SUCCEEDED
+
+    @property
+    def duration(self) -> float | None:
+        return self.completed - self.submitted if self.completed else None
+
+
+def migration_result(
+    name: str, migration_name: str, submitted: float, raw_migration: dict[str, Any] | None
+) -> MigrationResult:
+    """
+    Build the result of a VM live migration from its VirtualMachineInstanceMigration.
+
+    Args:
+        name (str): VM name
+        migration_name (str): Migration name
+        submitted (float): Time (seconds since the epoch) the migration was created
+        raw_migration (dict, optional): Raw migration dict, None if it was not found
+
+    Returns:
+        MigrationResult: Migration result; migrations which did not finish have a failure reason
+    """
+    status = (raw_migration or {}).get("status", {})
+    migration_state = status.get("migrationState") or {}
+    result = MigrationResult(
+        name=name,
+        migration=migration_name,
+        submitted=submitted,
+        phase=status.get("phase"),
+        source_node=migration_state.get("sourceNode"),
+        target_node=migration_state.get("targetNode"),
+    )
+    # Older versions only report the migration state in the VMI, fall back to the migration phase transitions
+    result.started = parse_timestamp(timestamp=migration_state.get("startTimestamp")) or vmi_phase_transition_time(
+        vmi=raw_migration or {}, phase=VirtualMachineInstanceMigration.Status.RUNNING
+    )
+    if result.phase in MIGRATION_FINAL_PHASES:
+        result.completed = parse_timestamp(timestamp=migration_state.get("endTimestamp")) or vmi_phase_transition_time(
+            vmi=raw_migration, phase=result.phase
+        )
+
+    if result.phase == VirtualMachineInstanceMigration.Status.FAILED:
+        result.failure_reason = migration_state.get("failureReason") or VirtualMachineInstanceMigration.Status.FAILED
+    elif result.phase not in MIGRATION_FINAL_PHASES:
+        result.failure_reason = f"Not finished in time, phase: {result.phase}"
+
+    return result
+
+
+@dataclass
+class MigrationReport:
+    """Results of a mass live migration, see migrate_vms_in_waves."""
+
+    results: dict[str, MigrationResult]
+    duration: float
+    waves: int
+
+    @property
+    def failed(self) -> dict[str, MigrationResult]:
+        return {name: result for name, result in self.results.items() if not result.succeeded}
+
+    @property
+    def migrations_per_minute(self) -> float:
+        succeeded = len(self.results) - len(self.failed)
+        return succeeded / self.duration * 60 if self.duration else 0.0
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Summarize the migrations throughput, durations, data processed and failures.
+
+        Returns:
+            dict: Migrations count, throughput, duration latency summary (see latency_summary), total data processed
+                and failure reason to its count
+        """
+        data_processed = [
+            result.data_processed_bytes for result in self.results.values() if result.data_processed_bytes is not None
+        ]
+        return {
+            "migrations": len(self.results),
+            "failed": len(self.failed),
+            "waves": self.waves,
+            "duration": round(self.duration, 3),
+            "migrations_per_minute": round(self.migrations_per_minute, 2),
+            "migration_duration": latency_summary(
+                values=[result.duration for result in self.results.values() if result.succeeded and result.duration]
+            ),
+            "data_processed_bytes": sum(data_processed) if data_processed else None,
+            "failure_reasons": dict(Counter(result.failure_reason for result in self.failed.values())),
+        }
+
+
+def add_migrations_data_processed(
+    prometheus: Any, results: dict[str, MigrationResult], namespaces: set[str], window: int
+) -> None:
+    """
+    Add the data processed by each migration, with one Prometheus query per namespace.
+
+    Failures are logged and not raised, the data processed is optional in the migration results.
+
+    Args:
+        prometheus (Prometheus): Prometheus client
+        results (dict): VM name to its migration result, updated in place
+        namespaces (set): Namespaces of the migrated VMs
+        window (int): Time in seconds since the first migration started
+    """
+    for namespace in namespaces:
+        try:
+            metrics = prometheus.query(query=MIGRATION_DATA_PROCESSED_QUERY.format(namespace=namespace, window=window))
+        except Exception as exp:
+            LOGGER.warning(f"Failed to get the migrations data processed in {namespace}: {exp}")
+            continue
+
+        for metric in metrics.get("data", {}).get("result", []):
+            if result := results.get(metric["metric"].get("name")):
+                result.data_processed_bytes = float(metric["value"][1])
+
+
+def migrate_vms_in_waves(
+    client: DynamicClient,
+    vms: list[VirtualMachine],
+    wave_size: int = 0,
+    max_workers: int = DEFAULT_BULK_WORKERS,
+    api_requests_per_second: float = DEFAULT_API_REQUESTS_PER_SECOND,
+    wave_timeout: int = TIMEOUT_30MIN,
+    prometheus: Any = None,
+) -> MigrationReport:
+    """
+    Live migrate many VMs in waves; each wave creates its migrations concurrently and waits for all of them to finish
+    with one migrations watch per namespace before the next wave starts.
+
+    How many migrations run at once is still limited by the cluster live migration config
+    (parallelMigrationsPerCluster, parallelOutboundMigrationsPerNode); the others wait in Pending.
+    Failed and timed out migrations are reported in the results, not raised.
+
+    Args:
+        client (DynamicClient): Client to use
+        vms (list): Running VMs to migrate
+        wave_size (int): Number of migrations per wave, 0 migrates all VMs in one wave
+        max_workers (int): Maximum number of concurrent migration create requests
+        api_requests_per_second (float): Maximum migration create requests per second, 0 means unlimited
+        wave_timeout (int): Time in seconds to wait for the migrations of a wave to finish
+        prometheus (Prometheus, optional): Prometheus client, to add the data processed by each migration
+
+    Returns:
+        MigrationReport: Per VM migration results and throughput
+
+    Raises:
+        BulkOperationError: If any migration could not be created
+    """
+    wave_size = wave_size or len(vms)
+    waves = list(itertools.batched(vms, wave_size))
+    run_id = uuid.uuid4().hex[:5]
+    results: dict[str, MigrationResult] = {}
+    start_time = time.time()
+    for wave_number, wave in enumerate(waves, start=1):
+        LOGGER.info(f"Migration wave {wave_number}/{len(waves)}: migrating {len(wave)} VMs")
+        migrations = {
+            vm.name: VirtualMachineInstanceMigration(
+                name=f"{vm.name}-{run_id}",
+                namespace=vm.namespace,
+                vmi_name=vm.name,
+                client=client,
+                teardown=False,
+            )
+            for vm in wave
+        }
+        timings = deploy_resources_in_parallel(
+            resources=list(migrations.values()),
+            max_workers=max_workers,
+            api_requests_per_second=api_requests_per_second,
+        )
+        try:
+            raw_migrations = _wait_for_resources_per_namespace(
+                client=client,
+                resource_kind=VirtualMachineInstanceMigration,
+                resources=list(migrations.values()),
+                predicate=lambda _migration: _migration.get("status", {}).get("phase") in MIGRATION_FINAL_PHASES,
+                timeout=wave_timeout,
+                description="finished",
+            )
+        except TimeoutExpiredError as exp:
+            LOGGER.warning(f"Not all migrations of wave {wave_number} finished: {exp}")
+            raw_migrations = {
+                raw_migration["metadata"]["name"]: raw_migration
+                for namespace in {vm.namespace for vm in wave}
+                for raw_migration in get_resource_api(client=client, resource_kind=VirtualMachineInstanceMigration)
+                .get(namespace=namespace)
+                .to_dict()["items"]
+            }
+
+        for name, migration in migrations.items():
+            results[name] = migration_result(
+                name=name,
+                migration_name=migration.name,
+                submitted=timings[migration.name].submitted,
+                raw_migration=raw_migrations.get(migration.name),
+            )
+
+    report = MigrationReport(results=results, duration=time.time() - start_time, waves=len(waves))
+    if prometheus:
+        add_migrations_data_processed(
+            prometheus=prometheus,
+            results=results,
+            namespaces={vm.namespace for vm in vms},
+            window=int(report.duration) + TIMEOUT_1MIN,
+        )
+
+    LOGGER.info(
+        f"Migrated {len(results)} VMs in {report.duration:.1f}s ({report.migrations_per_minute:.1f} migrations per "
+        f"minute), {len(report.failed)} failed"
+    )
+    return report
+
+
+@dataclass
+class DeletionTiming:
+    """Per resource deletion timestamps, in seconds since the epoch."""
+
+    kind: str
+    name: str
+    namespace: str | None
+    submitted: float
+    deleted: float | None = None
+    finalizers: list[str] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float | None:
+        return self.deleted - self.submitted if self.deleted else None
+
+
+@dataclass
+class DeletionReport:
+    """Results of a bulk deletion, see delete_resources_in_parallel and delete_collection."""
+
+    timings: list[DeletionTiming]
+    duration: float
+
+    @property
+    def deletions_per_second(self) -> float:
+        deleted = len([timing for timing in self.timings if timing.deleted])
+        return deleted / self.duration if self.duration else 0.0
+
+    def slowest(self, count: int = DEFAULT_SLOWEST_DELETIONS) -> list[DeletionTiming]:
+        return sorted(
+            (timing for timing in self.timings if timing.deleted), key=lambda timing: timing.duration, reverse=True
+        )[:count]
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Summarize the deletions throughput and latencies.
+
+        Returns:
+            dict: Deletions count, throughput, deletion latency summary (see latency_summary) and the slowest deletions
+                with the finalizers they waited for
+        """
+        return {
+            "deletions": len(self.timings),
+            "duration": round(self.duration, 3),
+            "deletions_per_second": round(self.deletions_per_second, 2),
+            "deletion_duration": latency_summary(
+                values=[timing.duration for timing in self.timings if timing.duration is not None]
+            ),
+            "slowest": [
+                {
+                    "kind": timing.kind,
+                    "namespace": timing.namespace,
+                    "name": timing.name,
+                    "duration": round(timing.duration, 3),
+                    "finalizers": timing.finalizers,
+                }
+                for timing in self.slowest()
+            ],
+        }
+
+
+def _wait_for_deletions(
+    client: DynamicClient,
+    resource_kind: type[Resource],
+    timings: list[DeletionTiming],
+    deadline: float,
+    label_selector: str | None = None,
+) -> None:
+    """Wait for the deletions of one kind with one watch per namespace, and record their deletion times."""
+    timings_by_namespace: dict[str | None, dict[str, DeletionTiming]] = defaultdict(dict)
+    for timing in timings:
+        timings_by_namespace[timing.namespace][timing.name] = timing
+
+    for namespace, namespace_timings in timings_by_namespace.items():
+        for name, (deleted, finalizers) in wait_for_resources_deleted(
+            client=client,
+            resource_kind=resource_kind,
+            names=set(namespace_timings),
+            namespace=namespace,
+            label_selector=label_selector,
+            timeout=max(int(deadline - time.monotonic()), 1),
+        ).items():
+            namespace_timings[name].deleted = deleted
+            namespace_timings[name].finalizers = finalizers
+
+
+def delete_resources_in_parallel(
+    resources: list[Resource],
+    max_workers: int = DEFAULT_BULK_WORKERS,
+    api_requests_per_second: float = DEFAULT_API_REQUESTS_PER_SECOND,
+    wait: bool = True,
+    timeout: int = TIMEOUT_30MIN,
+    ignored_exceptions: tuple[type[Exception], ...] = (NotFoundError,),
+) -> DeletionReport:
+    """
+    Tear down resources (VMs, DVs, ...) concurrently with a bounded worker pool and a shared API rate limit, then wait
+    for all of them to be deleted with one watch per kind and namespace.
+
+    Resources are torn down with their own clean_up (e.g. VirtualMachineForTests stops the VM and releases its SSH
+    transport first), without waiting; SKIP_RESOURCE_TEARDOWN is honoured.
+
+    Args:
+        resources (list): Resources to delete
+        max_workers (int): Maximum number of concurrent delete requests
+        api_requests_per_second (float): Maximum delete requests per second, 0 means unlimited
+        wait (bool): Wait for the resources to be deleted
+        timeout (int): Time in seconds to wait for all resources to be deleted
+        ignored_exceptions (tuple): Exceptions of resources which are skipped (e.g. ForbiddenError for resources the
+            client cannot delete), not reported as errors
+
+    Returns:
+        DeletionReport: Deletion timings of the deleted resources
+
+    Raises:
+        BulkOperationError: If any of the resources failed to delete (after all resources were submitted)
+        TimeoutExpiredError: If not all resources were deleted in time
+    """
+    rate_limiter = RateLimiter(requests_per_second=api_requests_per_second)
+    timings: dict[int, DeletionTiming] = {}
+
+    def _delete(_resource: Resource) -> None:
+        rate_limiter.wait()
+        submitted = time.time()
+        try:
+            _resource.clean_up(wait=False)
+        except ignored_exceptions as exp:
+            LOGGER.warning(f"Skipping {_resource.kind} {_resource.name} deletion: {exp}")
+            return
+
+        timings[id(_resource)] = DeletionTiming(
+            kind=_resource.kind, name=_resource.name, namespace=_resource.namespace, submitted=submitted
+        )
+
+    LOGGER.info(f"Deleting {len(resources)} resources with {max_workers} workers")
+    start_time = time.time()
+    deadline = time.monotonic() + timeout
+    errors = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_delete, _resource): _resource for _resource in resources}
+        for future in as_completed(futures):
+            if exp := future.exception():
+                errors[f"{futures[future].kind}/{futures[future].name}"] = str(exp)
+
+    if errors:
+        raise BulkOperationError(operation="delete", errors=errors)
+
+    if wait:
+        # Grouped by kind, not class: e.g. VirtualMachineForTests and VirtualMachine objects share one watch
+        resources_by_kind: dict[str, list[Resource]] = defaultdict(list)
+        for resource in resources:
+            if id(resource) in timings:
+                resources_by_kind[resource.kind].append(resource)
+
+        for kind_resources in resources_by_kind.values():
+            _wait_for_deletions(
+                client=kind_resources[0].client,
+                resource_kind=type(kind_resources[0]),
+                timings=[timings[id(resource)] for resource in kind_resources],
+                deadline=deadline,
+            )
+
+    report = DeletionReport(timings=list(timings.values()), duration=time.time() - start_time)
+    LOGGER.info(
+        f"Deleted {len(report.timings)} resources in {report.duration:.1f}s "
+        f"({report.deletions_per_second:.1f} per second)"
+    )
+    return report
+
+
+def delete_collection(
+    client: DynamicClient,
+    resource_kind: type[Resource],
+    namespace: str,
+    label_selector: str | None = None,
+    wait: bool = True,
+    timeout: int = TIMEOUT_30MIN,
+) -> DeletionReport:
+    """
+    Delete all the resources of a kind in a namespace (optionally matching a label selector) with one collection
+    delete request, then wait for all of them to be deleted with one watch.
+
+    Resources are deleted by the API server directly, their clean_up is not called.
+
+    Args:
+        client (DynamicClient): Client to use
+        resource_kind (type[Resource]): ocp_resources class, e.g. VirtualMachine
+        namespace (str): Namespace of the resources
+        label_selector (str, optional): Label selector of the resources to delete
+        wait (bool): Wait for the resources to be deleted
+        timeout (int): Time in seconds to wait for all resources to be deleted
+
+    Returns:
+        DeletionReport: Deletion timings of the deleted resources
+
+    Raises:
+        TimeoutExpiredError: If not all resources were deleted in time
+    """
+    api = get_resource_api(client=client, resource_kind=resource_kind)
+    start_time = time.time()
+    deadline = time.monotonic() + timeout
+    names = [
+        item["metadata"]["name"]
+        for item in api.get(namespace=namespace, label_selector=label_selector).to_dict()["items"]
+    ]
+    timings = []
+    if names:
+        LOGGER.info(f"Deleting {len(names)} {resource_kind.kind} resources in {namespace}")
+        submitted = time.time()
+        # The client refuses a collection delete without selector, all resources of a namespace match its field
+        api.delete(
+            namespace=namespace,
+            label_selector=label_selector,
+            field_selector=None if label_selector else f"metadata.namespace={namespace}",
+        )
+        timings = [
+            DeletionTiming(kind=resource_kind.kind, name=name, namespace=namespace, submitted=submitted)
+            for name in names
+        ]
+        if wait:
+            _wait_for_deletions(
+                client=client,
+                resource_kind=resource_kind,
+                timings=timings,
+                deadline=deadline,
+                label_selector=label_selector,
+            )
+
+    return DeletionReport(timings=timings, duration=time.time() - start_time)
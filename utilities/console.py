@@ -1,5 +1,10 @@
+import atexit
 import logging
 import os
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
 
 import pexpect
 from ocp_resources.virtual_machine import VirtualMachine
@@ -7,6 +12,8 @@ from timeout_sampler import TimeoutSampler, retry
 
 from utilities.constants import (
     TIMEOUT_5MIN,
+    TIMEOUT_5SEC,
+    TIMEOUT_10MIN,
     TIMEOUT_10SEC,
     TIMEOUT_30SEC,
     VIRTCTL,
@@ -144,3 +151,184 @@ class Console(object):
         Logout from shell
         """
         self.disconnect()
+
+
+class ConsoleSession:
+    def __init__(self, console: Console) -> None:
+        """
+        Authenticated console connection that is kept open between commands.
+
+        Args:
+            console: Console used to connect, reconnect and disconnect the session
+        """
+        self.console = console
+        self.lock = threading.Lock()
+        self.last_used = time.monotonic()
+        self.reuse_count = 0
+
+    @property
+    def child(self) -> pexpect.spawn | None:
+        return self.console.child
+
+    def is_alive(self, prompt: str | list[str]) -> bool:
+        """
+        Check that the pexpect child is running and the shell answers with a prompt.
+
+        Args:
+            prompt: Shell prompt pattern(s) to expect
+
+        Returns:
+            bool: True if the session can be used to run commands, False otherwise.
+        """
+        if not self.child or not self.child.isalive():
+            return False
+
+        try:
+            self.child.sendline("")
+            self.child.expect(prompt, timeout=TIMEOUT_5SEC)
+            return True
+        except pexpect.exceptions.TIMEOUT, pexpect.exceptions.EOF:
+            LOGGER.warning(f"{self.console.vm.name}: console session is not responsive")
+            return False
+
+    def connect(self) -> None:
+        self.console.connect()
+        self.last_used = time.monotonic()
+
+    def close(self) -> None:
+        """
+        Logout from shell and close the pexpect child, errors are logged and ignored.
+        """
+        if not self.child:
+            return
+
+        try:
+            if self.child.isalive():
+                self.console.disconnect()
+            else:
+                self.child.close()
+        except Exception as exp:
+            LOGGER.warning(f"{self.console.vm.name}: failed to close console session: {exp}")
+            self.child.close(force=True)
+
+
+class ConsoleSessionPool:
+    def __init__(self, idle_timeout: int = TIMEOUT_10MIN) -> None:
+        r"""
+        Pool of authenticated console sessions, one per VM.
+
+        A session is created on first use and kept open, so consecutive calls for the same VM do not pay
+        for a new `virtctl console` process and a login round-trip.
+        Before a session is reused, it is health checked; a dead session (EOF, VM restarted or migrated)
+        is closed and a new one is connected.
+        Sessions which were not used for `idle_timeout` seconds are evicted.
+
+        Args:
+            idle_timeout: Seconds a session may stay unused before it is closed
+
+        Examples:
+            from utilities.console import CONSOLE_SESSION_POOL
+            with CONSOLE_SESSION_POOL.session(vm=vm, prompt=r"\$ ") as vmc:
+                vmc.sendline('some command')
+                vmc.expect(r"\$ ")
+        """
+        self.idle_timeout = idle_timeout
+        self._sessions: dict[tuple[str | None, str, str | None], ConsoleSession] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _session_key(vm: VirtualMachine, kubeconfig: str | None) -> tuple[str | None, str, str | None]:
+        return vm.namespace, vm.name, kubeconfig
+
+    @contextmanager
+    def session(
+        self,
+        vm: VirtualMachine,
+        prompt: str | list[str] | None = None,
+        kubeconfig: str | None = None,
+    ) -> Generator[pexpect.spawn]:
+        """
+        Borrow the VM console session, connect (or reconnect) if needed.
+
+        The session is exclusive for the duration of the context.
+        If an exception is raised inside the context, the session is dropped and the next call reconnects, so no
+        later command reads output left unread by a failed one.
+
+        Args:
+            vm: VM resource
+            prompt: Shell prompt pattern(s) to expect
+            kubeconfig: Path to kubeconfig file for remote cluster access
+
+        Yields:
+            pexpect.spawn: Logged-in console child
+        """
+        self.evict_idle()
+        key = self._session_key(vm=vm, kubeconfig=kubeconfig)
+        with self._lock:
+            console_session = self._sessions.get(key)
+            if not console_session:
+                console_session = ConsoleSession(console=Console(vm=vm, prompt=prompt, kubeconfig=kubeconfig))
+                self._sessions[key] = console_session
+
+        with console_session.lock:
+            expected_prompt = prompt or console_session.console.prompt
+            if console_session.is_alive(prompt=expected_prompt):
+                console_session.reuse_count += 1
+                LOGGER.info(f"{vm.name}: reusing console session ({console_session.reuse_count} reuses)")
+            else:
+                console_session.close()
+                console_session.connect()
+
+            try:
+                yield console_session.child
+            except Exception as exp:
+                # After an EOF, a TIMEOUT or any other error the console state is unknown (output may be left unread)
+                LOGGER.warning(f"{vm.name}: console session failed ({exp!r}), it will be reconnected on next use")
+                console_session.close()
+                raise
+            finally:
+                console_session.last_used = time.monotonic()
+
+    def evict_idle(self) -> None:
+        """
+        Close sessions which were not used for more than `idle_timeout` seconds.
+        """
+        now = time.monotonic()
+        with self._lock:
+            idle_keys = [
+                key
+                for key, console_session in self._sessions.items()
+                if now - console_session.last_used > self.idle_timeout and not console_session.lock.locked()
+            ]
+            idle_sessions = [self._sessions.pop(key) for key in idle_keys]
+
+        for console_session in idle_sessions:
+            LOGGER.info(f"{console_session.console.vm.name}: closing idle console session")
+            console_session.close()
+
+    def close(self, vm: VirtualMachine, kubeconfig: str | None = None) -> None:
+        """
+        Close the VM console session, if exists.
+
+        Args:
+            vm: VM resource
+            kubeconfig: Path to kubeconfig file for remote cluster access
+        """
+        with self._lock:
+            console_session = self._sessions.pop(self._session_key(vm=vm, kubeconfig=kubeconfig), None)
+
+        if console_session:
+            with console_session.lock:
+                console_session.close()
+
+    def close_all(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+
+        for console_session in sessions:
+            console_session.close()
+
+
+CONSOLE_SESSION_POOL = ConsoleSessionPool()
+atexit.register(CONSOLE_SESSION_POOL.close_all)
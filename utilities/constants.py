@@ -227,6 +227,7 @@ Images = getattr(ArchImages, next(iter(get_cluster_architecture())).upper())
 # Virtctl constants
 VIRTCTL = "virtctl"
 VIRTCTL_CLI_DOWNLOADS = f"{VIRTCTL}-clidownloads-kubevirt-hyperconverged"
+OC_CLI_DOWNLOADS = "oc-cli-downloads"
 #  Network constants
 SRIOV = "sriov"
 IP_FAMILY_POLICY_PREFER_DUAL_STACK = "PreferDualStack"
@@ -0,0 +1,161 @@
+import logging
+import time
+from collections import defaultdict, deque
+from collections.abc import Generator
+from dataclasses import dataclass
+
+from kubernetes.dynamic import DynamicClient
+from ocp_resources.datavolume import DataVolume
+from timeout_sampler import TimeoutExpiredError
+
+from utilities.constants import TIMEOUT_60MIN
+from utilities.watch import WATCH_EVENT_DELETED, list_and_watch
+
+LOGGER = logging.getLogger(__name__)
+
+# Imports running at once on a storage class, unless set per storage class
+DEFAULT_IMPORTS_PER_STORAGE_CLASS = 4
+
+
+class DataVolumeImportError(Exception):
+    def __init__(self, name: str, namespace: str, reason: str) -> None:
+        self.name = name
+        self.namespace = namespace
+        self.reason = reason
+
+    def __str__(self) -> str:
+        return f"DataVolume {self.namespace}/{self.name} import failed: {self.reason}"
+
+
+@dataclass
+class DataVolumeImportTiming:
+    """DataVolume import timestamps, in seconds since the epoch."""
+
+    name: str
+    storage_class: str | None
+    created: float
+    succeeded: float | None = None
+
+    @property
+    def duration(self) -> float | None:
+        return self.succeeded - self.created if self.succeeded else None
+
+
+def import_data_volumes(
+    client: DynamicClient,
+    data_volumes: list[DataVolume],
+    imports_per_storage_class: int | dict[str, int] = DEFAULT_IMPORTS_PER_STORAGE_CLASS,
+    timeout: int = TIMEOUT_60MIN,
+    timings: dict[str, DataVolumeImportTiming] | None = None,
+) -> Generator[DataVolume]:
+    """
+    Import many DataVolumes concurrently and yield each one as soon as it succeeds.
+
+    DataVolumes are created in the given order, keeping at most `imports_per_storage_class` imports running on each
+    storage class; each success starts the next DataVolume of its storage class. All the DataVolumes are followed with
+    one list/watch stream, which also logs their import progress (status.progress).
+    DataVolumes should be bound immediately (e.g. golden images), a DataVolume waiting for its first consumer never
+    succeeds.
+
+    Usage:
+        for dv in import_data_volumes(client=admin_client, data_volumes=dvs):
+            ...
+
+    Args:
+        client (DynamicClient): Client used for the DataVolumes watch
+        data_volumes (list[DataVolume]): DataVolumes to create, not deployed yet
+        imports_per_storage_class (int | dict): Maximum number of imports running at once on a storage class, or
+            storage class name to its maximum (DEFAULT_IMPORTS_PER_STORAGE_CLASS for storage classes not in it)
+        timeout (int): Time in seconds to wait for all the imports
+        timings (dict, optional): Filled with DataVolume name to its import timing, for reporting by the caller
+
+    Yields:
+        DataVolume: Succeeded DataVolume
+
+    Raises:
+        DataVolumeImportError: If a DataVolume failed or was deleted before it succeeded
+        TimeoutExpiredError: If not all the DataVolumes succeeded in time
+    """
+    if not data_volumes:
+        return
+
+    timings = {} if timings is None else timings
+    queues: dict[str | None, deque[DataVolume]] = defaultdict(deque)
+    for data_volume in data_volumes:
+        queues[data_volume.storage_class].append(data_volume)
+
+    running: dict[tuple[str, str], DataVolume] = {}
+    running_per_storage_class: dict[str | None, int] = defaultdict(int)
+    progress: dict[tuple[str, str], tuple[str, str]] = {}
+
+    def _limit(_storage_class: str | None) -> int:
+        if isinstance(imports_per_storage_class, dict):
+            return imports_per_storage_class.get(_storage_class, DEFAULT_IMPORTS_PER_STORAGE_CLASS)
+        return imports_per_storage_class
+
+    def _start_imports(_storage_class: str | None) -> None:
+        storage_class_queue = queues[_storage_class]
+        while storage_class_queue and running_per_storage_class[_storage_class] < _limit(_storage_class):
+            _data_volume = storage_class_queue.popleft()
+            _data_volume.deploy()
+            timings[_data_volume.name] = DataVolumeImportTiming(
+                name=_data_volume.name, storage_class=_storage_class, created=time.time()
+            )
+            running[(_data_volume.namespace, _data_volume.name)] = _data_volume
+            running_per_storage_class[_storage_class] += 1
+
+    LOGGER.info(
+        f"Importing {len(data_volumes)} DataVolumes: "
+        f"{ {storage_class: len(queue) for storage_class, queue in queues.items()} } per storage class"
+    )
+    for storage_class in list(queues):
+        _start_imports(_storage_class=storage_class)
+
+    namespaces = {data_volume.namespace for data_volume in data_volumes}
+    for event_type, raw_dv in list_and_watch(
+        client=client,
+        resource_kind=DataVolume,
+        namespace=next(iter(namespaces)) if len(namespaces) == 1 else None,
+        timeout=timeout,
+    ):
+        key = (raw_dv["metadata"]["namespace"], raw_dv["metadata"]["name"])
+        if not (data_volume := running.get(key)):
+            continue
+
+        status = raw_dv.get("status", {})
+        phase = status.get("phase", "")
+        if phase == DataVolume.Status.SUCCEEDED:
+            timings[data_volume.name].succeeded = time.time()
+            LOGGER.info(
+                f"DataVolume {data_volume.namespace}/{data_volume.name} imported in "
+                f"{timings[data_volume.name].duration:.1f}s"
+            )
+            del running[key]
+            running_per_storage_class[data_volume.storage_class] -= 1
+            _start_imports(_storage_class=data_volume.storage_class)
+            yield data_volume
+            if not running:
+                return
+            continue
+
+        if event_type == WATCH_EVENT_DELETED:
+            raise DataVolumeImportError(
+                name=data_volume.name, namespace=data_volume.namespace, reason=f"deleted while {phase}"
+            )
+
+        if phase == DataVolume.Status.FAILED:
+            raise DataVolumeImportError(
+                name=data_volume.name,
+                namespace=data_volume.namespace,
+                reason=f"{phase}, conditions: {status.get('conditions')}",
+            )
+
+        if progress.get(key) != (phase, status.get("progress", "")):
+            progress[key] = (phase, status.get("progress", ""))
+            LOGGER.info(f"DataVolume {data_volume.namespace}/{data_volume.name}: {phase} {status.get('progress', '')}")
+
+    if running or any(queues.values()):
+        raise TimeoutExpiredError(
+            f"Timed out importing DataVolumes: {sorted(name for _, name in running)} running, "
+            f"{sum(len(queue) for queue in queues.values())} not started"
+        )
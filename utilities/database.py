@@ -1,9 +1,14 @@
 import datetime
 import logging
+import os
+import threading
+import time
 
 from _pytest.nodes import Collector
 from pytest import Item
 from sqlalchemy import Integer, String, create_engine
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
 
 from utilities.data_collector import get_data_collector_base, get_scope_identifier
@@ -11,6 +16,11 @@ from utilities.data_collector import get_data_collector_base, get_scope_identifi
 LOGGER = logging.getLogger(__name__)
 
 CNV_TEST_DB = "cnvtests.db"
+# Pending start times are written once there are this many, or the oldest write is this old (seconds)
+DEFAULT_WRITE_BATCH_SIZE = 100
+DEFAULT_WRITE_INTERVAL = 60
+# Time in seconds a write waits for another process holding the database lock
+DATABASE_BUSY_TIMEOUT = 30
 
 
 class Base(DeclarativeBase):
@@ -21,51 +31,139 @@ class CnvTestTable(Base):
     __tablename__ = "CnvTestTable"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, nullable=False)
-    test_name: Mapped[str] = mapped_column(String(500))
+    test_name: Mapped[str] = mapped_column(String(500), unique=True)
     start_time: Mapped[int] = mapped_column(Integer, nullable=False)
 
 
 class Database:
     def __init__(
-        self, database_file_name: str = CNV_TEST_DB, verbose: bool = True, base_dir: str | None = None
+        self,
+        database_file_name: str = CNV_TEST_DB,
+        verbose: bool = False,
+        base_dir: str | None = None,
+        write_batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+        write_interval: float = DEFAULT_WRITE_INTERVAL,
+        recreate: bool = False,
     ) -> None:
+        """
+        Start times store of the data collector, created once per session.
+
+        Start times are kept in memory and written to SQLite in batches (see flush), so recording the start time of a
+        test does not touch the database most of the time. The database is in WAL mode and the first start time of a
+        name wins, so worker processes can share it; the process creating it for the session recreates it, so a
+        database left by an interrupted run, possibly of an older schema, is not reused.
+
+        Args:
+            database_file_name (str): Database file name, in the data collector base directory
+            verbose (bool): Log the SQL statements
+            base_dir (str, optional): Data collector base directory
+            write_batch_size (int): Number of pending start times written at once
+            write_interval (float): Maximum time in seconds a start time stays pending, when start times are inserted
+            recreate (bool): Remove the database files first
+        """
         self.database_file_path = f"{get_data_collector_base(base_dir=base_dir)}{database_file_name}"
         self.connection_string = f"sqlite:///{self.database_file_path}"
         self.verbose = verbose
-        self.engine = create_engine(url=self.connection_string, echo=self.verbose)
+        self.write_batch_size = write_batch_size
+        self.write_interval = write_interval
+        if recreate:
+            self._remove_files()
+        self.engine = create_engine(
+            url=self.connection_string, echo=self.verbose, connect_args={"timeout": DATABASE_BUSY_TIMEOUT}
+        )
         Base.metadata.create_all(bind=self.engine)
+        # Persistent database setting: readers do not block the writer and writes do not rewrite the database
+        with self.engine.begin() as connection:
+            connection.exec_driver_sql("PRAGMA journal_mode=WAL")
+        self._start_times: dict[str, int] = {}
+        self._pending: dict[str, int] = {}
+        self._last_write = time.monotonic()
+        self._lock = threading.Lock()
 
     def insert_start_time(self, name: str, start_time: int) -> None:
         """
         Insert start time only if it doesn't exist.
 
+        The start time is written with the next batch, see flush.
+
         Args:
             name (str): Test/class/module identifier.
             start_time (int): Start time in seconds since epoch.
         """
-        with Session(bind=self.engine) as db_session:
-            existing_entry = db_session.query(CnvTestTable).filter_by(test_name=name).first()
-
-            if not existing_entry:
-                new_entry = CnvTestTable(test_name=name, start_time=start_time)
-                db_session.add(new_entry)
-                db_session.commit()
+        with self._lock:
+            if name in self._start_times:
+                return
+
+            self._start_times[name] = start_time
+            self._pending[name] = start_time
+            if (
+                len(self._pending) >= self.write_batch_size
+                or time.monotonic() - self._last_write >= self.write_interval
+            ):
+                self._write_pending()
+
+    def _write_pending(self) -> None:
+        if self._pending:
+            try:
+                with Session(bind=self.engine) as db_session:
+                    db_session.execute(
+                        insert(CnvTestTable).on_conflict_do_nothing(index_elements=["test_name"]),
+                        [{"test_name": name, "start_time": start_time} for name, start_time in self._pending.items()],
+                    )
+                    db_session.commit()
+            except SQLAlchemyError as db_exception:
+                # The start times are still read from memory by this process
+                LOGGER.error(
+                    f"[DATA_COLLECTOR] Failed to write {len(self._pending)} start times: {db_exception}. "
+                    "Must-gather collection of other processes may not be accurate"
+                )
+            finally:
+                self._pending.clear()
+        self._last_write = time.monotonic()
+
+    def flush(self) -> None:
+        """Write the pending start times."""
+        with self._lock:
+            self._write_pending()
 
     def get_start_time(self, name: str) -> int | None:
         """
         Get the start time for a test/class/module.
 
+        The pending start times are written first, the database holds the first start time of all the processes.
+
         Args:
             name (str): Test/class/module identifier.
 
         Returns:
             int | None: Start time in seconds since epoch, or None if not found.
         """
+        self.flush()
         with Session(bind=self.engine) as db_session:
             result = (
                 db_session.query(CnvTestTable).with_entities(CnvTestTable.start_time).filter_by(test_name=name).first()
             )
-            return result[0] if result else None
+            return result[0] if result else self._start_times.get(name)
+
+    def close(self) -> None:
+        """Write the pending start times and close the database connections."""
+        self.flush()
+        self.engine.dispose()
+
+    def remove(self) -> None:
+        """Close the database and remove its files."""
+        self.close()
+        self._remove_files()
+
+    def _remove_files(self) -> None:
+        for database_file in (
+            self.database_file_path,
+            f"{self.database_file_path}-wal",
+            f"{self.database_file_path}-shm",
+        ):
+            if os.path.exists(database_file):
+                LOGGER.info(f"Removing database file path {database_file}")
+                os.remove(database_file)
 
     def get_start_time_for_collection(self, node: Item | Collector) -> int:
         """
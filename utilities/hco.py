@@ -35,6 +35,7 @@ from utilities.ssp import (
     wait_for_deleted_data_import_crons,
     wait_for_ssp_conditions,
 )
+from utilities.watch import WATCH_HUB
 
 LOGGER = logging.getLogger(__name__)
 
@@ -144,21 +145,17 @@ def wait_for_hco_conditions(
 
 def wait_for_ds(ds):
     LOGGER.info(f"Waiting for daemonset {ds.name} to be up to date.")
-    samples = TimeoutSampler(
-        wait_timeout=TIMEOUT_4MIN,
-        sleep=5,
-        func=lambda: ds.instance.to_dict(),
-    )
+
+    def _ds_updated(_ds):
+        status = _ds.get("status", {})
+        return _ds["metadata"].get("generation") == status.get("observedGeneration") and (
+            status.get("desiredNumberScheduled")
+            == status.get("currentNumberScheduled")
+            == status.get("updatedNumberScheduled")
+        )
+
     try:
-        for sample in samples:
-            status = sample.get("status")
-            metadata = sample.get("metadata")
-            if metadata.get("generation") == status.get("observedGeneration") and (
-                status.get("desiredNumberScheduled")
-                == status.get("currentNumberScheduled")
-                == status.get("updatedNumberScheduled")
-            ):
-                break
+        WATCH_HUB.wait_for_resource(resource=ds, predicate=_ds_updated, timeout=TIMEOUT_4MIN)
     except TimeoutExpiredError:
         LOGGER.error(f"Timeout waiting for daemonset {ds.name} to be up to date.")
         raise
@@ -166,19 +163,15 @@ def wait_for_ds(ds):
 
 def wait_for_dp(dp):
     LOGGER.info(f"Waiting for deployment {dp.name} to be up to date.")
-    samples = TimeoutSampler(
-        wait_timeout=TIMEOUT_4MIN,
-        sleep=5,
-        func=lambda: dp.instance.to_dict(),
-    )
+
+    def _dp_updated(_dp):
+        status = _dp.get("status", {})
+        return _dp["metadata"].get("generation") == status.get("observedGeneration") and status.get(
+            "replicas"
+        ) == status.get("updatedReplicas")
+
     try:
-        for sample in samples:
-            status = sample.get("status")
-            metadata = sample.get("metadata")
-            if metadata.get("generation") == status.get("observedGeneration") and status.get("replicas") == status.get(
-                "updatedReplicas"
-            ):
-                break
+        WATCH_HUB.wait_for_resource(resource=dp, predicate=_dp_updated, timeout=TIMEOUT_4MIN)
     except TimeoutExpiredError:
         LOGGER.error(f"Timeout waiting for deployment {dp.name} to be up to date.")
         raise
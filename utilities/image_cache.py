@@ -0,0 +1,193 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+from utilities.constants import TIMEOUT_60MIN
+
+LOGGER = logging.getLogger(__name__)
+
+IMAGE_INFO_CACHE_TTL = TIMEOUT_60MIN
+# Directory of the on-disk cache, shared by processes and sessions; no on-disk cache if not set
+IMAGE_INFO_CACHE_DIR_ENV_VAR = "CNV_TESTS_IMAGE_INFO_CACHE_DIR"
+DEFAULT_IMAGE_LOOKUP_WORKERS = 8
+
+
+def file_sha256(path: str | None) -> str:
+    """
+    Get the sha256 of a file content.
+
+    Args:
+        path (str, optional): File path
+
+    Returns:
+        str: Hex digest, empty string if no path is given
+    """
+    if not path:
+        return ""
+
+    with open(path, "rb") as fd:
+        return hashlib.sha256(fd.read()).hexdigest()
+
+
+def is_digest_reference(image: str) -> bool:
+    """Image references pinned to a digest (image@sha256:...) always resolve to the same content."""
+    return "@sha256:" in image
+
+
+@dataclass
+class ImageInfoCacheStats:
+    hits: int = 0
+    disk_hits: int = 0
+    lookups: int = 0
+
+
+class ImageInfoCache:
+    def __init__(self, ttl: int = IMAGE_INFO_CACHE_TTL, cache_dir: str | None = None) -> None:
+        """
+        Process-wide cache of image info (`oc image info` output), optionally persisted on disk.
+
+        Entries are keyed by image reference, architecture and the pull secret content hash (not its path, which is a
+        new temporary file in every process). Entries of tag references expire after `ttl` seconds, entries of digest
+        references never expire. Concurrent lookups of the same key wait for a single registry lookup.
+
+        Args:
+            ttl (int): Time in seconds to keep entries of tag references
+            cache_dir (str, optional): Directory of the on-disk cache
+        """
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self.stats = ImageInfoCacheStats()
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def cache_key(image: str, architecture: str, pull_secret: str | None = None) -> str:
+        return hashlib.sha256(f"{image}|{architecture}|{file_sha256(path=pull_secret)}".encode()).hexdigest()
+
+    def _is_valid(self, entry: dict[str, Any] | None) -> bool:
+        return bool(entry) and (is_digest_reference(image=entry["image"]) or time.time() - entry["fetched"] < self.ttl)
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            setattr(self.stats, stat, getattr(self.stats, stat) + 1)
+
+    def _read_from_disk(self, key: str) -> dict[str, Any] | None:
+        if not self.cache_dir:
+            return None
+
+        try:
+            with open(os.path.join(self.cache_dir, f"{key}.json")) as fd:
+                return json.load(fd)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exp:
+            LOGGER.warning(f"Ignoring unreadable image info cache entry {key}: {exp}")
+            return None
+
+    def _write_to_disk(self, key: str, entry: dict[str, Any]) -> None:
+        if not self.cache_dir:
+            return
+
+        # Write and rename, so other processes never read a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as tmp_file:
+            json.dump(entry, tmp_file)
+        os.replace(tmp_path, os.path.join(self.cache_dir, f"{key}.json"))
+
+    def get(
+        self,
+        image: str,
+        architecture: str,
+        fetch: Callable[[], dict[str, Any] | None],
+        pull_secret: str | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Get image info from the cache, or look it up with `fetch` and cache it.
+
+        Args:
+            image (str): Image reference
+            architecture (str): Image architecture, e.g. linux/amd64
+            fetch (Callable): Looks up the image info in the registry
+            pull_secret (str, optional): Path of the pull secret used for the lookup
+
+        Returns:
+            dict | None: Image info, None (not cached) if the lookup returned nothing
+        """
+        key = self.cache_key(image=image, architecture=architecture, pull_secret=pull_secret)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            if self._is_valid(entry=(entry := self._entries.get(key))):
+                self._count(stat="hits")
+                return entry["info"]
+
+            if self._is_valid(entry=(entry := self._read_from_disk(key=key))):
+                self._count(stat="disk_hits")
+                self._entries[key] = entry
+                return entry["info"]
+
+            self._count(stat="lookups")
+            if not (image_info := fetch()):
+                return image_info
+
+            entry = {"image": image, "architecture": architecture, "fetched": time.time(), "info": image_info}
+            self._entries[key] = entry
+            self._write_to_disk(key=key, entry=entry)
+            return image_info
+
+    def get_many(
+        self,
+        images: list[str],
+        architecture: str,
+        fetch: Callable[[str], dict[str, Any] | None],
+        pull_secret: str | None = None,
+        max_workers: int = DEFAULT_IMAGE_LOOKUP_WORKERS,
+    ) -> dict[str, dict[str, Any] | None]:
+        """
+        Get the info of many images, looking up the missing ones in parallel.
+
+        Args:
+            images (list): Image references, duplicates are looked up once
+            architecture (str): Image architecture, e.g. linux/amd64
+            fetch (Callable): Called with the image keyword argument, looks up the image info in the registry
+            pull_secret (str, optional): Path of the pull secret used for the lookups
+            max_workers (int): Maximum number of concurrent lookups
+
+        Returns:
+            dict: Image reference to its info
+
+        Raises:
+            Exception: The first failed lookup, after all the lookups finished
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                _image: executor.submit(
+                    self.get,
+                    image=_image,
+                    architecture=architecture,
+                    fetch=partial(fetch, image=_image),
+                    pull_secret=pull_secret,
+                )
+                for _image in dict.fromkeys(images)
+            }
+        return {_image: future.result() for _image, future in futures.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+IMAGE_INFO_CACHE = ImageInfoCache(cache_dir=os.environ.get(IMAGE_INFO_CACHE_DIR_ENV_VAR))
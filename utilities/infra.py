@@ -1,6 +1,5 @@
 import base64
 import io
-import json
 import logging
 import os
 import platform
@@ -12,10 +11,12 @@ import tarfile
 import tempfile
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from dataclasses import dataclass, field
 from functools import cache
 from subprocess import PIPE, CalledProcessError, Popen
-from typing import Any, Generator
+from typing import Any
 
 import netaddr
 import requests
@@ -33,6 +34,7 @@ from ocp_resources.exceptions import ResourceTeardownError
 from ocp_resources.hyperconverged import HyperConverged
 from ocp_resources.infrastructure import Infrastructure
 from ocp_resources.namespace import Namespace
+from ocp_resources.node import Node
 from ocp_resources.package_manifest import PackageManifest
 from ocp_resources.pod import Pod
 from ocp_resources.project_request import ProjectRequest
@@ -43,27 +45,24 @@ from packaging.version import Version
 from pyhelper_utils.shell import run_command, run_ssh_commands
 from pytest_testconfig import config as py_config
 from requests import HTTPError, Timeout, TooManyRedirects
-from timeout_sampler import TimeoutExpiredError, TimeoutSampler, retry
+from timeout_sampler import TimeoutExpiredError, TimeoutSampler
 
 import utilities.virt
+from utilities.binary_cache import BINARY_CACHE
+from utilities.bulk import delete_collection
 from utilities.constants import (
     AMD_64,
-    AUDIT_LOGS_PATH,
     CLUSTER,
     HCO_CATALOG_SOURCE,
     KUBECONFIG,
     NET_UTIL_CONTAINER_IMAGE,
-    OC_ADM_LOGS_COMMAND,
     PROMETHEUS_K8S,
     TIMEOUT_1MIN,
     TIMEOUT_2MIN,
-    TIMEOUT_3MIN,
-    TIMEOUT_4MIN,
     TIMEOUT_5MIN,
     TIMEOUT_5SEC,
     TIMEOUT_6MIN,
     TIMEOUT_10MIN,
-    TIMEOUT_10SEC,
     TIMEOUT_30SEC,
     VIRTCTL,
     X86_64,
@@ -74,6 +73,7 @@ from utilities.exceptions import (
     UtilityPodNotFoundError,
 )
 from utilities.ssp import guest_agent_version_parser
+from utilities.watch import RESOURCE_CACHE, WATCH_HUB
 
 NON_EXIST_URL = "https://noneexist.test"  # Use 'test' domain rfc6761
 EXCLUDED_FROM_URL_VALIDATION = ("", NON_EXIST_URL)
@@ -95,9 +95,13 @@ def create_ns(
     labels: dict[str, str] | None = None,
     teardown: bool = True,
     delete_timeout: int = TIMEOUT_6MIN,
+    bulk_delete_kinds: list[type[Resource]] | None = None,
 ):
     """
     For kubemacpool labeling opt-modes, provide kmp_vm_label and admin_client as admin_client
+
+    bulk_delete_kinds: kinds (e.g. VirtualMachine) deleted with one collection delete each before the namespace is
+    deleted, much faster than the namespace deletion for namespaces with many resources of these kinds
     """
     if not unprivileged_client:
         with Namespace(
@@ -109,6 +113,10 @@ def create_ns(
         ) as ns:
             ns.wait_for_status(status=Namespace.Status.ACTIVE, timeout=TIMEOUT_2MIN)
             yield ns
+            if teardown:
+                delete_namespace_collections(
+                    client=admin_client, namespace=name, resource_kinds=bulk_delete_kinds, timeout=delete_timeout
+                )
     else:
         ProjectRequest(name=name, client=unprivileged_client, teardown=teardown).deploy()
         label_project(name=name, label=labels, admin_client=admin_client)
@@ -117,10 +125,35 @@ def create_ns(
         yield ns
 
         ns.client = admin_client
+        if teardown:
+            delete_namespace_collections(
+                client=admin_client, namespace=name, resource_kinds=bulk_delete_kinds, timeout=delete_timeout
+            )
         if teardown and not ns.clean_up():
             raise ResourceTeardownError(resource=ns)
 
 
+def delete_namespace_collections(
+    client: DynamicClient,
+    namespace: str,
+    resource_kinds: list[type[Resource]] | None,
+    timeout: int = TIMEOUT_6MIN,
+) -> None:
+    """
+    Delete all the resources of the given kinds in a namespace, with one collection delete and one watch per kind.
+
+    Args:
+        client (DynamicClient): Client to use
+        namespace (str): Namespace name
+        resource_kinds (list, optional): ocp_resources classes, e.g. VirtualMachine; nothing is deleted if not set
+        timeout (int): Time in seconds to wait for the resources of each kind to be deleted
+    """
+    for resource_kind in resource_kinds or []:
+        report = delete_collection(client=client, resource_kind=resource_kind, namespace=namespace, timeout=timeout)
+        if report.timings:
+            LOGGER.info(f"{resource_kind.kind} resources deletion in {namespace}: {report.summary()}")
+
+
 class ClusterHosts:
     class Type:
         VIRTUAL = "virtual"
@@ -179,17 +212,77 @@ def wait_for_pods_deletion(pods):
         pod.wait_deleted()
 
 
-def get_pod_container_error_status(pod: Pod) -> str | None:
-    try:
-        pod_instance_status = pod.instance.status
-        # Check the containerStatuses and if any container is in waiting state, return that information:
-        for container_status in pod_instance_status.get("containerStatuses", []):
-            if waiting_container := container_status.get("state", {}).get("waiting"):
-                return waiting_container["reason"] if waiting_container.get("reason") else waiting_container
-        return None
-    except NotFoundError:
-        LOGGER.error(f"Pod {pod.name} was not found")
-        raise
+def get_container_waiting_reason(pod_status: dict[str, Any]) -> str | dict[str, Any] | None:
+    """
+    Get the waiting state of the first waiting container of a pod.
+
+    Args:
+        pod_status (dict): Pod status (a raw dict or the ResourceField of pod.instance.status)
+
+    Returns:
+        str | dict | None: The waiting reason (or the waiting state if it has no reason), None if no container waits
+    """
+    for container_status in pod_status.get("containerStatuses") or []:
+        if waiting_container := container_status.get("state", {}).get("waiting"):
+            return waiting_container["reason"] if waiting_container.get("reason") else waiting_container
+    return None
+
+
+def get_pod_health_status(pod: dict[str, Any]) -> str | dict[str, Any] | None:
+    """
+    Evaluate the health of a raw pod dict, without API calls.
+
+    Pods marked for deletion are not healthy; this ensures any pod spun up in place of a pod marked for deletion
+    reaches a healthy state before the end of the check.
+
+    Args:
+        pod (dict): Raw pod dict
+
+    Returns:
+        str | dict | None: The pod phase or container waiting reason if the pod is not healthy, None if the pod is
+            Running/Succeeded with no waiting container
+    """
+    pod_status = pod.get("status") or {}
+    phase = pod_status.get("phase")
+    if pod["metadata"].get("deletionTimestamp") or phase not in (Pod.Status.RUNNING, Pod.Status.SUCCEEDED):
+        return phase
+    return get_container_waiting_reason(pod_status=pod_status)
+
+
+@dataclass
+class PodsHealthReport:
+    """Health of the pods of a namespace, evaluated in a single pass over the listed pods."""
+
+    checked: list[str] = field(default_factory=list)
+    ignored: list[str] = field(default_factory=list)
+    not_running: dict[str, str | dict[str, Any] | None] = field(default_factory=dict)
+
+
+def get_pods_health_report(pods: list[dict[str, Any]], filter_pods_by_name: str = "") -> PodsHealthReport:
+    """
+    Evaluate the health of raw pod dicts (e.g. from a single list request), without API calls.
+
+    Args:
+        pods (list): Raw pod dicts
+        filter_pods_by_name (str): Ignore pods with this string in their name
+
+    Returns:
+        PodsHealthReport: Checked, ignored and not running pods
+    """
+    report = PodsHealthReport()
+    for pod in pods:
+        pod_name = pod["metadata"]["name"]
+        if filter_pods_by_name and filter_pods_by_name in pod_name:
+            report.ignored.append(pod_name)
+            continue
+
+        report.checked.append(pod_name)
+        if (pod_health_status := get_pod_health_status(pod=pod)) is not None:
+            report.not_running[pod_name] = pod_health_status
+
+    if report.ignored:
+        LOGGER.warning(f"Ignoring pods: {report.ignored} for pod state validations.")
+    return report
 
 
 def get_not_running_pods(pods: list[Pod], filter_pods_by_name: str = "") -> list[dict[str | None, str]]:
@@ -199,18 +292,8 @@ def get_not_running_pods(pods: list[Pod], filter_pods_by_name: str = "") -> list
             LOGGER.warning(f"Ignoring pod: {pod.name} for pod state validations.")
             continue
         try:
-            pod_instance = pod.instance
-            # Waits for all pods in a given namespace to be in final healthy state(running/completed).
-            # We also need to keep track of pods marked for deletion as not running. This would ensure any
-            # pod that was spinned up in place of pod marked for deletion, reaches healthy state before end
-            # of this check
-            if pod_instance.metadata.get("deletionTimestamp") or pod_instance.status.phase not in (
-                pod.Status.RUNNING,
-                pod.Status.SUCCEEDED,
-            ):
-                pods_not_running.append({pod.name: pod.status})
-            elif container_status_error := get_pod_container_error_status(pod=pod):
-                pods_not_running.append({pod.name: container_status_error})
+            if (pod_health_status := get_pod_health_status(pod=pod.instance.to_dict())) is not None:
+                pods_not_running.append({pod.name: pod_health_status})
         except ResourceNotFoundError, NotFoundError:
             LOGGER.warning(f"Ignoring pod {pod.name} that disappeared during cluster sanity check")
             pods_not_running.append({pod.name: "Deleted"})
@@ -222,15 +305,23 @@ def wait_for_pods_running(
     namespace: Namespace,
     number_of_consecutive_checks: int = 1,
     filter_pods_by_name: str = "",
-) -> None:
+    watch: bool = False,
+) -> PodsHealthReport | None:
     """
     Waits for all pods in a given namespace to reach Running/Completed state. To avoid catching all pods in running
     state too soon, use number_of_consecutive_checks with appropriate values.
+
+    Each sample evaluates the pods of a single list request (or of the watch cache in watch mode).
+
     Args:
          admin_client(DynamicClient): Dynamic client
          namespace(Namespace): A namespace object
          number_of_consecutive_checks(int): Number of times to check for all pods in running state
          filter_pods_by_name(str): string to filter pod names by
+         watch(bool): Read the pods from the shared watch cache (utilities.watch.RESOURCE_CACHE) instead of listing
+            them on every sample
+    Returns:
+        PodsHealthReport | None: Report of the last check, None if no pods were found
     Raises:
         TimeoutExpiredError: Raises TimeoutExpiredError if any of the pods in the given namespace are not in Running
          state
@@ -238,31 +329,35 @@ def wait_for_pods_running(
     samples = TimeoutSampler(
         wait_timeout=TIMEOUT_5MIN,
         sleep=TIMEOUT_5SEC,
-        func=get_pods,
+        func=RESOURCE_CACHE.list_raw,
         client=admin_client,
-        namespace=namespace,
+        resource_kind=Pod,
+        namespace=namespace.name,
+        fresh=not watch,
         exceptions_dict={NotFoundError: []},
     )
 
-    not_running_pods = []
+    report = None
     try:
         current_check = 0
         for sample in samples:
             if sample:
-                if not_running_pods := get_not_running_pods(pods=sample, filter_pods_by_name=filter_pods_by_name):
-                    LOGGER.warning(f"Not running pods: {not_running_pods}")
+                report = get_pods_health_report(pods=sample, filter_pods_by_name=filter_pods_by_name)
+                if report.not_running:
+                    LOGGER.warning(f"Not running pods: {report.not_running}")
                     current_check = 0
                 else:
                     current_check += 1
                     if current_check >= number_of_consecutive_checks:
-                        return
+                        return report
     except TimeoutExpiredError:
-        if not_running_pods:
+        if report and report.not_running:
             LOGGER.error(
                 f"timeout waiting for all pods in namespace {namespace.name} to reach "
-                f"running state, following pods are in not running state: {not_running_pods}"
+                f"running state, following pods are in not running state: {report.not_running}"
             )
             raise
+    return report
 
 
 def get_daemonset_by_name(admin_client, daemonset_name, namespace_name):
@@ -303,9 +398,10 @@ def wait_for_consistent_resource_conditions(
 ):
     """This function awaits certain conditions of a given resource_kind (HCO, CSV, etc.).
 
-    Using TimeoutSampler loop and poll the CR (of the resource_kind type) and attempt to match the expected conditions
-    against the actual conditions found in the CR.
-    Since the conditions statuses might change, we use consecutive checks in order to have consistent results (stable),
+    Using the shared resource watch (utilities.watch.WATCH_HUB), attempt to match the expected conditions against the
+    actual conditions found in the CR (of the resource_kind type) on every change.
+    Since the conditions statuses might change, the conditions should be met continuously for
+    polling_interval * (consecutive_checks_count - 1) seconds in order to have consistent results (stable),
     thereby ascertaining that the expected conditions are met over time.
 
     Args:
@@ -323,70 +419,67 @@ def wait_for_consistent_resource_conditions(
         condition_key1 (str): the key of the first condition in the actual resource_kind (e.g. type, reason, status)
         condition_key2 (str): the key of the second condition in the actual resource_kind (e.g. type, reason, status)
         total_timeout (int): total timeout to wait for (seconds)
-        polling_interval (int): the time to sleep after each iteration (seconds)
-        consecutive_checks_count (int): the number of repetitions for the status check to make sure the transition is
-        done.
+        polling_interval (int): the time between two consecutive checks (seconds)
+        consecutive_checks_count (int): the number of consecutive checks the conditions should be met to make sure
+        the transition is done.
             The default value for this argument is not absolute, and there are situations in which it should be higher
             in order to ascertain the consistency of the Ready status.
             Possible situations:
             1. the resource is in a Ready status, because the process (that should cause
             the change in its state) has not started yet.
             2. some components are in Ready status, but others have not started the process yet.
-        exceptions_dict: TimeoutSampler exceptions_dict
+        exceptions_dict: TimeoutSampler style exceptions_dict, the watch is restarted on these exceptions
+        resource_name (str, optional): resource name, the first resource of resource_kind if not set
 
     Raises:
         TimeoutExpiredError: raised when expected conditions are not met within the timeframe
     """
-    samples = TimeoutSampler(
-        wait_timeout=total_timeout,
-        sleep=polling_interval,
-        func=lambda: list(
-            resource_kind.get(
-                client=dynamic_client,
-                namespace=namespace,
-                name=resource_name,
-            )
-        ),
-        exceptions_dict=exceptions_dict,
-    )
-    current_check = 0
     actual_conditions = {}
+
+    def _conditions_met(_resource):
+        nonlocal actual_conditions
+        status_conditions = _resource.get("status", {}).get("conditions")
+        if not status_conditions:
+            return False
+
+        actual_conditions = {
+            condition[condition_key1]: condition[condition_key2]
+            for condition in status_conditions
+            if condition[condition_key1] in expected_conditions
+        }
+        if actual_conditions == expected_conditions:
+            return True
+
+        if stop_conditions:
+            actual_conditions = {condition["type"]: condition["reason"] for condition in status_conditions}
+            matched_stop_conditions = {
+                type: reason
+                for type, reason in stop_conditions.items()
+                if type in actual_conditions and actual_conditions[type] == reason
+            }
+            if matched_stop_conditions:
+                LOGGER.error(
+                    f"Execution halted due to matched stop conditions: {matched_stop_conditions}. "
+                    f"Current status conditions: {status_conditions}."
+                )
+                raise TimeoutExpiredError(f"Stop condition met for {resource_kind.__name__}/{resource_name}.")
+        return False
+
     LOGGER.info(
         f"Waiting for resource to stabilize: resource_kind={resource_kind.__name__} conditions={expected_conditions} "
         f"sleep={total_timeout} consecutive_checks_count={consecutive_checks_count}"
     )
     try:
-        for sample in samples:
-            status_conditions = sample[0].instance.get("status", {}).get("conditions")
-            if status_conditions:
-                actual_conditions = {
-                    condition[condition_key1]: condition[condition_key2]
-                    for condition in status_conditions
-                    if condition[condition_key1] in expected_conditions
-                }
-                if actual_conditions == expected_conditions:
-                    current_check += 1
-                    if current_check >= consecutive_checks_count:
-                        return
-                    continue
-                else:
-                    current_check = 0
-                    if stop_conditions:
-                        actual_conditions = {condition["type"]: condition["reason"] for condition in status_conditions}
-                        matched_stop_conditions = {
-                            type: reason
-                            for type, reason in stop_conditions.items()
-                            if type in actual_conditions and actual_conditions[type] == reason
-                        }
-                        if matched_stop_conditions:
-                            LOGGER.error(
-                                f"Execution halted due to matched stop conditions: {matched_stop_conditions}. "
-                                f"Current status conditions: {status_conditions}."
-                            )
-                            raise TimeoutExpiredError(
-                                f"Stop condition met for {resource_kind.__name__}/{resource_name}."
-                            )
-
+        WATCH_HUB.wait_for(
+            client=dynamic_client,
+            resource_kind=resource_kind,
+            predicate=_conditions_met,
+            name=resource_name,
+            namespace=namespace,
+            timeout=total_timeout,
+            stable_for=polling_interval * max(consecutive_checks_count - 1, 0),
+            exceptions_dict=exceptions_dict,
+        )
     except TimeoutExpiredError:
         LOGGER.error(
             f"Timeout expired meeting conditions for resource: resource={resource_kind.kind} "
@@ -723,29 +816,93 @@ def get_and_extract_file_from_cluster(urls, system_os, dest_dir, machine_type=No
     raise UrlNotFoundError(f"Url not found for system_os={system_os}")
 
 
+def get_platform_console_link(urls: list[str], system_os: str | None = None, machine_type: str | None = None) -> str:
+    """
+    Get the ConsoleCLIDownload link of an OS and machine type.
+
+    Args:
+        urls (list[str]): ConsoleCLIDownload links
+        system_os (str, optional): OS, e.g. linux, mac or windows; the local OS if not given
+        machine_type (str, optional): Machine type, e.g. amd64; the local machine type if not given
+
+    Returns:
+        str: Link of the OS and machine type
+
+    Raises:
+        UrlNotFoundError: If no link matches
+    """
+    if not system_os:
+        system_os = platform.system().lower()
+        if system_os == "darwin" and platform.mac_ver()[0]:
+            system_os = "mac"
+
+    machine_type = machine_type or get_machine_platform()
+    for url in urls:
+        if system_os in url and machine_type in url:
+            return url
+
+    raise UrlNotFoundError(f"Url not found for system_os={system_os}")
+
+
 def download_file_from_cluster(
-    get_console_spec_links_name: str, dest_dir: os.PathLike[str], admin_client: DynamicClient
+    get_console_spec_links_name: str,
+    dest_dir: os.PathLike[str],
+    admin_client: DynamicClient,
+    server_version: str = "",
 ) -> str:
+    """
+    Download the binary of a ConsoleCLIDownload for the local OS and machine type, through BINARY_CACHE.
+
+    Args:
+        get_console_spec_links_name (str): ConsoleCLIDownload name
+        dest_dir (os.PathLike[str]): Directory of the binary
+        admin_client (DynamicClient): Client to use
+        server_version (str): Version of the component serving the binary, part of the cache key
+
+    Returns:
+        str: Binary path
+    """
     console_cli_links = get_console_spec_links(
         admin_client=admin_client,
         name=get_console_spec_links_name,
     )
-    download_urls = get_all_console_links(console_cli_downloads_spec_links=console_cli_links)
-    os_system = platform.system().lower()
-
-    if os_system == "darwin" and platform.mac_ver()[0]:
-        os_system = "mac"
-
-    binary_file = get_and_extract_file_from_cluster(
-        system_os=os_system,
-        urls=download_urls,
-        dest_dir=dest_dir,
-        machine_type=get_machine_platform(),
-    )
+    url = get_platform_console_link(urls=get_all_console_links(console_cli_downloads_spec_links=console_cli_links))
+    binary_file = BINARY_CACHE.get(url=url, dest_dir=str(dest_dir), server_version=server_version)
     os.chmod(binary_file, stat.S_IRUSR | stat.S_IXUSR)
     return binary_file
 
 
+def download_files_from_cluster(
+    console_cli_downloads: dict[str, str], dest_dir: os.PathLike[str], admin_client: DynamicClient
+) -> dict[str, str]:
+    """
+    Download the binaries of ConsoleCLIDownloads concurrently, see download_file_from_cluster.
+
+    Args:
+        console_cli_downloads (dict[str, str]): ConsoleCLIDownload name to the version of the component serving it
+        dest_dir (os.PathLike[str]): Directory of the binaries
+        admin_client (DynamicClient): Client to use
+
+    Returns:
+        dict[str, str]: ConsoleCLIDownload name to its binary path
+    """
+    if not console_cli_downloads:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=len(console_cli_downloads)) as executor:
+        futures = {
+            name: executor.submit(
+                download_file_from_cluster,
+                get_console_spec_links_name=name,
+                dest_dir=dest_dir,
+                admin_client=admin_client,
+                server_version=server_version,
+            )
+            for name, server_version in console_cli_downloads.items()
+        }
+    return {name: future.result() for name, future in futures.items()}
+
+
 def get_machine_platform():
     os_machine_type = platform.machine()
     return AMD_64 if os_machine_type == X86_64 else os_machine_type
@@ -805,76 +962,16 @@ def generate_openshift_pull_secret_file(client: DynamicClient = None) -> str:
     return json_file
 
 
-@retry(
-    wait_timeout=TIMEOUT_4MIN,
-    sleep=TIMEOUT_10SEC,
-    exceptions_dict={RuntimeError: []},
-)
-def get_node_audit_log_entries(log: str, node: str, log_entry: str) -> tuple[bool, list[str]]:
-    """
-    Retrieve audit log entries from a node matching a specific log entry pattern.
-
-    Args:
-        log: Name of the audit log file to read
-        node: Node name to retrieve logs from
-        log_entry: Pattern to search for in the audit logs
-
-    Returns:
-        Tuple of (success: bool, lines: list[str]) where success indicates if operation completed
-        and lines contains matching log entries
-    """
-    # Patterns to match errors that should trigger a retry
-    error_patterns_list = [
-        r"^\s*error:",
-        r"Unhandled Error.*couldn't get current server API group list.*i/o timeout",
-        r".*read tcp.*connection reset by peer",
-    ]
-    error_patterns = re.compile("|".join(f"({pattern})" for pattern in error_patterns_list))
-
-    result = subprocess.run(
-        f"{OC_ADM_LOGS_COMMAND} {node} {AUDIT_LOGS_PATH}/{log} | grep {shlex.quote(log_entry)}",
-        shell=True,
-        capture_output=True,
-        text=True,
-        timeout=TIMEOUT_3MIN,
-    )
-    lines = result.stdout.splitlines()
-    has_errors = any(error_patterns.search(line) for line in lines)
-    if has_errors:
-        if any(line.strip().startswith("404 page not found") for line in lines):
-            LOGGER.warning(f"Skipping {log} check as it was rotated:\n{lines}")
-            return True, []
-        LOGGER.warning(f"oc command failed for node {node}, log {log}:\n{lines}")
-        raise RuntimeError
-    return True, lines
-
-
-def get_node_audit_log_line_dict(logs: list[str], node: str, log_entry: str) -> Generator[dict[str, Any], None, None]:
-    """
-    Parse audit log entries into dictionaries.
-
-    Args:
-        logs: List of audit log file names
-        node: Node name to retrieve logs from
-        log_entry: Pattern to search for in the audit logs
-
-    Yields:
-        Parsed JSON dictionaries from matching audit log lines
-    """
-    for log in logs:
-        _, deprecated_api_lines = get_node_audit_log_entries(log=log, node=node, log_entry=log_entry)
-        if deprecated_api_lines:
-            for line in deprecated_api_lines:
-                try:
-                    yield json.loads(line)
-                except json.decoder.JSONDecodeError:
-                    LOGGER.error(f"Unable to parse line: {line!r}")
-                    raise
-
-
 def wait_for_node_status(node, status=True, wait_timeout=TIMEOUT_1MIN):
     """Wait for node status Ready (status=True) or NotReady (status=False)"""
-    for sample in TimeoutSampler(wait_timeout=wait_timeout, sleep=1, func=lambda: node.kubelet_ready):
+
+    def _kubelet_ready():
+        return any(
+            condition["reason"] == "KubeletReady" and condition["status"] == Node.Condition.Status.TRUE
+            for condition in RESOURCE_CACHE.instance(resource=node).status.conditions
+        )
+
+    for sample in TimeoutSampler(wait_timeout=wait_timeout, sleep=1, func=_kubelet_ready):
         if (status and sample) or (not status and not sample):
             return
 
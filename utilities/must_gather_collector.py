@@ -0,0 +1,160 @@
+import logging
+import os
+import shlex
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from pyhelper_utils.shell import run_command
+
+from utilities.cluster import cache_admin_client
+from utilities.constants import TIMEOUT_1MIN, TIMEOUT_5MIN
+from utilities.data_collector import collect_default_cnv_must_gather_with_vm_gather
+
+LOGGER = logging.getLogger(__name__)
+
+INSPECT_BASE_COMMAND = "oc adm inspect"
+# Failures within this time (seconds) of the first failure of a collection share its must-gather
+DEFAULT_MUST_GATHER_COALESCE_WINDOW = TIMEOUT_1MIN
+DEFAULT_MAX_CONCURRENT_MUST_GATHERS = 2
+# Added before the earliest test start, to work around must-gather timing issues
+MUST_GATHER_SINCE_BUFFER = TIMEOUT_5MIN
+# Link to the collection directory in the failure directory
+MUST_GATHER_LINK = "must-gather"
+
+
+@dataclass
+class MustGatherCollection:
+    """Must-gather shared by the failures added before it started."""
+
+    number: int
+    target_dir: str
+    deadline: float
+    # Earliest time to collect from, in seconds since the epoch
+    since_epoch: int
+    test_names: list[str] = field(default_factory=list)
+    started: bool = False
+
+    def since_time(self) -> int:
+        return int(time.time()) - self.since_epoch
+
+
+class MustGatherCollector:
+    def __init__(
+        self,
+        output_dir: str,
+        coalesce_window: float = DEFAULT_MUST_GATHER_COALESCE_WINDOW,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_MUST_GATHERS,
+    ) -> None:
+        """
+        Collect must-gathers of failed tests in background threads, one must-gather for failures close in time.
+
+        A failure joins the collection not started yet, or opens a new one which starts `coalesce_window` seconds
+        later; at most `max_concurrent` collections run at once, a collection waiting for a free slot keeps taking
+        failures. Its must-gather `--since` covers the earliest test start of its failures. The `oc adm inspect` of the
+        failed test namespaces runs at once, before the test teardown deletes them, in the failure directory, which
+        links to the collection directory.
+
+        Usage:
+            collector = MustGatherCollector(output_dir=directory)
+            collector.add_failure(test_name=name, test_start_time=start_time, failure_dir=failure_dir)
+            ...
+            collector.close()
+
+        Args:
+            output_dir (str): Directory of the collections directories
+            coalesce_window (float): Time in seconds a collection waits for more failures before it starts
+            max_concurrent (int): Maximum number of collections running at once
+        """
+        self.output_dir = output_dir
+        self.coalesce_window = coalesce_window
+        self.collections: list[MustGatherCollection] = []
+        self._open_collection: MustGatherCollection | None = None
+        self._futures: list[Future] = []
+        self._lock = threading.Lock()
+        self._closing = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix="must-gather")
+
+    def add_failure(
+        self, test_name: str, test_start_time: int, failure_dir: str, inspect_resources: list[str] | None = None
+    ) -> str:
+        """
+        Add a failure to the open collection, or to a new one, and run its `oc adm inspect`.
+
+        Args:
+            test_name (str): Failed test name
+            test_start_time (int): Test (or its data collector scope) start time in seconds since the epoch, 0 if not
+                known (the failure time is used)
+            failure_dir (str): Failure directory, with the inspect output and the link to the collection directory
+            inspect_resources (list[str], optional): Resources to `oc adm inspect`, e.g. namespace/openshift-cnv
+
+        Returns:
+            str: Collection directory
+        """
+        since_epoch = (test_start_time or int(time.time())) - MUST_GATHER_SINCE_BUFFER
+        with self._lock:
+            collection = self._open_collection
+            if not collection:
+                collection = MustGatherCollection(
+                    number=len(self.collections),
+                    target_dir=os.path.join(self.output_dir, f"collection-{len(self.collections)}"),
+                    deadline=time.monotonic() + self.coalesce_window,
+                    since_epoch=since_epoch,
+                )
+                self.collections.append(collection)
+                self._open_collection = collection
+                self._futures.append(self._executor.submit(self._collect, collection))
+
+            collection.since_epoch = min(collection.since_epoch, since_epoch)
+            collection.test_names.append(test_name)
+
+        os.makedirs(collection.target_dir, exist_ok=True)
+        os.makedirs(failure_dir, exist_ok=True)
+        link = os.path.join(failure_dir, MUST_GATHER_LINK)
+        # e.g. a test failing in call and teardown has one link, to its first collection
+        if not os.path.lexists(link):
+            os.symlink(os.path.relpath(collection.target_dir, start=failure_dir), link)
+        LOGGER.info(
+            f"[DATA_COLLECTOR] Must-gather of {test_name} is collected in the background to {collection.target_dir} "
+            f"(collection {collection.number}, {len(collection.test_names)} failures)"
+        )
+        if inspect_resources:
+            inspect_command = (
+                f"{INSPECT_BASE_COMMAND} {' '.join(inspect_resources)} --since={int(time.time()) - since_epoch}s "
+                f"--dest-dir={os.path.join(failure_dir, 'inspect_collection')}"
+            )
+            LOGGER.info(f"running inspect command on {inspect_command}")
+            run_command(command=shlex.split(inspect_command), check=False, verify_stderr=False)
+        return collection.target_dir
+
+    def _collect(self, collection: MustGatherCollection) -> None:
+        # Set when closing, so the collections waiting for more failures start at once
+        self._closing.wait(timeout=max(collection.deadline - time.monotonic(), 0))
+        with self._lock:
+            collection.started = True
+            if self._open_collection is collection:
+                self._open_collection = None
+
+        since_time = collection.since_time()
+        start_time = time.monotonic()
+        LOGGER.info(
+            f"[DATA_COLLECTOR] Collecting must-gather {collection.number} for the last {since_time}s, "
+            f"failures: {collection.test_names}"
+        )
+        try:
+            collect_default_cnv_must_gather_with_vm_gather(
+                since_time=since_time, target_dir=collection.target_dir, admin_client=cache_admin_client()
+            )
+        except Exception as exp:
+            LOGGER.warning(f"Failed to collect logs of must-gather {collection.number}: {collection.test_names}: {exp}")
+        LOGGER.info(
+            f"[DATA_COLLECTOR] Collected must-gather {collection.number} in {time.monotonic() - start_time:.1f}s"
+        )
+
+    def close(self) -> None:
+        """Start the collections waiting for more failures and wait for all the collections to finish."""
+        if self._futures:
+            LOGGER.info(f"[DATA_COLLECTOR] Waiting for {len(self._futures)} must-gather collections")
+        self._closing.set()
+        self._executor.shutdown(wait=True)
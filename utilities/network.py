@@ -5,8 +5,12 @@ import os
 import random
 import re
 import shlex
+import threading
+from collections import Counter
+from typing import Any
 
 import netaddr
+from kubernetes.dynamic import DynamicClient
 from ocp_resources.network_addons_config import NetworkAddonsConfig
 from ocp_resources.network_attachment_definition import (
     LinuxBridgeNetworkAttachmentDefinition,
@@ -15,12 +19,14 @@ from ocp_resources.network_attachment_definition import (
 )
 from ocp_resources.network_config_openshift_io import Network
 from ocp_resources.node import Node
+from ocp_resources.node_network_configuration_enactment import NodeNetworkConfigurationEnactment
 from ocp_resources.node_network_configuration_policy import (
     NNCPConfigurationFailed,
     NodeNetworkConfigurationPolicy,
 )
 from ocp_resources.node_network_state import NodeNetworkState
 from ocp_resources.pod import Pod
+from ocp_resources.resource import Resource
 from ocp_resources.sriov_network import SriovNetwork
 from ocp_resources.sriov_network_node_policy import SriovNetworkNodePolicy
 from pytest_testconfig import config as py_config
@@ -42,6 +48,7 @@ from utilities.constants import (
     WORKERS_TYPE,
 )
 from utilities.hco import ResourceEditorValidateHCOReconcile
+from utilities.watch import RESOURCE_CACHE, WATCH_HUB
 
 LOGGER = logging.getLogger(__name__)
 IFACE_UP_STATE = NodeNetworkConfigurationPolicy.Interface.State.UP
@@ -50,13 +57,128 @@ OVS_DS_NAME = "ovs-cni-amd64"
 DEPLOY_OVS = "deployOVS"
 BOND = "bond"
 INPROGRESS = "InProgress"
+NNCE_POLICY_LABEL = "nmstate.io/policy"
+NNCE_NODE_LABEL = "nmstate.io/node"
+# NNCE condition types, the first true one is the enactment status
+NNCE_STATUSES = (
+    NodeNetworkConfigurationEnactment.Conditions.Type.FAILING,
+    NodeNetworkConfigurationEnactment.Conditions.Type.ABORTED,
+    NodeNetworkConfigurationEnactment.Conditions.Type.AVAILABLE,
+    NodeNetworkConfigurationEnactment.Conditions.Type.PROGRESSING,
+    NodeNetworkConfigurationEnactment.Conditions.Type.PENDING,
+)
 
 
 class SriovIfaceNotFound(Exception):
     pass
 
 
-class BridgeNodeNetworkConfigurationPolicy(NodeNetworkConfigurationPolicy):
+def nncp_enactments(client: DynamicClient, policy_name: str) -> dict[str, tuple[str, str]]:
+    """
+    Get the enactment status of a NodeNetworkConfigurationPolicy on each node, from the shared NNCE watch.
+
+    Args:
+        client (DynamicClient): Client to use
+        policy_name (str): NodeNetworkConfigurationPolicy name
+
+    Returns:
+        dict: Node name to a tuple of its enactment status (one of NNCE_STATUSES, "Unknown" if none is true) and the
+            message of the status condition
+    """
+    enactments: dict[str, tuple[str, str]] = {}
+    for nnce in RESOURCE_CACHE.list_raw(
+        client=client,
+        resource_kind=NodeNetworkConfigurationEnactment,
+        label_selector=f"{NNCE_POLICY_LABEL}={policy_name}",
+    ):
+        conditions = {
+            condition["type"]: condition
+            for condition in nnce.get("status", {}).get("conditions") or []
+            if condition.get("status") == NodeNetworkConfigurationEnactment.Condition.Status.TRUE
+        }
+        status = next((_status for _status in NNCE_STATUSES if _status in conditions), "Unknown")
+        enactments[nnce["metadata"]["labels"][NNCE_NODE_LABEL]] = (
+            status,
+            conditions.get(status, {}).get("message", ""),
+        )
+    return enactments
+
+
+def wait_for_nncp_status_success(nncp: Resource, timeout: int, last_success_timestamp: str = "") -> dict[str, Any]:
+    """
+    Wait for a NodeNetworkConfigurationPolicy to be configured on all its nodes, driven by the shared NNCP watch.
+
+    Returns as soon as the policy is Available, logging the per node enactment progress on every policy update.
+
+    Args:
+        nncp (Resource): NodeNetworkConfigurationPolicy to wait for
+        timeout (int): Time in seconds to wait
+        last_success_timestamp (str, optional): lastTransitionTime of the Available condition before the policy was
+            updated; an Available condition not newer than it is ignored
+
+    Returns:
+        dict: Available condition
+
+    Raises:
+        NNCPConfigurationFailed: If the policy is degraded, failed to configure or matches no node
+        TimeoutExpiredError: If the policy is not configured in time
+    """
+    conditions_type = NodeNetworkConfigurationPolicy.Conditions.Type
+    conditions_reason = NodeNetworkConfigurationPolicy.Conditions.Reason
+    logged_enactments: dict[str, tuple[str, str]] = {}
+
+    def _configured(_nncp: dict[str, Any]) -> bool:
+        conditions = {condition["type"]: condition for condition in _nncp.get("status", {}).get("conditions") or []}
+        available = conditions.get(conditions_type.AVAILABLE, {})
+        degraded = conditions.get(conditions_type.DEGRADED, {})
+        if (
+            available.get("status") == NodeNetworkConfigurationPolicy.Condition.Status.TRUE
+            and available.get("lastTransitionTime", "") > last_success_timestamp
+        ):
+            return True
+
+        if degraded.get("status") == NodeNetworkConfigurationPolicy.Condition.Status.TRUE or available.get(
+            "reason"
+        ) in (conditions_reason.FAILED_TO_CONFIGURE, conditions_reason.NO_MATCHING_NODE):
+            failed_enactments = {
+                node: message
+                for node, (status, message) in nncp_enactments(client=nncp.client, policy_name=nncp.name).items()
+                if status != NodeNetworkConfigurationEnactment.Conditions.Type.AVAILABLE
+            }
+            raise NNCPConfigurationFailed(
+                f"{nncp.name} failed on condition:\n{degraded or available}\nFailed enactments: {failed_enactments}"
+            )
+
+        if (enactments := nncp_enactments(client=nncp.client, policy_name=nncp.name)) != logged_enactments:
+            logged_enactments.clear()
+            logged_enactments.update(enactments)
+            LOGGER.info(
+                f"{nncp.kind}/{nncp.name} enactments: "
+                f"{dict(Counter(status for status, _ in enactments.values()))} "
+                f"{ {node: status for node, (status, _) in enactments.items()} }"
+            )
+        return False
+
+    try:
+        raw_nncp = WATCH_HUB.wait_for_resource(resource=nncp, predicate=_configured, timeout=timeout)
+    except TimeoutExpiredError, NNCPConfigurationFailed:
+        LOGGER.error(f"Unable to configure {nncp.kind}/{nncp.name}, enactments: {logged_enactments}")
+        raise
+
+    LOGGER.info(f"{nncp.kind}/{nncp.name} configured successfully")
+    return next(
+        condition for condition in raw_nncp["status"]["conditions"] if condition["type"] == conditions_type.AVAILABLE
+    )
+
+
+class NodeNetworkConfigurationPolicyForTests(NodeNetworkConfigurationPolicy):
+    """NodeNetworkConfigurationPolicy waiting for its status with the shared NNCP watch, see wait_for_nncp_status_success"""
+
+    def wait_for_status_success(self):
+        return wait_for_nncp_status_success(nncp=self, timeout=self.success_timeout)
+
+
+class BridgeNodeNetworkConfigurationPolicy(NodeNetworkConfigurationPolicyForTests):
     def __init__(
         self,
         name,
@@ -125,15 +247,21 @@ class BridgeNodeNetworkConfigurationPolicy(NodeNetworkConfigurationPolicy):
 
     @staticmethod
     def _does_port_match_type(nns, port_name, port_type):
+        def _port_iface(_nns):
+            return next(
+                (
+                    _iface
+                    for _iface in _nns.get("status", {}).get("currentState", {}).get("interfaces") or []
+                    if _iface["name"] == port_name
+                ),
+                None,
+            )
+
         # From time to time the NNS interfaces take longer to get updated with the new port
-        samples = TimeoutSampler(
-            wait_timeout=TIMEOUT_90SEC,
-            sleep=1,
-            func=lambda: [_iface for _iface in nns.interfaces if _iface["name"] == port_name],
+        raw_nns = WATCH_HUB.wait_for_resource(
+            resource=nns, predicate=lambda _nns: _port_iface(_nns=_nns) is not None, timeout=TIMEOUT_90SEC
         )
-        for sample in samples:
-            if sample:
-                return sample[0]["type"] == port_type
+        return _port_iface(_nns=raw_nns)["type"] == port_type
 
     def to_dict(self):
         bridge_ports = [{"name": port} for port in self.ports]
@@ -335,7 +463,7 @@ class OvsBridgeNodeNetworkConfigurationPolicy(BridgeNodeNetworkConfigurationPoli
             raise
 
 
-class VLANInterfaceNodeNetworkConfigurationPolicy(NodeNetworkConfigurationPolicy):
+class VLANInterfaceNodeNetworkConfigurationPolicy(NodeNetworkConfigurationPolicyForTests):
     def __init__(
         self,
         iface_state,
@@ -384,7 +512,7 @@ class VLANInterfaceNodeNetworkConfigurationPolicy(NodeNetworkConfigurationPolicy
         super().to_dict()
 
 
-class BondNodeNetworkConfigurationPolicy(NodeNetworkConfigurationPolicy):
+class BondNodeNetworkConfigurationPolicy(NodeNetworkConfigurationPolicyForTests):
     def __init__(
         self,
         name,
@@ -538,7 +666,7 @@ def network_nad(
         yield nad
 
 
-class EthernetNetworkConfigurationPolicy(NodeNetworkConfigurationPolicy):
+class EthernetNetworkConfigurationPolicy(NodeNetworkConfigurationPolicyForTests):
     def __init__(
         self,
         name,
@@ -606,29 +734,88 @@ def sriov_network_dict(namespace, network):
     return {network.name: f"{namespace.name}/{network.name}"}
 
 
+class MacPoolExhaustedError(Exception):
+    def __init__(self, range_start: str, range_end: str, requested: int, available: int) -> None:
+        self.range_start = range_start
+        self.range_end = range_end
+        self.requested = requested
+        self.available = available
+
+    def __str__(self) -> str:
+        return (
+            f"MAC pool {self.range_start} - {self.range_end} is exhausted: {self.requested} MACs requested, "
+            f"{self.available} available"
+        )
+
+
 class MacPool:
     """
     Class to manage the mac addresses pool.
     to get this class, use mac_pool fixture.
     whenever you create a VM, before yield, call: mac_pool.append_macs(vm)
     and after yield, call: mac_pool.remove_macs(vm).
+
+    MACs are allocated by a cursor walking the range from a random offset and skipping used MACs, so allocation and
+    release are O(1) (amortized) and never retry randomly; the cursor wraps around to reuse released MACs once the
+    rest of the range was allocated. Used MACs are kept as a set of integers, as KubeMacPool ranges can hold up to
+    2^40 MACs. The pool is thread safe.
     """
 
     def __init__(self, kmp_range):
         self.range_start = self.mac_to_int(mac=kmp_range["RANGE_START"])
         self.range_end = self.mac_to_int(mac=kmp_range["RANGE_END"])
         self.pool = range(self.range_start, self.range_end + 1)
-        self.used_macs = []
+        self.used_macs = set()
+        self._cursor = random.choice(self.pool)
+        self._lock = threading.Lock()
+
+    @property
+    def available(self):
+        return len(self.pool) - len(self.used_macs)
+
+    @property
+    def utilization(self):
+        """Ratio of used MACs of the range, 0 to 1."""
+        return len(self.used_macs) / len(self.pool)
 
     def get_mac_from_pool(self):
-        return self.mac_sampler(func=random.choice, seq=self.pool)
+        return self.get_macs_from_pool(count=1)[0]
 
-    def mac_sampler(self, func, *args, **kwargs):
-        sampler = TimeoutSampler(wait_timeout=20, sleep=1, func=func, *args, **kwargs)
-        for sample in sampler:
-            mac = self.int_to_mac(num=sample)
-            if mac not in self.used_macs:
-                return mac
+    def get_macs_from_pool(self, count):
+        """
+        Allocate unused MACs of the range, e.g. for all the interfaces of a multi-NIC VM.
+
+        Allocated MACs are used until released by remove_macs (of the VM using them) or release_macs.
+
+        Args:
+            count (int): Number of MACs to allocate
+
+        Returns:
+            list: MAC addresses (str)
+
+        Raises:
+            MacPoolExhaustedError: If the range has less than `count` unused MACs
+        """
+        with self._lock:
+            if count > self.available:
+                raise MacPoolExhaustedError(
+                    range_start=self.int_to_mac(num=self.range_start),
+                    range_end=self.int_to_mac(num=self.range_end),
+                    requested=count,
+                    available=self.available,
+                )
+
+            macs = []
+            while len(macs) < count:
+                if self._cursor not in self.used_macs:
+                    self.used_macs.add(self._cursor)
+                    macs.append(self.int_to_mac(num=self._cursor))
+                self._cursor = self._cursor + 1 if self._cursor < self.range_end else self.range_start
+            return macs
+
+    def release_macs(self, macs):
+        with self._lock:
+            self.used_macs.difference_update(self.mac_to_int(mac=mac) for mac in macs)
 
     @staticmethod
     def mac_to_int(mac):
@@ -641,12 +828,15 @@ class MacPool:
         return str(mac)
 
     def append_macs(self, vm):
-        for iface in vm.get_interfaces():
-            self.used_macs.append(iface["macAddress"])
+        with self._lock:
+            self.used_macs.update(
+                mac
+                for mac in (self.mac_to_int(mac=iface["macAddress"]) for iface in vm.get_interfaces())
+                if mac in self.pool
+            )
 
     def remove_macs(self, vm):
-        for iface in vm.get_interfaces():
-            self.used_macs.remove(iface["macAddress"])
+        self.release_macs(macs=[iface["macAddress"] for iface in vm.get_interfaces()])
 
     def mac_is_within_range(self, mac):
         return self.mac_to_int(mac) in self.pool
@@ -0,0 +1,277 @@
+import csv
+import json
+import logging
+import os
+import threading
+import time
+from array import array
+from collections import Counter, defaultdict
+from typing import Any
+
+from kubernetes.dynamic import DynamicClient
+from kubernetes.utils import parse_quantity
+from ocp_resources.pod import Pod
+
+from utilities.bulk import NODE_METRICS_API_VERSION, get_nodes_usage, percentile
+from utilities.constants import TIMEOUT_30SEC, VIRT_LAUNCHER
+from utilities.data_collector import write_to_file
+from utilities.watch import get_resource_api
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_RESOURCE_USAGE_INTERVAL = TIMEOUT_30SEC
+NODES_USAGE_FILE = "nodes_usage.csv"
+VIRT_LAUNCHERS_USAGE_FILE = "virt_launchers_usage.csv"
+RESOURCE_USAGE_SUMMARY_FILE = "resource_usage_summary.json"
+NODES_USAGE_COLUMNS = ("timestamp", "node", "cpu_cores", "memory_bytes", "virt_launchers")
+VIRT_LAUNCHERS_USAGE_COLUMNS = ("timestamp", "namespace", "pod", "node", "cpu_cores", "memory_bytes")
+USAGE_PERCENTILES = (50, 90, 99)
+
+
+def get_virt_launchers_usage(client: DynamicClient) -> dict[tuple[str, str], dict[str, float]]:
+    """
+    Get the CPU and memory usage of all virt-launcher pods with one metrics API read (the data `oc adm top pods`
+    shows), summed over the pod containers.
+
+    Args:
+        client (DynamicClient): Client to use
+
+    Returns:
+        dict: (namespace, pod name) to its usage, {"cpu_cores": float, "memory_bytes": float}
+    """
+    pods_metrics = client.resources.get(api_version=NODE_METRICS_API_VERSION, kind="PodMetrics").get(
+        label_selector=f"kubevirt.io={VIRT_LAUNCHER}"
+    )
+    return {
+        (metrics["metadata"]["namespace"], metrics["metadata"]["name"]): {
+            "cpu_cores": float(sum(parse_quantity(container["usage"]["cpu"]) for container in metrics["containers"])),
+            "memory_bytes": float(
+                sum(parse_quantity(container["usage"]["memory"]) for container in metrics["containers"])
+            ),
+        }
+        for metrics in pods_metrics.to_dict()["items"]
+    }
+
+
+def get_virt_launchers_nodes(client: DynamicClient) -> dict[tuple[str, str], str]:
+    """
+    Get the node of all scheduled virt-launcher pods with one pod list.
+
+    Args:
+        client (DynamicClient): Client to use
+
+    Returns:
+        dict: (namespace, pod name) to its node name
+    """
+    return {
+        (pod["metadata"]["namespace"], pod["metadata"]["name"]): pod["spec"]["nodeName"]
+        for pod in get_resource_api(client=client, resource_kind=Pod)
+        .get(label_selector=f"kubevirt.io={VIRT_LAUNCHER}")
+        .to_dict()["items"]
+        if pod["spec"].get("nodeName")
+    }
+
+
+def usage_summary(values: array | list[float]) -> dict[str, float]:
+    """
+    Summarize usage values as count, mean, p50, p90, p99 and max.
+
+    Args:
+        values (array | list): Usage values
+
+    Returns:
+        dict: Summary name to its value, only the count if there are no values
+    """
+    if not values:
+        return {"count": 0}
+
+    return {
+        "count": len(values),
+        "mean": round(sum(values) / len(values), 3),
+        **{f"p{_percent}": round(percentile(values=values, percent=_percent), 3) for _percent in USAGE_PERCENTILES},
+        "max": round(max(values), 3),
+    }
+
+
+class ResourceUsageRecorder:
+    def __init__(
+        self,
+        client: DynamicClient,
+        output_directory: str,
+        interval: int = DEFAULT_RESOURCE_USAGE_INTERVAL,
+        virt_launchers: bool = True,
+    ) -> None:
+        """
+        Record the CPU and memory usage of the nodes and virt-launcher pods from the metrics API, in a background
+        thread.
+
+        Every `interval` seconds one node metrics read, and with `virt_launchers` one virt-launcher pod metrics read and
+        one virt-launcher pod list, are appended as rows to NODES_USAGE_FILE and VIRT_LAUNCHERS_USAGE_FILE (CSV,
+        flushed every sample so a failed run keeps its data). Values are also kept in memory as compact per node
+        columns (array of doubles) for the summary written to RESOURCE_USAGE_SUMMARY_FILE when the recorder stops.
+        Failed samples are logged and skipped, the recording goes on.
+
+        Usage:
+            with ResourceUsageRecorder(client=admin_client, output_directory=directory, interval=30):
+                ...
+
+        Args:
+            client (DynamicClient): Client to use
+            output_directory (str): Directory of the CSV and summary files
+            interval (int): Time in seconds between samples
+            virt_launchers (bool): Record the virt-launcher pods usage and count them per node
+        """
+        self.client = client
+        self.output_directory = output_directory
+        self.interval = interval
+        self.virt_launchers = virt_launchers
+        self.samples = 0
+        self.failed_samples = 0
+        self._nodes_columns: dict[str, dict[str, array]] = defaultdict(
+            lambda: {column: array("d") for column in NODES_USAGE_COLUMNS[2:]}
+        )
+        self._virt_launchers_columns: dict[str, array] = {
+            column: array("d") for column in VIRT_LAUNCHERS_USAGE_COLUMNS[4:]
+        }
+        self._virt_launchers_total_columns: dict[str, array] = {
+            column: array("d") for column in VIRT_LAUNCHERS_USAGE_COLUMNS[4:]
+        }
+        self._virt_launcher_pods: set[tuple[str, str]] = set()
+        self._files: dict[str, Any] = {}
+        self._writers: dict[str, Any] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "ResourceUsageRecorder":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.stop()
+
+    def _open_csv(self, file_name: str, columns: tuple[str, ...]) -> None:
+        self._files[file_name] = open(os.path.join(self.output_directory, file_name), "w", newline="")
+        self._writers[file_name] = csv.writer(self._files[file_name])
+        self._writers[file_name].writerow(columns)
+
+    def start(self) -> None:
+        os.makedirs(self.output_directory, exist_ok=True)
+        self._open_csv(file_name=NODES_USAGE_FILE, columns=NODES_USAGE_COLUMNS)
+        if self.virt_launchers:
+            self._open_csv(file_name=VIRT_LAUNCHERS_USAGE_FILE, columns=VIRT_LAUNCHERS_USAGE_COLUMNS)
+
+        LOGGER.info(f"Recording resource usage every {self.interval}s to {self.output_directory}")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="resource-usage-recorder", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            start_time = time.monotonic()
+            try:
+                self.sample()
+            except Exception as exp:
+                self.failed_samples += 1
+                LOGGER.warning(f"Failed to sample resource usage: {exp}")
+            self._stop.wait(timeout=max(self.interval - (time.monotonic() - start_time), 0))
+
+    def sample(self) -> None:
+        """Read the nodes (and virt-launcher pods) usage once and record it."""
+        timestamp = round(time.time(), 3)
+        nodes_usage = get_nodes_usage(client=self.client)
+        launchers_per_node: Counter[str] = Counter()
+        launchers_rows = []
+        if self.virt_launchers:
+            launchers_nodes = get_virt_launchers_nodes(client=self.client)
+            launchers_per_node.update(launchers_nodes.values())
+            launchers_usage = get_virt_launchers_usage(client=self.client)
+            for (namespace, name), usage in launchers_usage.items():
+                launchers_rows.append((
+                    timestamp,
+                    namespace,
+                    name,
+                    launchers_nodes.get((namespace, name), ""),
+                    usage["cpu_cores"],
+                    usage["memory_bytes"],
+                ))
+                self._virt_launcher_pods.add((namespace, name))
+                for column in self._virt_launchers_columns:
+                    self._virt_launchers_columns[column].append(usage[column])
+
+            for column, total_column in self._virt_launchers_total_columns.items():
+                total_column.append(sum(usage[column] for usage in launchers_usage.values()))
+
+            self._writers[VIRT_LAUNCHERS_USAGE_FILE].writerows(launchers_rows)
+            self._files[VIRT_LAUNCHERS_USAGE_FILE].flush()
+
+        for node, usage in nodes_usage.items():
+            node_columns = self._nodes_columns[node]
+            node_columns["cpu_cores"].append(usage["cpu_cores"])
+            node_columns["memory_bytes"].append(usage["memory_bytes"])
+            node_columns["virt_launchers"].append(launchers_per_node[node])
+            self._writers[NODES_USAGE_FILE].writerow((
+                timestamp,
+                node,
+                usage["cpu_cores"],
+                usage["memory_bytes"],
+                launchers_per_node[node],
+            ))
+        self._files[NODES_USAGE_FILE].flush()
+        self.samples += 1
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Summarize the recorded usage, see usage_summary.
+
+        Returns:
+            dict: Samples counts, per node summary of each column, and the virt-launcher pods per pod and total usage
+        """
+        summary: dict[str, Any] = {
+            "interval": self.interval,
+            "samples": self.samples,
+            "failed_samples": self.failed_samples,
+            "nodes": {
+                node: {column: usage_summary(values=values) for column, values in columns.items()}
+                for node, columns in sorted(self._nodes_columns.items())
+            },
+        }
+        if self.virt_launchers:
+            summary["virt_launchers"] = {
+                "pods": len(self._virt_launcher_pods),
+                "per_pod": {
+                    column: usage_summary(values=values) for column, values in self._virt_launchers_columns.items()
+                },
+                "total": {
+                    column: usage_summary(values=values)
+                    for column, values in self._virt_launchers_total_columns.items()
+                },
+            }
+        return summary
+
+    def stop(self) -> dict[str, Any]:
+        """
+        Stop recording, close the CSV files and write the summary.
+
+        Returns:
+            dict: Usage summary, see summary
+        """
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+        for csv_file in self._files.values():
+            csv_file.close()
+        self._files.clear()
+        self._writers.clear()
+
+        summary = self.summary()
+        LOGGER.info(
+            f"Recorded {self.samples} resource usage samples ({self.failed_samples} failed) to {self.output_directory}"
+        )
+        write_to_file(
+            file_name=RESOURCE_USAGE_SUMMARY_FILE,
+            content=json.dumps(summary, indent=2),
+            base_directory=self.output_directory,
+        )
+        return summary
@@ -1,3 +1,7 @@
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_EXCEPTION, Future, wait
 from typing import Any, List
 
 from _pytest.fixtures import FixtureRequest
@@ -15,12 +19,15 @@ from ocp_utilities.infra import assert_nodes_in_healthy_condition, assert_nodes_
 from pytest_testconfig import config as py_config
 from timeout_sampler import TimeoutExpiredError
 
-from utilities.constants import IMAGE_CRON_STR, KUBELET_READY_CONDITION
+from utilities.constants import IMAGE_CRON_STR, KUBELET_READY_CONDITION, TIMEOUT_15MIN
 from utilities.exceptions import ClusterSanityError, StorageSanityError
 from utilities.hco import wait_for_hco_conditions
 from utilities.infra import LOGGER, wait_for_pods_running
 from utilities.pytest_utils import exit_pytest_execution
 
+# Combined deadline of the concurrent checks, longer than the slowest check (HCO conditions, 10 minutes)
+CLUSTER_SANITY_TIMEOUT = TIMEOUT_15MIN
+
 
 def storage_sanity_check(cluster_storage_classes_names: List[str]) -> bool:
     """
@@ -201,6 +208,75 @@ def check_vm_creation_capability(admin_client: DynamicClient, namespace: str) ->
         ) from ex
 
 
+def run_sanity_checks_concurrently(
+    checks: dict[str, Callable[[], None]],
+    durations: dict[str, float],
+    timeout: int = CLUSTER_SANITY_TIMEOUT,
+) -> None:
+    """
+    Run independent sanity checks concurrently with a combined deadline.
+
+    Returns on the first failure, without waiting for the other checks. Each check runs in a daemon thread: the checks
+    left running on failure or timeout can not be interrupted, they keep running until pytest execution exits and the
+    interpreter does not wait for them at exit.
+
+    Args:
+        checks: Check name to a callable which raises on failure.
+        durations: Filled with check name to its duration in seconds for the checks which finished, also on failure.
+        timeout: Time in seconds for all the checks to finish.
+
+    Raises:
+        ClusterSanityError: When not all checks finished before the deadline.
+        Exception: The exception of a failed check (the first one, in checks order, if several failed).
+    """
+
+    def _timed_check(_name: str, _check: Callable[[], None], _future: Future) -> None:
+        start = time.monotonic()
+        try:
+            _check()
+        except BaseException as exp:
+            durations[_name] = time.monotonic() - start
+            _future.set_exception(exception=exp)
+        else:
+            durations[_name] = time.monotonic() - start
+            _future.set_result(result=None)
+
+    futures: dict[str, Future] = {}
+    for name, check in checks.items():
+        futures[name] = Future()
+        threading.Thread(
+            target=_timed_check,
+            kwargs={"_name": name, "_check": check, "_future": futures[name]},
+            name=f"cluster-sanity-{name}",
+            daemon=True,
+        ).start()
+
+    _, not_done = wait(fs=futures.values(), timeout=timeout, return_when=FIRST_EXCEPTION)
+    for future in futures.values():
+        if future.done() and (exception := future.exception()):
+            raise exception
+
+    if not_done:
+        raise ClusterSanityError(
+            err_str=f"Cluster sanity checks did not finish in {timeout} seconds: "
+            f"{[name for name, future in futures.items() if future in not_done]}"
+        )
+
+
+def report_sanity_checks_durations(durations: dict[str, float], junitxml_property: Any | None = None) -> None:
+    """
+    Log the duration of each sanity check, slowest first, and record them as JUnit XML test suite properties.
+
+    Args:
+        durations: Check name to its duration in seconds.
+        junitxml_property: Optional pytest record_testsuite_property function.
+    """
+    for name, duration in sorted(durations.items(), key=lambda item: item[1], reverse=True):
+        LOGGER.info(f"Cluster sanity check {name} took {duration:.1f} seconds")
+        if junitxml_property:
+            junitxml_property(name=f"cluster_sanity_{name}_duration", value=f"{duration:.1f}")
+
+
 def cluster_sanity(
     request: FixtureRequest,
     admin_client: DynamicClient,
@@ -221,7 +297,11 @@ def cluster_sanity(
        are present on the cluster.
     2. Nodes: Ensures all nodes are in ready and schedulable state.
     3. Pods: Validates all CNV pods in the HCO namespace are running.
-    4. HCO conditions: Waits for HyperConverged Operator to reach healthy state.
+    4. Webhooks: Verifies webhook services have endpoints and a VM can be created (dry-run).
+    5. HCO conditions: Waits for HyperConverged Operator to reach healthy state.
+
+    The storage classes check runs first; the other checks run concurrently, with a combined deadline
+    (CLUSTER_SANITY_TIMEOUT). The duration of each check is logged and recorded in the JUnit XML properties.
 
     Args:
         request: Pytest fixture request object providing access to test configuration
@@ -231,7 +311,7 @@ def cluster_sanity(
         nodes: List of Node resources representing all cluster nodes.
         hco_namespace: Namespace resource where HyperConverged Operator is deployed.
         junitxml_property: Optional pytest plugin function for recording test suite properties
-            in JUnit XML output. Used to record exit codes on failure.
+            in JUnit XML output. Used to record the checks durations and exit codes on failure.
 
     Raises:
         ClusterSanityError: When cluster is not in healthy state (pods not running, HCO unhealthy).
@@ -278,6 +358,7 @@ def cluster_sanity(
                     f"either run with '--storage-class-matrix' or with '{skip_storage_classes_check}'"
                 )
 
+        checks: dict[str, Callable[[], None]] = {}
         # Check nodes only if --cluster-sanity-skip-nodes-check not passed to pytest.
         if request.session.config.getoption(skip_nodes_check):
             LOGGER.warning(f"Skipping nodes check, got {skip_nodes_check}")
@@ -285,35 +366,52 @@ def cluster_sanity(
         else:
             # validate that all the nodes are ready and schedulable and CNV pods are running
             LOGGER.info(f"Check nodes sanity. (To skip nodes sanity check pass {skip_nodes_check} to pytest)")
-            assert_nodes_in_healthy_condition(nodes=nodes, healthy_node_condition_type=KUBELET_READY_CONDITION)
-            assert_nodes_schedulable(nodes=nodes)
-
-            try:
-                wait_for_pods_running(
-                    admin_client=admin_client,
-                    namespace=hco_namespace,
-                    filter_pods_by_name=IMAGE_CRON_STR,
-                )
-            except TimeoutExpiredError as timeout_error:
-                LOGGER.error(timeout_error)
-                raise ClusterSanityError(
-                    err_str=f"Timed out waiting for all pods in namespace {hco_namespace.name} to get to running state."
-                )
+
+            def _check_nodes() -> None:
+                assert_nodes_in_healthy_condition(nodes=nodes, healthy_node_condition_type=KUBELET_READY_CONDITION)
+                assert_nodes_schedulable(nodes=nodes)
+
+            def _check_pods() -> None:
+                try:
+                    wait_for_pods_running(
+                        admin_client=admin_client,
+                        namespace=hco_namespace,
+                        filter_pods_by_name=IMAGE_CRON_STR,
+                    )
+                except TimeoutExpiredError as timeout_error:
+                    LOGGER.error(timeout_error)
+                    raise ClusterSanityError(
+                        err_str=f"Timed out waiting for all pods in namespace {hco_namespace.name} to get to running "
+                        "state."
+                    )
+
+            checks["nodes"] = _check_nodes
+            checks["pods"] = _check_pods
 
         # Check webhook endpoints only if --cluster-sanity-skip-webhook-check not passed to pytest.
         if request.session.config.getoption(skip_webhook_check):
             LOGGER.warning(f"Skipping webhook health check, got {skip_webhook_check}")
         else:
             LOGGER.info(f"Check webhook endpoints health. (To skip webhook check pass {skip_webhook_check} to pytest)")
-            check_webhook_endpoints_health(admin_client=admin_client, namespace=hco_namespace)
-            check_vm_creation_capability(admin_client=admin_client, namespace="default")
+            checks["webhook_endpoints"] = lambda: check_webhook_endpoints_health(
+                admin_client=admin_client, namespace=hco_namespace
+            )
+            checks["vm_creation"] = lambda: check_vm_creation_capability(admin_client=admin_client, namespace="default")
 
         # Wait for hco to be healthy
-        wait_for_hco_conditions(
+        checks["hco_conditions"] = lambda: wait_for_hco_conditions(
             admin_client=admin_client,
             hco_namespace=hco_namespace,
         )
 
+        start = time.monotonic()
+        durations: dict[str, float] = {}
+        try:
+            run_sanity_checks_concurrently(checks=checks, durations=durations)
+        finally:
+            durations["total"] = time.monotonic() - start
+            report_sanity_checks_durations(durations=durations, junitxml_property=junitxml_property)
+
     except (ClusterSanityError, NodeUnschedulableError, NodeNotReadyError, StorageSanityError) as ex:
         exit_pytest_execution(
             filename=exceptions_filename,
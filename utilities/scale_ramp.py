@@ -0,0 +1,256 @@
+import logging
+import math
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Any
+
+from kubernetes.dynamic import DynamicClient
+from ocp_resources.virtual_machine import VirtualMachine
+from ocp_resources.virtual_machine_instance import VirtualMachineInstance
+from timeout_sampler import TimeoutExpiredError
+
+from utilities.bulk import (
+    DEFAULT_API_REQUESTS_PER_SECOND,
+    DEFAULT_BULK_WORKERS,
+    deploy_resources_in_parallel,
+    latency_summary,
+    vmi_phase_transition_time,
+    wait_for_vmis_running,
+)
+from utilities.constants import TIMEOUT_30MIN
+from utilities.watch import get_resource_api
+
+LOGGER = logging.getLogger(__name__)
+
+RAMP_PROFILE_CONSTANT = "constant"
+RAMP_PROFILE_LINEAR = "linear"
+RAMP_PROFILE_STEP = "step"
+RAMP_PROFILE_EXPONENTIAL = "exponential"
+RAMP_PROFILES = (RAMP_PROFILE_CONSTANT, RAMP_PROFILE_LINEAR, RAMP_PROFILE_STEP, RAMP_PROFILE_EXPONENTIAL)
+# Start latency summary value compared to the saturation latency threshold, see latency_summary
+DEFAULT_SATURATION_LATENCY_STAT = "p90"
+
+
+def ramp_batch_sizes(
+    profile: str,
+    initial: int,
+    increment: int = 0,
+    factor: float = 2.0,
+    step_batches: int = 1,
+) -> Iterator[int]:
+    """
+    Generate the batch sizes of a ramp profile, endlessly.
+
+    constant: initial, initial, ...
+    linear: initial, initial + increment, initial + 2 * increment, ...
+    step: initial for step_batches batches, then initial + increment for step_batches batches, ...
+    exponential: initial, initial * factor, initial * factor ** 2, ... (rounded up)
+
+    Args:
+        profile (str): Ramp profile, one of RAMP_PROFILES
+        initial (int): Size of the first batch
+        increment (int): Batch size increment of the linear and step profiles
+        factor (float): Batch size growth factor of the exponential profile
+        step_batches (int): Number of batches of each step of the step profile
+
+    Yields:
+        int: Batch size
+
+    Raises:
+        ValueError: If the profile is unknown
+    """
+    if profile not in RAMP_PROFILES:
+        raise ValueError(f"Unknown ramp profile {profile}, supported profiles: {RAMP_PROFILES}")
+
+    for batch in count():
+        if profile == RAMP_PROFILE_LINEAR:
+            yield initial + batch * increment
+        elif profile == RAMP_PROFILE_STEP:
+            yield initial + batch // step_batches * increment
+        elif profile == RAMP_PROFILE_EXPONENTIAL:
+            yield math.ceil(initial * factor**batch)
+        else:
+            yield initial
+
+
+@dataclass
+class RampStep:
+    """Result of one batch of a ramp; latencies are from the start request to VMI Running, in seconds."""
+
+    batch: int
+    size: int
+    total_vms: int
+    running: int
+    latency: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def failed(self) -> int:
+        return self.size - self.running
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failed / self.size if self.size else 0.0
+
+
+@dataclass
+class SaturationResult:
+    """Result of a saturation search, see find_saturation."""
+
+    steps: list[RampStep]
+    knee: RampStep | None
+    max_sustainable_vms: int
+    reason: str
+
+    def vms_per_node(self, nodes: int) -> float:
+        return self.max_sustainable_vms / nodes if nodes else 0.0
+
+    def summary(self, nodes: int) -> dict[str, Any]:
+        return {
+            "max_sustainable_vms": self.max_sustainable_vms,
+            "nodes": nodes,
+            "max_sustainable_vms_per_node": round(self.vms_per_node(nodes=nodes), 2),
+            "reason": self.reason,
+            "knee_batch": self.knee.batch if self.knee else None,
+            "steps": [
+                {
+                    "batch": step.batch,
+                    "size": step.size,
+                    "total_vms": step.total_vms,
+                    "running": step.running,
+                    "failure_rate": round(step.failure_rate, 3),
+                    "latency": step.latency,
+                }
+                for step in self.steps
+            ],
+        }
+
+
+def _vms_running_times(client: DynamicClient, vms: list[VirtualMachine]) -> dict[str, float]:
+    """Running time of the VMs whose VMI is Running, with one VMI list per namespace."""
+    names = {(vm.namespace, vm.name) for vm in vms}
+    running_times = {}
+    for namespace in {vm.namespace for vm in vms}:
+        for vmi in (
+            get_resource_api(client=client, resource_kind=VirtualMachineInstance)
+            .get(namespace=namespace)
+            .to_dict()["items"]
+        ):
+            name = vmi["metadata"]["name"]
+            if (namespace, name) not in names:
+                continue
+
+            if vmi.get("status", {}).get("phase") == VirtualMachineInstance.Status.RUNNING:
+                running_times[name] = vmi_phase_transition_time(vmi=vmi, phase=VirtualMachineInstance.Status.RUNNING)
+
+    return running_times
+
+
+def run_vms_batch(
+    client: DynamicClient,
+    vms: list[VirtualMachine],
+    batch: int,
+    total_vms: int,
+    timeout: int = TIMEOUT_30MIN,
+    max_workers: int = DEFAULT_BULK_WORKERS,
+    api_requests_per_second: float = DEFAULT_API_REQUESTS_PER_SECOND,
+) -> RampStep:
+    """
+    Create a batch of VMs (started by their run strategy, e.g. Always) and measure how many run within `timeout`.
+
+    VMs not running in time are counted as failed, not raised.
+
+    Args:
+        client (DynamicClient): Client used for the VMI watch
+        vms (list): VMs (not yet deployed) of the batch
+        batch (int): Batch number
+        total_vms (int): Number of VMs requested so far, including this batch
+        timeout (int): Time in seconds to wait for the VMIs to be Running
+        max_workers (int): Maximum number of concurrent create requests
+        api_requests_per_second (float): Maximum create requests per second, 0 means unlimited
+
+    Returns:
+        RampStep: Running VMs count and start latency summary of the batch
+
+    Raises:
+        BulkOperationError: If any VM failed to deploy
+    """
+    timings = deploy_resources_in_parallel(
+        resources=vms, max_workers=max_workers, api_requests_per_second=api_requests_per_second
+    )
+    try:
+        running_times = wait_for_vmis_running(client=client, vms=vms, timeout=timeout)
+    except TimeoutExpiredError:
+        LOGGER.warning(f"Not all VMs of batch {batch} are running after {timeout}s")
+        running_times = _vms_running_times(client=client, vms=vms)
+
+    return RampStep(
+        batch=batch,
+        size=len(vms),
+        total_vms=total_vms,
+        running=len(running_times),
+        latency=latency_summary(
+            values=[
+                running_time - timings[name].submitted for name, running_time in running_times.items() if running_time
+            ]
+        ),
+    )
+
+
+def find_saturation(
+    run_batch: Callable[[int, int, int], RampStep],
+    batch_sizes: Iterable[int],
+    latency_threshold: float,
+    failure_rate_threshold: float,
+    max_vms: int,
+    latency_stat: str = DEFAULT_SATURATION_LATENCY_STAT,
+) -> SaturationResult:
+    """
+    Keep adding batches of VMs until the start latency or the failure rate of a batch crosses its threshold (the knee),
+    or `max_vms` VMs were added.
+
+    The maximum sustainable number of VMs is the number of running VMs before the knee batch.
+
+    Args:
+        run_batch (Callable): Called with batch, size and total_vms keyword arguments, adds the batch (see
+            run_vms_batch)
+        batch_sizes (Iterable): Batch sizes, e.g. ramp_batch_sizes
+        latency_threshold (float): Maximum start latency in seconds (latency_stat of the batch)
+        failure_rate_threshold (float): Maximum ratio of VMs of a batch which did not run, 0 to 1
+        max_vms (int): Maximum number of VMs to add
+        latency_stat (str): Latency summary value compared to the threshold, e.g. p90 or max
+
+    Returns:
+        SaturationResult: Ramp steps, the knee step and the maximum sustainable number of VMs
+    """
+    steps: list[RampStep] = []
+    total_vms = sustainable_vms = 0
+    for batch, size in enumerate(batch_sizes):
+        size = min(size, max_vms - total_vms)
+        if size <= 0:
+            return SaturationResult(
+                steps=steps, knee=None, max_sustainable_vms=sustainable_vms, reason=f"Reached {max_vms} VMs"
+            )
+
+        total_vms += size
+        start_time = time.monotonic()
+        step = run_batch(batch=batch, size=size, total_vms=total_vms)
+        steps.append(step)
+        LOGGER.info(
+            f"Batch {batch}: {step.running}/{step.size} VMs running ({step.total_vms} VMs requested) in "
+            f"{time.monotonic() - start_time:.1f}s, start latency: {step.latency}"
+        )
+
+        if step.failure_rate > failure_rate_threshold:
+            reason = f"Failure rate {step.failure_rate:.2f} crossed {failure_rate_threshold}"
+        elif step.latency.get(latency_stat, 0) > latency_threshold:
+            reason = f"Start latency {latency_stat} {step.latency[latency_stat]}s crossed {latency_threshold}s"
+        else:
+            sustainable_vms += step.running
+            continue
+
+        LOGGER.info(f"Saturation reached at batch {batch}: {reason}")
+        return SaturationResult(steps=steps, knee=step, max_sustainable_vms=sustainable_vms, reason=reason)
+
+    return SaturationResult(steps=steps, knee=None, max_sustainable_vms=sustainable_vms, reason="Ramp ended")
@@ -0,0 +1,253 @@
+import atexit
+import contextlib
+import logging
+import subprocess
+import threading
+from dataclasses import dataclass
+
+import paramiko
+from rrmngmnt import ssh
+from rrmngmnt.user import User
+
+from utilities.constants import SSH_PORT_22, TIMEOUT_5SEC
+
+LOGGER = logging.getLogger(__name__)
+
+# Errors which mean the SSH connection (or the port-forward under it) is broken and must be reconnected
+SSH_CONNECTION_ERRORS = (paramiko.SSHException, EOFError, OSError)
+
+SshTransportKey = tuple[str, str, str, str]
+
+
+@dataclass
+class SshTransportStats:
+    connections: int = 0
+    reuses: int = 0
+    invalidations: int = 0
+
+
+class ReusableSshTransport:
+    def __init__(self, hostname: str, proxy_command: str, port: int = SSH_PORT_22) -> None:
+        """
+        SSH connection over `virtctl port-forward --stdio` which is kept open between commands.
+
+        The connection is opened on first use and reused by all sessions until it is invalidated
+        (VM restarted / migrated, connection error) or closed.
+
+        Args:
+            hostname: SSH host name (the VM name)
+            proxy_command: ProxyCommand used to reach the VM SSH port
+            port: SSH port
+        """
+        self.hostname = hostname
+        self.proxy_command = proxy_command
+        self.port = port
+        self.ref_count = 0
+        self.stats = SshTransportStats()
+        self._client: paramiko.SSHClient | None = None
+        self._proxy: paramiko.ProxyCommand | None = None
+        self._lock = threading.Lock()
+
+    def _is_usable(self) -> bool:
+        if not self._client:
+            return False
+
+        transport = self._client.get_transport()
+        if not (transport and transport.is_active()):
+            return False
+
+        # An active transport may still sit on top of a dead port-forward; opening a channel verifies it end to end
+        try:
+            transport.open_session(timeout=TIMEOUT_5SEC).close()
+            return True
+        except SSH_CONNECTION_ERRORS as exp:
+            LOGGER.warning(f"{self.hostname}: SSH connection is not usable: {exp}")
+            return False
+
+    def connect(
+        self,
+        user: User,
+        pkey: paramiko.PKey | None,
+        timeout: float | None,
+        banner_timeout: float | None = None,
+    ) -> paramiko.SSHClient:
+        """
+        Return the open SSH client, connect if there is no usable connection.
+
+        Args:
+            user: SSH user
+            pkey: Private key, None for password authentication
+            timeout: TCP connect timeout
+            banner_timeout: Timeout to wait for the SSH banner
+
+        Returns:
+            paramiko.SSHClient: Connected client
+        """
+        with self._lock:
+            if self._is_usable():
+                self.stats.reuses += 1
+                return self._client
+
+            self._disconnect()
+            LOGGER.info(f"{self.hostname}: opening SSH connection via '{self.proxy_command}'")
+            self._proxy = paramiko.ProxyCommand(command_line=self.proxy_command)
+            client = paramiko.SSHClient()
+            client.set_missing_host_key_policy(policy=paramiko.AutoAddPolicy())
+            try:
+                client.connect(
+                    hostname=self.hostname,
+                    port=self.port,
+                    username=user.name,
+                    password=None if pkey else user.password,
+                    pkey=pkey,
+                    timeout=timeout,
+                    sock=self._proxy,
+                    banner_timeout=banner_timeout,
+                )
+            except Exception:
+                client.close()
+                self._disconnect()
+                raise
+
+            self._client = client
+            self.stats.connections += 1
+            return client
+
+    def invalidate(self) -> None:
+        """
+        Close the connection; the next session reconnects.
+        """
+        with self._lock:
+            if self._client:
+                self.stats.invalidations += 1
+            self._disconnect()
+
+    def _disconnect(self) -> None:
+        if self._client:
+            self._client.close()
+            self._client = None
+
+        if self._proxy:
+            # Paramiko's ProxyCommand.close() does not reap the virtctl process
+            with contextlib.suppress(OSError):
+                self._proxy.close()
+            try:
+                self._proxy.process.wait(timeout=TIMEOUT_5SEC)
+            except subprocess.TimeoutExpired:
+                with contextlib.suppress(OSError):
+                    self._proxy.process.kill()
+            self._proxy = None
+
+
+class ReusableSshSession(ssh.RemoteExecutor.Session):
+    """
+    rrmngmnt SSH session which runs commands over the executor ReusableSshTransport.
+
+    Closing the session keeps the connection open; a connection error invalidates the transport.
+    """
+
+    def open(self) -> None:
+        self._ssh = self._executor.transport.connect(
+            user=self._executor.user,
+            pkey=self.pkey,
+            timeout=self._timeout,
+            banner_timeout=self._executor.banner_timeout,
+        )
+
+    def close(self) -> None:
+        pass
+
+    def __exit__(self, type_, value, tb):
+        if type_ and issubclass(type_, SSH_CONNECTION_ERRORS):
+            self._executor.transport.invalidate()
+        super().__exit__(type_, value, tb)
+
+
+class ReusableRemoteExecutor(ssh.RemoteExecutor):
+    def __init__(self, transport: ReusableSshTransport, **kwargs) -> None:
+        # `sock` is owned by the transport and must not be exposed, callers close the executor sock after each call
+        super().__init__(sock=None, **kwargs)
+        self.transport = transport
+
+    def session(self, timeout: float | None = None) -> ReusableSshSession:
+        return ReusableSshSession(executor=self, timeout=timeout)
+
+
+class ReusableRemoteExecutorFactory(ssh.RemoteExecutorFactory):
+    def __init__(self, transport: ReusableSshTransport) -> None:
+        super().__init__(port=transport.port)
+        self.transport = transport
+
+    def build(self, host, user, sudo=False):
+        return ReusableRemoteExecutor(
+            transport=self.transport,
+            user=user,
+            address=host.ip,
+            port=self.port,
+            sudo=sudo,
+            disabled_algorithms=self.disabled_algorithms,
+            banner_timeout=self.banner_timeout,
+        )
+
+
+class SshTransportPool:
+    def __init__(self) -> None:
+        """
+        Reference counted ReusableSshTransport registry, one transport per VM and credentials.
+
+        Examples:
+            from utilities.ssh_transport import SSH_TRANSPORT_POOL
+            transport = SSH_TRANSPORT_POOL.acquire(key=key, hostname=vm.name, proxy_command=proxy_command)
+            host.executor_factory = ReusableRemoteExecutorFactory(transport=transport)
+            ...
+            SSH_TRANSPORT_POOL.release(key=key)
+        """
+        self._transports: dict[SshTransportKey, ReusableSshTransport] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: SshTransportKey, hostname: str, proxy_command: str) -> ReusableSshTransport:
+        with self._lock:
+            transport = self._transports.get(key)
+            if not transport:
+                transport = ReusableSshTransport(hostname=hostname, proxy_command=proxy_command)
+                self._transports[key] = transport
+            transport.ref_count += 1
+            return transport
+
+    def release(self, key: SshTransportKey) -> None:
+        with self._lock:
+            transport = self._transports.get(key)
+            if not transport:
+                return
+
+            transport.ref_count -= 1
+            if transport.ref_count > 0:
+                return
+
+            self._transports.pop(key)
+
+        LOGGER.info(f"{transport.hostname}: closing SSH transport, stats: {transport.stats}")
+        transport.invalidate()
+
+    def invalidate(self, key: SshTransportKey) -> None:
+        with self._lock:
+            transport = self._transports.get(key)
+
+        if transport:
+            transport.invalidate()
+
+    def stats(self) -> dict[SshTransportKey, SshTransportStats]:
+        with self._lock:
+            return {key: transport.stats for key, transport in self._transports.items()}
+
+    def close_all(self) -> None:
+        with self._lock:
+            transports = list(self._transports.values())
+            self._transports.clear()
+
+        for transport in transports:
+            transport.invalidate()
+
+
+SSH_TRANSPORT_POOL = SshTransportPool()
+atexit.register(SSH_TRANSPORT_POOL.close_all)
@@ -0,0 +1,223 @@
+# Generated using Claude cli
+
+"""Unit tests for audit_logs module"""
+
+import json
+import queue
+import subprocess
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from audit_logs import (
+    AuditLogScanStats,
+    audit_log_entry_key,
+    scan_audit_logs,
+    scan_node_audit_log,
+)
+
+LOG_ENTRY = '"k8s.io/deprecated":"true"'
+
+
+def _audit_line(user_agent, name="obj", deprecated=True):
+    annotations = {"k8s.io/deprecated": "true"} if deprecated else {}
+    return (
+        json.dumps(
+            {"userAgent": user_agent, "objectRef": {"name": name}, "annotations": annotations},
+            separators=(",", ":"),
+        )
+        + "\n"
+    )
+
+
+def _fake_popen(files_lines, returncode=0, error=""):
+    """Fake Popen streaming the lines of the requested file, keyed by node and log name"""
+
+    def _popen(args, stdout, stderr, text):
+        stderr.write(error)
+        process = MagicMock()
+        process.__enter__.return_value = process
+        process.stdout = iter(files_lines[(args[3], args[4].rsplit("/", 1)[-1])])
+        process.returncode = returncode
+        return process
+
+    return _popen
+
+
+class TestAuditLogEntryKey:
+    """Test cases for audit_log_entry_key function"""
+
+    def test_same_call_same_key(self):
+        """Test entries differing only by audit id and timestamps share the key"""
+        first_entry = {"auditID": "1", "userAgent": "ua", "objectRef": {"a": 1, "b": 2}, "annotations": {}}
+        second_entry = {"auditID": "2", "userAgent": "ua", "objectRef": {"b": 2, "a": 1}, "annotations": {}}
+
+        assert audit_log_entry_key(entry=first_entry) == audit_log_entry_key(entry=second_entry)
+
+    def test_different_object_different_key(self):
+        """Test entries of different objects have different keys"""
+        assert audit_log_entry_key(entry={"userAgent": "ua", "objectRef": {"name": "a"}}) != audit_log_entry_key(
+            entry={"userAgent": "ua", "objectRef": {"name": "b"}}
+        )
+
+
+class TestScanNodeAuditLog:
+    """Test cases for scan_node_audit_log function"""
+
+    def test_matching_entries_queued(self):
+        """Test only matching lines are parsed and counted"""
+        entries = queue.Queue()
+        stats = AuditLogScanStats()
+        lines = [_audit_line(user_agent="ua-1"), _audit_line(user_agent="ua-2", deprecated=False)]
+
+        with patch(
+            "audit_logs.subprocess.Popen", side_effect=_fake_popen(files_lines={("node-1", "audit.log"): lines})
+        ):
+            assert scan_node_audit_log(
+                node="node-1",
+                log="audit.log",
+                log_entry=LOG_ENTRY,
+                entries=entries,
+                stop=threading.Event(),
+                stats=stats,
+            )
+
+        assert entries.qsize() == 1
+        assert entries.get()["userAgent"] == "ua-1"
+        assert (stats.files, stats.lines, stats.matched) == (1, 2, 1)
+
+    def test_rotated_log_skipped(self):
+        """Test a log rotated before it was read is skipped"""
+        entries = queue.Queue()
+
+        with patch(
+            "audit_logs.subprocess.Popen",
+            side_effect=_fake_popen(
+                files_lines={("node-1", "audit.log"): []}, returncode=1, error="404 page not found"
+            ),
+        ):
+            assert scan_node_audit_log(
+                node="node-1",
+                log="audit.log",
+                log_entry=LOG_ENTRY,
+                entries=entries,
+                stop=threading.Event(),
+                stats=AuditLogScanStats(),
+            )
+
+        assert entries.empty()
+
+    def test_unparsable_line_raises(self):
+        """Test a matching line which is not JSON is raised"""
+        with patch(
+            "audit_logs.subprocess.Popen",
+            side_effect=_fake_popen(files_lines={("node-1", "audit.log"): [f"garbage {LOG_ENTRY}\n"]}),
+        ):
+            with pytest.raises(json.JSONDecodeError):
+                scan_node_audit_log(
+                    node="node-1",
+                    log="audit.log",
+                    log_entry=LOG_ENTRY,
+                    entries=queue.Queue(),
+                    stop=threading.Event(),
+                    stats=AuditLogScanStats(),
+                )
+
+    def test_stop_checked_on_every_line(self):
+        """Test a stopped scan kills the stream without reading to its end, also without matching lines"""
+        stop = threading.Event()
+        stats = AuditLogScanStats()
+        lines = [_audit_line(user_agent="ua", deprecated=False) for _ in range(10)]
+
+        def _lines():
+            for index, line in enumerate(lines):
+                if index == 3:
+                    stop.set()
+                yield line
+
+        with patch(
+            "audit_logs.subprocess.Popen", side_effect=_fake_popen(files_lines={("node-1", "audit.log"): _lines()})
+        ):
+            assert scan_node_audit_log(
+                node="node-1", log="audit.log", log_entry=LOG_ENTRY, entries=queue.Queue(), stop=stop, stats=stats
+            )
+
+        assert (stats.files, stats.lines) == (0, 3)
+
+    def test_stuck_stream_killed(self):
+        """Test a stream still open after the file deadline is killed, and the timeout is raised without retries"""
+        killed = threading.Event()
+        process = MagicMock()
+        process.__enter__.return_value = process
+        process.kill.side_effect = killed.set
+
+        def _lines():
+            yield _audit_line(user_agent="ua", deprecated=False)
+            # Blocked on the stream until the process is killed
+            killed.wait()
+
+        process.stdout = _lines()
+        with (
+            patch("audit_logs.AUDIT_LOG_FILE_TIMEOUT", 0.1),
+            patch("audit_logs.subprocess.Popen", return_value=process) as mock_popen,
+            patch("audit_logs.LOGGER") as mock_logger,
+        ):
+            with pytest.raises(subprocess.TimeoutExpired):
+                scan_node_audit_log(
+                    node="node-1",
+                    log="audit.log",
+                    log_entry=LOG_ENTRY,
+                    entries=queue.Queue(),
+                    stop=threading.Event(),
+                    stats=AuditLogScanStats(),
+                )
+
+        mock_popen.assert_called_once()
+        assert "took more than 0.1s" in mock_logger.warning.call_args[0][0]
+
+
+class TestScanAuditLogs:
+    """Test cases for scan_audit_logs function"""
+
+    def test_all_files_scanned_and_deduplicated(self):
+        """Test entries of all nodes and logs are yielded once"""
+        files_lines = {
+            ("node-1", "audit.log"): [_audit_line(user_agent="ua-1"), _audit_line(user_agent="ua-1")],
+            ("node-1", "audit-old.log"): [_audit_line(user_agent="ua-2")],
+            ("node-2", "audit.log"): [_audit_line(user_agent="ua-1"), _audit_line(user_agent="ua-3", name="other")],
+        }
+        stats = AuditLogScanStats()
+
+        with patch("audit_logs.subprocess.Popen", side_effect=_fake_popen(files_lines=files_lines)):
+            entries = list(
+                scan_audit_logs(
+                    nodes_logs={"node-1": ["audit.log", "audit-old.log"], "node-2": ["audit.log"]},
+                    log_entry=LOG_ENTRY,
+                    stats=stats,
+                )
+            )
+
+        assert sorted(entry["userAgent"] for entry in entries) == ["ua-1", "ua-2", "ua-3"]
+        assert (stats.files, stats.matched, stats.duplicates) == (3, 5, 2)
+
+    def test_worker_error_raised(self):
+        """Test a failing file is raised to the consumer"""
+        with patch(
+            "audit_logs.subprocess.Popen",
+            side_effect=_fake_popen(files_lines={("node-1", "audit.log"): [f"garbage {LOG_ENTRY}\n"]}),
+        ):
+            with pytest.raises(json.JSONDecodeError):
+                list(scan_audit_logs(nodes_logs={"node-1": ["audit.log"]}, log_entry=LOG_ENTRY))
+
+    def test_close_stops_scan(self):
+        """Test closing the generator early stops the workers"""
+        lines = [_audit_line(user_agent=f"ua-{idx}") for idx in range(5000)]
+
+        with (
+            patch("audit_logs.AUDIT_LOG_QUEUE_SIZE", 10),
+            patch("audit_logs.subprocess.Popen", side_effect=_fake_popen(files_lines={("node-1", "audit.log"): lines})),
+        ):
+            scanner = scan_audit_logs(nodes_logs={"node-1": ["audit.log"]}, log_entry=LOG_ENTRY)
+            assert next(scanner)["userAgent"] == "ua-0"
+            scanner.close()
@@ -0,0 +1,196 @@
+# Generated using Claude cli
+
+"""Unit tests for binary_cache module"""
+
+import hashlib
+import io
+import os
+import tarfile
+import zipfile
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from binary_cache import (
+    BinaryCache,
+    BinaryDownloadError,
+    download_binary,
+    extract_single_file,
+    url_validator,
+)
+
+TAR_URL = "https://downloads.example.com/amd64/linux/virtctl.tar.gz"
+ZIP_URL = "https://downloads.example.com/amd64/mac/oc.zip"
+BINARY_CONTENT = b"#!/bin/sh\necho virtctl\n"
+
+
+def _tar_archive(files):
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode="w:gz") as tar_archive:
+        for name, content in files.items():
+            member = tarfile.TarInfo(name=name)
+            member.size = len(content)
+            tar_archive.addfile(member, fileobj=io.BytesIO(content))
+    return archive.getvalue()
+
+
+def _zip_archive(files):
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, mode="w") as zip_archive:
+        for name, content in files.items():
+            zip_archive.writestr(name, content)
+    return archive.getvalue()
+
+
+def _response(content, headers=None):
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.raw = io.BytesIO(content)
+    response.headers = {"Content-Length": str(len(content)), **(headers or {})}
+    return response
+
+
+class TestExtractSingleFile:
+    """Test cases for extract_single_file function"""
+
+    @pytest.mark.parametrize(
+        "url, archive",
+        [
+            pytest.param(TAR_URL, _tar_archive(files={"./virtctl": BINARY_CONTENT}), id="tar"),
+            pytest.param(ZIP_URL, _zip_archive(files={"virtctl": BINARY_CONTENT}), id="zip"),
+        ],
+    )
+    def test_single_file_extracted(self, url, archive):
+        """Test the file is extracted from the stream with its base name and sha256"""
+        destination = io.BytesIO()
+
+        name, sha256 = extract_single_file(archive=io.BytesIO(archive), url=url, destination=destination)
+
+        assert (name, destination.getvalue()) == ("virtctl", BINARY_CONTENT)
+        assert sha256 == hashlib.sha256(BINARY_CONTENT).hexdigest()
+
+    def test_many_files_rejected(self):
+        """Test an archive with more than one file is rejected"""
+        archive = _tar_archive(files={"virtctl": BINARY_CONTENT, "README": b"readme"})
+
+        with pytest.raises(BinaryDownloadError, match="Only a single file expected"):
+            extract_single_file(archive=io.BytesIO(archive), url=TAR_URL, destination=io.BytesIO())
+
+
+class TestDownloadBinary:
+    """Test cases for download_binary function"""
+
+    @patch("binary_cache.requests.get")
+    def test_truncated_download_rejected(self, mock_get):
+        """Test a response shorter than its Content-Length is rejected"""
+        archive = _tar_archive(files={"virtctl": BINARY_CONTENT})
+        mock_get.return_value = _response(content=archive, headers={"Content-Length": str(len(archive) + 10)})
+
+        with pytest.raises(BinaryDownloadError, match="expected"):
+            download_binary(url=TAR_URL, destination=io.BytesIO())
+
+
+class TestUrlValidator:
+    """Test cases for url_validator function"""
+
+    @pytest.mark.parametrize(
+        "headers, expected",
+        [
+            pytest.param({"ETag": '"abc"', "Last-Modified": "Mon"}, '"abc"', id="etag"),
+            pytest.param({"Last-Modified": "Mon", "Content-Length": "10"}, "Mon|10", id="last_modified"),
+            pytest.param({}, "", id="none"),
+        ],
+    )
+    @patch("binary_cache.requests.head")
+    def test_validator(self, mock_head, headers, expected):
+        """Test the ETag is preferred over Last-Modified and Content-Length"""
+        mock_head.return_value.headers = headers
+
+        assert url_validator(url=TAR_URL) == expected
+
+    @patch("binary_cache.requests.head", side_effect=requests.ConnectionError("unreachable"))
+    def test_failed_request(self, mock_head):
+        """Test a failed HEAD request gives no validator"""
+        assert url_validator(url=TAR_URL) == ""
+
+
+class TestBinaryCache:
+    """Test cases for BinaryCache class"""
+
+    @pytest.fixture()
+    def dest_dir(self, tmp_path):
+        dest_dir = tmp_path / "bin"
+        dest_dir.mkdir()
+        return str(dest_dir)
+
+    @pytest.fixture()
+    def mock_requests(self):
+        with patch("binary_cache.requests.head") as mock_head, patch("binary_cache.requests.get") as mock_get:
+            mock_head.return_value.headers = {"ETag": '"v1"'}
+            mock_get.side_effect = lambda *args, **kwargs: _response(
+                content=_tar_archive(files={"virtctl": BINARY_CONTENT})
+            )
+            yield mock_head, mock_get
+
+    def test_persisted_between_sessions(self, mock_requests, tmp_path, dest_dir):
+        """Test a second cache on the same directory copies the binary without downloading it"""
+        _, mock_get = mock_requests
+        BinaryCache(cache_dir=str(tmp_path / "cache")).get(url=TAR_URL, dest_dir=dest_dir, server_version="4.99")
+        os.remove(os.path.join(dest_dir, "virtctl"))
+
+        cache = BinaryCache(cache_dir=str(tmp_path / "cache"))
+        binary = cache.get(url=TAR_URL, dest_dir=dest_dir, server_version="4.99")
+
+        assert mock_get.call_count == 1
+        assert (cache.stats.hits, cache.stats.downloads) == (1, 0)
+        with open(binary, "rb") as fd:
+            assert fd.read() == BINARY_CONTENT
+
+    def test_new_etag_downloaded_and_old_entry_removed(self, mock_requests, tmp_path, dest_dir):
+        """Test a changed ETag downloads again and replaces the entry of the URL"""
+        mock_head, mock_get = mock_requests
+        cache = BinaryCache(cache_dir=str(tmp_path / "cache"))
+        cache.get(url=TAR_URL, dest_dir=dest_dir)
+        mock_head.return_value.headers = {"ETag": '"v2"'}
+
+        cache.get(url=TAR_URL, dest_dir=dest_dir)
+
+        assert mock_get.call_count == 2
+        assert os.listdir(tmp_path / "cache") == [cache.cache_key(url=TAR_URL, server_version="", validator='"v2"')]
+
+    def test_new_server_version_downloaded(self, mock_requests, tmp_path, dest_dir):
+        """Test the server version is part of the key"""
+        _, mock_get = mock_requests
+        cache = BinaryCache(cache_dir=str(tmp_path / "cache"))
+        cache.get(url=TAR_URL, dest_dir=dest_dir, server_version="4.99.0")
+        cache.get(url=TAR_URL, dest_dir=dest_dir, server_version="4.99.1")
+
+        assert mock_get.call_count == 2
+
+    def test_corrupted_entry_downloaded_again(self, mock_requests, tmp_path, dest_dir):
+        """Test a cached binary not matching its sha256 is downloaded again"""
+        _, mock_get = mock_requests
+        cache = BinaryCache(cache_dir=str(tmp_path / "cache"))
+        cache.get(url=TAR_URL, dest_dir=dest_dir)
+        key = cache.cache_key(url=TAR_URL, server_version="", validator='"v1"')
+        with open(tmp_path / "cache" / key / "virtctl", "wb") as fd:
+            fd.write(b"corrupted")
+
+        binary = cache.get(url=TAR_URL, dest_dir=dest_dir)
+
+        assert mock_get.call_count == 2
+        with open(binary, "rb") as fd:
+            assert fd.read() == BINARY_CONTENT
+
+    def test_no_cache_dir(self, mock_requests, dest_dir):
+        """Test without a cache directory every get downloads straight into the destination"""
+        mock_head, mock_get = mock_requests
+        cache = BinaryCache()
+
+        assert cache.get(url=TAR_URL, dest_dir=dest_dir) == os.path.join(dest_dir, "virtctl")
+        cache.get(url=TAR_URL, dest_dir=dest_dir)
+
+        assert mock_get.call_count == 2
+        mock_head.assert_not_called()
+        assert os.listdir(dest_dir) == ["virtctl"]
@@ -6,7 +6,7 @@ import json
 import os
 import sys
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from timeout_sampler import TimeoutExpiredError, TimeoutSampler
@@ -15,8 +15,12 @@ from timeout_sampler import TimeoutExpiredError, TimeoutSampler
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from bitwarden import (
+    _SECRET_VALUES,
+    SECRETS_CACHE_DIR_ENV_VAR,
+    SECRETS_CACHE_TTL_ENV_VAR,
     get_all_cnv_tests_secrets,
     get_cnv_tests_secret_by_name,
+    prefetch_cnv_tests_secrets,
 )
 
 from utilities.exceptions import MissingEnvironmentVariableError
@@ -221,3 +225,108 @@ class TestGetCnvTestsSecretByName:
         mock_get_all.assert_not_called()
         # Verify getoption was called with correct argument
         mock_session.config.getoption.assert_called_once_with("--disabled-bitwarden")
+
+
+def _bws_secret_list(secrets):
+    return json.dumps([
+        {"key": name, "id": f"uuid-{name}", **({"value": json.dumps(value)} if value is not None else {})}
+        for name, value in secrets.items()
+    ])
+
+
+class TestPrefetchCnvTestsSecrets:
+    """Test cases for prefetch_cnv_tests_secrets function"""
+
+    @pytest.fixture(autouse=True)
+    def clear_secrets(self):
+        get_all_cnv_tests_secrets.cache_clear()
+        get_cnv_tests_secret_by_name.cache_clear()
+        _SECRET_VALUES.clear()
+        yield
+        get_all_cnv_tests_secrets.cache_clear()
+        get_cnv_tests_secret_by_name.cache_clear()
+        _SECRET_VALUES.clear()
+
+    @pytest.fixture()
+    def secrets_cache_dir(self, tmp_path):
+        with patch.dict(os.environ, {"ACCESS_TOKEN": "test-token", SECRETS_CACHE_DIR_ENV_VAR: str(tmp_path)}):
+            yield tmp_path
+
+    @patch("bitwarden.run_command")
+    def test_listed_values_used(self, mock_run_command):
+        """Test the values of the secrets list are returned without reading each secret"""
+        mock_run_command.return_value = (True, _bws_secret_list(secrets={"os_login": {"user": "cloud"}}), "")
+
+        with patch.dict(os.environ, {"ACCESS_TOKEN": "test-token"}):
+            prefetch_cnv_tests_secrets(secret_names=["os_login"])
+            get_cnv_tests_secret_by_name.cache_clear()
+
+            assert get_cnv_tests_secret_by_name(secret_name="os_login") == {"user": "cloud"}
+
+        assert mock_run_command.call_count == 1
+
+    @patch("bitwarden.run_command")
+    def test_unlisted_values_read(self, mock_run_command):
+        """Test the needed secrets without a value in the list are read"""
+        mock_run_command.side_effect = [
+            (True, _bws_secret_list(secrets={"os_login": None, "other": None}), ""),
+            (True, json.dumps({"value": json.dumps({"user": "cloud"})}), ""),
+        ]
+
+        with patch.dict(os.environ, {"ACCESS_TOKEN": "test-token"}):
+            prefetch_cnv_tests_secrets(secret_names=["os_login"])
+
+        assert _SECRET_VALUES == {"os_login": {"user": "cloud"}}
+        assert mock_run_command.call_args.kwargs["command"][-3:] == ["secret", "get", "uuid-os_login"]
+
+    @patch("bitwarden.run_command")
+    def test_encrypted_cache_shared(self, mock_run_command, secrets_cache_dir):
+        """Test a second process reads the secrets from the encrypted cache without calling bws"""
+        mock_run_command.return_value = (True, _bws_secret_list(secrets={"os_login": {"password": "secret"}}), "")
+        prefetch_cnv_tests_secrets(secret_names=["os_login"])
+        _SECRET_VALUES.clear()
+        get_all_cnv_tests_secrets.cache_clear()
+
+        prefetch_cnv_tests_secrets(secret_names=["os_login"])
+
+        assert mock_run_command.call_count == 1
+        assert _SECRET_VALUES == {"os_login": {"password": "secret"}}
+        (cache_file,) = secrets_cache_dir.iterdir()
+        assert b"secret" not in cache_file.read_bytes()
+        assert cache_file.stat().st_mode & 0o077 == 0
+
+    @patch("bitwarden.run_command")
+    def test_expired_cache_fetched_again(self, mock_run_command, secrets_cache_dir):
+        """Test the secrets are fetched again once the cache is older than its TTL"""
+        mock_run_command.return_value = (True, _bws_secret_list(secrets={"os_login": {"user": "cloud"}}), "")
+        prefetch_cnv_tests_secrets(secret_names=["os_login"])
+        get_all_cnv_tests_secrets.cache_clear()
+
+        with patch.dict(os.environ, {SECRETS_CACHE_TTL_ENV_VAR: "0"}), patch("cryptography.fernet.time.time") as time:
+            time.return_value = 2**40
+            prefetch_cnv_tests_secrets(secret_names=["os_login"])
+
+        assert mock_run_command.call_count == 2
+
+    @patch("bitwarden.run_command")
+    def test_other_token_cache_not_used(self, mock_run_command, secrets_cache_dir):
+        """Test the cache of another access token is not read"""
+        mock_run_command.return_value = (True, _bws_secret_list(secrets={"os_login": {"user": "cloud"}}), "")
+        prefetch_cnv_tests_secrets(secret_names=["os_login"])
+        get_all_cnv_tests_secrets.cache_clear()
+
+        with patch.dict(os.environ, {"ACCESS_TOKEN": "other-token"}):
+            prefetch_cnv_tests_secrets(secret_names=["os_login"])
+
+        assert mock_run_command.call_count == 2
+        assert len(list(secrets_cache_dir.iterdir())) == 2
+
+    @patch("bitwarden.run_command")
+    def test_disabled_bitwarden(self, mock_run_command):
+        """Test nothing is fetched with --disabled-bitwarden"""
+        mock_session = MagicMock()
+        mock_session.config.getoption.return_value = True
+
+        prefetch_cnv_tests_secrets(secret_names=["os_login"], session=mock_session)
+
+        mock_run_command.assert_not_called()
@@ -0,0 +1,109 @@
+# Generated using Claude cli
+
+"""Unit tests for bootstrap module"""
+
+import threading
+from functools import partial
+from unittest.mock import MagicMock
+
+import pytest
+
+from bootstrap import BootstrapStage, run_bootstrap_stages, validate_bootstrap_stages
+
+
+class TestValidateBootstrapStages:
+    """Test cases for validate_bootstrap_stages function"""
+
+    @pytest.mark.parametrize(
+        "stages, error",
+        [
+            pytest.param(
+                [BootstrapStage(name="a", func=MagicMock()), BootstrapStage(name="a", func=MagicMock())],
+                "Duplicated",
+                id="duplicated",
+            ),
+            pytest.param(
+                [BootstrapStage(name="a", func=MagicMock(), depends_on=("b",))],
+                "unknown stages",
+                id="unknown_dependency",
+            ),
+            pytest.param(
+                [
+                    BootstrapStage(name="a", func=MagicMock(), depends_on=("b",)),
+                    BootstrapStage(name="b", func=MagicMock(), depends_on=("a",)),
+                ],
+                "cycle",
+                id="cycle",
+            ),
+        ],
+    )
+    def test_invalid_graph(self, stages, error):
+        """Test invalid dependency graphs are rejected"""
+        with pytest.raises(ValueError, match=error):
+            validate_bootstrap_stages(stages=stages)
+
+
+class TestRunBootstrapStages:
+    """Test cases for run_bootstrap_stages function"""
+
+    def test_independent_stages_run_concurrently(self):
+        """Test stages without dependencies between them run at the same time"""
+        barrier = threading.Barrier(parties=2, timeout=5)
+
+        def _stage(value):
+            # Both stages must be waiting on the barrier at once, or it times out
+            barrier.wait()
+            return value
+
+        results = run_bootstrap_stages(
+            stages=[
+                BootstrapStage(name="network", func=partial(_stage, value="10.0.0.0/16")),
+                BootstrapStage(name="secrets", func=partial(_stage, value={"user": "cloud"})),
+            ]
+        )
+
+        assert results == {"network": "10.0.0.0/16", "secrets": {"user": "cloud"}}
+
+    def test_dependencies_run_first(self):
+        """Test a stage starts only after the stages it depends on finished, and timings are filled"""
+        order = []
+        timings = {}
+
+        run_bootstrap_stages(
+            stages=[
+                BootstrapStage(name="config_map", func=lambda: order.append("config_map"), depends_on=("namespace",)),
+                BootstrapStage(name="namespace", func=lambda: order.append("namespace"), depends_on=("check",)),
+                BootstrapStage(name="check", func=lambda: order.append("check")),
+            ],
+            timings=timings,
+        )
+
+        assert order == ["check", "namespace", "config_map"]
+        assert timings["config_map"].started >= timings["namespace"].finished >= timings["check"].finished
+        assert all(timing.duration is not None for timing in timings.values())
+
+    def test_failure_stops_dependent_stages(self):
+        """Test a failure is raised once the running stages finished, and its dependent stages never start"""
+        release_slow_stage = threading.Event()
+        slow_stage_finished = threading.Event()
+        dependent_stage = MagicMock()
+
+        def _slow_stage():
+            release_slow_stage.wait(timeout=5)
+            slow_stage_finished.set()
+
+        def _failing_stage():
+            release_slow_stage.set()
+            raise RuntimeError("run in progress")
+
+        with pytest.raises(RuntimeError, match="run in progress"):
+            run_bootstrap_stages(
+                stages=[
+                    BootstrapStage(name="slow", func=_slow_stage),
+                    BootstrapStage(name="check", func=_failing_stage),
+                    BootstrapStage(name="deploy", func=dependent_stage, depends_on=("slow", "check")),
+                ]
+            )
+
+        assert slow_stage_finished.is_set()
+        dependent_stage.assert_not_called()
@@ -0,0 +1,676 @@
+# Generated using Claude cli
+
+"""Unit tests for bulk module"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from ocp_resources.virtual_machine_instance import VirtualMachineInstance
+from ocp_resources.virtual_machine_instance_migration import VirtualMachineInstanceMigration
+from timeout_sampler import TimeoutExpiredError
+
+from bulk import (
+    BulkOperationError,
+    DeletionReport,
+    DeletionTiming,
+    MigrationReport,
+    MigrationResult,
+    ProvisioningTiming,
+    RateLimiter,
+    VmStartTiming,
+    add_migrations_data_processed,
+    collect_vm_start_timings,
+    condition_transition_time,
+    delete_collection,
+    delete_resources_in_parallel,
+    deploy_resources_in_parallel,
+    get_nodes_usage,
+    latency_summary,
+    launcher_pod_start_times,
+    migrate_vms_in_waves,
+    migration_result,
+    percentile,
+    provision_vms,
+    sample_vms_health,
+    vm_start_latency_histograms,
+    vmi_phase_transition_time,
+    wait_for_vmis_running,
+)
+
+# 2025-01-01T00:00:00Z
+BASE_TIME = 1735689600.0
+
+
+def _mock_resource(name, namespace="test-namespace"):
+    resource = MagicMock()
+    resource.kind = "VirtualMachine"
+    resource.name = name
+    resource.namespace = namespace
+    return resource
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter class"""
+
+    def test_rate_limiter_unlimited(self):
+        """Test 0 requests per second never sleeps"""
+        with patch("bulk.time.sleep") as mock_sleep:
+            rate_limiter = RateLimiter(requests_per_second=0)
+            rate_limiter.wait()
+            rate_limiter.wait()
+
+        mock_sleep.assert_not_called()
+
+    def test_rate_limiter_spaces_requests(self):
+        """Test consecutive requests are spaced by the interval"""
+        with patch("bulk.time.sleep") as mock_sleep:
+            rate_limiter = RateLimiter(requests_per_second=2)
+            rate_limiter.wait()
+            rate_limiter.wait()
+
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args.args[0] <= 0.5
+
+
+class TestProvisioningTiming:
+    """Test cases for ProvisioningTiming class"""
+
+    def test_durations(self):
+        """Test durations are relative to the submission time"""
+        timing = ProvisioningTiming(name="vm", submitted=100.0, created=101.5, running=130.0)
+
+        assert timing.create_duration == 1.5
+        assert timing.start_duration == 30.0
+
+    def test_durations_not_reached(self):
+        """Test durations are None until the phase is reached"""
+        timing = ProvisioningTiming(name="vm", submitted=100.0)
+
+        assert timing.create_duration is None
+        assert timing.start_duration is None
+
+
+class TestDeployResourcesInParallel:
+    """Test cases for deploy_resources_in_parallel function"""
+
+    def test_deploy_all_resources(self):
+        """Test all resources are deployed and timed"""
+        resources = [_mock_resource(name=f"vm-{idx}") for idx in range(5)]
+
+        timings = deploy_resources_in_parallel(resources=resources, max_workers=3, api_requests_per_second=0)
+
+        assert set(timings) == {f"vm-{idx}" for idx in range(5)}
+        for resource in resources:
+            resource.deploy.assert_called_once()
+        assert all(timing.created >= timing.submitted for timing in timings.values())
+
+    def test_deploy_failure_reported_after_all_submitted(self):
+        """Test a failing deploy does not stop the others and is raised as BulkOperationError"""
+        resources = [_mock_resource(name="vm-ok"), _mock_resource(name="vm-bad")]
+        resources[1].deploy.side_effect = ValueError("quota exceeded")
+
+        with pytest.raises(BulkOperationError, match="vm-bad") as exc_info:
+            deploy_resources_in_parallel(resources=resources, api_requests_per_second=0)
+
+        resources[0].deploy.assert_called_once()
+        assert exc_info.value.errors == {"vm-bad": "quota exceeded"}
+
+
+class TestVmiPhaseTransitionTime:
+    """Test cases for vmi_phase_transition_time function"""
+
+    def test_phase_found(self):
+        """Test the phase transition timestamp is converted to epoch seconds"""
+        vmi = {
+            "status": {
+                "phaseTransitionTimestamps": [
+                    {"phase": "Pending", "phaseTransitionTimestamp": "2025-01-01T00:00:00Z"},
+                    {"phase": "Running", "phaseTransitionTimestamp": "2025-01-01T00:01:00Z"},
+                ]
+            }
+        }
+
+        assert vmi_phase_transition_time(vmi=vmi, phase="Running") == 1735689660.0
+
+    def test_phase_not_found(self):
+        """Test None is returned when the phase was not reached"""
+        assert vmi_phase_transition_time(vmi={"status": {}}, phase="Running") is None
+
+
+class TestWaitForVmisRunning:
+    """Test cases for wait_for_vmis_running function"""
+
+    @patch("bulk.wait_for_resources")
+    def test_one_watch_per_namespace(self, mock_wait_for_resources):
+        """Test VMs are grouped by namespace and waited with one watch each"""
+        vms = [
+            _mock_resource(name="vm-1", namespace="ns-1"),
+            _mock_resource(name="vm-2", namespace="ns-1"),
+            _mock_resource(name="vm-3", namespace="ns-2"),
+        ]
+        mock_wait_for_resources.side_effect = lambda names, **kwargs: {name: {"status": {}} for name in names}
+
+        running_times = wait_for_vmis_running(client=MagicMock(), vms=vms)
+
+        assert set(running_times) == {"vm-1", "vm-2", "vm-3"}
+        assert mock_wait_for_resources.call_count == 2
+        predicate = mock_wait_for_resources.call_args.kwargs["predicate"]
+        assert predicate({"status": {"phase": "Running"}})
+        assert not predicate({"status": {"phase": "Scheduling"}})
+
+
+class TestProvisionVms:
+    """Test cases for provision_vms function"""
+
+    @patch("bulk.wait_for_vmis_running")
+    def test_provision_vms_records_running_time(self, mock_wait_for_vmis_running):
+        """Test running times from the watch are added to the timings"""
+        vms = [_mock_resource(name="vm-1")]
+        mock_wait_for_vmis_running.return_value = {"vm-1": 4102444800.0}
+
+        timings = provision_vms(client=MagicMock(), vms=vms, api_requests_per_second=0)
+
+        assert timings["vm-1"].running == 4102444800.0
+
+    @patch("bulk.wait_for_vmis_running")
+    def test_provision_vms_without_wait(self, mock_wait_for_vmis_running):
+        """Test no watch is opened when wait_for_running is False"""
+        timings = provision_vms(
+            client=None, vms=[_mock_resource(name="vm-1")], api_requests_per_second=0, wait_for_running=False
+        )
+
+        mock_wait_for_vmis_running.assert_not_called()
+        assert timings["vm-1"].running is None
+
+
+def _raw_vmi(name, agent_connected=True):
+    conditions = [{"type": "Ready", "status": "True", "lastTransitionTime": "2025-01-01T00:00:40Z"}]
+    if agent_connected:
+        conditions.append({"type": "AgentConnected", "status": "True", "lastTransitionTime": "2025-01-01T00:01:00Z"})
+    return {
+        "metadata": {"name": name, "creationTimestamp": "2025-01-01T00:00:01Z"},
+        "status": {
+            "phaseTransitionTimestamps": [{"phase": "Running", "phaseTransitionTimestamp": "2025-01-01T00:00:30Z"}],
+            "conditions": conditions,
+        },
+    }
+
+
+def _raw_launcher_pod(vm_name):
+    return {
+        "metadata": {"name": f"virt-launcher-{vm_name}-abcde", "labels": {"vm.kubevirt.io/name": vm_name}},
+        "status": {
+            "conditions": [{"type": "PodScheduled", "status": "True", "lastTransitionTime": "2025-01-01T00:00:02Z"}],
+            "containerStatuses": [
+                {"name": "guest-console-log", "state": {"running": {"startedAt": "2025-01-01T00:00:50Z"}}},
+                {"name": "compute", "state": {"running": {"startedAt": "2025-01-01T00:00:10Z"}}},
+            ],
+        },
+    }
+
+
+def _mock_resource_api(vmis, pods):
+    def _get_resource_api(client, resource_kind):
+        api = MagicMock()
+        api.get.return_value.to_dict.return_value = {
+            "items": vmis if resource_kind.kind == "VirtualMachineInstance" else pods
+        }
+        return api
+
+    return _get_resource_api
+
+
+class TestConditionTransitionTime:
+    """Test cases for condition_transition_time function"""
+
+    def test_true_condition(self):
+        """Test the transition time of a True condition is returned"""
+        assert condition_transition_time(resource=_raw_vmi(name="vm-1"), condition_type="AgentConnected") == (
+            BASE_TIME + 60
+        )
+
+    def test_false_condition(self):
+        """Test None is returned when the condition is not True"""
+        resource = {"status": {"conditions": [{"type": "AgentConnected", "status": "False"}]}}
+
+        assert condition_transition_time(resource=resource, condition_type="AgentConnected") is None
+
+
+class TestVmStartTiming:
+    """Test cases for VmStartTiming class"""
+
+    def test_latencies_of_reached_phases(self):
+        """Test latencies are relative to the start request and skip phases not reached"""
+        timing = VmStartTiming(name="vm", requested=100.0, created=101.0, running=130.0)
+
+        assert timing.latencies() == {"created": 1.0, "running": 30.0}
+
+
+class TestLauncherPodStartTimes:
+    """Test cases for launcher_pod_start_times function"""
+
+    def test_scheduled_and_compute_started(self):
+        """Test the scheduled time and the compute container start time are returned"""
+        assert launcher_pod_start_times(pod=_raw_launcher_pod(vm_name="vm-1")) == (BASE_TIME + 2, BASE_TIME + 10)
+
+    def test_pending_pod(self):
+        """Test None is returned for phases the pod did not reach"""
+        assert launcher_pod_start_times(pod={"status": {"phase": "Pending"}}) == (None, None)
+
+
+class TestCollectVmStartTimings:
+    """Test cases for collect_vm_start_timings function"""
+
+    @patch("bulk.wait_for_resources")
+    def test_timings_from_vmis_and_pods(self, mock_wait_for_resources):
+        """Test all phases are collected with one VMI and one pod list, without waiting for the agents"""
+        vms = [_mock_resource(name="vm-1"), _mock_resource(name="vm-2")]
+
+        with patch(
+            "bulk.get_resource_api",
+            side_effect=_mock_resource_api(
+                vmis=[_raw_vmi(name="vm-1"), _raw_vmi(name="vm-2", agent_connected=False)],
+                pods=[_raw_launcher_pod(vm_name="vm-1")],
+            ),
+        ) as mock_get_resource_api:
+            timings = collect_vm_start_timings(
+                client=MagicMock(), vms=vms, requested={"vm-1": BASE_TIME, "vm-2": BASE_TIME}
+            )
+
+        mock_wait_for_resources.assert_not_called()
+        assert mock_get_resource_api.call_count == 2
+        assert timings["vm-1"].latencies() == {
+            "created": 1.0,
+            "scheduled": 2.0,
+            "launcher_running": 10.0,
+            "running": 30.0,
+            "agent_connected": 60.0,
+        }
+        assert timings["vm-2"].latencies() == {"created": 1.0, "running": 30.0}
+
+    @patch("bulk.wait_for_resources")
+    def test_agent_timeout_not_raised(self, mock_wait_for_resources):
+        """Test timings are collected even if not all guest agents connected in time"""
+        mock_wait_for_resources.side_effect = TimeoutExpiredError("agent not connected")
+
+        with patch("bulk.get_resource_api", side_effect=_mock_resource_api(vmis=[], pods=[])):
+            timings = collect_vm_start_timings(
+                client=MagicMock(), vms=[_mock_resource(name="vm-1")], requested={"vm-1": BASE_TIME}, agent_timeout=60
+            )
+
+        predicate = mock_wait_for_resources.call_args.kwargs["predicate"]
+        assert predicate(_raw_vmi(name="vm-1"))
+        assert not predicate(_raw_vmi(name="vm-1", agent_connected=False))
+        assert timings["vm-1"].latencies() == {}
+
+
+class TestLatencySummary:
+    """Test cases for percentile and latency_summary functions"""
+
+    def test_percentile_nearest_rank(self):
+        """Test percentiles are values of the input"""
+        values = [float(value) for value in range(100, 0, -1)]
+
+        assert percentile(values=values, percent=50) == 50.0
+        assert percentile(values=values, percent=99) == 99.0
+        assert percentile(values=[7.0], percent=0) == 7.0
+
+    def test_latency_summary(self):
+        """Test the summary holds count, percentiles and max"""
+        assert latency_summary(values=[1.0, 2.0, 3.0, 4.0]) == {
+            "count": 4,
+            "p50": 2.0,
+            "p90": 4.0,
+            "p99": 4.0,
+            "max": 4.0,
+        }
+
+    def test_latency_summary_no_values(self):
+        """Test only the count is returned when there are no values"""
+        assert latency_summary(values=[]) == {"count": 0}
+
+
+class TestVmStartLatencyHistograms:
+    """Test cases for vm_start_latency_histograms function"""
+
+    def test_grouped_per_phase(self):
+        """Test latencies are summarized per group and phase"""
+        timings = {
+            "vm-rhel-ocs-b0-0": VmStartTiming(name="vm-rhel-ocs-b0-0", requested=0.0, running=10.0),
+            "vm-rhel-ocs-b0-1": VmStartTiming(name="vm-rhel-ocs-b0-1", requested=0.0, running=20.0),
+            "vm-win-nfs-b0-0": VmStartTiming(name="vm-win-nfs-b0-0", requested=0.0, running=90.0),
+        }
+
+        histograms = vm_start_latency_histograms(timings=timings, group_of=lambda name: name.rsplit("-", 2)[0])
+
+        assert list(histograms) == ["vm-rhel-ocs", "vm-win-nfs"]
+        assert histograms["vm-rhel-ocs"]["running"]["count"] == 2
+        assert histograms["vm-rhel-ocs"]["running"]["max"] == 20.0
+        assert histograms["vm-win-nfs"]["agent_connected"] == {"count": 0}
+
+
+def _mock_node_metrics_client():
+    client = MagicMock()
+    client.resources.get.return_value.get.return_value.to_dict.return_value = {
+        "items": [{"metadata": {"name": "node-1"}, "usage": {"cpu": "1500m", "memory": "2Gi"}}]
+    }
+    return client
+
+
+class TestGetNodesUsage:
+    """Test cases for get_nodes_usage function"""
+
+    def test_usage_parsed(self):
+        """Test node usage quantities are converted to cores and bytes"""
+        assert get_nodes_usage(client=_mock_node_metrics_client()) == {
+            "node-1": {"cpu_cores": 1.5, "memory_bytes": 2147483648.0}
+        }
+
+
+class TestSampleVmsHealth:
+    """Test cases for sample_vms_health function"""
+
+    def test_one_list_per_namespace(self):
+        """Test phases and per node distribution are computed from one VMI list per namespace"""
+        vms = [
+            _mock_resource(name="vm-1", namespace="ns-1"),
+            _mock_resource(name="vm-2", namespace="ns-1"),
+            _mock_resource(name="vm-3", namespace="ns-1"),
+            _mock_resource(name="vm-4", namespace="ns-2"),
+        ]
+        vmis = [
+            {"metadata": {"name": "vm-1"}, "status": {"phase": "Running", "nodeName": "node-1"}},
+            {"metadata": {"name": "vm-2"}, "status": {"phase": "Scheduling"}},
+            {"metadata": {"name": "vm-4"}, "status": {"phase": "Running", "nodeName": "node-2"}},
+        ]
+
+        with patch("bulk.get_resource_api", side_effect=_mock_resource_api(vmis=vmis, pods=[])) as mock_api:
+            sample = sample_vms_health(client=MagicMock(), vms=vms)
+
+        assert mock_api.call_count == 2
+        assert not sample.all_running
+        assert (sample.total, sample.running) == (4, 2)
+        assert sample.phases == {"Running": 2, "Scheduling": 1, "Missing": 1}
+        assert sample.vms_per_node == {"node-1": 1, "node-2": 1}
+        assert sample.nodes_usage == {}
+
+    def test_nodes_usage(self):
+        """Test the nodes usage is added when requested"""
+        sample = sample_vms_health(client=_mock_node_metrics_client(), vms=[], nodes_usage=True)
+
+        assert sample.all_running
+        assert sample.nodes_usage["node-1"]["cpu_cores"] == 1.5
+
+
+def _raw_migration(name, phase="Succeeded", failure_reason=None):
+    migration_state = {
+        "startTimestamp": "2025-01-01T00:00:05Z",
+        "endTimestamp": "2025-01-01T00:00:25Z",
+        "sourceNode": "node-1",
+        "targetNode": "node-2",
+    }
+    if failure_reason:
+        migration_state["failureReason"] = failure_reason
+    return {"metadata": {"name": name}, "status": {"phase": phase, "migrationState": migration_state}}
+
+
+class TestMigrationResult:
+    """Test cases for migration_result function"""
+
+    def test_succeeded(self):
+        """Test a succeeded migration duration and nodes are taken from its migration state"""
+        result = migration_result(
+            name="vm-1", migration_name="vm-1-abcde", submitted=BASE_TIME, raw_migration=_raw_migration(name="vm-1")
+        )
+
+        assert result.succeeded
+        assert result.duration == 25.0
+        assert (result.source_node, result.target_node) == ("node-1", "node-2")
+        assert result.failure_reason is None
+
+    def test_failed(self):
+        """Test the failure reason of a failed migration is kept"""
+        result = migration_result(
+            name="vm-1",
+            migration_name="vm-1-abcde",
+            submitted=BASE_TIME,
+            raw_migration=_raw_migration(name="vm-1", phase="Failed", failure_reason="target pod unschedulable"),
+        )
+
+        assert not result.succeeded
+        assert result.failure_reason == "target pod unschedulable"
+
+    def test_not_finished(self):
+        """Test a migration which did not finish has no duration and a failure reason"""
+        result = migration_result(
+            name="vm-1",
+            migration_name="vm-1-abcde",
+            submitted=BASE_TIME,
+            raw_migration={"status": {"phase": "Scheduling"}},
+        )
+
+        assert result.duration is None
+        assert result.failure_reason == "Not finished in time, phase: Scheduling"
+
+
+class TestMigrationReport:
+    """Test cases for MigrationReport class"""
+
+    def test_summary(self):
+        """Test throughput, durations, data and failure reasons are summarized"""
+        report = MigrationReport(
+            results={
+                "vm-1": MigrationResult(
+                    name="vm-1",
+                    migration="m-1",
+                    submitted=0.0,
+                    completed=20.0,
+                    phase="Succeeded",
+                    data_processed_bytes=100.0,
+                ),
+                "vm-2": MigrationResult(
+                    name="vm-2",
+                    migration="m-2",
+                    submitted=0.0,
+                    completed=40.0,
+                    phase="Succeeded",
+                    data_processed_bytes=300.0,
+                ),
+                "vm-3": MigrationResult(
+                    name="vm-3", migration="m-3", submitted=0.0, phase="Failed", failure_reason="aborted"
+                ),
+            },
+            duration=60.0,
+            waves=2,
+        )
+
+        summary = report.summary()
+
+        assert list(report.failed) == ["vm-3"]
+        assert summary["migrations_per_minute"] == 2.0
+        assert summary["migration_duration"]["max"] == 40.0
+        assert summary["data_processed_bytes"] == 400.0
+        assert summary["failure_reasons"] == {"aborted": 1}
+
+
+class TestAddMigrationsDataProcessed:
+    """Test cases for add_migrations_data_processed function"""
+
+    def test_data_added_per_vm(self):
+        """Test the data processed is added to the result of its VM"""
+        results = {"vm-1": MigrationResult(name="vm-1", migration="m-1", submitted=0.0)}
+        prometheus = MagicMock()
+        prometheus.query.return_value = {
+            "data": {"result": [{"metric": {"name": "vm-1"}, "value": [0, "2048"]}, {"metric": {"name": "other"}}]}
+        }
+
+        add_migrations_data_processed(prometheus=prometheus, results=results, namespaces={"ns-1"}, window=60)
+
+        assert results["vm-1"].data_processed_bytes == 2048.0
+        assert "namespace='ns-1'" in prometheus.query.call_args.kwargs["query"]
+
+    def test_query_failure_not_raised(self):
+        """Test a failing query leaves the data processed unset"""
+        results = {"vm-1": MigrationResult(name="vm-1", migration="m-1", submitted=0.0)}
+        prometheus = MagicMock()
+        prometheus.query.side_effect = ConnectionError("prometheus unavailable")
+
+        add_migrations_data_processed(prometheus=prometheus, results=results, namespaces={"ns-1"}, window=60)
+
+        assert results["vm-1"].data_processed_bytes is None
+
+
+@pytest.fixture()
+def mock_migration_class():
+    """VirtualMachineInstanceMigration class creating mock migrations, keeping the real statuses"""
+    with patch("bulk.VirtualMachineInstanceMigration") as migration_class:
+        migration_class.Status = VirtualMachineInstanceMigration.Status
+        migration_class.side_effect = lambda name, namespace, **kwargs: _mock_resource(name=name, namespace=namespace)
+        yield migration_class
+
+
+@pytest.mark.usefixtures("mock_migration_class")
+class TestMigrateVmsInWaves:
+    """Test cases for migrate_vms_in_waves function"""
+
+    @patch("bulk.deploy_resources_in_parallel")
+    @patch("bulk.wait_for_resources")
+    def test_waves(self, mock_wait_for_resources, mock_deploy_resources_in_parallel):
+        """Test each wave is created and waited for with one watch before the next one"""
+        vms = [_mock_resource(name=f"vm-{idx}") for idx in range(5)]
+        mock_deploy_resources_in_parallel.side_effect = lambda resources, **kwargs: {
+            resource.name: ProvisioningTiming(name=resource.name, submitted=BASE_TIME) for resource in resources
+        }
+        mock_wait_for_resources.side_effect = lambda names, **kwargs: {
+            name: _raw_migration(name=name) for name in names
+        }
+
+        report = migrate_vms_in_waves(client=MagicMock(), vms=vms, wave_size=2)
+
+        assert report.waves == 3
+        assert mock_deploy_resources_in_parallel.call_count == 3
+        assert mock_wait_for_resources.call_count == 3
+        assert [len(call.kwargs["names"]) for call in mock_wait_for_resources.call_args_list] == [2, 2, 1]
+        assert set(report.results) == {f"vm-{idx}" for idx in range(5)}
+        assert not report.failed
+        predicate = mock_wait_for_resources.call_args.kwargs["predicate"]
+        assert predicate({"status": {"phase": "Failed"}})
+        assert not predicate({"status": {"phase": "Running"}})
+
+    @patch("bulk.deploy_resources_in_parallel")
+    @patch("bulk.wait_for_resources")
+    def test_timed_out_wave_reported(self, mock_wait_for_resources, mock_deploy_resources_in_parallel):
+        """Test migrations of a timed out wave are listed and reported as failed"""
+        mock_deploy_resources_in_parallel.side_effect = lambda resources, **kwargs: {
+            resource.name: ProvisioningTiming(name=resource.name, submitted=BASE_TIME) for resource in resources
+        }
+        mock_wait_for_resources.side_effect = TimeoutExpiredError("migrations not finished")
+
+        with patch("bulk.get_resource_api", side_effect=_mock_resource_api(vmis=[], pods=[])):
+            report = migrate_vms_in_waves(client=MagicMock(), vms=[_mock_resource(name="vm-1")])
+
+        assert list(report.failed) == ["vm-1"]
+        assert report.failed["vm-1"].failure_reason == "Not finished in time, phase: None"
+
+
+class TestDeletionReport:
+    """Test cases for DeletionReport class"""
+
+    def test_summary(self):
+        """Test throughput, latencies and the slowest deletions with their finalizers are summarized"""
+        report = DeletionReport(
+            timings=[
+                DeletionTiming(kind="VirtualMachine", name="vm-1", namespace="ns", submitted=0.0, deleted=5.0),
+                DeletionTiming(
+                    kind="VirtualMachine",
+                    name="vm-2",
+                    namespace="ns",
+                    submitted=0.0,
+                    deleted=50.0,
+                    finalizers=["kubevirt.io/virtualMachineControllerFinalize"],
+                ),
+            ],
+            duration=50.0,
+        )
+
+        summary = report.summary()
+
+        assert summary["deletions_per_second"] == 0.04
+        assert summary["deletion_duration"]["max"] == 50.0
+        assert summary["slowest"][0]["name"] == "vm-2"
+        assert summary["slowest"][0]["finalizers"] == ["kubevirt.io/virtualMachineControllerFinalize"]
+
+
+class TestDeleteResourcesInParallel:
+    """Test cases for delete_resources_in_parallel function"""
+
+    @patch("bulk.wait_for_resources_deleted")
+    def test_delete_and_wait_with_one_watch(self, mock_wait_for_resources_deleted):
+        """Test resources are cleaned up without waiting and waited for with one watch per namespace"""
+        resources = [_mock_resource(name=f"vm-{idx}") for idx in range(3)]
+        mock_wait_for_resources_deleted.side_effect = lambda names, **kwargs: {name: (BASE_TIME, []) for name in names}
+
+        report = delete_resources_in_parallel(resources=resources, api_requests_per_second=0)
+
+        for resource in resources:
+            resource.clean_up.assert_called_once_with(wait=False)
+        mock_wait_for_resources_deleted.assert_called_once()
+        assert all(timing.deleted == BASE_TIME for timing in report.timings)
+
+    @patch("bulk.wait_for_resources_deleted")
+    def test_ignored_exception_skipped(self, mock_wait_for_resources_deleted):
+        """Test resources failing with an ignored exception are not waited for nor reported"""
+        resources = [_mock_resource(name="vm-ok"), _mock_resource(name="vm-forbidden")]
+        resources[1].clean_up.side_effect = PermissionError("forbidden")
+        mock_wait_for_resources_deleted.side_effect = lambda names, **kwargs: {name: (BASE_TIME, []) for name in names}
+
+        report = delete_resources_in_parallel(
+            resources=resources, api_requests_per_second=0, ignored_exceptions=(PermissionError,)
+        )
+
+        assert mock_wait_for_resources_deleted.call_args.kwargs["names"] == {"vm-ok"}
+        assert [timing.name for timing in report.timings] == ["vm-ok"]
+
+    @patch("bulk.wait_for_resources_deleted")
+    def test_failure_raised_after_all_submitted(self, mock_wait_for_resources_deleted):
+        """Test a failing delete does not stop the others and is raised as BulkOperationError"""
+        resources = [_mock_resource(name="vm-ok"), _mock_resource(name="vm-bad")]
+        resources[1].clean_up.side_effect = ValueError("conflict")
+
+        with pytest.raises(BulkOperationError, match="vm-bad"):
+            delete_resources_in_parallel(resources=resources, api_requests_per_second=0)
+
+        resources[0].clean_up.assert_called_once()
+        mock_wait_for_resources_deleted.assert_not_called()
+
+
+class TestDeleteCollection:
+    """Test cases for delete_collection function"""
+
+    @patch("bulk.wait_for_resources_deleted")
+    def test_collection_delete(self, mock_wait_for_resources_deleted):
+        """Test all resources of the namespace are deleted with one request and waited for"""
+        mock_wait_for_resources_deleted.return_value = {"vm-1": (BASE_TIME, [])}
+        api = MagicMock()
+        api.get.return_value.to_dict.return_value = {"items": [{"metadata": {"name": "vm-1"}}]}
+
+        with patch("bulk.get_resource_api", return_value=api):
+            report = delete_collection(client=MagicMock(), resource_kind=VirtualMachineInstance, namespace="ns")
+
+        api.delete.assert_called_once_with(namespace="ns", label_selector=None, field_selector="metadata.namespace=ns")
+        assert report.timings[0].deleted == BASE_TIME
+
+    @patch("bulk.wait_for_resources_deleted")
+    def test_nothing_to_delete(self, mock_wait_for_resources_deleted):
+        """Test no delete request is sent when no resource matches"""
+        api = MagicMock()
+        api.get.return_value.to_dict.return_value = {"items": []}
+
+        with patch("bulk.get_resource_api", return_value=api):
+            report = delete_collection(
+                client=MagicMock(), resource_kind=VirtualMachineInstance, namespace="ns", label_selector="app=scale"
+            )
+
+        api.delete.assert_not_called()
+        mock_wait_for_resources_deleted.assert_not_called()
+        assert report.timings == []
@@ -5,7 +5,11 @@
 import os
 from unittest.mock import MagicMock, mock_open, patch
 
-from console import Console
+import pexpect
+import pytest
+from ocp_utilities.exceptions import CommandExecFailed
+
+from console import Console, ConsoleSession, ConsoleSessionPool
 
 
 class TestConsole:
@@ -408,3 +412,143 @@ class TestConsole:
 
         # Should not change child when no valid sample is found
         assert console.child == original_child
+
+
+class TestConsoleSession:
+    """Test cases for ConsoleSession class"""
+
+    def test_console_session_is_alive(self, mock_vm):
+        """Test is_alive returns True when the shell answers with a prompt"""
+        console_session = ConsoleSession(console=Console(vm=mock_vm))
+        console_session.console.child = MagicMock()
+        console_session.console.child.isalive.return_value = True
+
+        assert console_session.is_alive(prompt=r"\$ ")
+        console_session.child.sendline.assert_called_once_with("")
+        console_session.child.expect.assert_called_with(r"\$ ", timeout=5)
+
+    def test_console_session_is_alive_no_child(self, mock_vm):
+        """Test is_alive returns False before the session was connected"""
+        console_session = ConsoleSession(console=Console(vm=mock_vm))
+
+        assert not console_session.is_alive(prompt=r"\$ ")
+
+    def test_console_session_is_alive_eof(self, mock_vm):
+        """Test is_alive returns False when the console got EOF"""
+        console_session = ConsoleSession(console=Console(vm=mock_vm))
+        console_session.console.child = MagicMock()
+        console_session.console.child.isalive.return_value = True
+        console_session.console.child.expect.side_effect = pexpect.exceptions.EOF("eof")
+
+        assert not console_session.is_alive(prompt=r"\$ ")
+
+    def test_console_session_close_dead_child(self, mock_vm):
+        """Test close does not logout when the child is not alive"""
+        console_session = ConsoleSession(console=Console(vm=mock_vm))
+        console_session.console.child = MagicMock()
+        console_session.console.child.isalive.return_value = False
+
+        with patch.object(console_session.console, "disconnect") as mock_disconnect:
+            console_session.close()
+
+        mock_disconnect.assert_not_called()
+        console_session.child.close.assert_called_once()
+
+    def test_console_session_close_ignores_errors(self, mock_vm):
+        """Test close force closes the child when logout fails"""
+        console_session = ConsoleSession(console=Console(vm=mock_vm))
+        console_session.console.child = MagicMock()
+        console_session.console.child.isalive.return_value = True
+
+        with patch.object(console_session.console, "disconnect", side_effect=pexpect.exceptions.TIMEOUT("timeout")):
+            console_session.close()
+
+        console_session.child.close.assert_called_once_with(force=True)
+
+
+class TestConsoleSessionPool:
+    """Test cases for ConsoleSessionPool class"""
+
+    def test_session_connects_once_and_reuses(self, mock_vm):
+        """Test the first session call connects and the next one reuses the session"""
+        pool = ConsoleSessionPool()
+        mock_child = MagicMock()
+
+        with (
+            patch.object(ConsoleSession, "is_alive", side_effect=[False, True]),
+            patch.object(ConsoleSession, "close"),
+            patch.object(Console, "connect", side_effect=lambda: mock_child) as mock_connect,
+        ):
+            with pool.session(vm=mock_vm, prompt=r"\$ "):
+                pool._sessions[("test-namespace", "test-vm", None)].console.child = mock_child
+            with pool.session(vm=mock_vm, prompt=r"\$ ") as child:
+                assert child == mock_child
+
+        mock_connect.assert_called_once()
+        assert pool._sessions[("test-namespace", "test-vm", None)].reuse_count == 1
+
+    def test_session_reconnects_when_not_alive(self, mock_vm):
+        """Test a session that fails the health check is closed and reconnected"""
+        pool = ConsoleSessionPool()
+
+        with (
+            patch.object(ConsoleSession, "is_alive", return_value=False),
+            patch.object(ConsoleSession, "close") as mock_close,
+            patch.object(Console, "connect") as mock_connect,
+        ):
+            with pool.session(vm=mock_vm):
+                pass
+            with pool.session(vm=mock_vm):
+                pass
+
+        assert mock_connect.call_count == 2
+        assert mock_close.call_count == 2
+
+    @pytest.mark.parametrize(
+        "exception",
+        [
+            pytest.param(pexpect.exceptions.EOF("eof"), id="eof"),
+            pytest.param(pexpect.exceptions.TIMEOUT("timeout"), id="timeout"),
+            pytest.param(CommandExecFailed("output", err="rc==1=="), id="command_failed"),
+        ],
+    )
+    def test_session_closed_on_exception(self, mock_vm, exception):
+        """Test any exception inside the session context closes the session and is re-raised"""
+        pool = ConsoleSessionPool()
+
+        with (
+            patch.object(ConsoleSession, "is_alive", return_value=True),
+            patch.object(ConsoleSession, "close") as mock_close,
+        ):
+            with pytest.raises(type(exception)):
+                with pool.session(vm=mock_vm):
+                    raise exception
+
+        mock_close.assert_called_once()
+
+    def test_evict_idle(self, mock_vm):
+        """Test sessions unused for more than idle_timeout are closed and removed"""
+        pool = ConsoleSessionPool(idle_timeout=10)
+        console_session = ConsoleSession(console=Console(vm=mock_vm))
+        console_session.last_used -= 20
+        pool._sessions[("test-namespace", "test-vm", None)] = console_session
+
+        with patch.object(ConsoleSession, "close") as mock_close:
+            pool.evict_idle()
+
+        mock_close.assert_called_once()
+        assert not pool._sessions
+
+    def test_close_and_close_all(self, mock_vm):
+        """Test close removes a single VM session and close_all removes all sessions"""
+        pool = ConsoleSessionPool()
+        pool._sessions[("test-namespace", "test-vm", None)] = ConsoleSession(console=Console(vm=mock_vm))
+        pool._sessions[("test-namespace", "other-vm", None)] = ConsoleSession(console=Console(vm=mock_vm))
+
+        with patch.object(ConsoleSession, "close") as mock_close:
+            pool.close(vm=mock_vm)
+            assert list(pool._sessions) == [("test-namespace", "other-vm", None)]
+            pool.close_all()
+
+        assert mock_close.call_count == 2
+        assert not pool._sessions
@@ -0,0 +1,113 @@
+# Generated using Claude cli
+
+"""Unit tests for data_volume_import module"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from timeout_sampler import TimeoutExpiredError
+
+from data_volume_import import DataVolumeImportError, import_data_volumes
+
+
+def _mock_dv(name, storage_class="sc-1", namespace="golden-images"):
+    data_volume = MagicMock()
+    data_volume.name = name
+    data_volume.namespace = namespace
+    data_volume.storage_class = storage_class
+    return data_volume
+
+
+def _raw_dv(name, phase, progress="", namespace="golden-images"):
+    return {"metadata": {"name": name, "namespace": namespace}, "status": {"phase": phase, "progress": progress}}
+
+
+def _deployed_dvs_watch(data_volumes, phases):
+    """
+    Fake list_and_watch: every DV deployed so far goes through its phases, the first deployed DV first,
+    so a DV deployed on a success is only watched after it
+    """
+
+    def _list_and_watch(client, resource_kind, namespace, timeout):
+        watched = set()
+        while pending := [dv for dv in data_volumes if dv.deploy.called and dv.name not in watched]:
+            for data_volume in pending:
+                watched.add(data_volume.name)
+                for phase in phases[data_volume.name]:
+                    yield "MODIFIED", _raw_dv(name=data_volume.name, phase=phase)
+
+    return _list_and_watch
+
+
+class TestImportDataVolumes:
+    """Test cases for import_data_volumes function"""
+
+    def test_concurrency_limited_per_storage_class(self):
+        """Test at most imports_per_storage_class DVs of a storage class are imported at once"""
+        data_volumes = [_mock_dv(name=f"dv-{idx}") for idx in range(3)] + [
+            _mock_dv(name="dv-other", storage_class="sc-2")
+        ]
+        phases = {data_volume.name: ["ImportInProgress", "Succeeded"] for data_volume in data_volumes}
+        watch = _deployed_dvs_watch(data_volumes=data_volumes, phases=phases)
+        deployed_at_watch_start = []
+
+        def _list_and_watch(**kwargs):
+            deployed_at_watch_start.extend(dv.name for dv in data_volumes if dv.deploy.called)
+            return watch(**kwargs)
+
+        with patch("data_volume_import.list_and_watch", side_effect=_list_and_watch):
+            imported = [
+                data_volume.name
+                for data_volume in import_data_volumes(
+                    client=MagicMock(), data_volumes=data_volumes, imports_per_storage_class=2
+                )
+            ]
+
+        assert deployed_at_watch_start == ["dv-0", "dv-1", "dv-other"]
+        assert imported == ["dv-0", "dv-1", "dv-other", "dv-2"]
+
+    def test_yields_in_success_order_with_timings(self):
+        """Test each DV is yielded when it succeeds and its import is timed"""
+        data_volumes = [_mock_dv(name="dv-slow"), _mock_dv(name="dv-fast")]
+        events = [
+            ("ADDED", _raw_dv(name="dv-slow", phase="ImportInProgress", progress="10.00%")),
+            ("ADDED", _raw_dv(name="dv-fast", phase="Succeeded")),
+            ("MODIFIED", _raw_dv(name="unrelated", phase="Succeeded")),
+            ("MODIFIED", _raw_dv(name="dv-slow", phase="Succeeded")),
+        ]
+        timings = {}
+
+        with patch("data_volume_import.list_and_watch", return_value=iter(events)):
+            imported = [
+                data_volume.name
+                for data_volume in import_data_volumes(client=MagicMock(), data_volumes=data_volumes, timings=timings)
+            ]
+
+        assert imported == ["dv-fast", "dv-slow"]
+        assert all(timing.duration is not None for timing in timings.values())
+
+    def test_failed_import_raises(self):
+        """Test a failed DV is raised"""
+        with patch(
+            "data_volume_import.list_and_watch", return_value=iter([("MODIFIED", _raw_dv(name="dv-1", phase="Failed"))])
+        ):
+            with pytest.raises(DataVolumeImportError, match="dv-1 import failed"):
+                list(import_data_volumes(client=MagicMock(), data_volumes=[_mock_dv(name="dv-1")]))
+
+    def test_timeout_raises(self):
+        """Test DVs not succeeded when the watch ends are a timeout"""
+        with patch("data_volume_import.list_and_watch", return_value=iter([])):
+            with pytest.raises(TimeoutExpiredError, match="dv-1"):
+                list(import_data_volumes(client=MagicMock(), data_volumes=[_mock_dv(name="dv-1")], timeout=1))
+
+    def test_storage_class_limits(self):
+        """Test per storage class limits, with the default for other storage classes"""
+        data_volumes = [_mock_dv(name=f"dv-{idx}") for idx in range(2)]
+
+        with patch("data_volume_import.list_and_watch", return_value=iter([])):
+            with pytest.raises(TimeoutExpiredError, match="1 not started"):
+                list(
+                    import_data_volumes(
+                        client=MagicMock(), data_volumes=data_volumes, imports_per_storage_class={"sc-1": 1}
+                    )
+                )
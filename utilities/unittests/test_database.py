@@ -2,14 +2,19 @@
 
 """Unit tests for database module"""
 
+import sqlite3
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
 # Add utilities to Python path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from database import CNV_TEST_DB, Base, CnvTestTable, Database  # noqa: E402
+from database import CNV_TEST_DB, DATABASE_BUSY_TIMEOUT, Base, CnvTestTable, Database  # noqa: E402
 
 
 class TestCnvTestTable:
@@ -46,15 +51,19 @@ class TestDatabase:
         # Check attributes
         assert db.database_file_path == f"/tmp/data/{CNV_TEST_DB}"
         assert db.connection_string == f"sqlite:////tmp/data/{CNV_TEST_DB}"
-        assert db.verbose is True
+        assert db.verbose is False
         assert db.engine == mock_engine
 
         # Check engine creation
         mock_create_engine.assert_called_once_with(
             url=f"sqlite:////tmp/data/{CNV_TEST_DB}",
-            echo=True,
+            echo=False,
+            connect_args={"timeout": DATABASE_BUSY_TIMEOUT},
         )
         mock_create_all.assert_called_once_with(bind=mock_engine)
+        mock_engine.begin.return_value.__enter__.return_value.exec_driver_sql.assert_called_once_with(
+            "PRAGMA journal_mode=WAL"
+        )
 
     @patch("database.create_engine")
     @patch("database.get_data_collector_base")
@@ -77,59 +86,6 @@ class TestDatabase:
 
         mock_get_base.assert_called_once_with(base_dir="/custom/dir")
 
-    @patch("database.Session")
-    @patch("database.create_engine")
-    @patch("database.get_data_collector_base")
-    @patch("database.Base.metadata.create_all")
-    def test_insert_start_time_new_entry(self, mock_create_all, mock_get_base, mock_create_engine, mock_session_class):
-        """Test inserting start time when entry doesn't exist"""
-        mock_get_base.return_value = "/tmp/data/"
-        mock_engine = MagicMock()
-        mock_create_engine.return_value = mock_engine
-
-        # Mock session - no existing entry
-        mock_session = MagicMock()
-        mock_session.query.return_value.filter_by.return_value.first.return_value = None
-        mock_session_class.return_value.__enter__.return_value = mock_session
-
-        db = Database()
-        db.insert_start_time(name="test_example", start_time=1234567890)
-
-        # Check that add and commit were called
-        mock_session.add.assert_called_once()
-        mock_session.commit.assert_called_once()
-
-        # Check the object that was added
-        added_obj = mock_session.add.call_args[0][0]
-        assert isinstance(added_obj, CnvTestTable)
-        assert added_obj.test_name == "test_example"
-        assert added_obj.start_time == 1234567890
-
-    @patch("database.Session")
-    @patch("database.create_engine")
-    @patch("database.get_data_collector_base")
-    @patch("database.Base.metadata.create_all")
-    def test_insert_start_time_already_exists(
-        self, mock_create_all, mock_get_base, mock_create_engine, mock_session_class
-    ):
-        """Test inserting start time when entry already exists (should not insert again)"""
-        mock_get_base.return_value = "/tmp/data/"
-        mock_engine = MagicMock()
-        mock_create_engine.return_value = mock_engine
-
-        # Mock session - existing entry
-        existing_entry = MagicMock()
-        mock_session = MagicMock()
-        mock_session.query.return_value.filter_by.return_value.first.return_value = existing_entry
-        mock_session_class.return_value.__enter__.return_value = mock_session
-
-        db = Database()
-        db.insert_start_time(name="test_example", start_time=1234567890)
-
-        # Check that add and commit were NOT called (entry already exists)
-        mock_session.add.assert_not_called()
-        mock_session.commit.assert_not_called()
-
     @patch("database.Session")
     @patch("database.create_engine")
     @patch("database.get_data_collector_base")
@@ -448,3 +404,94 @@ class TestDatabase:
         mock_logger.warning.assert_called_once()
         assert "Error:" in mock_logger.warning.call_args[0][0]
         assert "Database connection error" in mock_logger.warning.call_args[0][0]
+
+
+class TestDatabaseStartTimes:
+    """Test cases for Database start times writes, on a real database"""
+
+    @pytest.fixture()
+    def base_dir(self, tmp_path):
+        with patch("database.get_data_collector_base", return_value=f"{tmp_path}/"):
+            yield tmp_path
+
+    def _rows(self, db):
+        with Session(bind=db.engine) as db_session:
+            return {row.test_name: row.start_time for row in db_session.query(CnvTestTable)}
+
+    def test_writes_batched(self, base_dir):
+        """Test start times are written once a batch is full, and only the first start time of a name is kept"""
+        db = Database(write_batch_size=3, write_interval=3600)
+        db.insert_start_time(name="test_1", start_time=100)
+        db.insert_start_time(name="test_1", start_time=200)
+        db.insert_start_time(name="test_2", start_time=300)
+
+        assert self._rows(db=db) == {}
+
+        db.insert_start_time(name="test_3", start_time=400)
+
+        assert self._rows(db=db) == {"test_1": 100, "test_2": 300, "test_3": 400}
+        db.close()
+
+    def test_write_interval(self, base_dir):
+        """Test a start time is written when the last write is older than the write interval"""
+        db = Database(write_interval=0)
+        db.insert_start_time(name="test_1", start_time=100)
+
+        assert self._rows(db=db) == {"test_1": 100}
+        db.close()
+
+    def test_shared_between_processes(self, base_dir):
+        """Test the first start time written by any process wins, and is read after the pending writes"""
+        first_worker = Database(write_interval=3600)
+        second_worker = Database(write_interval=3600)
+        first_worker.insert_start_time(name="test_module.py", start_time=100)
+        first_worker.flush()
+        second_worker.insert_start_time(name="test_module.py", start_time=200)
+        second_worker.insert_start_time(name="test_other.py", start_time=300)
+
+        assert second_worker.get_start_time(name="test_module.py") == 100
+        assert first_worker.get_start_time(name="test_other.py") == 300
+        first_worker.close()
+        second_worker.close()
+
+    def test_wal_mode_and_remove(self, base_dir):
+        """Test the database is in WAL mode and all its files are removed"""
+        db = Database()
+        db.insert_start_time(name="test_1", start_time=100)
+        with db.engine.connect() as connection:
+            assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+
+        db.remove()
+
+        assert list(base_dir.iterdir()) == []
+
+    def test_recreate_outdated_database(self, base_dir):
+        """Test a database of a previous run, without unique test names, is replaced when recreated"""
+        with sqlite3.connect(base_dir / CNV_TEST_DB) as connection:
+            connection.execute(
+                'CREATE TABLE "CnvTestTable" (id INTEGER PRIMARY KEY, test_name VARCHAR(500), start_time INTEGER)'
+            )
+            connection.execute('INSERT INTO "CnvTestTable" (test_name, start_time) VALUES ("test_1", 1)')
+        connection.close()
+
+        db = Database(write_interval=0, recreate=True)
+        db.insert_start_time(name="test_1", start_time=100)
+
+        assert self._rows(db=db) == {"test_1": 100}
+        db.close()
+
+    def test_failed_write_dropped(self, base_dir):
+        """Test start times which failed to be written are logged, dropped from the batch and kept in memory"""
+        db = Database(write_interval=3600)
+        db.insert_start_time(name="test_1", start_time=100)
+        with (
+            patch.object(db.engine, "connect", side_effect=OperationalError("INSERT", {}, Exception("locked"))),
+            patch("database.LOGGER") as mock_logger,
+        ):
+            db.flush()
+
+        assert "Failed to write 1 start times" in mock_logger.error.call_args[0][0]
+        assert db._pending == {}
+        assert db.get_start_time(name="test_1") == 100
+        assert self._rows(db=db) == {}
+        db.close()
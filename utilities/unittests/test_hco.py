@@ -405,12 +405,17 @@ class TestAddLabelsToNodes:
 class TestWaitForDs:
     """Test cases for wait_for_ds function"""
 
-    @patch("utilities.hco.TimeoutSampler")
-    def test_wait_for_ds_success(self, mock_sampler):
+    @patch("utilities.hco.WATCH_HUB")
+    def test_wait_for_ds_success(self, mock_watch_hub):
         """Test wait_for_ds succeeds when daemonset is up to date"""
         mock_ds = MagicMock()
         mock_ds.name = "test-daemonset"
-        mock_ds.instance.to_dict.return_value = {
+
+        wait_for_ds(mock_ds)
+
+        mock_watch_hub.wait_for_resource.assert_called_once()
+        predicate = mock_watch_hub.wait_for_resource.call_args.kwargs["predicate"]
+        assert predicate({
             "metadata": {"generation": 5},
             "status": {
                 "observedGeneration": 5,
@@ -418,25 +423,23 @@ class TestWaitForDs:
                 "currentNumberScheduled": 3,
                 "updatedNumberScheduled": 3,
             },
-        }
-
-        mock_sampler_instance = MagicMock()
-        mock_sampler_instance.__iter__ = MagicMock(return_value=iter([mock_ds.instance.to_dict()]))
-        mock_sampler.return_value = mock_sampler_instance
-
-        wait_for_ds(mock_ds)
-
-        mock_sampler.assert_called_once()
+        })
+        assert not predicate({
+            "metadata": {"generation": 5},
+            "status": {
+                "observedGeneration": 5,
+                "desiredNumberScheduled": 3,
+                "currentNumberScheduled": 3,
+                "updatedNumberScheduled": 2,
+            },
+        })
 
-    @patch("utilities.hco.TimeoutSampler")
-    def test_wait_for_ds_timeout(self, mock_sampler):
+    @patch("utilities.hco.WATCH_HUB")
+    def test_wait_for_ds_timeout(self, mock_watch_hub):
         """Test wait_for_ds raises timeout when daemonset is not up to date"""
         mock_ds = MagicMock()
         mock_ds.name = "test-daemonset"
-
-        mock_sampler_instance = MagicMock()
-        mock_sampler_instance.__iter__ = MagicMock(side_effect=TimeoutExpiredError("Timeout", "test_value"))
-        mock_sampler.return_value = mock_sampler_instance
+        mock_watch_hub.wait_for_resource.side_effect = TimeoutExpiredError("Timeout", "test_value")
 
         with pytest.raises(TimeoutExpiredError):
             wait_for_ds(mock_ds)
@@ -445,33 +448,31 @@ class TestWaitForDs:
 class TestWaitForDp:
     """Test cases for wait_for_dp function"""
 
-    @patch("utilities.hco.TimeoutSampler")
-    def test_wait_for_dp_success(self, mock_sampler):
+    @patch("utilities.hco.WATCH_HUB")
+    def test_wait_for_dp_success(self, mock_watch_hub):
         """Test wait_for_dp succeeds when deployment is up to date"""
         mock_dp = MagicMock()
         mock_dp.name = "test-deployment"
-        mock_dp.instance.to_dict.return_value = {
-            "metadata": {"generation": 3},
-            "status": {"observedGeneration": 3, "replicas": 2, "updatedReplicas": 2},
-        }
-
-        mock_sampler_instance = MagicMock()
-        mock_sampler_instance.__iter__ = MagicMock(return_value=iter([mock_dp.instance.to_dict()]))
-        mock_sampler.return_value = mock_sampler_instance
 
         wait_for_dp(mock_dp)
 
-        mock_sampler.assert_called_once()
+        mock_watch_hub.wait_for_resource.assert_called_once()
+        predicate = mock_watch_hub.wait_for_resource.call_args.kwargs["predicate"]
+        assert predicate({
+            "metadata": {"generation": 3},
+            "status": {"observedGeneration": 3, "replicas": 2, "updatedReplicas": 2},
+        })
+        assert not predicate({
+            "metadata": {"generation": 4},
+            "status": {"observedGeneration": 3, "replicas": 2, "updatedReplicas": 2},
+        })
 
-    @patch("utilities.hco.TimeoutSampler")
-    def test_wait_for_dp_timeout(self, mock_sampler):
+    @patch("utilities.hco.WATCH_HUB")
+    def test_wait_for_dp_timeout(self, mock_watch_hub):
         """Test wait_for_dp raises timeout when deployment is not up to date"""
         mock_dp = MagicMock()
         mock_dp.name = "test-deployment"
-
-        mock_sampler_instance = MagicMock()
-        mock_sampler_instance.__iter__ = MagicMock(side_effect=TimeoutExpiredError("Timeout", "test_value"))
-        mock_sampler.return_value = mock_sampler_instance
+        mock_watch_hub.wait_for_resource.side_effect = TimeoutExpiredError("Timeout", "test_value")
 
         with pytest.raises(TimeoutExpiredError):
             wait_for_dp(mock_dp)
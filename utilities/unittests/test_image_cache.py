@@ -0,0 +1,177 @@
+# Generated using Claude cli
+
+"""Unit tests for image_cache module"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from image_cache import ImageInfoCache, file_sha256, is_digest_reference
+
+TAG_IMAGE = "quay.io/org/image:latest"
+DIGEST_IMAGE = "quay.io/org/image@sha256:0123456789abcdef"
+ARCHITECTURE = "linux/amd64"
+
+
+@pytest.fixture()
+def pull_secret(tmp_path):
+    secret_file = tmp_path / "pull-secret.json"
+    secret_file.write_text('{"auths": {}}')
+    return str(secret_file)
+
+
+class TestFileSha256:
+    """Test cases for file_sha256 function"""
+
+    def test_no_path(self):
+        """Test an empty digest is returned when there is no file"""
+        assert file_sha256(path=None) == ""
+
+    def test_same_content_same_digest(self, tmp_path):
+        """Test the digest depends on the content only, not on the path"""
+        first_file = tmp_path / "first"
+        second_file = tmp_path / "second"
+        first_file.write_text("secret")
+        second_file.write_text("secret")
+
+        assert file_sha256(path=str(first_file)) == file_sha256(path=str(second_file))
+
+
+class TestIsDigestReference:
+    """Test cases for is_digest_reference function"""
+
+    def test_digest_reference(self):
+        """Test image pinned to a digest"""
+        assert is_digest_reference(image=DIGEST_IMAGE)
+
+    def test_tag_reference(self):
+        """Test image referenced by tag"""
+        assert not is_digest_reference(image=TAG_IMAGE)
+
+
+class TestImageInfoCache:
+    """Test cases for ImageInfoCache class"""
+
+    def test_get_cached_in_memory(self):
+        """Test the registry is queried once for the same image"""
+        image_cache = ImageInfoCache()
+        fetch = MagicMock(return_value={"digest": "sha256:1"})
+
+        assert image_cache.get(image=TAG_IMAGE, architecture=ARCHITECTURE, fetch=fetch) == {"digest": "sha256:1"}
+        assert image_cache.get(image=TAG_IMAGE, architecture=ARCHITECTURE, fetch=fetch) == {"digest": "sha256:1"}
+
+        fetch.assert_called_once()
+        assert image_cache.stats.hits == 1
+        assert image_cache.stats.lookups == 1
+
+    def test_key_uses_pull_secret_content(self, tmp_path, pull_secret):
+        """Test a new pull secret file with the same content reuses the cached entry"""
+        other_pull_secret = tmp_path / "other-pull-secret.json"
+        other_pull_secret.write_text('{"auths": {}}')
+
+        assert ImageInfoCache.cache_key(
+            image=TAG_IMAGE, architecture=ARCHITECTURE, pull_secret=pull_secret
+        ) == ImageInfoCache.cache_key(image=TAG_IMAGE, architecture=ARCHITECTURE, pull_secret=str(other_pull_secret))
+        assert ImageInfoCache.cache_key(
+            image=TAG_IMAGE, architecture=ARCHITECTURE, pull_secret=pull_secret
+        ) != ImageInfoCache.cache_key(image=TAG_IMAGE, architecture="linux/arm64", pull_secret=pull_secret)
+
+    def test_tag_reference_expires(self):
+        """Test entries of tag references are looked up again after the TTL"""
+        image_cache = ImageInfoCache(ttl=10)
+        fetch = MagicMock(return_value={"digest": "sha256:1"})
+
+        with patch("image_cache.time.time", side_effect=[100, 105, 120, 120]):
+            for _ in range(3):
+                image_cache.get(image=TAG_IMAGE, architecture=ARCHITECTURE, fetch=fetch)
+
+        assert fetch.call_count == 2
+
+    def test_digest_reference_never_expires(self):
+        """Test entries of digest references are never looked up again"""
+        image_cache = ImageInfoCache(ttl=10)
+        fetch = MagicMock(return_value={"digest": "sha256:1"})
+
+        with patch("image_cache.time.time", side_effect=[100, 100000]):
+            image_cache.get(image=DIGEST_IMAGE, architecture=ARCHITECTURE, fetch=fetch)
+            image_cache.get(image=DIGEST_IMAGE, architecture=ARCHITECTURE, fetch=fetch)
+
+        fetch.assert_called_once()
+
+    def test_empty_result_not_cached(self):
+        """Test failed lookups are retried on the next call"""
+        image_cache = ImageInfoCache()
+        fetch = MagicMock(side_effect=[None, {"digest": "sha256:1"}])
+
+        assert image_cache.get(image=TAG_IMAGE, architecture=ARCHITECTURE, fetch=fetch) is None
+        assert image_cache.get(image=TAG_IMAGE, architecture=ARCHITECTURE, fetch=fetch) == {"digest": "sha256:1"}
+        assert fetch.call_count == 2
+
+    def test_disk_cache_shared_between_instances(self, tmp_path, pull_secret):
+        """Test an entry written by one cache is read by another one using the same directory"""
+        cache_dir = str(tmp_path / "cache")
+        ImageInfoCache(cache_dir=cache_dir).get(
+            image=TAG_IMAGE, architecture=ARCHITECTURE, fetch=lambda: {"digest": "sha256:1"}, pull_secret=pull_secret
+        )
+        other_cache = ImageInfoCache(cache_dir=cache_dir)
+        fetch = MagicMock()
+
+        assert other_cache.get(image=TAG_IMAGE, architecture=ARCHITECTURE, fetch=fetch, pull_secret=pull_secret) == {
+            "digest": "sha256:1"
+        }
+        fetch.assert_not_called()
+        assert other_cache.stats.disk_hits == 1
+
+    def test_unreadable_disk_entry_ignored(self, tmp_path):
+        """Test a corrupted on-disk entry is looked up again"""
+        image_cache = ImageInfoCache(cache_dir=str(tmp_path))
+        key = ImageInfoCache.cache_key(image=TAG_IMAGE, architecture=ARCHITECTURE)
+        (tmp_path / f"{key}.json").write_text("{not json")
+
+        assert image_cache.get(image=TAG_IMAGE, architecture=ARCHITECTURE, fetch=lambda: {"digest": "sha256:1"}) == {
+            "digest": "sha256:1"
+        }
+        assert image_cache.stats.lookups == 1
+
+    def test_concurrent_get_single_lookup(self):
+        """Test concurrent lookups of the same image wait for a single registry lookup"""
+        image_cache = ImageInfoCache()
+        release = threading.Event()
+        fetch = MagicMock(side_effect=lambda: release.wait() and {"digest": "sha256:1"})
+        threads = [
+            threading.Thread(
+                target=image_cache.get, kwargs={"image": TAG_IMAGE, "architecture": ARCHITECTURE, "fetch": fetch}
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        fetch.assert_called_once()
+        assert image_cache.stats.hits == 4
+
+    def test_get_many(self):
+        """Test duplicated images are looked up once and all images are returned"""
+        image_cache = ImageInfoCache()
+        fetch = MagicMock(side_effect=lambda image: {"name": image})
+
+        images_info = image_cache.get_many(
+            images=[TAG_IMAGE, DIGEST_IMAGE, TAG_IMAGE], architecture=ARCHITECTURE, fetch=fetch
+        )
+
+        assert images_info == {TAG_IMAGE: {"name": TAG_IMAGE}, DIGEST_IMAGE: {"name": DIGEST_IMAGE}}
+        assert fetch.call_count == 2
+
+    def test_get_many_raises_failed_lookup(self):
+        """Test a failing lookup is raised"""
+        image_cache = ImageInfoCache()
+
+        def _fetch(image):
+            raise ValueError(f"cannot inspect {image}")
+
+        with pytest.raises(ValueError, match="cannot inspect"):
+            image_cache.get_many(images=[TAG_IMAGE], architecture=ARCHITECTURE, fetch=_fetch)
@@ -0,0 +1,133 @@
+# Generated using Claude cli
+
+"""Unit tests for must_gather_collector module"""
+
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from must_gather_collector import MUST_GATHER_LINK, MUST_GATHER_SINCE_BUFFER, MustGatherCollector
+
+
+@pytest.fixture()
+def mock_must_gather():
+    with (
+        patch("must_gather_collector.collect_default_cnv_must_gather_with_vm_gather") as mock_collect,
+        patch("must_gather_collector.run_command") as mock_run_command,
+        patch("must_gather_collector.cache_admin_client"),
+    ):
+        yield mock_collect, mock_run_command
+
+
+class TestMustGatherCollector:
+    """Test cases for MustGatherCollector class"""
+
+    def test_failures_in_window_share_collection(self, mock_must_gather, tmp_path):
+        """Test failures added before the collection started share one must-gather covering the earliest start"""
+        mock_collect, _ = mock_must_gather
+        collector = MustGatherCollector(output_dir=str(tmp_path / "must-gather"), coalesce_window=60)
+        now = int(time.time())
+
+        first_dir = collector.add_failure(
+            test_name="test_a",
+            test_start_time=now - 100,
+            failure_dir=str(tmp_path / "test_a" / "pytest_exception_interact"),
+            inspect_resources=["namespace/ns-a", "namespace/openshift-cnv"],
+        )
+        second_dir = collector.add_failure(
+            test_name="test_b",
+            test_start_time=now - 10,
+            failure_dir=str(tmp_path / "test_b" / "pytest_exception_interact"),
+            inspect_resources=["namespace/openshift-cnv", "namespace/ns-b"],
+        )
+        collector.close()
+
+        assert first_dir == second_dir
+        mock_collect.assert_called_once()
+        assert mock_collect.call_args.kwargs["since_time"] >= 100 + MUST_GATHER_SINCE_BUFFER
+        for test_name in ("test_a", "test_b"):
+            link = tmp_path / test_name / "pytest_exception_interact" / MUST_GATHER_LINK
+            assert os.path.realpath(link) == os.path.realpath(first_dir)
+
+    def test_inspect_runs_before_must_gather(self, mock_must_gather, tmp_path):
+        """Test the failure namespaces are inspected at once, while the must-gather waits for more failures"""
+        mock_collect, mock_run_command = mock_must_gather
+        collector = MustGatherCollector(output_dir=str(tmp_path / "must-gather"), coalesce_window=3600)
+        failure_dir = tmp_path / "test_a" / "pytest_exception_interact"
+
+        collector.add_failure(
+            test_name="test_a",
+            test_start_time=int(time.time()) - 100,
+            failure_dir=str(failure_dir),
+            inspect_resources=["namespace/ns-a", "namespace/openshift-cnv"],
+        )
+
+        mock_collect.assert_not_called()
+        inspect_command = mock_run_command.call_args.kwargs["command"]
+        assert inspect_command[3:5] == ["namespace/ns-a", "namespace/openshift-cnv"]
+        assert f"--dest-dir={failure_dir / 'inspect_collection'}" in inspect_command
+        assert int(inspect_command[5].removeprefix("--since=").removesuffix("s")) >= 100 + MUST_GATHER_SINCE_BUFFER
+        collector.close()
+
+    def test_failure_after_start_opens_new_collection(self, mock_must_gather, tmp_path):
+        """Test a failure added once the collection started gets a new collection"""
+        mock_collect, _ = mock_must_gather
+        collecting = threading.Event()
+        release = threading.Event()
+
+        def _collect(**kwargs):
+            collecting.set()
+            release.wait(timeout=5)
+
+        mock_collect.side_effect = _collect
+        collector = MustGatherCollector(output_dir=str(tmp_path), coalesce_window=0)
+        first_dir = collector.add_failure(test_name="test_a", test_start_time=0, failure_dir=str(tmp_path / "a"))
+        assert collecting.wait(timeout=5)
+
+        second_dir = collector.add_failure(test_name="test_b", test_start_time=0, failure_dir=str(tmp_path / "b"))
+        release.set()
+        collector.close()
+
+        assert first_dir != second_dir
+        assert mock_collect.call_count == 2
+        assert [collection.test_names for collection in collector.collections] == [["test_a"], ["test_b"]]
+
+    def test_close_starts_waiting_collection(self, mock_must_gather, tmp_path):
+        """Test closing does not wait for the end of the coalesce window"""
+        mock_collect, mock_run_command = mock_must_gather
+        collector = MustGatherCollector(output_dir=str(tmp_path), coalesce_window=3600)
+        collector.add_failure(test_name="test_a", test_start_time=0, failure_dir=str(tmp_path / "a"))
+
+        start_time = time.monotonic()
+        collector.close()
+
+        assert time.monotonic() - start_time < 5
+        mock_collect.assert_called_once()
+        mock_run_command.assert_not_called()
+
+    def test_existing_link_kept(self, mock_must_gather, tmp_path):
+        """Test a second failure of a test keeps the link to its first collection"""
+        failure_dir = str(tmp_path / "pytest_exception_interact")
+        collector = MustGatherCollector(output_dir=str(tmp_path / "must-gather"), coalesce_window=0)
+
+        first_dir = collector.add_failure(test_name="test_a", test_start_time=0, failure_dir=failure_dir)
+        collector.close()
+        collector = MustGatherCollector(output_dir=str(tmp_path / "must-gather-teardown"), coalesce_window=0)
+        collector.add_failure(test_name="test_a", test_start_time=0, failure_dir=failure_dir)
+        collector.close()
+
+        assert os.path.realpath(os.path.join(failure_dir, MUST_GATHER_LINK)) == os.path.realpath(first_dir)
+
+    def test_collection_failure_logged(self, mock_must_gather, tmp_path):
+        """Test a failed must-gather does not fail closing"""
+        mock_collect, _ = mock_must_gather
+        mock_collect.side_effect = RuntimeError("must-gather failed")
+        collector = MustGatherCollector(output_dir=str(tmp_path), coalesce_window=0)
+
+        collector.add_failure(test_name="test_a", test_start_time=0, failure_dir=str(tmp_path / "a"))
+        collector.close()
+
+        mock_collect.assert_called_once()
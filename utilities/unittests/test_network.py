@@ -0,0 +1,212 @@
+# Generated using Claude cli
+
+"""Unit tests for network module"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from ocp_resources.node_network_configuration_policy import NNCPConfigurationFailed
+
+from network import (
+    BridgeNodeNetworkConfigurationPolicy,
+    MacPool,
+    MacPoolExhaustedError,
+    nncp_enactments,
+    wait_for_nncp_status_success,
+)
+
+KMP_RANGE = {"RANGE_START": "02:00:00:00:00:00", "RANGE_END": "02:00:00:00:00:07"}
+
+
+def _mock_vm(macs):
+    vm = MagicMock()
+    vm.get_interfaces.return_value = [{"macAddress": mac} for mac in macs]
+    return vm
+
+
+class TestMacPool:
+    """Test cases for MacPool class"""
+
+    def test_allocated_macs_unique_and_within_range(self):
+        """Test the whole range can be allocated without duplicates"""
+        mac_pool = MacPool(kmp_range=KMP_RANGE)
+
+        macs = mac_pool.get_macs_from_pool(count=8)
+
+        assert len(set(macs)) == 8
+        assert all(mac_pool.mac_is_within_range(mac=mac) for mac in macs)
+        assert mac_pool.utilization == 1.0
+
+    def test_exhausted_pool_raises(self):
+        """Test allocating more MACs than available raises and allocates nothing"""
+        mac_pool = MacPool(kmp_range=KMP_RANGE)
+        mac_pool.get_macs_from_pool(count=6)
+
+        with pytest.raises(MacPoolExhaustedError, match="3 MACs requested, 2 available"):
+            mac_pool.get_macs_from_pool(count=3)
+
+        assert mac_pool.available == 2
+
+    def test_vm_macs_skipped_and_released(self):
+        """Test MACs used by a VM are not allocated until the VM MACs are removed"""
+        mac_pool = MacPool(kmp_range=KMP_RANGE)
+        vm = _mock_vm(macs=[f"02:00:00:00:00:0{idx}" for idx in range(7)] + ["02:01:00:00:00:00"])
+        mac_pool.append_macs(vm=vm)
+
+        assert mac_pool.available == 1
+        assert mac_pool.get_mac_from_pool() == "02:00:00:00:00:07"
+
+        mac_pool.remove_macs(vm=vm)
+
+        assert mac_pool.available == 7
+
+    def test_released_macs_reused_after_wrap_around(self):
+        """Test released MACs are allocated again once the cursor wrapped around"""
+        mac_pool = MacPool(kmp_range=KMP_RANGE)
+        macs = mac_pool.get_macs_from_pool(count=8)
+        mac_pool.release_macs(macs=macs[:2])
+
+        assert sorted(mac_pool.get_macs_from_pool(count=2)) == sorted(macs[:2])
+
+    def test_concurrent_allocation(self):
+        """Test concurrent allocations never return the same MAC"""
+        mac_pool = MacPool(kmp_range={"RANGE_START": "02:00:00:00:00:00", "RANGE_END": "02:00:00:00:ff:ff"})
+        macs = []
+
+        def _allocate():
+            for _ in range(100):
+                macs.extend(mac_pool.get_macs_from_pool(count=4))
+
+        threads = [threading.Thread(target=_allocate) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(macs)) == len(macs) == 3200
+
+
+def _raw_nnce(node, status, message=""):
+    return {
+        "metadata": {
+            "name": f"{node}.test-nncp",
+            "labels": {"nmstate.io/node": node, "nmstate.io/policy": "test-nncp"},
+        },
+        "status": {"conditions": [{"type": status, "status": "True", "message": message}]},
+    }
+
+
+def _raw_nncp(conditions):
+    return {"metadata": {"name": "test-nncp"}, "status": {"conditions": conditions}}
+
+
+def _mock_nncp():
+    nncp = MagicMock()
+    nncp.name = "test-nncp"
+    nncp.kind = "NodeNetworkConfigurationPolicy"
+    return nncp
+
+
+def _watch_events(raw_objects):
+    """WATCH_HUB.wait_for_resource returning the first raw object the predicate is true for"""
+
+    def _wait_for_resource(resource, predicate, timeout):
+        return next(raw_object for raw_object in raw_objects if predicate(raw_object))
+
+    return _wait_for_resource
+
+
+AVAILABLE = {"type": "Available", "status": "True", "lastTransitionTime": "2025-01-01T00:01:00Z"}
+PROGRESSING = {"type": "Available", "status": "Unknown", "reason": "ConfigurationProgressing"}
+
+
+class TestNncpEnactments:
+    """Test cases for nncp_enactments function"""
+
+    @patch("network.RESOURCE_CACHE")
+    def test_status_per_node(self, mock_cache):
+        """Test each node gets its true enactment condition"""
+        mock_cache.list_raw.return_value = [
+            _raw_nnce(node="node-1", status="Available"),
+            _raw_nnce(node="node-2", status="Failing", message="bad bridge"),
+        ]
+
+        assert nncp_enactments(client=MagicMock(), policy_name="test-nncp") == {
+            "node-1": ("Available", ""),
+            "node-2": ("Failing", "bad bridge"),
+        }
+        assert mock_cache.list_raw.call_args.kwargs["label_selector"] == "nmstate.io/policy=test-nncp"
+
+
+@patch("network.RESOURCE_CACHE")
+class TestWaitForNncpStatusSuccess:
+    """Test cases for wait_for_nncp_status_success function"""
+
+    def test_returns_when_available(self, mock_cache):
+        """Test the wait ends on the first Available update"""
+        mock_cache.list_raw.return_value = [_raw_nnce(node="node-1", status="Progressing")]
+
+        with patch(
+            "network.WATCH_HUB.wait_for_resource",
+            side_effect=_watch_events(
+                raw_objects=[_raw_nncp(conditions=[PROGRESSING]), _raw_nncp(conditions=[AVAILABLE])]
+            ),
+        ):
+            assert wait_for_nncp_status_success(nncp=_mock_nncp(), timeout=10) == AVAILABLE
+
+    def test_previous_success_ignored(self, mock_cache):
+        """Test an Available condition older than the update is not a success"""
+        mock_cache.list_raw.return_value = []
+        new_available = {**AVAILABLE, "lastTransitionTime": "2025-01-01T00:02:00Z"}
+
+        with patch(
+            "network.WATCH_HUB.wait_for_resource",
+            side_effect=_watch_events(
+                raw_objects=[_raw_nncp(conditions=[AVAILABLE]), _raw_nncp(conditions=[new_available])]
+            ),
+        ):
+            assert (
+                wait_for_nncp_status_success(
+                    nncp=_mock_nncp(), timeout=10, last_success_timestamp=AVAILABLE["lastTransitionTime"]
+                )
+                == new_available
+            )
+
+    def test_degraded_raises_with_failed_enactments(self, mock_cache):
+        """Test a degraded policy raises with the failing nodes messages"""
+        mock_cache.list_raw.return_value = [
+            _raw_nnce(node="node-1", status="Available"),
+            _raw_nnce(node="node-2", status="Failing", message="bad bridge"),
+        ]
+        degraded = {"type": "Degraded", "status": "True", "reason": "FailedToConfigure"}
+
+        with patch(
+            "network.WATCH_HUB.wait_for_resource",
+            side_effect=_watch_events(raw_objects=[_raw_nncp(conditions=[degraded])]),
+        ):
+            with pytest.raises(NNCPConfigurationFailed, match="node-2.*bad bridge"):
+                wait_for_nncp_status_success(nncp=_mock_nncp(), timeout=10)
+
+
+class TestDoesPortMatchType:
+    """Test cases for BridgeNodeNetworkConfigurationPolicy._does_port_match_type"""
+
+    def test_waits_for_port_in_node_state(self):
+        """Test the port type is checked once the port shows up in the node network state"""
+        nns_without_port = {"status": {"currentState": {"interfaces": [{"name": "eth0", "type": "ethernet"}]}}}
+        nns_with_port = {
+            "status": {
+                "currentState": {
+                    "interfaces": [{"name": "eth0", "type": "ethernet"}, {"name": "bond1", "type": "bond"}]
+                }
+            }
+        }
+
+        with patch(
+            "network.WATCH_HUB.wait_for_resource",
+            side_effect=_watch_events(raw_objects=[nns_without_port, nns_with_port]),
+        ):
+            assert BridgeNodeNetworkConfigurationPolicy._does_port_match_type(
+                nns=MagicMock(), port_name="bond1", port_type="bond"
+            )
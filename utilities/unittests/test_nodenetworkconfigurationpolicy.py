@@ -0,0 +1,159 @@
+# Generated using Claude cli
+
+"""Unit tests for the NncpRegistry of tests/network/libs/nodenetworkconfigurationpolicy"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tests.network.libs.nodenetworkconfigurationpolicy import (
+    OVN,
+    Bridge,
+    BridgeMappings,
+    DesiredState,
+    Interface,
+    NncpRegistry,
+    Port,
+    desired_state_key,
+)
+
+NODE_SELECTOR = {"node-role.kubernetes.io/worker": ""}
+
+
+def _bridge_state(bridge_name, port_name):
+    return DesiredState(
+        interfaces=[
+            Interface(name=bridge_name, type="linux-bridge", state="up", bridge=Bridge(port=[Port(name=port_name)]))
+        ]
+    )
+
+
+def _localnet_state(*localnets):
+    return DesiredState(
+        ovn=OVN(
+            bridge_mappings=[
+                BridgeMappings(localnet=localnet, bridge="br-ex", state="present") for localnet in localnets
+            ]
+        )
+    )
+
+
+@pytest.fixture()
+def mock_nncp_class():
+    def _nncp(client, name, desired_state, node_selector):
+        nncp = MagicMock()
+        nncp.name = name
+        nncp.desired_state_spec = desired_state
+        return nncp
+
+    with patch(
+        "tests.network.libs.nodenetworkconfigurationpolicy.NodeNetworkConfigurationPolicy", side_effect=_nncp
+    ) as mock_class:
+        yield mock_class
+
+
+@pytest.fixture()
+def registry():
+    return NncpRegistry(client=MagicMock())
+
+
+class TestDesiredStateKey:
+    """Test cases for desired_state_key function"""
+
+    def test_order_does_not_matter(self):
+        """Test the same interfaces and bridge mappings in another order share the key"""
+        first_state = DesiredState(
+            interfaces=[
+                Interface(name="br1", type="linux-bridge", state="up"),
+                Interface(name="br2", type="linux-bridge", state="up"),
+            ],
+            ovn=_localnet_state("localnet-1", "localnet-2").ovn,
+        )
+        second_state = DesiredState(
+            interfaces=[
+                Interface(name="br2", type="linux-bridge", state="up"),
+                Interface(name="br1", type="linux-bridge", state="up"),
+            ],
+            ovn=_localnet_state("localnet-2", "localnet-1").ovn,
+        )
+
+        assert desired_state_key(desired_state=first_state, node_selector=NODE_SELECTOR) == desired_state_key(
+            desired_state=second_state, node_selector=NODE_SELECTOR
+        )
+
+    @pytest.mark.parametrize(
+        "other_state, other_node_selector",
+        [
+            pytest.param(_bridge_state(bridge_name="br1", port_name="ens5"), NODE_SELECTOR, id="other_port"),
+            pytest.param(_bridge_state(bridge_name="br1", port_name="ens4"), None, id="other_nodes"),
+        ],
+    )
+    def test_different_configuration(self, other_state, other_node_selector):
+        """Test a different desired state or node selector has another key"""
+        assert desired_state_key(
+            desired_state=_bridge_state(bridge_name="br1", port_name="ens4"), node_selector=NODE_SELECTOR
+        ) != desired_state_key(desired_state=other_state, node_selector=other_node_selector)
+
+
+class TestNncpRegistry:
+    """Test cases for NncpRegistry class"""
+
+    def test_equivalent_policy_shared(self, registry, mock_nncp_class):
+        """Test an equivalent request reuses the applied policy, removed by its last user"""
+        first_nncp = registry.acquire(name="first", desired_state=_localnet_state("localnet-1", "localnet-2"))
+        second_nncp = registry.acquire(name="second", desired_state=_localnet_state("localnet-2", "localnet-1"))
+
+        assert second_nncp is first_nncp
+        mock_nncp_class.assert_called_once()
+        first_nncp.deploy.assert_called_once()
+        first_nncp.wait_for_status_success.assert_called_once()
+
+        registry.release(nncp=first_nncp)
+        first_nncp.clean_up.assert_not_called()
+        registry.release(nncp=second_nncp)
+        first_nncp.clean_up.assert_called_once()
+
+    def test_lingering_policy_kept_until_clean_up(self, registry, mock_nncp_class):
+        """Test a lingering policy stays applied without users, for reuse, until the registry is cleaned up"""
+        with registry.policy(name="localnet", desired_state=_localnet_state("localnet-1"), linger=True) as nncp:
+            pass
+
+        nncp.clean_up.assert_not_called()
+        assert registry.acquire(name="localnet", desired_state=_localnet_state("localnet-1")) is nncp
+        registry.release(nncp=nncp)
+
+        registry.clean_up()
+        nncp.clean_up.assert_called_once()
+
+    def test_conflicting_idle_policy_removed(self, registry, mock_nncp_class):
+        """Test an idle lingering policy is removed before a policy configuring the same port is applied"""
+        with registry.policy(
+            name="bridge-1", desired_state=_bridge_state(bridge_name="br1", port_name="ens4"), linger=True
+        ) as conflicting_nncp:
+            pass
+        with registry.policy(name="localnet", desired_state=_localnet_state("localnet-1"), linger=True) as other_nncp:
+            pass
+
+        with registry.policy(name="bridge-2", desired_state=_bridge_state(bridge_name="br2", port_name="ens4")):
+            conflicting_nncp.clean_up.assert_called_once()
+            other_nncp.clean_up.assert_not_called()
+
+    def test_used_policy_not_removed_on_conflict(self, registry, mock_nncp_class):
+        """Test a policy still in use is left to its users, even when a conflicting policy is applied"""
+        with registry.policy(
+            name="bridge-1", desired_state=_bridge_state(bridge_name="br1", port_name="ens4"), linger=True
+        ) as used_nncp:
+            with registry.policy(name="bridge-2", desired_state=_bridge_state(bridge_name="br2", port_name="ens4")):
+                used_nncp.clean_up.assert_not_called()
+
+    def test_failed_policy_removed(self, registry, mock_nncp_class):
+        """Test a policy which failed to configure is removed and not registered"""
+        failing_nncp = MagicMock()
+        failing_nncp.wait_for_status_success.side_effect = TimeoutError("not available")
+        mock_nncp_class.side_effect = [failing_nncp, MagicMock()]
+
+        with pytest.raises(TimeoutError, match="not available"):
+            registry.acquire(name="localnet", desired_state=_localnet_state("localnet-1"))
+
+        failing_nncp.clean_up.assert_called_once()
+        assert registry.acquire(name="localnet", desired_state=_localnet_state("localnet-1")) is not failing_nncp
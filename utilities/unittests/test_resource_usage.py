@@ -0,0 +1,139 @@
+# Generated using Claude cli
+
+"""Unit tests for resource_usage module"""
+
+import csv
+from unittest.mock import MagicMock, patch
+
+from resource_usage import (
+    NODES_USAGE_FILE,
+    VIRT_LAUNCHERS_USAGE_FILE,
+    ResourceUsageRecorder,
+    get_virt_launchers_nodes,
+    get_virt_launchers_usage,
+    usage_summary,
+)
+
+
+def _pod_metrics(namespace, name, containers_usage):
+    return {
+        "metadata": {"namespace": namespace, "name": name},
+        "containers": [{"usage": {"cpu": cpu, "memory": memory}} for cpu, memory in containers_usage],
+    }
+
+
+def _launcher_pod(namespace, name, node=None):
+    return {"metadata": {"namespace": namespace, "name": name}, "spec": {"nodeName": node} if node else {}}
+
+
+def _read_csv(path):
+    with open(path, newline="") as fd:
+        return list(csv.DictReader(fd))
+
+
+class TestGetVirtLaunchersUsage:
+    """Test cases for get_virt_launchers_usage function"""
+
+    def test_containers_usage_summed(self):
+        """Test the usage of a pod is the sum of its containers usage"""
+        client = MagicMock()
+        client.resources.get.return_value.get.return_value.to_dict.return_value = {
+            "items": [_pod_metrics(namespace="ns-1", name="virt-launcher-vm-1", containers_usage=[("250m", "1Mi")] * 2)]
+        }
+
+        assert get_virt_launchers_usage(client=client) == {
+            ("ns-1", "virt-launcher-vm-1"): {"cpu_cores": 0.5, "memory_bytes": 2 * 2**20}
+        }
+        client.resources.get.return_value.get.assert_called_once_with(label_selector="kubevirt.io=virt-launcher")
+
+
+class TestGetVirtLaunchersNodes:
+    """Test cases for get_virt_launchers_nodes function"""
+
+    @patch("resource_usage.get_resource_api")
+    def test_unscheduled_pods_skipped(self, mock_get_resource_api):
+        """Test pods without a node are not returned"""
+        mock_get_resource_api.return_value.get.return_value.to_dict.return_value = {
+            "items": [
+                _launcher_pod(namespace="ns-1", name="pod-1", node="node-1"),
+                _launcher_pod(namespace="ns-1", name="pod-2"),
+            ]
+        }
+
+        assert get_virt_launchers_nodes(client=MagicMock()) == {("ns-1", "pod-1"): "node-1"}
+
+
+class TestUsageSummary:
+    """Test cases for usage_summary function"""
+
+    def test_no_values(self):
+        """Test only the count is returned without values"""
+        assert usage_summary(values=[]) == {"count": 0}
+
+    def test_summary(self):
+        """Test mean, percentiles and max"""
+        summary = usage_summary(values=[float(value) for value in range(1, 11)])
+
+        assert summary == {"count": 10, "mean": 5.5, "p50": 5.0, "p90": 9.0, "p99": 10.0, "max": 10.0}
+
+
+class TestResourceUsageRecorder:
+    """Test cases for ResourceUsageRecorder class"""
+
+    @patch("resource_usage.write_to_file")
+    @patch("resource_usage.get_virt_launchers_usage")
+    @patch("resource_usage.get_virt_launchers_nodes")
+    @patch("resource_usage.get_nodes_usage")
+    def test_samples_written_and_summarized(
+        self, mock_get_nodes_usage, mock_get_virt_launchers_nodes, mock_get_virt_launchers_usage, mock_write, tmp_path
+    ):
+        """Test each sample is appended to the CSV files and summarized per node"""
+        mock_get_nodes_usage.side_effect = [
+            {"node-1": {"cpu_cores": 1.0, "memory_bytes": 100.0}, "node-2": {"cpu_cores": 2.0, "memory_bytes": 50.0}},
+            {"node-1": {"cpu_cores": 3.0, "memory_bytes": 300.0}, "node-2": {"cpu_cores": 2.0, "memory_bytes": 50.0}},
+        ]
+        mock_get_virt_launchers_nodes.return_value = {("ns-1", "pod-1"): "node-1", ("ns-1", "pod-2"): "node-1"}
+        mock_get_virt_launchers_usage.return_value = {
+            ("ns-1", "pod-1"): {"cpu_cores": 0.5, "memory_bytes": 10.0},
+            ("ns-1", "pod-2"): {"cpu_cores": 0.25, "memory_bytes": 20.0},
+        }
+        recorder = ResourceUsageRecorder(client=MagicMock(), output_directory=str(tmp_path))
+        with patch("resource_usage.threading.Thread"):
+            recorder.start()
+        recorder.sample()
+        recorder.sample()
+        summary = recorder.stop()
+
+        nodes_rows = _read_csv(path=tmp_path / NODES_USAGE_FILE)
+        assert len(nodes_rows) == 4
+        assert nodes_rows[0]["virt_launchers"] == "2"
+        assert len(_read_csv(path=tmp_path / VIRT_LAUNCHERS_USAGE_FILE)) == 4
+        assert summary["samples"] == 2
+        assert summary["nodes"]["node-1"]["cpu_cores"]["max"] == 3.0
+        assert summary["nodes"]["node-2"]["virt_launchers"]["max"] == 0
+        assert summary["virt_launchers"]["pods"] == 2
+        assert summary["virt_launchers"]["total"]["cpu_cores"]["max"] == 0.75
+        mock_write.assert_called_once()
+
+    @patch("resource_usage.write_to_file")
+    @patch("resource_usage.get_nodes_usage")
+    def test_background_recording_survives_failures(self, mock_get_nodes_usage, mock_write, tmp_path):
+        """Test failed samples are counted and the recording goes on until stopped"""
+        mock_get_nodes_usage.side_effect = [
+            Exception("metrics API unavailable"),
+            {"node-1": {"cpu_cores": 1.0, "memory_bytes": 100.0}},
+        ]
+        recorder = ResourceUsageRecorder(
+            client=MagicMock(), output_directory=str(tmp_path), interval=0, virt_launchers=False
+        )
+
+        def _wait(timeout):
+            if mock_get_nodes_usage.call_count == 2:
+                recorder._stop.set()
+
+        with patch.object(recorder._stop, "wait", side_effect=_wait):
+            with recorder:
+                recorder._thread.join()
+
+        assert (recorder.samples, recorder.failed_samples) == (1, 1)
+        assert "virt_launchers" not in recorder.summary()
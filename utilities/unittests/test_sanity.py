@@ -2,6 +2,7 @@
 
 """Unit tests for sanity module"""
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -491,7 +492,7 @@ class TestClusterSanity:
         mock_check_vm,
         mock_check_webhook,
     ):
-        """Test all components called in correct order (storage, nodes, webhook, HCO)"""
+        """Test storage is checked first and the other components are all called (concurrently)"""
         from utilities.sanity import cluster_sanity
 
         mock_request = MagicMock()
@@ -539,8 +540,10 @@ class TestClusterSanity:
             hco_namespace=MagicMock(),
         )
 
-        # Verify the order: storage -> healthy -> schedulable -> pods -> webhook -> vm -> hco
-        assert call_order == ["storage", "healthy", "schedulable", "pods", "webhook", "vm", "hco"]
+        # Storage is checked before the concurrent checks, nodes health is checked before nodes schedulability
+        assert call_order[0] == "storage"
+        assert sorted(call_order[1:]) == ["hco", "healthy", "pods", "schedulable", "vm", "webhook"]
+        assert call_order.index("healthy") < call_order.index("schedulable")
 
     @patch("utilities.sanity.check_webhook_endpoints_health")
     @patch("utilities.sanity.check_vm_creation_capability")
@@ -1187,3 +1190,93 @@ class TestCheckVmCreationCapability:
         assert "Connection error during dry-run VM creation" in str(exc_info.value), (
             "Expected 'Connection error during dry-run VM creation' in exception message for timeout"
         )
+
+
+class TestRunSanityChecksConcurrently:
+    """Test cases for run_sanity_checks_concurrently function"""
+
+    def test_all_checks_pass(self):
+        """Test all checks run and their durations are recorded"""
+        from utilities.sanity import run_sanity_checks_concurrently
+
+        called = []
+        durations = {}
+
+        run_sanity_checks_concurrently(
+            checks={"first": lambda: called.append("first"), "second": lambda: called.append("second")},
+            durations=durations,
+        )
+
+        assert sorted(called) == ["first", "second"]
+        assert set(durations) == {"first", "second"}
+
+    def test_failed_check_raised_without_waiting(self):
+        """Test a failed check is raised without waiting for slow checks"""
+        from utilities.sanity import run_sanity_checks_concurrently
+
+        release = threading.Event()
+
+        def _failing_check():
+            raise ClusterSanityError("nodes are not ready")
+
+        try:
+            with pytest.raises(ClusterSanityError, match="nodes are not ready"):
+                run_sanity_checks_concurrently(
+                    checks={"slow": lambda: release.wait(timeout=5), "nodes": _failing_check}, durations={}
+                )
+        finally:
+            release.set()
+
+    def test_deadline(self):
+        """Test ClusterSanityError lists the checks which did not finish before the deadline"""
+        from utilities.sanity import run_sanity_checks_concurrently
+
+        release = threading.Event()
+        durations = {}
+
+        try:
+            with pytest.raises(ClusterSanityError, match="hco_conditions"):
+                run_sanity_checks_concurrently(
+                    checks={"fast": lambda: None, "hco_conditions": lambda: release.wait(timeout=5)},
+                    durations=durations,
+                    timeout=0.2,
+                )
+        finally:
+            release.set()
+
+        assert "fast" in durations
+
+    def test_checks_run_in_daemon_threads(self):
+        """Test checks left running do not keep the interpreter alive at exit"""
+        from utilities.sanity import run_sanity_checks_concurrently
+
+        daemon = []
+
+        run_sanity_checks_concurrently(
+            checks={"nodes": lambda: daemon.append(threading.current_thread().daemon)}, durations={}
+        )
+
+        assert daemon == [True]
+
+
+class TestReportSanityChecksDurations:
+    """Test cases for report_sanity_checks_durations function"""
+
+    def test_durations_recorded_as_junit_properties(self):
+        """Test each duration is recorded as a test suite property"""
+        from utilities.sanity import report_sanity_checks_durations
+
+        mock_junitxml_property = MagicMock()
+
+        report_sanity_checks_durations(
+            durations={"pods": 12.34, "nodes": 0.5}, junitxml_property=mock_junitxml_property
+        )
+
+        mock_junitxml_property.assert_any_call(name="cluster_sanity_pods_duration", value="12.3")
+        mock_junitxml_property.assert_any_call(name="cluster_sanity_nodes_duration", value="0.5")
+
+    def test_durations_without_junitxml(self):
+        """Test durations are only logged when JUnit XML is not enabled"""
+        from utilities.sanity import report_sanity_checks_durations
+
+        report_sanity_checks_durations(durations={"pods": 1.0})
@@ -0,0 +1,167 @@
+# Generated using Claude cli
+
+"""Unit tests for scale_ramp module"""
+
+from itertools import islice
+from unittest.mock import MagicMock, patch
+
+import pytest
+from timeout_sampler import TimeoutExpiredError
+
+from bulk import ProvisioningTiming
+from scale_ramp import RampStep, find_saturation, ramp_batch_sizes, run_vms_batch
+
+# 2025-01-01T00:00:00Z
+BASE_TIME = 1735689600.0
+
+
+def _mock_vm(name, namespace="test-namespace"):
+    vm = MagicMock()
+    vm.kind = "VirtualMachine"
+    vm.name = name
+    vm.namespace = namespace
+    return vm
+
+
+def _raw_vmi(name, phase="Running"):
+    return {
+        "metadata": {"name": name},
+        "status": {
+            "phase": phase,
+            "phaseTransitionTimestamps": [{"phase": "Running", "phaseTransitionTimestamp": "2025-01-01T00:00:30Z"}],
+        },
+    }
+
+
+def _step_runner(steps):
+    """run_batch returning the given (running, p90 latency) per batch"""
+
+    def _run_batch(batch, size, total_vms):
+        running, latency = steps[batch]
+        return RampStep(
+            batch=batch, size=size, total_vms=total_vms, running=min(running, size), latency={"p90": latency}
+        )
+
+    return _run_batch
+
+
+class TestRampBatchSizes:
+    """Test cases for ramp_batch_sizes function"""
+
+    @pytest.mark.parametrize(
+        "profile, kwargs, expected",
+        [
+            pytest.param("constant", {}, [5, 5, 5, 5], id="constant"),
+            pytest.param("linear", {"increment": 3}, [5, 8, 11, 14], id="linear"),
+            pytest.param("step", {"increment": 5, "step_batches": 2}, [5, 5, 10, 10], id="step"),
+            pytest.param("exponential", {"factor": 1.5}, [5, 8, 12, 17], id="exponential"),
+        ],
+    )
+    def test_profiles(self, profile, kwargs, expected):
+        """Test the batch sizes of each profile"""
+        assert list(islice(ramp_batch_sizes(profile=profile, initial=5, **kwargs), 4)) == expected
+
+    def test_unknown_profile(self):
+        """Test an unknown profile is rejected"""
+        with pytest.raises(ValueError, match="Unknown ramp profile"):
+            next(ramp_batch_sizes(profile="sine", initial=5))
+
+
+class TestRampStep:
+    """Test cases for RampStep class"""
+
+    def test_failure_rate(self):
+        """Test failure rate is the ratio of VMs not running"""
+        assert RampStep(batch=0, size=4, total_vms=4, running=3).failure_rate == 0.25
+
+    def test_empty_batch_failure_rate(self):
+        """Test an empty batch has no failures"""
+        assert RampStep(batch=0, size=0, total_vms=0, running=0).failure_rate == 0.0
+
+
+class TestFindSaturation:
+    """Test cases for find_saturation function"""
+
+    def test_knee_by_latency(self):
+        """Test the search stops at the first batch crossing the latency threshold"""
+        result = find_saturation(
+            run_batch=_step_runner(steps=[(10, 30), (20, 60), (30, 400), (40, 30)]),
+            batch_sizes=ramp_batch_sizes(profile="linear", initial=10, increment=10),
+            latency_threshold=300,
+            failure_rate_threshold=0.1,
+            max_vms=1000,
+        )
+
+        assert result.knee.batch == 2
+        assert result.max_sustainable_vms == 30
+        assert len(result.steps) == 3
+        assert "latency" in result.reason
+
+    def test_knee_by_failure_rate(self):
+        """Test the search stops at the first batch crossing the failure rate threshold"""
+        result = find_saturation(
+            run_batch=_step_runner(steps=[(10, 30), (5, 30)]),
+            batch_sizes=ramp_batch_sizes(profile="constant", initial=10),
+            latency_threshold=300,
+            failure_rate_threshold=0.1,
+            max_vms=1000,
+        )
+
+        assert result.knee.batch == 1
+        assert result.max_sustainable_vms == 10
+        assert "Failure rate" in result.reason
+
+    def test_max_vms_reached(self):
+        """Test the last batch is trimmed to max_vms and the search ends without a knee"""
+        run_batch = MagicMock(side_effect=_step_runner(steps=[(100, 30)] * 3))
+
+        result = find_saturation(
+            run_batch=run_batch,
+            batch_sizes=ramp_batch_sizes(profile="constant", initial=10),
+            latency_threshold=300,
+            failure_rate_threshold=0.1,
+            max_vms=25,
+        )
+
+        assert result.knee is None
+        assert [step.size for step in result.steps] == [10, 10, 5]
+        assert result.max_sustainable_vms == 25
+        assert result.summary(nodes=5)["max_sustainable_vms_per_node"] == 5.0
+
+
+class TestRunVmsBatch:
+    """Test cases for run_vms_batch function"""
+
+    @patch("scale_ramp.wait_for_vmis_running")
+    @patch("scale_ramp.deploy_resources_in_parallel")
+    def test_running_latency(self, mock_deploy, mock_wait_for_vmis_running):
+        """Test the latency is measured from the create request to Running"""
+        vms = [_mock_vm(name="vm-1"), _mock_vm(name="vm-2")]
+        mock_deploy.return_value = {
+            vm.name: ProvisioningTiming(name=vm.name, submitted=BASE_TIME, created=BASE_TIME) for vm in vms
+        }
+        mock_wait_for_vmis_running.return_value = {"vm-1": BASE_TIME + 10, "vm-2": BASE_TIME + 20}
+
+        step = run_vms_batch(client=MagicMock(), vms=vms, batch=0, total_vms=2)
+
+        assert (step.size, step.running, step.failed) == (2, 2, 0)
+        assert step.latency["max"] == 20
+
+    @patch("scale_ramp.get_resource_api")
+    @patch("scale_ramp.wait_for_vmis_running", side_effect=TimeoutExpiredError("timeout"))
+    @patch("scale_ramp.deploy_resources_in_parallel")
+    def test_timeout_counts_not_running_as_failed(self, mock_deploy, mock_wait_for_vmis_running, mock_get_resource_api):
+        """Test VMs not running in time are failures, listed once per namespace"""
+        vms = [_mock_vm(name="vm-1"), _mock_vm(name="vm-2")]
+        mock_deploy.return_value = {
+            vm.name: ProvisioningTiming(name=vm.name, submitted=BASE_TIME, created=BASE_TIME) for vm in vms
+        }
+        mock_get_resource_api.return_value.get.return_value.to_dict.return_value = {
+            "items": [_raw_vmi(name="vm-1"), _raw_vmi(name="vm-2", phase="Scheduling"), _raw_vmi(name="other")]
+        }
+
+        step = run_vms_batch(client=MagicMock(), vms=vms, batch=1, total_vms=4, timeout=1)
+
+        assert (step.running, step.failure_rate) == (1, 0.5)
+        assert step.latency["max"] == 30
+        mock_get_resource_api.return_value.get.assert_called_once_with(namespace="test-namespace")
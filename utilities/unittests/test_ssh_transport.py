@@ -0,0 +1,208 @@
+# Generated using Claude cli
+
+"""Unit tests for ssh_transport module"""
+
+from unittest.mock import MagicMock, patch
+
+import paramiko
+import pytest
+
+from ssh_transport import (
+    ReusableRemoteExecutor,
+    ReusableRemoteExecutorFactory,
+    ReusableSshSession,
+    ReusableSshTransport,
+    SshTransportPool,
+)
+
+KEY = ("test-namespace", "test-vm", "user", "pass")
+PROXY_COMMAND = "virtctl port-forward --stdio=true vm/test-vm/test-namespace 22"
+
+
+@pytest.fixture
+def mock_user():
+    user = MagicMock()
+    user.name = "user"
+    user.password = "pass"
+    return user
+
+
+@pytest.fixture
+def transport():
+    return ReusableSshTransport(hostname="test-vm", proxy_command=PROXY_COMMAND)
+
+
+class TestReusableSshTransport:
+    """Test cases for ReusableSshTransport class"""
+
+    @patch("ssh_transport.paramiko.SSHClient")
+    @patch("ssh_transport.paramiko.ProxyCommand")
+    def test_connect_opens_connection_once(self, mock_proxy, mock_ssh_client, transport, mock_user):
+        """Test connect opens a connection once and reuses it while it is usable"""
+        client = mock_ssh_client.return_value
+        client.get_transport.return_value.is_active.return_value = True
+
+        assert transport.connect(user=mock_user, pkey=None, timeout=10) == client
+        assert transport.connect(user=mock_user, pkey=None, timeout=10) == client
+
+        mock_proxy.assert_called_once_with(command_line=PROXY_COMMAND)
+        client.connect.assert_called_once()
+        assert client.connect.call_args.kwargs["password"] == "pass"
+        assert transport.stats.connections == 1
+        assert transport.stats.reuses == 1
+
+    @patch("ssh_transport.paramiko.SSHClient")
+    @patch("ssh_transport.paramiko.ProxyCommand")
+    def test_connect_reconnects_when_channel_fails(self, mock_proxy, mock_ssh_client, transport, mock_user):
+        """Test connect reconnects when the active transport cannot open a channel"""
+        client = mock_ssh_client.return_value
+        client.get_transport.return_value.is_active.return_value = True
+        client.get_transport.return_value.open_session.side_effect = paramiko.SSHException("broken")
+
+        transport.connect(user=mock_user, pkey=None, timeout=10)
+        transport.connect(user=mock_user, pkey=None, timeout=10)
+
+        assert mock_proxy.call_count == 2
+        assert transport.stats.connections == 2
+        assert transport.stats.reuses == 0
+
+    @patch("ssh_transport.paramiko.SSHClient")
+    @patch("ssh_transport.paramiko.ProxyCommand")
+    def test_connect_with_pkey_does_not_send_password(self, mock_proxy, mock_ssh_client, transport, mock_user):
+        """Test key based authentication does not pass the password"""
+        pkey = MagicMock()
+
+        transport.connect(user=mock_user, pkey=pkey, timeout=10)
+
+        connect_kwargs = mock_ssh_client.return_value.connect.call_args.kwargs
+        assert connect_kwargs["password"] is None
+        assert connect_kwargs["pkey"] == pkey
+        assert connect_kwargs["sock"] == mock_proxy.return_value
+
+    @patch("ssh_transport.paramiko.SSHClient")
+    @patch("ssh_transport.paramiko.ProxyCommand")
+    def test_connect_failure_cleans_up(self, mock_proxy, mock_ssh_client, transport, mock_user):
+        """Test a failed connect closes the client and the proxy command"""
+        mock_ssh_client.return_value.connect.side_effect = paramiko.SSHException("auth failed")
+
+        with pytest.raises(paramiko.SSHException):
+            transport.connect(user=mock_user, pkey=None, timeout=10)
+
+        mock_ssh_client.return_value.close.assert_called()
+        mock_proxy.return_value.close.assert_called_once()
+        assert transport.stats.connections == 0
+
+    @patch("ssh_transport.paramiko.SSHClient")
+    @patch("ssh_transport.paramiko.ProxyCommand")
+    def test_invalidate(self, mock_proxy, mock_ssh_client, transport, mock_user):
+        """Test invalidate closes the connection and counts the invalidation"""
+        transport.connect(user=mock_user, pkey=None, timeout=10)
+
+        transport.invalidate()
+        transport.invalidate()
+
+        mock_ssh_client.return_value.close.assert_called_once()
+        mock_proxy.return_value.process.wait.assert_called_once()
+        assert transport.stats.invalidations == 1
+
+
+class TestReusableSshSession:
+    """Test cases for ReusableSshSession and ReusableRemoteExecutor classes"""
+
+    def test_factory_builds_executor_without_sock(self, transport, mock_user):
+        """Test the executor does not expose the proxy command socket"""
+        host = MagicMock()
+        host.ip = "test-vm"
+
+        executor = ReusableRemoteExecutorFactory(transport=transport).build(host=host, user=mock_user, sudo=True)
+
+        assert isinstance(executor, ReusableRemoteExecutor)
+        assert executor.sock is None
+        assert executor.sudo
+        assert isinstance(executor.session(), ReusableSshSession)
+
+    def test_session_uses_transport_client(self, transport, mock_user):
+        """Test the session runs over the transport client and keeps it open on exit"""
+        executor = ReusableRemoteExecutor(transport=transport, user=mock_user, address="test-vm")
+        client = MagicMock()
+
+        with patch.object(transport, "connect", return_value=client) as mock_connect:
+            with executor.session() as session:
+                assert session._ssh == client
+
+        mock_connect.assert_called_once()
+        client.close.assert_not_called()
+
+    def test_session_connection_error_invalidates(self, transport, mock_user):
+        """Test a connection error inside the session invalidates the transport"""
+        executor = ReusableRemoteExecutor(transport=transport, user=mock_user, address="test-vm")
+
+        with (
+            patch.object(transport, "connect"),
+            patch.object(transport, "invalidate") as mock_invalidate,
+        ):
+            with pytest.raises(EOFError):
+                with executor.session():
+                    raise EOFError()
+
+        mock_invalidate.assert_called_once()
+
+    def test_session_command_error_keeps_connection(self, transport, mock_user):
+        """Test a non connection error does not invalidate the transport"""
+        executor = ReusableRemoteExecutor(transport=transport, user=mock_user, address="test-vm")
+
+        with (
+            patch.object(transport, "connect"),
+            patch.object(transport, "invalidate") as mock_invalidate,
+        ):
+            with pytest.raises(ValueError):
+                with executor.session():
+                    raise ValueError()
+
+        mock_invalidate.assert_not_called()
+
+
+class TestSshTransportPool:
+    """Test cases for SshTransportPool class"""
+
+    def test_acquire_returns_same_transport(self):
+        """Test acquiring the same key returns the same transport and counts references"""
+        pool = SshTransportPool()
+
+        first = pool.acquire(key=KEY, hostname="test-vm", proxy_command=PROXY_COMMAND)
+        second = pool.acquire(key=KEY, hostname="test-vm", proxy_command=PROXY_COMMAND)
+
+        assert first is second
+        assert first.ref_count == 2
+
+    def test_release_closes_on_last_reference(self):
+        """Test the transport is closed and removed only when the last reference is released"""
+        pool = SshTransportPool()
+        transport = pool.acquire(key=KEY, hostname="test-vm", proxy_command=PROXY_COMMAND)
+        pool.acquire(key=KEY, hostname="test-vm", proxy_command=PROXY_COMMAND)
+
+        with patch.object(transport, "invalidate") as mock_invalidate:
+            pool.release(key=KEY)
+            mock_invalidate.assert_not_called()
+            assert KEY in pool.stats()
+
+            pool.release(key=KEY)
+            mock_invalidate.assert_called_once()
+            assert KEY not in pool.stats()
+
+    def test_release_unknown_key(self):
+        """Test releasing an unknown key is a no-op"""
+        SshTransportPool().release(key=KEY)
+
+    def test_invalidate_and_close_all(self):
+        """Test invalidate keeps the transport registered and close_all removes all transports"""
+        pool = SshTransportPool()
+        transport = pool.acquire(key=KEY, hostname="test-vm", proxy_command=PROXY_COMMAND)
+
+        with patch.object(transport, "invalidate") as mock_invalidate:
+            pool.invalidate(key=KEY)
+            assert KEY in pool.stats()
+            pool.close_all()
+
+        assert mock_invalidate.call_count == 2
+        assert not pool.stats()
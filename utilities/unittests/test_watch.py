@@ -0,0 +1,452 @@
+# Generated using Claude cli
+
+"""Unit tests for watch module"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from kubernetes.client import ApiException
+from ocp_resources.node import Node
+from ocp_resources.pod import Pod
+from ocp_resources.virtual_machine_instance import VirtualMachineInstance
+from timeout_sampler import TimeoutExpiredError
+
+from watch import (
+    ResourceCache,
+    WatchHub,
+    get_resource_api,
+    is_expected_exception,
+    list_and_watch,
+    match_label_selector,
+    wait_for_resources,
+    wait_for_resources_deleted,
+)
+
+
+def _raw(name, resource_version="1", phase=None):
+    return {"metadata": {"name": name, "resourceVersion": resource_version}, "status": {"phase": phase}}
+
+
+def _event(event_type, raw_object):
+    return {"type": event_type, "raw_object": raw_object}
+
+
+@pytest.fixture
+def mock_api():
+    api = MagicMock()
+    api.get.return_value.to_dict.return_value = {"metadata": {"resourceVersion": "10"}, "items": []}
+    api.watch.return_value = []
+    return api
+
+
+@pytest.fixture
+def mock_client(mock_api):
+    client = MagicMock()
+    client.resources.get.return_value = mock_api
+    client.resources.search.return_value = [mock_api]
+    return client
+
+
+class TestGetResourceApi:
+    """Test cases for get_resource_api function"""
+
+    def test_get_resource_api_with_api_version(self, mock_client, mock_api):
+        """Test a kind with a fixed api_version is resolved with resources.get"""
+        assert get_resource_api(client=mock_client, resource_kind=Pod) == mock_api
+        mock_client.resources.get.assert_called_once_with(kind="Pod", api_version="v1")
+
+    def test_get_resource_api_prefers_preferred_version(self, mock_client):
+        """Test the preferred version is picked when the kind is served in several versions"""
+        old_api, preferred_api = MagicMock(preferred=False), MagicMock(preferred=True)
+        mock_client.resources.search.return_value = [old_api, preferred_api]
+
+        assert get_resource_api(client=mock_client, resource_kind=VirtualMachineInstance) == preferred_api
+        mock_client.resources.search.assert_called_once_with(kind="VirtualMachineInstance", group="kubevirt.io")
+
+
+class TestListAndWatch:
+    """Test cases for list_and_watch function"""
+
+    def test_list_then_watch_from_list_resource_version(self, mock_client, mock_api):
+        """Test listed objects are yielded first and the watch starts at the list resourceVersion"""
+        mock_api.get.return_value.to_dict.return_value = {
+            "metadata": {"resourceVersion": "10"},
+            "items": [_raw(name="vmi-1")],
+        }
+        mock_api.watch.return_value = [
+            _event(event_type="MODIFIED", raw_object=_raw(name="vmi-1", resource_version="11"))
+        ]
+
+        events = list_and_watch(client=mock_client, resource_kind=Pod, namespace="ns", timeout=10)
+
+        assert next(events) == ("ADDED", _raw(name="vmi-1"))
+        assert next(events) == ("MODIFIED", _raw(name="vmi-1", resource_version="11"))
+        assert mock_api.watch.call_args.kwargs["resource_version"] == "10"
+        assert mock_api.watch.call_args.kwargs["namespace"] == "ns"
+
+    def test_relist_on_gone_event(self, mock_client, mock_api):
+        """Test an expired resourceVersion (410 Gone error event) triggers a new list"""
+        mock_api.watch.side_effect = [
+            [_event(event_type="ERROR", raw_object={"code": 410, "message": "too old"})],
+            [_event(event_type="ADDED", raw_object=_raw(name="vmi-2", resource_version="20"))],
+        ]
+
+        events = list_and_watch(client=mock_client, resource_kind=Pod, timeout=10)
+
+        assert next(events) == ("ADDED", _raw(name="vmi-2", resource_version="20"))
+        assert mock_api.get.call_count == 2
+
+    def test_relist_on_gone_exception(self, mock_client, mock_api):
+        """Test an ApiException with status 410 triggers a new list"""
+        mock_api.watch.side_effect = [
+            ApiException(status=410, reason="Gone"),
+            [_event(event_type="ADDED", raw_object=_raw(name="vmi-3"))],
+        ]
+
+        events = list_and_watch(client=mock_client, resource_kind=Pod, timeout=10)
+
+        assert next(events) == ("ADDED", _raw(name="vmi-3"))
+        assert mock_api.get.call_count == 2
+
+    def test_other_api_exception_raised(self, mock_client, mock_api):
+        """Test ApiException other than 410 is raised"""
+        mock_api.watch.side_effect = ApiException(status=403, reason="Forbidden")
+
+        with pytest.raises(ApiException):
+            next(list_and_watch(client=mock_client, resource_kind=Pod, timeout=10))
+
+
+class TestWaitForResources:
+    """Test cases for wait_for_resources function"""
+
+    def test_wait_for_resources_success(self, mock_client, mock_api):
+        """Test the wait returns once all named resources satisfy the predicate"""
+        mock_api.get.return_value.to_dict.return_value = {
+            "metadata": {"resourceVersion": "10"},
+            "items": [_raw(name="vmi-1", phase="Running"), _raw(name="other", phase="Running")],
+        }
+        mock_api.watch.return_value = [_event(event_type="MODIFIED", raw_object=_raw(name="vmi-2", phase="Running"))]
+
+        result = wait_for_resources(
+            client=mock_client,
+            resource_kind=Pod,
+            names={"vmi-1", "vmi-2"},
+            predicate=lambda raw: raw["status"]["phase"] == "Running",
+            timeout=10,
+        )
+
+        assert set(result) == {"vmi-1", "vmi-2"}
+
+    def test_wait_for_resources_no_names(self, mock_client, mock_api):
+        """Test waiting for no resources returns without API calls"""
+        assert wait_for_resources(client=mock_client, resource_kind=Pod, names=set(), predicate=bool) == {}
+        mock_api.get.assert_not_called()
+
+    def test_wait_for_resources_timeout(self, mock_client, mock_api):
+        """Test TimeoutExpiredError lists the resources which did not satisfy the predicate"""
+        mock_api.watch.return_value = [_event(event_type="DELETED", raw_object=_raw(name="vmi-1", phase="Running"))]
+
+        with pytest.raises(TimeoutExpiredError, match="vmi-1"):
+            wait_for_resources(
+                client=mock_client,
+                resource_kind=Pod,
+                names={"vmi-1"},
+                predicate=lambda raw: raw["status"]["phase"] == "Running",
+                timeout=1,
+            )
+
+
+class TestWaitForResourcesDeleted:
+    """Test cases for wait_for_resources_deleted function"""
+
+    def test_deleted_when_listed_or_on_event(self, mock_client, mock_api):
+        """Test resources missing from the list and resources with a DELETED event are deleted"""
+        finalizing = _raw(name="vm-2")
+        finalizing["metadata"]["finalizers"] = ["kubevirt.io/virtualMachineControllerFinalize"]
+        mock_api.get.return_value.to_dict.return_value = {"metadata": {"resourceVersion": "10"}, "items": [finalizing]}
+        mock_api.watch.return_value = [
+            _event(event_type="MODIFIED", raw_object=_raw(name="other", resource_version="11")),
+            _event(event_type="DELETED", raw_object=_raw(name="vm-2", resource_version="12")),
+        ]
+
+        deleted = wait_for_resources_deleted(
+            client=mock_client, resource_kind=Pod, names={"vm-1", "vm-2"}, namespace="ns", timeout=10
+        )
+
+        assert set(deleted) == {"vm-1", "vm-2"}
+        assert deleted["vm-1"][1] == []
+        assert deleted["vm-2"][1] == ["kubevirt.io/virtualMachineControllerFinalize"]
+        assert mock_api.watch.call_args.kwargs["resource_version"] == "10"
+
+    def test_all_deleted_no_watch(self, mock_client, mock_api):
+        """Test no watch is opened when all resources are already gone"""
+        assert set(wait_for_resources_deleted(client=mock_client, resource_kind=Pod, names={"vm-1"}, timeout=10)) == {
+            "vm-1"
+        }
+        mock_api.watch.assert_not_called()
+
+    def test_timeout(self, mock_client, mock_api):
+        """Test TimeoutExpiredError lists the resources which were not deleted"""
+        mock_api.get.return_value.to_dict.return_value = {
+            "metadata": {"resourceVersion": "10"},
+            "items": [_raw(name="vm-1")],
+        }
+
+        with pytest.raises(TimeoutExpiredError, match="vm-1"):
+            wait_for_resources_deleted(client=mock_client, resource_kind=Pod, names={"vm-1"}, timeout=1)
+
+
+def _slow_watch(events):
+    """Watch side effect which yields the events and then blocks for a while, like an idle watch"""
+
+    def _watch(**kwargs):
+        yield from events
+        time.sleep(0.05)
+
+    return _watch
+
+
+@pytest.fixture
+def watch_hub():
+    hub = WatchHub(idle_timeout=0)
+    yield hub
+    hub.close_all()
+
+
+class TestIsExpectedException:
+    """Test cases for is_expected_exception function"""
+
+    def test_any_message(self):
+        """Test an empty message list allows any message"""
+        assert is_expected_exception(exp=ValueError("boom"), exceptions_dict={ValueError: []})
+
+    def test_message_filter(self):
+        """Test only the listed messages are allowed"""
+        exceptions_dict = {ValueError: ["connection reset"]}
+
+        assert is_expected_exception(exp=ValueError("connection reset by peer"), exceptions_dict=exceptions_dict)
+        assert not is_expected_exception(exp=ValueError("boom"), exceptions_dict=exceptions_dict)
+        assert not is_expected_exception(exp=KeyError("boom"), exceptions_dict=None)
+
+
+class TestWatchHub:
+    """Test cases for WatchHub and ResourceWatcher classes"""
+
+    def test_wait_for_event(self, watch_hub, mock_client, mock_api):
+        """Test the wait returns the resource once a watch event satisfies the predicate"""
+        mock_api.get.return_value.to_dict.return_value = {
+            "metadata": {"resourceVersion": "10"},
+            "items": [_raw(name="vmi-1", phase="Scheduling")],
+        }
+        mock_api.watch.side_effect = _slow_watch(
+            events=[
+                _event(event_type="MODIFIED", raw_object=_raw(name="vmi-1", resource_version="11", phase="Running"))
+            ]
+        )
+
+        result = watch_hub.wait_for(
+            client=mock_client,
+            resource_kind=Pod,
+            name="vmi-1",
+            predicate=lambda raw: raw["status"]["phase"] == "Running",
+            timeout=5,
+        )
+
+        assert result == _raw(name="vmi-1", resource_version="11", phase="Running")
+        assert mock_api.watch.call_args.kwargs["resource_version"] == "10"
+
+    def test_waiters_share_watcher(self, watch_hub, mock_client, mock_api):
+        """Test waiters of the same kind and namespace use one list and watch"""
+        watch_hub.idle_timeout = 10
+        mock_api.get.return_value.to_dict.return_value = {
+            "metadata": {"resourceVersion": "10"},
+            "items": [_raw(name="vmi-1", phase="Running"), _raw(name="vmi-2", phase="Running")],
+        }
+        mock_api.watch.side_effect = _slow_watch(events=[])
+
+        for name in ("vmi-1", "vmi-2"):
+            watch_hub.wait_for(
+                client=mock_client,
+                resource_kind=Pod,
+                name=name,
+                predicate=lambda raw: raw["status"]["phase"] == "Running",
+                timeout=5,
+            )
+
+        mock_api.get.assert_called_once()
+
+    def test_wait_without_name_uses_first_resource(self, watch_hub, mock_client, mock_api):
+        """Test the first listed resource is used when no name is given (singleton CRs)"""
+        mock_api.get.return_value.to_dict.return_value = {
+            "metadata": {"resourceVersion": "10"},
+            "items": [_raw(name="hco", phase="Ready")],
+        }
+        mock_api.watch.side_effect = _slow_watch(events=[])
+
+        result = watch_hub.wait_for(client=mock_client, resource_kind=Pod, predicate=bool, timeout=5)
+
+        assert result["metadata"]["name"] == "hco"
+
+    def test_stable_for(self, watch_hub, mock_client, mock_api):
+        """Test the predicate should be true for stable_for seconds"""
+        mock_api.get.return_value.to_dict.return_value = {
+            "metadata": {"resourceVersion": "10"},
+            "items": [_raw(name="vmi-1", phase="Running")],
+        }
+        mock_api.watch.side_effect = _slow_watch(events=[])
+
+        start = time.monotonic()
+        watch_hub.wait_for(
+            client=mock_client, resource_kind=Pod, name="vmi-1", predicate=bool, timeout=5, stable_for=0.3
+        )
+
+        assert time.monotonic() - start >= 0.3
+
+    def test_deleted_resource_times_out(self, watch_hub, mock_client, mock_api):
+        """Test a deleted resource is removed from the cache and the wait times out"""
+        mock_api.get.return_value.to_dict.return_value = {
+            "metadata": {"resourceVersion": "10"},
+            "items": [_raw(name="vmi-1", phase="Scheduling")],
+        }
+        mock_api.watch.side_effect = _slow_watch(
+            events=[_event(event_type="DELETED", raw_object=_raw(name="vmi-1", resource_version="11"))]
+        )
+
+        with pytest.raises(TimeoutExpiredError):
+            watch_hub.wait_for(client=mock_client, resource_kind=Pod, name="vmi-1", predicate=bool, timeout=1)
+
+    def test_predicate_exception_raised(self, watch_hub, mock_client, mock_api):
+        """Test an exception raised by the predicate (e.g. a stop condition) is propagated"""
+        mock_api.get.return_value.to_dict.return_value = {
+            "metadata": {"resourceVersion": "10"},
+            "items": [_raw(name="vmi-1", phase="Failed")],
+        }
+        mock_api.watch.side_effect = _slow_watch(events=[])
+
+        def _predicate(raw):
+            raise TimeoutExpiredError("stop condition")
+
+        with pytest.raises(TimeoutExpiredError, match="stop condition"):
+            watch_hub.wait_for(client=mock_client, resource_kind=Pod, name="vmi-1", predicate=_predicate, timeout=5)
+
+    def test_watch_error_raised(self, watch_hub, mock_client, mock_api):
+        """Test a watcher error is raised to the waiter"""
+        mock_api.get.side_effect = ApiException(status=403, reason="Forbidden")
+
+        with pytest.raises(ApiException):
+            watch_hub.wait_for(client=mock_client, resource_kind=Pod, name="vmi-1", predicate=bool, timeout=5)
+
+    def test_expected_watch_error_retried(self, watch_hub, mock_client, mock_api, mocker):
+        """Test a watcher error listed in exceptions_dict starts a new watcher"""
+        mocker.patch("watch.time.sleep")
+        listed = MagicMock()
+        listed.to_dict.return_value = {"metadata": {"resourceVersion": "10"}, "items": [_raw(name="vmi-1")]}
+        mock_api.get.side_effect = [ApiException(status=500, reason="Internal"), listed]
+        mock_api.watch.return_value = []
+
+        result = watch_hub.wait_for(
+            client=mock_client,
+            resource_kind=Pod,
+            name="vmi-1",
+            predicate=bool,
+            timeout=5,
+            exceptions_dict={ApiException: []},
+        )
+
+        assert result["metadata"]["name"] == "vmi-1"
+        assert mock_api.get.call_count == 2
+
+
+class TestMatchLabelSelector:
+    """Test cases for match_label_selector function"""
+
+    @pytest.mark.parametrize(
+        "label_selector, expected",
+        [
+            pytest.param(None, True, id="no_selector"),
+            pytest.param("app=virt", True, id="equal"),
+            pytest.param("app==virt,tier", True, id="double_equal_and_exists"),
+            pytest.param("app!=virt", False, id="not_equal"),
+            pytest.param("!tier", False, id="not_exists"),
+            pytest.param("missing", False, id="missing_key"),
+        ],
+    )
+    def test_match_label_selector(self, label_selector, expected):
+        """Test equality based label selectors"""
+        assert match_label_selector(labels={"app": "virt", "tier": ""}, label_selector=label_selector) == expected
+
+
+class TestResourceCache:
+    """Test cases for ResourceCache class"""
+
+    @pytest.fixture
+    def resource_cache(self, watch_hub):
+        cache = ResourceCache(hub=watch_hub, idle_timeout=60)
+        yield cache
+        cache.close()
+
+    @pytest.fixture
+    def listed_nodes(self, mock_api):
+        mock_api.get.return_value.to_dict.return_value = {
+            "metadata": {"resourceVersion": "10"},
+            "items": [
+                {"metadata": {"name": "worker-1", "labels": {"role": "worker"}}, "spec": {"unschedulable": True}},
+                {"metadata": {"name": "master-1", "labels": {"role": "master"}}, "spec": {}},
+            ],
+        }
+        mock_api.watch.side_effect = _slow_watch(events=[])
+
+    def test_list_from_cache(self, resource_cache, mock_client, mock_api, listed_nodes):
+        """Test repeated reads are served by one list and filtered by label"""
+        workers = resource_cache.list(client=mock_client, resource_kind=Node, label_selector="role=worker")
+        all_nodes = resource_cache.list(client=mock_client, resource_kind=Node)
+
+        assert [node.name for node in workers] == ["worker-1"]
+        assert {node.name for node in all_nodes} == {"worker-1", "master-1"}
+        mock_api.get.assert_called_once()
+
+    def test_fresh_read(self, resource_cache, mock_client, mock_api, listed_nodes):
+        """Test a fresh read goes to the API server"""
+        resource_cache.list_raw(client=mock_client, resource_kind=Node, label_selector="role=worker", fresh=True)
+
+        mock_api.get.assert_called_once_with(namespace=None, label_selector="role=worker")
+
+    def test_set_based_selector_read_from_api(self, resource_cache, mock_client, mock_api, listed_nodes):
+        """Test set based selectors, which the cache does not evaluate, go to the API server"""
+        resource_cache.list_raw(client=mock_client, resource_kind=Node, label_selector="role in (worker)")
+
+        mock_api.get.assert_called_once_with(namespace=None, label_selector="role in (worker)")
+
+    def test_stale_cache_read_from_api(self, resource_cache, mock_client, mock_api, listed_nodes):
+        """Test reads go to the API server when the watch did not confirm the state in max_staleness"""
+        resource_cache.max_staleness = -1
+
+        assert resource_cache.get_raw(client=mock_client, resource_kind=Node, name="worker-1")
+        assert mock_api.get.call_args.kwargs == {"name": "worker-1", "namespace": None}
+
+    def test_get_raw_missing(self, resource_cache, mock_client, listed_nodes):
+        """Test None is returned for a resource which is not in the cache"""
+        assert resource_cache.get_raw(client=mock_client, resource_kind=Node, name="worker-2") is None
+
+    def test_instance(self, resource_cache, mock_client, listed_nodes):
+        """Test instance returns the cached state of a resource"""
+        node = Node(client=mock_client, name="worker-1")
+
+        assert resource_cache.instance(resource=node).spec.unschedulable
+
+    def test_idle_informer_released(self, watch_hub, mock_client, listed_nodes):
+        """Test an informer not read for the idle timeout is released on the next read and its watcher stops"""
+        resource_cache = ResourceCache(hub=watch_hub, idle_timeout=0)
+        resource_cache.list_raw(client=mock_client, resource_kind=Pod, namespace="test-namespace")
+        watcher = resource_cache._informers[(id(mock_client), "Pod", "test-namespace")]
+        time.sleep(0.01)
+
+        resource_cache.list_raw(client=mock_client, resource_kind=Pod, namespace="other-namespace")
+
+        assert list(resource_cache._informers) == [(id(mock_client), "Pod", "other-namespace")]
+        deadline = time.monotonic() + 5
+        while watcher.running and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not watcher.running
+        resource_cache.close()
@@ -10,7 +10,7 @@ import secrets
 import shlex
 from collections import defaultdict
 from contextlib import contextmanager
-from functools import cache
+from functools import partial
 from json import JSONDecodeError
 from subprocess import run
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
@@ -22,7 +22,7 @@ import yaml
 from benedict import benedict
 from kubernetes.client import ApiException
 from kubernetes.dynamic import DynamicClient
-from kubernetes.dynamic.exceptions import NotFoundError
+from kubernetes.dynamic.exceptions import NotFoundError, ResourceNotFoundError
 from ocp_resources.daemonset import DaemonSet
 from ocp_resources.datavolume import DataVolume
 from ocp_resources.kubevirt import KubeVirt
@@ -43,14 +43,14 @@ from ocp_utilities.exceptions import CommandExecFailed
 from paramiko import ProxyCommandFailure
 from pyhelper_utils.shell import run_command, run_ssh_commands
 from pytest_testconfig import config as py_config
-from rrmngmnt import Host, ssh, user
+from rrmngmnt import Host, user
 from timeout_sampler import TimeoutExpiredError, TimeoutSampler
 
 import utilities.cpu
 import utilities.data_utils
 import utilities.infra
 from libs.net.cluster import is_ipv6_single_stack_cluster
-from utilities.console import Console
+from utilities.console import CONSOLE_SESSION_POOL, Console
 from utilities.constants import (
     CLOUD_INIT_DISK_NAME,
     CLOUD_INIT_NO_CLOUD,
@@ -94,10 +94,19 @@ from utilities.constants import (
 )
 from utilities.data_collector import collect_vnc_screenshot_for_vms
 from utilities.hco import get_hco_namespace, wait_for_hco_conditions
+from utilities.image_cache import DEFAULT_IMAGE_LOOKUP_WORKERS, IMAGE_INFO_CACHE
 from utilities.network import (
     cloud_init_network_data,
 )
+from utilities.ssh_transport import (
+    SSH_TRANSPORT_POOL,
+    ReusableRemoteExecutorFactory,
+    ReusableSshTransport,
+    SshTransportKey,
+    SshTransportStats,
+)
 from utilities.storage import get_default_storage_class
+from utilities.watch import RESOURCE_CACHE, WATCH_HUB
 
 if TYPE_CHECKING:
     from libs.vm.vm import BaseVirtualMachine
@@ -132,21 +141,24 @@ def wait_for_vm_interfaces(vmi: VirtualMachineInstance, timeout: int = TIMEOUT_1
     Raises:
         TimeoutExpiredError: After timeout reached.
     """
+
+    def _agent_connected(_vmi: dict[str, Any]) -> bool:
+        return any(
+            condition.get("type") == VirtualMachineInstance.Condition.Type.AGENT_CONNECTED
+            and condition.get("status") == VirtualMachineInstance.Condition.Status.TRUE
+            for condition in _vmi.get("status", {}).get("conditions") or []
+        )
+
+    def _interfaces_reported(_vmi: dict[str, Any]) -> bool:
+        interfaces = _vmi.get("status", {}).get("interfaces", [])
+        return all(interface.get("interfaceName") for interface in interfaces)
+
     # Waiting for guest agent connection before checking guest agent interfaces report
     LOGGER.info(f"Wait until guest agent is active on {vmi.name}")
-    vmi.wait_for_condition(
-        condition=VirtualMachineInstance.Condition.Type.AGENT_CONNECTED,
-        status=VirtualMachineInstance.Condition.Status.TRUE,
-        timeout=timeout,
-    )
+    WATCH_HUB.wait_for_resource(resource=vmi, predicate=_agent_connected, timeout=timeout)
     LOGGER.info(f"Wait for {vmi.name} network interfaces")
-    sampler = TimeoutSampler(wait_timeout=timeout, sleep=1, func=lambda: vmi.instance)
-    for sample in sampler:
-        interfaces = sample.get("status", {}).get("interfaces", [])
-        active_interfaces = [interface for interface in interfaces if interface.get("interfaceName")]
-        if len(active_interfaces) == len(interfaces):
-            return True
-    return False
+    WATCH_HUB.wait_for_resource(resource=vmi, predicate=_interfaces_reported, timeout=timeout)
+    return True
 
 
 def generate_cloud_init_data(data):
@@ -440,6 +452,7 @@ class VirtualMachineForTests(VirtualMachine):
         self.hugepages_page_size = hugepages_page_size
         self.vm_affinity = vm_affinity
         self.annotations = annotations
+        self.ssh_transport_key: SshTransportKey | None = None
 
         # Must be here to apply on existing VMs
         self.set_login_params()
@@ -449,13 +462,25 @@ class VirtualMachineForTests(VirtualMachine):
         return self
 
     def clean_up(self, wait: bool = True, timeout: int | None = None) -> bool:
+        # Without wait (e.g. bulk teardown, which waits for all deletions at once) only request the stop
         if self.exists and self.ready:
-            self.stop(wait=True, vmi_delete_timeout=TIMEOUT_8MIN)
+            self.stop(wait=wait, vmi_delete_timeout=TIMEOUT_8MIN)
         super().clean_up(wait=wait, timeout=timeout)
         if self.custom_service:
             self.custom_service.delete(wait=True)
+        if self.ssh_transport_key:
+            SSH_TRANSPORT_POOL.release(key=self.ssh_transport_key)
+            self.ssh_transport_key = None
         return True
 
+    def stop(self, timeout=TIMEOUT_4MIN, vmi_delete_timeout=TIMEOUT_4MIN, wait=False):
+        self.invalidate_ssh_transport()
+        return super().stop(timeout=timeout, vmi_delete_timeout=vmi_delete_timeout, wait=wait)
+
+    def restart(self, timeout=TIMEOUT_4MIN, wait=False):
+        self.invalidate_ssh_transport()
+        return super().restart(timeout=timeout, wait=wait)
+
     def to_dict(self):
         super().to_dict()
         self.set_labels()
@@ -1178,18 +1203,49 @@ class VirtualMachineForTests(VirtualMachine):
         else:
             host_user = user.UserWithPKey(name=self.username, private_key=os.environ[CNV_VM_SSH_KEY_PATH])
         host.executor_user = host_user
-        host.executor_factory = ssh.RemoteExecutorFactory(
-            sock=self.virtctl_port_forward_cmd,
+        host.executor_factory = ReusableRemoteExecutorFactory(
+            transport=self._acquire_ssh_transport(host_user=host_user)
         )
         return host
 
-    def wait_for_specific_status(self, status, timeout=TIMEOUT_3MIN, sleep=TIMEOUT_5SEC):
+    def _acquire_ssh_transport(self, host_user: user.User) -> ReusableSshTransport:
+        """
+        Get the VM SSH transport (kept open between ssh_exec calls), acquire a new one if the credentials changed.
+        """
+        credentials = getattr(host_user, "private_key", None) or host_user.password
+        key = (self.namespace, self.name, host_user.name, credentials)
+        transport = SSH_TRANSPORT_POOL.acquire(key=key, hostname=self.name, proxy_command=self.virtctl_port_forward_cmd)
+        if self.ssh_transport_key == key:
+            # Already referenced by this VM, keep a single reference
+            SSH_TRANSPORT_POOL.release(key=key)
+        else:
+            if self.ssh_transport_key:
+                SSH_TRANSPORT_POOL.release(key=self.ssh_transport_key)
+            self.ssh_transport_key = key
+        return transport
+
+    def invalidate_ssh_transport(self) -> None:
+        """
+        Drop the VM SSH connection, must be called when the VMI is replaced (restart, migration).
+        """
+        if self.ssh_transport_key:
+            SSH_TRANSPORT_POOL.invalidate(key=self.ssh_transport_key)
+
+    @property
+    def ssh_transport_stats(self) -> SshTransportStats | None:
+        """
+        SSH connection reuse statistics (connections opened, reuses, invalidations) of this VM.
+        """
+        return SSH_TRANSPORT_POOL.stats().get(self.ssh_transport_key) if self.ssh_transport_key else None
+
+    def wait_for_specific_status(self, status, timeout=TIMEOUT_3MIN):
         LOGGER.info(f"Wait for {self.kind} {self.name} status to be {status}")
-        samples = TimeoutSampler(wait_timeout=timeout, sleep=sleep, func=lambda: self.printable_status)
         try:
-            for sample in samples:
-                if sample == status:
-                    return
+            WATCH_HUB.wait_for_resource(
+                resource=self,
+                predicate=lambda _vm: _vm.get("status", {}).get("printableStatus") == status,
+                timeout=timeout,
+            )
         except TimeoutExpiredError:
             LOGGER.error(f"Status of {self.kind} {self.name} is {status}")
             raise
@@ -1479,6 +1535,7 @@ def vm_console_run_commands(
     commands: list[str],
     timeout: int = TIMEOUT_1MIN,
     return_code_validation: bool = True,
+    reuse_session: bool = False,
 ) -> dict[str, list[str]]:
     """
     Run a list of commands inside VM and (if verify_commands_output) check all commands return 0.
@@ -1489,6 +1546,8 @@ def vm_console_run_commands(
         commands (list): List of commands
         timeout (int): Time to wait for the command output
         return_code_validation (bool): Check commands return 0
+        reuse_session (bool): Run the commands over the pooled VM console session (CONSOLE_SESSION_POOL)
+            instead of opening a new console and logging in and out.
 
     Returns:
         Dict of the commands outputs, where the key is the command and the value is the output as a list of lines.
@@ -1497,7 +1556,8 @@ def vm_console_run_commands(
     # Source: https://www.tutorialspoint.com/how-can-i-remove-the-ansi-escape-sequences-from-a-string-in-python
     ansi_escape = re.compile(r"(\x9B|\x1B\[)[0-?]*[ -\/]*[@-~]")
     prompt = r"\$ "
-    with Console(vm=vm, prompt=prompt) as vmc:
+    console = CONSOLE_SESSION_POOL.session(vm=vm, prompt=prompt) if reuse_session else Console(vm=vm, prompt=prompt)
+    with console as vmc:
         for command in commands:
             LOGGER.info(f"Execute {command} on {vm.name}")
             try:
@@ -1929,6 +1989,9 @@ def migrate_vm_and_verify(
             return migration
         wait_for_migration_finished(namespace=vm.namespace, migration=migration, timeout=timeout)
 
+    if isinstance(vm, VirtualMachineForTests):
+        vm.invalidate_ssh_transport()
+
     verify_vm_migrated(
         vm=vm,
         node_before=node_before,
@@ -2180,7 +2243,9 @@ def wait_for_node_schedulable_status(node, status, timeout=60):
     """
     LOGGER.info(f"Wait for node {node.name} to be {Node.Status.READY if status else Node.Status.SCHEDULING_DISABLED}.")
 
-    sampler = TimeoutSampler(wait_timeout=timeout, sleep=1, func=lambda: node.instance.spec.unschedulable)
+    sampler = TimeoutSampler(
+        wait_timeout=timeout, sleep=1, func=lambda: RESOURCE_CACHE.instance(resource=node).spec.unschedulable
+    )
     for sample in sampler:
         if status:
             if not sample and not kubernetes_taint_exists(node):
@@ -2200,9 +2265,10 @@ def get_hyperconverged_kubevirt(admin_client, hco_namespace):
 
 
 def get_kubevirt_hyperconverged_spec(admin_client, hco_namespace):
-    return get_hyperconverged_kubevirt(admin_client=admin_client, hco_namespace=hco_namespace).instance.to_dict()[
-        "spec"
-    ]
+    kubevirt = get_hyperconverged_kubevirt(admin_client=admin_client, hco_namespace=hco_namespace)
+    if not kubevirt:
+        raise ResourceNotFoundError(f"KubeVirt: kubevirt-kubevirt-hyperconverged not found in {hco_namespace.name}")
+    return kubevirt.instance.to_dict()["spec"]
 
 
 def get_hyperconverged_ovs_annotations(hyperconverged):
@@ -2385,8 +2451,7 @@ def wait_for_kv_stabilize(admin_client, hco_namespace):
     wait_for_hco_conditions(admin_client=admin_client, hco_namespace=hco_namespace)
 
 
-@cache
-def get_oc_image_info(  # type: ignore[return]
+def _fetch_oc_image_info(  # type: ignore[return]
     image: str, pull_secret: str | None = None, architecture: str = LINUX_AMD_64
 ) -> dict[str, Any]:
 
@@ -2418,6 +2483,53 @@ def get_oc_image_info(  # type: ignore[return]
         raise
 
 
+def get_oc_image_info(image: str, pull_secret: str | None = None, architecture: str = LINUX_AMD_64) -> dict[str, Any]:
+    """
+    Get image info (`oc image info`), cached by image, architecture and pull secret content.
+
+    Args:
+        image (str): Image reference
+        pull_secret (str, optional): Path of the registry config to use
+        architecture (str): Image architecture
+
+    Returns:
+        dict: Image info
+    """
+    return IMAGE_INFO_CACHE.get(
+        image=image,
+        architecture=architecture,
+        pull_secret=pull_secret,
+        fetch=partial(_fetch_oc_image_info, image=image, pull_secret=pull_secret, architecture=architecture),
+    )
+
+
+def get_oc_images_info(
+    images: list[str],
+    pull_secret: str | None = None,
+    architecture: str = LINUX_AMD_64,
+    max_workers: int = DEFAULT_IMAGE_LOOKUP_WORKERS,
+) -> dict[str, dict[str, Any] | None]:
+    """
+    Get the info of many images, looking up the uncached ones in parallel.
+
+    Args:
+        images (list): Image references
+        pull_secret (str, optional): Path of the registry config to use
+        architecture (str): Image architecture
+        max_workers (int): Maximum number of concurrent lookups
+
+    Returns:
+        dict: Image reference to its info, None if it could not be looked up
+    """
+    return IMAGE_INFO_CACHE.get_many(
+        images=images,
+        architecture=architecture,
+        pull_secret=pull_secret,
+        fetch=partial(_fetch_oc_image_info, pull_secret=pull_secret, architecture=architecture),
+        max_workers=max_workers,
+    )
+
+
 def taint_node_no_schedule(node):
     return ResourceEditor(
         patches={
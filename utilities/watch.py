@@ -0,0 +1,885 @@
+import atexit
+import logging
+import threading
+import time
+from collections.abc import Callable, Generator
+from typing import Any
+
+from kubernetes.client import ApiException
+from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.exceptions import NotFoundError
+from kubernetes.dynamic.resource import Resource as DynamicResource
+from kubernetes.dynamic.resource import ResourceInstance
+from ocp_resources.resource import NamespacedResource, Resource
+from timeout_sampler import TimeoutExpiredError
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+from utilities.constants import TIMEOUT_1MIN, TIMEOUT_2MIN, TIMEOUT_5MIN, TIMEOUT_5SEC, TIMEOUT_30SEC
+
+LOGGER = logging.getLogger(__name__)
+
+WATCH_EVENT_ADDED = "ADDED"
+WATCH_EVENT_MODIFIED = "MODIFIED"
+WATCH_EVENT_DELETED = "DELETED"
+WATCH_EVENT_ERROR = "ERROR"
+HTTP_GONE = 410
+WATCH_CYCLE_TIMEOUT = TIMEOUT_1MIN
+SET_BASED_SELECTOR_OPERATORS = (" in ", " notin ", "(")
+
+
+class WatchExpiredError(Exception):
+    """Raised when the watch resourceVersion is too old (HTTP 410 Gone) and a new list is needed."""
+
+
+class WatchStoppedError(Exception):
+    """Raised to waiters when their watcher stopped without an error."""
+
+
+def get_resource_api(client: DynamicClient, resource_kind: type[Resource]) -> DynamicResource:
+    """
+    Get the dynamic client API of a resource kind (the preferred version when the kind is served in several versions).
+
+    Args:
+        client (DynamicClient): Client to use
+        resource_kind (type[Resource]): ocp_resources class, e.g. VirtualMachineInstance
+
+    Returns:
+        DynamicResource: API to list/watch the kind
+    """
+    if resource_kind.api_version:
+        return client.resources.get(kind=resource_kind.kind, api_version=resource_kind.api_version)
+
+    resources = client.resources.search(kind=resource_kind.kind, group=resource_kind.api_group)
+    return next((resource for resource in resources if resource.preferred), resources[0])
+
+
+def _watch_events(
+    api: DynamicResource,
+    resource_kind: type[Resource],
+    namespace: str | None,
+    label_selector: str | None,
+    resource_version: str,
+    timeout: int,
+) -> Generator[tuple[str, dict[str, Any]]]:
+    """
+    Watch a kind from a resourceVersion, skipping non fatal error events.
+
+    Raises:
+        WatchExpiredError: If the resourceVersion is too old (410 Gone), as an error event or an ApiException
+    """
+    try:
+        for event in api.watch(
+            namespace=namespace,
+            label_selector=label_selector,
+            resource_version=resource_version,
+            timeout=timeout,
+        ):
+            raw_object = event["raw_object"]
+            if event["type"] == WATCH_EVENT_ERROR:
+                if raw_object.get("code") == HTTP_GONE:
+                    raise WatchExpiredError(raw_object.get("message"))
+                LOGGER.warning(f"{resource_kind.kind} watch error: {raw_object}")
+                continue
+
+            yield event["type"], raw_object
+    except ApiException as exp:
+        if exp.status != HTTP_GONE:
+            raise
+        raise WatchExpiredError(exp.reason) from exp
+
+
+def list_and_watch(
+    client: DynamicClient,
+    resource_kind: type[Resource],
+    namespace: str | None = None,
+    label_selector: str | None = None,
+    timeout: int = TIMEOUT_5MIN,
+) -> Generator[tuple[str, dict[str, Any]]]:
+    """
+    Stream the state of all resources of a kind with a single list and a single watch.
+
+    The current objects are yielded as ADDED events, followed by the watch events starting at the list
+    resourceVersion. If the resourceVersion expires (410 Gone), the objects are listed again.
+    The generator ends after `timeout` seconds.
+
+    Args:
+        client (DynamicClient): Client to use
+        resource_kind (type[Resource]): ocp_resources class, e.g. VirtualMachineInstance
+        namespace (str, optional): Namespace to watch, all namespaces if not set
+        label_selector (str, optional): Label selector to filter the resources
+        timeout (int): Time in seconds to watch
+
+    Yields:
+        tuple[str, dict]: Event type and the raw resource dict
+    """
+    api = get_resource_api(client=client, resource_kind=resource_kind)
+    deadline = time.monotonic() + timeout
+    resource_version = None
+    while (remaining := int(deadline - time.monotonic())) > 0:
+        if not resource_version:
+            resources_list = api.get(namespace=namespace, label_selector=label_selector).to_dict()
+            resource_version = resources_list["metadata"]["resourceVersion"]
+            for item in resources_list["items"]:
+                yield WATCH_EVENT_ADDED, item
+
+        try:
+            for event_type, raw_object in _watch_events(
+                api=api,
+                resource_kind=resource_kind,
+                namespace=namespace,
+                label_selector=label_selector,
+                resource_version=resource_version,
+                timeout=remaining,
+            ):
+                resource_version = raw_object["metadata"]["resourceVersion"]
+                yield event_type, raw_object
+        except WatchExpiredError as exp:
+            LOGGER.info(f"{resource_kind.kind} watch expired ({exp}), listing again")
+            resource_version = None
+
+
+def wait_for_resources(
+    client: DynamicClient,
+    resource_kind: type[Resource],
+    names: set[str],
+    predicate: Callable[[dict[str, Any]], bool],
+    namespace: str | None = None,
+    label_selector: str | None = None,
+    timeout: int = TIMEOUT_5MIN,
+) -> dict[str, dict[str, Any]]:
+    """
+    Wait, over one list/watch stream, until the predicate is true for all the named resources.
+
+    Args:
+        client (DynamicClient): Client to use
+        resource_kind (type[Resource]): ocp_resources class, e.g. VirtualMachineInstance
+        names (set[str]): Names of the resources to wait for
+        predicate (Callable): Called with the raw resource dict, True when the resource is done
+        namespace (str, optional): Namespace of the resources
+        label_selector (str, optional): Label selector to narrow down the watch
+        timeout (int): Time in seconds to wait
+
+    Returns:
+        dict[str, dict]: Resource name to the raw resource dict which satisfied the predicate
+
+    Raises:
+        TimeoutExpiredError: If not all resources satisfied the predicate in time
+    """
+    done: dict[str, dict[str, Any]] = {}
+    if not names:
+        return done
+
+    for event_type, raw_object in list_and_watch(
+        client=client,
+        resource_kind=resource_kind,
+        namespace=namespace,
+        label_selector=label_selector,
+        timeout=timeout,
+    ):
+        name = raw_object["metadata"]["name"]
+        if name not in names or name in done or event_type == WATCH_EVENT_DELETED:
+            continue
+
+        if predicate(raw_object):
+            done[name] = raw_object
+            if len(done) == len(names):
+                return done
+
+    raise TimeoutExpiredError(f"Timed out waiting for {resource_kind.kind} resources: {sorted(names - done.keys())}")
+
+
+def wait_for_resources_deleted(
+    client: DynamicClient,
+    resource_kind: type[Resource],
+    names: set[str],
+    namespace: str | None = None,
+    label_selector: str | None = None,
+    timeout: int = TIMEOUT_5MIN,
+) -> dict[str, tuple[float, list[str]]]:
+    """
+    Wait, over one list/watch stream, until all the named resources are deleted.
+
+    Resources already gone when listed are deleted at the list time; the others when their DELETED event is received.
+
+    Args:
+        client (DynamicClient): Client to use
+        resource_kind (type[Resource]): ocp_resources class, e.g. VirtualMachine
+        names (set[str]): Names of the resources to wait for
+        namespace (str, optional): Namespace of the resources
+        label_selector (str, optional): Label selector to narrow down the watch
+        timeout (int): Time in seconds to wait
+
+    Returns:
+        dict[str, tuple]: Resource name to the time (seconds since the epoch) its deletion was seen, and the
+            finalizers it had while being deleted
+
+    Raises:
+        TimeoutExpiredError: If not all resources were deleted in time
+    """
+    deleted: dict[str, tuple[float, list[str]]] = {}
+    finalizers: dict[str, list[str]] = {}
+    pending = set(names)
+    api = get_resource_api(client=client, resource_kind=resource_kind)
+    deadline = time.monotonic() + timeout
+    resource_version = None
+    while pending and (remaining := int(deadline - time.monotonic())) > 0:
+        if not resource_version:
+            resources_list = api.get(namespace=namespace, label_selector=label_selector).to_dict()
+            resource_version = resources_list["metadata"]["resourceVersion"]
+            listed = {}
+            for item in resources_list["items"]:
+                listed[item["metadata"]["name"]] = item
+                finalizers[item["metadata"]["name"]] = item["metadata"].get("finalizers") or []
+            list_time = time.time()
+            for name in pending - listed.keys():
+                deleted[name] = (list_time, finalizers.get(name, []))
+            pending &= listed.keys()
+            if not pending:
+                break
+
+        try:
+            for event_type, raw_object in _watch_events(
+                api=api,
+                resource_kind=resource_kind,
+                namespace=namespace,
+                label_selector=label_selector,
+                resource_version=resource_version,
+                timeout=remaining,
+            ):
+                resource_version = raw_object["metadata"]["resourceVersion"]
+                name = raw_object["metadata"]["name"]
+                if name not in pending:
+                    continue
+
+                # Finalizers are removed one by one before the object is gone, keep the last non empty ones
+                finalizers[name] = raw_object["metadata"].get("finalizers") or finalizers.get(name, [])
+                if event_type == WATCH_EVENT_DELETED:
+                    deleted[name] = (time.time(), finalizers[name])
+                    pending.discard(name)
+                    if not pending:
+                        break
+        except WatchExpiredError as exp:
+            LOGGER.info(f"{resource_kind.kind} watch expired ({exp}), listing again")
+            resource_version = None
+
+    if pending:
+        raise TimeoutExpiredError(f"Timed out waiting for {resource_kind.kind} resources deletion: {sorted(pending)}")
+
+    return deleted
+
+
+def is_expected_exception(exp: Exception, exceptions_dict: dict[type[Exception], list[str]] | None) -> bool:
+    """
+    Check if an exception is allowed by a TimeoutSampler style exceptions_dict.
+
+    Args:
+        exp (Exception): Raised exception
+        exceptions_dict (dict, optional): Exception type to a list of allowed messages, an empty list allows any message
+
+    Returns:
+        bool: True if the exception is allowed
+    """
+    for exception_type, messages in (exceptions_dict or {}).items():
+        if isinstance(exp, exception_type) and (not messages or any(message in str(exp) for message in messages)):
+            return True
+    return False
+
+
+def _resource_key(raw_object: dict[str, Any]) -> tuple[str | None, str]:
+    return raw_object["metadata"].get("namespace"), raw_object["metadata"]["name"]
+
+
+class ResourceWatcher:
+    def __init__(
+        self,
+        client: DynamicClient,
+        resource_kind: type[Resource],
+        namespace: str | None = None,
+        idle_timeout: int = TIMEOUT_1MIN,
+    ) -> None:
+        """
+        Background list/watch of one kind in one namespace, keeping the latest state of every resource.
+
+        Waiters are woken on each event and check their predicate against the cached state, so any number of
+        waiters costs one watch. The watcher stops after `idle_timeout` seconds without waiters.
+
+        Args:
+            client (DynamicClient): Client to use
+            resource_kind (type[Resource]): ocp_resources class, e.g. VirtualMachineInstance
+            namespace (str, optional): Namespace to watch, all namespaces if not set
+            idle_timeout (int): Time in seconds to keep watching without waiters
+        """
+        self.client = client
+        self.resource_kind = resource_kind
+        self.namespace = namespace
+        self.idle_timeout = idle_timeout
+        self.resources: dict[tuple[str | None, str], dict[str, Any]] = {}
+        self.synced = False
+        self.last_sync = 0.0
+        self.error: Exception | None = None
+        self.events = 0
+        self._waiters = 0
+        self._idle_since = time.monotonic()
+        self._closed = False
+        self._stopped = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name=f"watch-{resource_kind.kind}-{namespace or 'all'}", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def add_waiter(self) -> bool:
+        """
+        Register a waiter.
+
+        Returns:
+            bool: False if the watcher already stopped and a new one is needed
+        """
+        with self._condition:
+            if self._stopped:
+                return False
+            self._waiters += 1
+            return True
+
+    def remove_waiter(self) -> None:
+        with self._condition:
+            self._waiters -= 1
+            if not self._waiters:
+                self._idle_since = time.monotonic()
+
+    def _should_stop(self) -> bool:
+        with self._condition:
+            if self._closed or (not self._waiters and time.monotonic() - self._idle_since > self.idle_timeout):
+                self._stopped = True
+                self._condition.notify_all()
+            return self._stopped
+
+    @property
+    def running(self) -> bool:
+        return not self._stopped
+
+    def is_fresh(self, max_staleness: float) -> bool:
+        """
+        Check the cached state can be used.
+
+        Args:
+            max_staleness (float): Maximum time in seconds since the watch last confirmed the state
+
+        Returns:
+            bool: True if the watcher is synced, running and confirmed the state in the last `max_staleness` seconds
+        """
+        with self._condition:
+            return self.synced and not self._stopped and time.monotonic() - self.last_sync <= max_staleness
+
+    def wait_synced(self, timeout: float) -> bool:
+        """
+        Wait for the initial list.
+
+        Args:
+            timeout (float): Time in seconds to wait
+
+        Returns:
+            bool: True if the resources were listed, False if the watcher stopped or the timeout expired
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self.synced or self._stopped, timeout=timeout) and self.synced
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        with self._condition:
+            return list(self.resources.values())
+
+    def get(self, name: str, namespace: str | None = None) -> dict[str, Any] | None:
+        with self._condition:
+            return self.resources.get((namespace or self.namespace, name))
+
+    def _touch(self) -> None:
+        with self._condition:
+            self.last_sync = time.monotonic()
+
+    def _set_resources(self, resources: list[dict[str, Any]]) -> None:
+        with self._condition:
+            self.resources = {_resource_key(raw_object=raw_object): raw_object for raw_object in resources}
+            self.synced = True
+            self.last_sync = time.monotonic()
+            self._condition.notify_all()
+
+    def _apply_event(self, event_type: str, raw_object: dict[str, Any]) -> None:
+        with self._condition:
+            if event_type == WATCH_EVENT_DELETED:
+                self.resources.pop(_resource_key(raw_object=raw_object), None)
+            else:
+                self.resources[_resource_key(raw_object=raw_object)] = raw_object
+            self.events += 1
+            self.last_sync = time.monotonic()
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        try:
+            api = get_resource_api(client=self.client, resource_kind=self.resource_kind)
+            resource_version = None
+            while not self._should_stop():
+                if not resource_version:
+                    resources_list = api.get(namespace=self.namespace).to_dict()
+                    resource_version = resources_list["metadata"]["resourceVersion"]
+                    # List items have no kind and apiVersion, unlike watch events
+                    for item in resources_list["items"]:
+                        item.setdefault("kind", self.resource_kind.kind)
+                        item.setdefault("apiVersion", resources_list.get("apiVersion"))
+                    self._set_resources(resources=resources_list["items"])
+
+                try:
+                    # Short watch cycles, to notice when the watcher is idle
+                    for event_type, raw_object in _watch_events(
+                        api=api,
+                        resource_kind=self.resource_kind,
+                        namespace=self.namespace,
+                        label_selector=None,
+                        resource_version=resource_version,
+                        timeout=WATCH_CYCLE_TIMEOUT,
+                    ):
+                        resource_version = raw_object["metadata"]["resourceVersion"]
+                        self._apply_event(event_type=event_type, raw_object=raw_object)
+
+                        if self._closed:
+                            break
+                    else:
+                        # The watch cycle ended without an error, the state is up to date
+                        self._touch()
+                except WatchExpiredError as exp:
+                    LOGGER.info(f"{self.resource_kind.kind} watch expired ({exp}), listing again")
+                    resource_version = None
+                except (ProtocolError, ReadTimeoutError) as exp:
+                    LOGGER.warning(f"{self.resource_kind.kind} watch connection dropped ({exp}), watching again")
+
+        except Exception as exp:
+            LOGGER.error(f"{self.resource_kind.kind} watch failed: {exp}")
+            with self._condition:
+                self.error = exp
+
+        finally:
+            with self._condition:
+                self._stopped = True
+                self._condition.notify_all()
+
+    def wait(
+        self,
+        predicate: Callable[[dict[str, Any]], bool],
+        name: str | None = None,
+        timeout: float = TIMEOUT_5MIN,
+        stable_for: float = 0,
+    ) -> dict[str, Any]:
+        """
+        Wait until the predicate is true for a resource.
+
+        Args:
+            predicate (Callable): Called with the raw resource dict, True when the resource is done.
+                Exceptions raised by the predicate (e.g. on a failure state) are propagated.
+            name (str, optional): Resource name, the first listed resource if not set (for singletons, e.g. HCO)
+            timeout (float): Time in seconds to wait
+            stable_for (float): Time in seconds the predicate should be continuously true
+
+        Returns:
+            dict: Raw resource dict which satisfied the predicate
+
+        Raises:
+            TimeoutExpiredError: If the predicate is not true in time
+            WatchStoppedError: If the watcher stopped, the wait should be retried with a new watcher
+        """
+        deadline = time.monotonic() + timeout
+        matched_since = None
+        raw_object = None
+        with self._condition:
+            while True:
+                if self.error:
+                    raise self.error
+
+                if self._stopped:
+                    raise WatchStoppedError(f"{self.resource_kind.kind} watch stopped")
+
+                now = time.monotonic()
+                if self.synced:
+                    raw_object = (
+                        self.resources.get((self.namespace, name))
+                        if name
+                        else next(iter(self.resources.values()), None)
+                    )
+                    if raw_object is not None and predicate(raw_object):
+                        matched_since = matched_since or now
+                        if now - matched_since >= stable_for:
+                            return raw_object
+                    else:
+                        matched_since = None
+
+                remaining = deadline - now
+                if remaining <= 0:
+                    raise TimeoutExpiredError(
+                        f"Timed out waiting for {self.resource_kind.kind} {name or ''} (namespace: {self.namespace}), "
+                        f"last state: {raw_object.get('status') if raw_object else None}"
+                    )
+
+                self._condition.wait(
+                    timeout=remaining if matched_since is None else min(remaining, matched_since + stable_for - now)
+                )
+
+
+class WatchHub:
+    def __init__(self, idle_timeout: int = TIMEOUT_1MIN) -> None:
+        """
+        Shared watchers, one per client, kind and namespace, for all the waiters in the session.
+
+        Args:
+            idle_timeout (int): Time in seconds to keep a watcher without waiters
+        """
+        self.idle_timeout = idle_timeout
+        self._watchers: dict[tuple[int, str, str | None], ResourceWatcher] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, client: DynamicClient, resource_kind: type[Resource], namespace: str | None) -> ResourceWatcher:
+        """
+        Get the running watcher of a kind and namespace (starting one if needed) and register as its waiter.
+
+        The caller should call remove_waiter() on the watcher when done.
+
+        Args:
+            client (DynamicClient): Client to use
+            resource_kind (type[Resource]): ocp_resources class, e.g. VirtualMachineInstance
+            namespace (str, optional): Namespace to watch, all namespaces if not set
+
+        Returns:
+            ResourceWatcher: Running watcher
+        """
+        key = (id(client), resource_kind.kind, namespace)
+        with self._lock:
+            watcher = self._watchers.get(key)
+            if watcher and watcher.add_waiter():
+                return watcher
+
+            watcher = ResourceWatcher(
+                client=client, resource_kind=resource_kind, namespace=namespace, idle_timeout=self.idle_timeout
+            )
+            watcher.add_waiter()
+            watcher.start()
+            self._watchers[key] = watcher
+            return watcher
+
+    def wait_for(
+        self,
+        client: DynamicClient,
+        resource_kind: type[Resource],
+        predicate: Callable[[dict[str, Any]], bool],
+        name: str | None = None,
+        namespace: str | None = None,
+        timeout: int = TIMEOUT_5MIN,
+        stable_for: float = 0,
+        exceptions_dict: dict[type[Exception], list[str]] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Wait until the predicate is true for a resource, using the shared watcher of its kind and namespace.
+
+        Args:
+            client (DynamicClient): Client to use
+            resource_kind (type[Resource]): ocp_resources class, e.g. VirtualMachineInstance
+            predicate (Callable): Called with the raw resource dict, True when the resource is done
+            name (str, optional): Resource name, the first listed resource if not set (for singletons, e.g. HCO)
+            namespace (str, optional): Resource namespace, not needed for cluster scoped resources
+            timeout (int): Time in seconds to wait
+            stable_for (float): Time in seconds the predicate should be continuously true
+            exceptions_dict (dict, optional): TimeoutSampler style exceptions to retry the watch on
+
+        Returns:
+            dict: Raw resource dict which satisfied the predicate
+
+        Raises:
+            TimeoutExpiredError: If the predicate is not true in time
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            watcher = self.acquire(client=client, resource_kind=resource_kind, namespace=namespace)
+            try:
+                return watcher.wait(
+                    predicate=predicate,
+                    name=name,
+                    timeout=max(deadline - time.monotonic(), 0),
+                    stable_for=stable_for,
+                )
+            except WatchStoppedError:
+                continue
+            except TimeoutExpiredError:
+                raise
+            except Exception as exp:
+                if not is_expected_exception(exp=exp, exceptions_dict=exceptions_dict):
+                    raise
+                if time.monotonic() >= deadline:
+                    raise TimeoutExpiredError(f"Timed out waiting for {resource_kind.kind} {name or ''}: {exp}")
+                LOGGER.warning(f"{resource_kind.kind} watch failed with an expected error ({exp}), watching again")
+                time.sleep(TIMEOUT_5SEC)
+            finally:
+                watcher.remove_waiter()
+
+    def wait_for_resource(
+        self,
+        resource: Resource,
+        predicate: Callable[[dict[str, Any]], bool],
+        timeout: int = TIMEOUT_5MIN,
+        stable_for: float = 0,
+    ) -> dict[str, Any]:
+        """
+        Wait until the predicate is true for an ocp_resources object (see wait_for).
+
+        Args:
+            resource (Resource): Resource to wait for
+            predicate (Callable): Called with the raw resource dict, True when the resource is done
+            timeout (int): Time in seconds to wait
+            stable_for (float): Time in seconds the predicate should be continuously true
+
+        Returns:
+            dict: Raw resource dict which satisfied the predicate
+
+        Raises:
+            TimeoutExpiredError: If the predicate is not true in time
+        """
+        return self.wait_for(
+            client=resource.client,
+            resource_kind=type(resource),
+            predicate=predicate,
+            name=resource.name,
+            namespace=resource.namespace,
+            timeout=timeout,
+            stable_for=stable_for,
+        )
+
+    def close_all(self) -> None:
+        with self._lock:
+            for watcher in self._watchers.values():
+                watcher.close()
+            self._watchers.clear()
+
+
+WATCH_HUB = WatchHub()
+atexit.register(WATCH_HUB.close_all)
+
+
+def match_label_selector(labels: dict[str, str], label_selector: str | None) -> bool:
+    """
+    Match labels against an equality based label selector (key, !key, key=value, key==value, key!=value).
+
+    Args:
+        labels (dict): Resource labels
+        label_selector (str, optional): Comma separated requirements, all resources match if not set
+
+    Returns:
+        bool: True if all the requirements are met
+    """
+    for requirement in filter(None, (_requirement.strip() for _requirement in (label_selector or "").split(","))):
+        if "!=" in requirement:
+            key, value = requirement.split("!=", 1)
+            if labels.get(key.strip()) == value.strip():
+                return False
+        elif "=" in requirement:
+            key, value = requirement.replace("==", "=").split("=", 1)
+            if labels.get(key.strip()) != value.strip():
+                return False
+        elif requirement.startswith("!"):
+            if requirement[1:].strip() in labels:
+                return False
+        elif requirement not in labels:
+            return False
+    return True
+
+
+def _is_set_based_selector(label_selector: str | None) -> bool:
+    return bool(label_selector) and any(operator in label_selector for operator in SET_BASED_SELECTOR_OPERATORS)
+
+
+class ResourceCache:
+    def __init__(
+        self, hub: WatchHub = WATCH_HUB, max_staleness: float = TIMEOUT_2MIN, idle_timeout: float | None = None
+    ) -> None:
+        """
+        Informer style read cache; a hub watcher per client, kind and namespace serves all the reads.
+
+        Reads go to the API server when a fresh read is requested (e.g. right after the resource was updated), or
+        when the watcher is not synced, stopped or did not confirm its state in the last `max_staleness` seconds.
+        Informers not read for `idle_timeout` seconds are released on the next read, and their watchers stop, so
+        namespaces read once (e.g. test namespaces) do not keep a watch for the rest of the session.
+
+        Args:
+            hub (WatchHub): Hub to get the watchers from
+            max_staleness (float): Maximum time in seconds since the watch last confirmed the cached state
+            idle_timeout (float, optional): Time in seconds to keep an informer without reads, the hub idle timeout
+                if not set
+        """
+        self.hub = hub
+        self.max_staleness = max_staleness
+        self.idle_timeout = hub.idle_timeout if idle_timeout is None else idle_timeout
+        self._informers: dict[tuple[int, str, str | None], ResourceWatcher] = {}
+        self._last_read: dict[tuple[int, str, str | None], float] = {}
+        self._lock = threading.Lock()
+
+    def _release_idle_informers(self) -> None:
+        # Called with the lock held
+        now = time.monotonic()
+        for key in [key for key, last_read in self._last_read.items() if now - last_read > self.idle_timeout]:
+            self._informers.pop(key).remove_waiter()
+            del self._last_read[key]
+
+    def _informer(
+        self, client: DynamicClient, resource_kind: type[Resource], namespace: str | None
+    ) -> ResourceWatcher | None:
+        key = (id(client), resource_kind.kind, namespace)
+        with self._lock:
+            self._release_idle_informers()
+            watcher = self._informers.get(key)
+            if not watcher or not watcher.running:
+                if watcher:
+                    watcher.remove_waiter()
+                watcher = self.hub.acquire(client=client, resource_kind=resource_kind, namespace=namespace)
+                self._informers[key] = watcher
+            self._last_read[key] = time.monotonic()
+
+        if watcher.wait_synced(timeout=TIMEOUT_30SEC) and watcher.is_fresh(max_staleness=self.max_staleness):
+            return watcher
+
+        LOGGER.warning(f"{resource_kind.kind} cache is not up to date, reading from the API server")
+        return None
+
+    def list_raw(
+        self,
+        client: DynamicClient,
+        resource_kind: type[Resource],
+        namespace: str | None = None,
+        label_selector: str | None = None,
+        fresh: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        List the raw resources of a kind.
+
+        Args:
+            client (DynamicClient): Client to use
+            resource_kind (type[Resource]): ocp_resources class, e.g. Node
+            namespace (str, optional): Namespace, all namespaces if not set
+            label_selector (str, optional): Label selector, set based selectors are always read from the API server
+            fresh (bool): Read from the API server
+
+        Returns:
+            list[dict]: Raw resource dicts
+        """
+        watcher = (
+            None
+            if fresh or _is_set_based_selector(label_selector=label_selector)
+            else self._informer(client=client, resource_kind=resource_kind, namespace=namespace)
+        )
+        if not watcher:
+            api = get_resource_api(client=client, resource_kind=resource_kind)
+            return api.get(namespace=namespace, label_selector=label_selector).to_dict()["items"]
+
+        return [
+            raw_object
+            for raw_object in watcher.snapshot()
+            if match_label_selector(labels=raw_object["metadata"].get("labels") or {}, label_selector=label_selector)
+        ]
+
+    def list(
+        self,
+        client: DynamicClient,
+        resource_kind: type[Resource],
+        namespace: str | None = None,
+        label_selector: str | None = None,
+        fresh: bool = False,
+    ) -> list[Resource]:
+        """
+        List the resources of a kind, as ocp_resources objects (see list_raw).
+
+        Returns:
+            list[Resource]: Resources of resource_kind
+        """
+        resources = []
+        for raw_object in self.list_raw(
+            client=client,
+            resource_kind=resource_kind,
+            namespace=namespace,
+            label_selector=label_selector,
+            fresh=fresh,
+        ):
+            if issubclass(resource_kind, NamespacedResource):
+                resources.append(
+                    resource_kind(
+                        client=client,
+                        name=raw_object["metadata"]["name"],
+                        namespace=raw_object["metadata"]["namespace"],
+                    )
+                )
+            else:
+                resources.append(resource_kind(client=client, name=raw_object["metadata"]["name"]))
+        return resources
+
+    def get_raw(
+        self,
+        client: DynamicClient,
+        resource_kind: type[Resource],
+        name: str,
+        namespace: str | None = None,
+        fresh: bool = False,
+    ) -> dict[str, Any] | None:
+        """
+        Get a raw resource.
+
+        Args:
+            client (DynamicClient): Client to use
+            resource_kind (type[Resource]): ocp_resources class, e.g. HyperConverged
+            name (str): Resource name
+            namespace (str, optional): Resource namespace, not needed for cluster scoped resources
+            fresh (bool): Read from the API server
+
+        Returns:
+            dict | None: Raw resource dict, None if the resource does not exist
+        """
+        watcher = None if fresh else self._informer(client=client, resource_kind=resource_kind, namespace=namespace)
+        if watcher:
+            return watcher.get(name=name, namespace=namespace)
+
+        try:
+            return (
+                get_resource_api(client=client, resource_kind=resource_kind)
+                .get(name=name, namespace=namespace)
+                .to_dict()
+            )
+        except NotFoundError:
+            return None
+
+    def instance(self, resource: Resource, fresh: bool = False) -> ResourceInstance:
+        """
+        Cached replacement of Resource.instance.
+
+        Args:
+            resource (Resource): Resource to get
+            fresh (bool): Read from the API server
+
+        Returns:
+            ResourceInstance: Resource instance
+
+        Raises:
+            NotFoundError: If the resource does not exist
+        """
+        if not fresh:
+            watcher = self._informer(client=resource.client, resource_kind=type(resource), namespace=resource.namespace)
+            if watcher and (raw_object := watcher.get(name=resource.name)):
+                return ResourceInstance(client=resource.client, instance=raw_object)
+        return resource.instance
+
+    def close(self) -> None:
+        with self._lock:
+            for watcher in self._informers.values():
+                watcher.remove_waiter()
+            self._informers.clear()
+            self._last_read.clear()
+
+
+RESOURCE_CACHE = ResourceCache()